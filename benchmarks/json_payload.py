@@ -0,0 +1,87 @@
+"""
+Serialization benchmark for a large `/assets` payload.
+
+Serves the same list of `Asset` objects through a Flask view three ways and reports latency:
+    default  Flask's DefaultJSONProvider with a dict copy per model (the previous behaviour)
+    fast     FastJSONProvider on the stdlib json encoder
+    orjson   FastJSONProvider on orjson (skipped when it is not installed)
+
+Usage:
+    python -m benchmarks.json_payload --items 10000 --iterations 50
+"""
+import argparse
+import sys
+import time
+from dataclasses import asdict
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.app.models.asset import Asset
+from src.app.models.response import CustomResponse
+from src.app.utils.json_provider import FastJSONProvider, orjson
+from src.app.utils.stats import summarize_latencies
+
+DEFAULT_ITEMS = 10_000
+DEFAULT_ITERATIONS = 50
+
+
+def build_assets(n_items: int) -> list:
+    return [
+        Asset(name=f"dell latitude {i % 100}", description=f"dell latitude #{i:06d}", serial_number=f"{i:032x}")
+        for i in range(n_items)
+    ]
+
+
+def build_app(assets: list, variant: str) -> Flask:
+    app = Flask(__name__)
+    if variant == "default":
+        app.json = DefaultJSONProvider(app)
+
+        def get_assets():
+            return CustomResponse(200, "Assets retrieved successfully", [asdict(asset) for asset in assets]).object_to_dict()
+    else:
+        app.json = FastJSONProvider(app, use_orjson=variant == "orjson")
+
+        def get_assets():
+            return CustomResponse(200, "Assets retrieved successfully", assets).object_to_dict()
+
+    app.add_url_rule("/assets", "assets", get_assets)
+    return app
+
+
+def run(n_items: int = DEFAULT_ITEMS, iterations: int = DEFAULT_ITERATIONS) -> dict:
+    assets = build_assets(n_items)
+    variants = ["default", "fast"] + (["orjson"] if orjson else [])
+
+    results = {}
+    for variant in variants:
+        client = build_app(assets, variant).test_client()
+        client.get("/assets")  # warmup
+        latencies = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            response = client.get("/assets")
+            latencies.append(time.perf_counter() - started)
+        results[variant] = summarize_latencies(latencies)
+        results[variant]["bytes"] = len(response.data)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization of a large /assets payload")
+    parser.add_argument("--items", type=int, default=DEFAULT_ITEMS)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args(argv)
+
+    results = run(args.items, args.iterations)
+    baseline = results["default"]["p50_ms"]
+    print(f"{'variant':<10}{'p50':>10}{'p95':>10}{'bytes':>12}{'speedup':>10}")
+    for variant, stats in results.items():
+        print(f"{variant:<10}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['bytes']:>12}"
+              f"{baseline / stats['p50_ms']:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Row materialization benchmark: loads a large `assets` table into models two ways and reports
+time and peak traced memory:
+    init     fetch tuples, then `Asset(**fields)` per row (the previous repository code)
+    mapper   compiled `row_mapper` installed as the cursor's row_factory
+
+Usage:
+    python -m benchmarks.row_materialization --rows 200000
+"""
+import argparse
+import sqlite3
+import sys
+import time
+import tracemalloc
+
+from src.app.models.asset import Asset
+from src.app.repositories.asset_repository import ASSET_COLUMNS
+from src.app.utils.db.row_mapper import row_mapper
+
+DEFAULT_ROWS = 200_000
+QUERY = f"SELECT {', '.join(ASSET_COLUMNS)} FROM assets"
+
+
+def build_db(n_rows: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE assets (serial_number TEXT PRIMARY KEY, name TEXT, description TEXT, status TEXT)")
+    conn.executemany(
+        "INSERT INTO assets VALUES (?, ?, ?, ?)",
+        ((f"{i:032x}", f"dell latitude {i % 100}", f"dell latitude #{i:06d}", "available") for i in range(n_rows))
+    )
+    return conn
+
+
+def load_init(conn: sqlite3.Connection) -> list:
+    rows = conn.execute(QUERY).fetchall()
+    return [Asset(serial_number=row[0], name=row[1], description=row[2], status=row[3]) for row in rows]
+
+
+def load_mapper(conn: sqlite3.Connection) -> list:
+    cursor = conn.cursor()
+    cursor.row_factory = row_mapper(Asset, ASSET_COLUMNS)
+    return cursor.execute(QUERY).fetchall()
+
+
+def measure(loader, conn: sqlite3.Connection) -> dict:
+    started = time.perf_counter()
+    loader(conn)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    result = loader(conn)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"ms": elapsed * 1000, "peak_mb": peak / 1e6}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark materializing rows into models")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    args = parser.parse_args(argv)
+
+    conn = build_db(args.rows)
+    print(f"{'variant':<10}{'ms':>10}{'peak MB':>10}")
+    for name, loader in (("init", load_init), ("mapper", load_mapper)):
+        stats = measure(loader, conn)
+        print(f"{name:<10}{stats['ms']:>10.1f}{stats['peak_mb']:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Endpoint benchmarks against a seeded SQLite database.
+
+Builds the app with `create_app()` on a temporary database seeded at the requested scale, drives
+every route through the Flask test client and writes p50/p95/p99 latency, throughput and peak
+memory per route to a JSON results file.
+
+Usage:
+    python -m benchmarks.run_benchmarks --scale 1k --iterations 200
+    python -m benchmarks.run_benchmarks --scale 1k --baseline benchmarks/baselines/1k.json
+    python -m benchmarks.run_benchmarks --scale 1k --save-baseline benchmarks/baselines/1k.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from benchmarks.seed import SCALES, BENCH_EMAIL, BENCH_PASSWORD, seed_database
+from src.app.utils.stats import summarize_latencies
+
+DEFAULT_ITERATIONS = 100
+# Warmup iterations are excluded from latency stats and run under tracemalloc to measure peak memory
+WARMUP_ITERATIONS = 3
+# bcrypt dominates login/signup, so they run a fraction of the iterations
+SLOW_ROUTE_WEIGHT = 0.1
+REGRESSION_THRESHOLD = 0.2
+# Regressions smaller than this are treated as noise
+REGRESSION_MIN_DELTA_MS = 1.0
+# Admin controls that change the server's configuration rather than serve data
+UNBENCHMARKED_ROUTES = {"POST /admin/profiler", "POST /admin/caches/<name>"}
+# Words of the generator's asset models and issue templates, cycled through by the search scenarios
+ASSET_SEARCH_TERMS = ["dell", "macbook", "thinkpad", "monitor", "logitech", "ipad", "dock"]
+ISSUE_SEARCH_TERMS = ["screen", "battery", "overheat", "wifi", "charger", "bluetooth", "usb"]
+
+
+class Scenario:
+    def __init__(self, name: str, method: str, path, body=None, token: str = None, pool: int = None,
+                 weight: float = 1.0, stream: bool = False):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.body = body
+        self.token = token
+        self.pool = pool
+        self.weight = weight
+        # Streaming responses never end on their own: only the time to their first chunk is measured
+        self.stream = stream
+
+    def iterations(self, requested: int) -> int:
+        total = max(1, int(requested * self.weight)) + WARMUP_ITERATIONS
+        return min(total, self.pool) if self.pool is not None else total
+
+    def request(self, client, i: int):
+        path = self.path(i) if callable(self.path) else self.path
+        body = self.body(i) if callable(self.body) else self.body
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        return client.open(path, method=self.method, json=body, headers=headers)
+
+    def read(self, response):
+        if not self.stream:
+            response.get_data()
+            return
+        next(iter(response.response), None)
+        response.close()
+
+
+def build_scenarios(ids: dict, admin_token: str, user_token: str, run_id: str) -> list:
+    """
+    Every route of the app but UNBENCHMARKED_ROUTES, ordered so write scenarios leave the data in
+    a consistent state. Reads whose responses are cached vary their query per iteration where the
+    point is to measure the database work behind them.
+    """
+    user_id = ids["user_id"]
+    available = ids["available_asset_ids"]
+    half = len(available) // 2
+    assignable, deletable = available[:half], available[half:]
+    deletable_users = ids["unassigned_user_ids"]
+
+    return [
+        Scenario("POST /login", "POST", "/login",
+                 body={"email": BENCH_EMAIL, "password": BENCH_PASSWORD}, weight=SLOW_ROUTE_WEIGHT),
+        Scenario("POST /signup", "POST", "/signup",
+                 body=lambda i: {"name": "benchuser", "email": f"bench{run_id}{i}@watchguard.com",
+                                 "password": BENCH_PASSWORD, "department": "CLOUD PLATFORM"},
+                 weight=SLOW_ROUTE_WEIGHT),
+        Scenario("GET /users", "GET", "/users", token=admin_token),
+        Scenario("GET /user/<user_id>", "GET", f"/user/{user_id}", token=user_token),
+        Scenario("GET /assets", "GET", "/assets", token=admin_token),
+        Scenario("GET /assets/search", "GET",
+                 lambda i: f"/assets/search?q={ASSET_SEARCH_TERMS[i % len(ASSET_SEARCH_TERMS)]}&offset={i}",
+                 token=admin_token),
+        Scenario("POST /add-asset", "POST", "/add-asset",
+                 body={"name": "bench asset", "description": "added by benchmark"}, token=admin_token),
+        Scenario("POST /assign-asset", "POST", "/assign-asset",
+                 body=lambda i: {"user_id": user_id, "asset_id": assignable[i]}, token=admin_token,
+                 pool=len(assignable)),
+        Scenario("GET /assigned-assets/<user_id>", "GET", f"/assigned-assets/{user_id}", token=user_token),
+        Scenario("GET /assigned-assets/all", "GET", "/assigned-assets/all", token=admin_token),
+        Scenario("GET /assignment-history/assets/<asset_id>", "GET",
+                 lambda i: f"/assignment-history/assets/{ids['assigned_asset_id']}?at=2025-{i % 12 + 1:02d}-01",
+                 token=admin_token),
+        Scenario("GET /assignment-history/users/<user_id>", "GET",
+                 lambda i: f"/assignment-history/users/{user_id}?from=2024-01-01&to=2025-{i % 12 + 1:02d}-01",
+                 token=admin_token),
+        Scenario("POST /unassign-asset", "POST", "/unassign-asset",
+                 body=lambda i: {"user_id": user_id, "asset_id": assignable[i]}, token=admin_token,
+                 pool=len(assignable)),
+        Scenario("POST /report-issue", "POST", "/report-issue",
+                 body={"asset_id": ids["assigned_asset_id"], "description": "screen flickers"}, token=user_token),
+        Scenario("GET /issues/<user_id>", "GET", f"/issues/{user_id}", token=user_token),
+        Scenario("GET /issues", "GET", "/issues", token=admin_token),
+        Scenario("GET /issues/search", "GET",
+                 lambda i: f"/issues/search?q={ISSUE_SEARCH_TERMS[i % len(ISSUE_SEARCH_TERMS)]}&offset={i}",
+                 token=admin_token),
+        Scenario("GET /stats", "GET", "/stats", token=admin_token),
+        Scenario("GET /changes", "GET", "/changes", token=admin_token),
+        Scenario("GET /events", "GET", "/events", token=admin_token, stream=True),
+        Scenario("DELETE /delete-asset/<asset_id>", "DELETE", lambda i: f"/delete-asset/{deletable[i]}",
+                 token=admin_token, pool=len(deletable)),
+        Scenario("DELETE /delete-user/<user_id>", "DELETE", lambda i: f"/delete-user/{deletable_users[i]}",
+                 token=admin_token, pool=len(deletable_users)),
+        Scenario("GET /admin/profiler", "GET", "/admin/profiler", token=admin_token),
+        Scenario("GET /admin/profiler/stacks", "GET", "/admin/profiler/stacks", token=admin_token),
+        Scenario("GET /admin/caches", "GET", "/admin/caches", token=admin_token),
+        Scenario("GET /admin/caches/metrics", "GET", "/admin/caches/metrics", token=admin_token),
+        Scenario("GET /admin/caches/<name>", "GET", "/admin/caches/responses", token=admin_token),
+    ]
+
+
+def run_scenario(client, scenario: Scenario, iterations: int) -> dict:
+    latencies = []
+    errors = 0
+    peak_memory = 0
+
+    for i in range(scenario.iterations(iterations)):
+        warmup = i < WARMUP_ITERATIONS
+        if warmup:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        response = scenario.request(client, i)
+        scenario.read(response)
+        elapsed = time.perf_counter() - start
+
+        if warmup:
+            peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        else:
+            latencies.append(elapsed)
+
+        if response.status_code >= 400:
+            errors += 1
+
+    summary = summarize_latencies(latencies)
+    total = sum(latencies)
+    return {
+        "iterations": summary["count"],
+        "errors": errors,
+        "mean_ms": summary["mean_ms"],
+        "p50_ms": summary["p50_ms"],
+        "p95_ms": summary["p95_ms"],
+        "p99_ms": summary["p99_ms"],
+        "throughput_rps": round(len(latencies) / total, 2) if total else 0.0,
+        "peak_memory_kb": round(peak_memory / 1024, 1),
+    }
+
+
+def compare_with_baseline(results: dict, baseline: dict, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """Return a description of every route whose p95 latency regressed beyond `threshold`"""
+    regressions = []
+    for route, stats in results["routes"].items():
+        base = baseline.get("routes", {}).get(route)
+        if not base:
+            continue
+        limit = base["p95_ms"] * (1 + threshold)
+        if stats["p95_ms"] > limit and stats["p95_ms"] - base["p95_ms"] > REGRESSION_MIN_DELTA_MS:
+            regressions.append(
+                f"{route}: p95 {stats['p95_ms']}ms vs baseline {base['p95_ms']}ms (+{threshold:.0%} allowed)"
+            )
+    return regressions
+
+
+def run_benchmarks(n_rows: int, iterations: int, work_dir: str, trace: bool = False) -> dict:
+    """Seed a database in `work_dir` and benchmark every route against it"""
+    # Log, trace and profile files are created relative to the working directory
+    os.chdir(work_dir)
+
+    from src.app.config.app_config import AppConfig
+    from src.app.controllers.main import create_app
+    from src.app.utils.utils import Utils
+
+    seed_start = time.perf_counter()
+    ids = seed_database(os.path.join(work_dir, "benchmark.db"), n_rows)
+    seed_seconds = time.perf_counter() - seed_start
+
+    app = create_app(AppConfig(db_path=os.path.join(work_dir, "benchmark.db"), trace_enabled=trace))
+    client = app.test_client()
+    admin_token = Utils.create_jwt_token(ids["admin_id"], "admin")
+    user_token = Utils.create_jwt_token(ids["user_id"], "user")
+
+    routes = {}
+    for scenario in build_scenarios(ids, admin_token, user_token, run_id=str(int(time.time()))):
+        routes[scenario.name] = run_scenario(client, scenario, iterations)
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rows": n_rows,
+        "iterations": iterations,
+        "seed_seconds": round(seed_seconds, 2),
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "routes": routes,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark every route against a seeded SQLite database")
+    parser.add_argument("--scale", default="1k",
+                        help=f"rows per table: one of {', '.join(SCALES)} or an integer")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="allowed relative p95 increase over the baseline")
+    parser.add_argument("--save-baseline", help="also write the results to this baseline file")
+    parser.add_argument("--trace", action="store_true", help="keep request tracing enabled")
+    args = parser.parse_args(argv)
+
+    n_rows = SCALES[args.scale.lower()] if args.scale.lower() in SCALES else int(args.scale)
+    output = os.path.abspath(args.output)
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    save_baseline = os.path.abspath(args.save_baseline) if args.save_baseline else None
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        try:
+            results = run_benchmarks(n_rows, args.iterations, work_dir, trace=args.trace)
+        finally:
+            os.chdir(cwd)
+    results["scale"] = args.scale
+
+    for path in filter(None, [output, save_baseline]):
+        with open(path, "w") as results_file:
+            json.dump(results, results_file, indent=2)
+
+    print(f"{'route':<44}{'p50':>10}{'p95':>10}{'p99':>10}{'rps':>10}{'peak KB':>10}{'errors':>8}")
+    for route, stats in results["routes"].items():
+        print(f"{route:<44}{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+              f"{stats['throughput_rps']:>10}{stats['peak_memory_kb']:>10}{stats['errors']:>8}")
+
+    if baseline_path:
+        with open(baseline_path) as baseline_file:
+            regressions = compare_with_baseline(results, json.load(baseline_file), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import sqlite3
+
+from src.app.config.types import Role, AssetStatus
+from src.app.scripts.generate_data import SyntheticDataGenerator, USER_PASSWORD_PREFIX
+
+SCALES = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+BENCH_EMAIL = "user0@watchguard.com"
+BENCH_PASSWORD = f"{USER_PASSWORD_PREFIX}0"
+BENCH_SEED = 42
+POOL_SIZE = 10_000
+
+
+def seed_database(db_path: str, n_rows: int) -> dict:
+    """
+    Load `n_rows` users, assets and issues plus `n_rows // 2` assignments into `db_path` with the
+    deterministic generator, so every run at the same scale benchmarks identical data.
+    Requires n_rows >= 2.
+
+    Returns:
+        dict: ids of seeded rows the benchmark uses as request parameters.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        SyntheticDataGenerator(
+            seed=BENCH_SEED, users=n_rows, assets=n_rows, assignments=n_rows // 2, issues=n_rows
+        ).generate(conn)
+
+        admin_id = conn.execute("SELECT id FROM users WHERE role = ?", (Role.ADMIN.value,)).fetchone()[0]
+        # user0 is the heaviest holder thanks to the generator's skew
+        user_id = conn.execute("SELECT id FROM users WHERE email = ?", (BENCH_EMAIL,)).fetchone()[0]
+        assigned_asset_id = conn.execute(
+            "SELECT asset_id FROM assets_assigned WHERE user_id = ? ORDER BY asset_id LIMIT 1", (user_id,)
+        ).fetchone()[0]
+        # Rows without assignments that write benchmarks may assign or delete
+        available_asset_ids = [row[0] for row in conn.execute(
+            "SELECT serial_number FROM assets WHERE status = ? ORDER BY serial_number LIMIT ?",
+            (AssetStatus.AVAILABLE.value, POOL_SIZE)
+        )]
+        unassigned_user_ids = [row[0] for row in conn.execute(
+            "SELECT id FROM users WHERE role = ? AND id NOT IN (SELECT user_id FROM assets_assigned) "
+            "ORDER BY id LIMIT ?",
+            (Role.USER.value, POOL_SIZE)
+        )]
+    finally:
+        conn.close()
+
+    return {
+        "admin_id": admin_id,
+        "user_id": user_id,
+        "assigned_asset_id": assigned_asset_id,
+        "available_asset_ids": available_asset_ids,
+        "unassigned_user_ids": unassigned_user_ids,
+    }
@@ -0,0 +1,42 @@
+"""
+SQL-side JSON benchmark: encodes a large `assets` table as the `/assets` data array two ways and
+reports time and peak traced memory:
+    python   compiled `row_mapper` models, then FastJSONProvider.dumps_bytes
+    sqlite   json_group_array(json_object(...)) in the query, bytes used as they come
+
+Usage:
+    python -m benchmarks.sql_json --rows 200000
+"""
+import argparse
+import sys
+
+from flask import Flask
+
+from benchmarks.row_materialization import build_db, load_mapper, measure
+from src.app.repositories.asset_repository import ASSET_JSON_OBJECT
+from src.app.utils.json_provider import FastJSONProvider
+
+DEFAULT_ROWS = 200_000
+QUERY = f"SELECT json_group_array({ASSET_JSON_OBJECT}) FROM assets a"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark encoding assets as JSON in Python and in SQLite")
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    args = parser.parse_args(argv)
+
+    conn = build_db(args.rows)
+    provider = FastJSONProvider(Flask(__name__))
+    variants = (
+        ("python", lambda conn: provider.dumps_bytes(load_mapper(conn))),
+        ("sqlite", lambda conn: conn.execute(QUERY).fetchone()[0].encode("utf-8")),
+    )
+    print(f"{'variant':<10}{'ms':>10}{'peak MB':>10}")
+    for name, encode in variants:
+        stats = measure(encode, conn)
+        print(f"{name:<10}{stats['ms']:>10.1f}{stats['peak_mb']:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+
+import src.app.config.cache_config as cache_config
+import src.app.config.compression_config as compression_config
+import src.app.config.db_config as db_config
+import src.app.config.logging_config as logging_config
+import src.app.config.profiling_config as profiling_config
+import src.app.config.read_model_config as read_model_config
+import src.app.config.tracing_config as tracing_config
+import src.app.config.traffic_config as traffic_config
+
+BLUEPRINTS = ("users", "issues", "assets", "admin", "changes", "events", "caches", "stats")
+
+
+@dataclass
+class AppConfig:
+    """
+    Settings passed to `create_app()`. Defaults are read from the config modules when the object
+    is created, so callers override fields instead of patching module constants.
+    """
+    db_path: str = field(default_factory=lambda: db_config.DB)
+    # None or "" disables file logging
+    log_file: str = field(default_factory=lambda: logging_config.LOG_FILE)
+    trace_enabled: bool = field(default_factory=lambda: tracing_config.TRACE_ENABLED)
+    trace_file: str = field(default_factory=lambda: tracing_config.TRACE_FILE)
+    capture_enabled: bool = field(default_factory=lambda: traffic_config.CAPTURE_ENABLED)
+    capture_file: str = field(default_factory=lambda: traffic_config.CAPTURE_FILE)
+    sampler_enabled: bool = field(default_factory=lambda: profiling_config.SAMPLER_ENABLED)
+    profile_dir: str = field(default_factory=lambda: profiling_config.PROFILE_DIR)
+    # Byte budget of the admin list response cache; 0 disables it
+    response_cache_bytes: int = field(default_factory=lambda: cache_config.RESPONSE_CACHE_MAX_BYTES)
+    cache_coherence_enabled: bool = field(default_factory=lambda: cache_config.CACHE_COHERENCE_ENABLED)
+    # "local", "shared" or "" for none; see cache_config
+    object_cache_backend: str = field(default_factory=lambda: cache_config.OBJECT_CACHE_BACKEND)
+    # Memory divided across the registered caches; see CacheRegistry
+    cache_memory_budget_bytes: int = field(default_factory=lambda: cache_config.CACHE_MEMORY_BUDGET_BYTES)
+    compression_enabled: bool = field(default_factory=lambda: compression_config.COMPRESSION_ENABLED)
+    sql_json_enabled: bool = field(default_factory=lambda: db_config.SQL_JSON_ENABLED)
+    read_model_enabled: bool = field(default_factory=lambda: read_model_config.READ_MODEL_ENABLED)
+    # Route groups to register; the modules of the others are never imported
+    blueprints: tuple = BLUEPRINTS
+
+    @classmethod
+    def for_testing(cls, **overrides) -> "AppConfig":
+        """In-memory database, no log, trace or capture files"""
+        settings = {"db_path": ":memory:", "log_file": None, "trace_enabled": False, "capture_enabled": False}
+        settings.update(overrides)
+        return cls(**settings)
@@ -0,0 +1,26 @@
+# Response cache for the admin list endpoints; 0 disables it
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Larger responses are served but never cached
+RESPONSE_CACHE_MAX_ENTRY_BYTES = 8 * 1024 * 1024
+
+# How long a coalesced read waits for the identical call already in flight
+SINGLE_FLIGHT_TIMEOUT_SECONDS = 10.0
+
+# Drop in-process cache entries for tables written by other processes (see CacheCoherence)
+CACHE_COHERENCE_ENABLED = True
+# Minimum time between two coherence checks; 0 checks before every cache lookup
+COHERENCE_CHECK_INTERVAL_SECONDS = 0.0
+
+# Backend of the user, asset and verified-token caches: "local" (a copy per process), "shared"
+# (one shared-memory table per cache for every worker forked on the host) or "" (no caching)
+OBJECT_CACHE_BACKEND = "local"
+# Byte budget of a "local" cache not given one by the cache registry
+LOCAL_CACHE_MAX_BYTES = 16 * 1024 * 1024
+# Each shared cache takes SHARED_CACHE_SLOTS * SHARED_CACHE_SLOT_BYTES of shared memory
+SHARED_CACHE_SLOTS = 16_384
+SHARED_CACHE_SLOT_BYTES = 1024
+
+# Memory shared by the registered caches. Caches with a fixed size (the response cache, shared
+# memory tables) take theirs out of it first; the rest is divided in proportion to CACHE_SHARES
+CACHE_MEMORY_BUDGET_BYTES = 128 * 1024 * 1024
+CACHE_SHARES = {"tokens": 1, "users": 1, "assets": 2}
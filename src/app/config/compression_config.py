@@ -0,0 +1,7 @@
+# Response compression (gzip / deflate, negotiated from Accept-Encoding)
+COMPRESSION_ENABLED = True
+# Smaller bodies are sent as they are: the saving would not cover the CPU and header overhead
+COMPRESSION_MIN_BYTES = 1024
+# zlib level, 1 (fastest) to 9 (smallest)
+COMPRESSION_LEVEL = 6
+COMPRESSIBLE_MIMETYPES = ("application/json", "text/plain", "text/csv", "text/html")
@@ -1 +1,4 @@
-DB="C:\\Users\\pjalodiya\\PycharmProjects\\Asset-Management\\src\\app\\utils\\db\\asset_management.db"
\ No newline at end of file
+DB="C:\\Users\\pjalodiya\\PycharmProjects\\Asset-Management\\src\\app\\utils\\db\\asset_management.db"
+
+# Have SQLite encode the JSON of the large asset list endpoints, passed through as-is
+SQL_JSON_ENABLED = True
@@ -0,0 +1,21 @@
+# Server-Sent Events stream (GET /events)
+# Events buffered per subscriber; the oldest are dropped when a slow client falls behind
+EVENTS_QUEUE_SIZE = 256
+# Most changes replayed to a client resuming with Last-Event-ID; one further behind is sent reset
+EVENTS_REPLAY_LIMIT = 1024
+# How often each worker reads new changes from the changes log while it has subscribers; its own
+# writes are picked up at once
+EVENTS_POLL_SECONDS = 0.5
+# Changes read from the log per query
+EVENTS_POLL_BATCH = 256
+# A comment frame is sent after this long without events, keeping proxies from timing out
+EVENTS_HEARTBEAT_SECONDS = 15
+# Streams end after this long and the client reconnects, resuming from its Last-Event-ID. Kept
+# below the server's GRACEFUL_TIMEOUT so a draining worker's streams close before it is killed
+EVENTS_MAX_STREAM_SECONDS = 25
+# Reconnection delay suggested to clients
+EVENTS_RETRY_MS = 3000
+# Streams a worker serves at once. Each holds one of the worker's request threads for up to
+# EVENTS_MAX_STREAM_SECONDS, so this stays below THREADS_PER_WORKER to leave threads for other
+# requests; clients beyond it get a 503 and retry
+EVENTS_MAX_STREAMS = 4
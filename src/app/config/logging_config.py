@@ -0,0 +1,4 @@
+# Application log settings; an empty LOG_FILE disables file logging
+LOG_FILE = "app.log"
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
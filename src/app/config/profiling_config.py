@@ -0,0 +1,13 @@
+# On-demand request profiling settings
+PROFILE_DIR = "profiles"
+PROFILE_HEADER = "X-Profile"
+# Query parameter that profiles a request when set to 1, as in ?profile=1
+PROFILE_QUERY_PARAM = "profile"
+# Maximum number of profiled requests per rolling window
+PROFILE_RATE_LIMIT = 6
+PROFILE_RATE_WINDOW_SECONDS = 60
+
+# Continuous sampling profiler settings
+SAMPLER_ENABLED = False
+SAMPLER_INTERVAL_MS = 10
+SAMPLER_MAX_STACK_DEPTH = 64
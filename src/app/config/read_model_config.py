@@ -0,0 +1,4 @@
+# Serve asset reads from an in-process copy of assets and assignments
+READ_MODEL_ENABLED = False
+# Above this many pending changes the read model reloads instead of replaying the changes log
+READ_MODEL_MAX_REPLAY = 10_000
@@ -0,0 +1,11 @@
+# Paging of GET /assets/search and GET /issues/search
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+
+# Snippets: the best matching part of the text as HTML, SNIPPET_TOKENS tokens long, with the
+# matched terms between SNIPPET_OPEN and SNIPPET_CLOSE and SNIPPET_ELLIPSIS where the text was
+# cut. The text itself is HTML-escaped.
+SNIPPET_OPEN = "<mark>"
+SNIPPET_CLOSE = "</mark>"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 12
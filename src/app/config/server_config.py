@@ -0,0 +1,17 @@
+import os
+
+# Production prefork server settings (python -m src.app.server)
+HOST = "0.0.0.0"
+PORT = 5000
+# One worker process per core by default
+WORKERS = os.cpu_count() or 1
+THREADS_PER_WORKER = 8
+LISTEN_BACKLOG = 1024
+# Seconds a worker gets to finish in-flight requests on SIGTERM or reload before it is killed
+GRACEFUL_TIMEOUT = 30
+# Workers that die sooner than this after starting are restarted with a back-off
+MIN_WORKER_UPTIME = 1.0
+# Admin commands kept for workers to apply (see ControlBlock), and the largest encoded command
+CONTROL_COMMAND_SLOTS = 64
+CONTROL_COMMAND_BYTES = 512
+CONTROL_LOCK_TIMEOUT_SECONDS = 1.0
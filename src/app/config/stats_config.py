@@ -0,0 +1,3 @@
+# GET /stats lists the `top` assets with the most open issues
+STATS_DEFAULT_TOP = 10
+STATS_MAX_TOP = 100
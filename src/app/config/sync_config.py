@@ -0,0 +1,5 @@
+# Paging of GET /changes
+CHANGES_DEFAULT_LIMIT = 500
+CHANGES_MAX_LIMIT = 5000
+# Changes older than this are deleted by the prune_changes script; mirrors further behind resync in full
+CHANGES_RETENTION_DAYS = 7
@@ -0,0 +1,6 @@
+# Request tracing settings
+TRACE_ENABLED = True
+TRACE_FILE = "traces.jsonl"
+# Fraction of new traces (no incoming traceparent) that are recorded
+TRACE_SAMPLE_RATE = 0.1
+TRACE_SERVICE_NAME = "asset-management"
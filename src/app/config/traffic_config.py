@@ -0,0 +1,5 @@
+# Traffic capture settings (opt-in)
+CAPTURE_ENABLED = False
+CAPTURE_FILE = "traffic.jsonl"
+# Fraction of requests recorded while capture is enabled
+CAPTURE_SAMPLE_RATE = 1.0
@@ -0,0 +1,76 @@
+import os
+from dataclasses import dataclass
+
+from flask import request, Response
+from werkzeug.routing import ValidationError
+
+from src.app.models.request_objects import ProfilerSettingsRequest
+from src.app.models.response import CustomResponse
+from src.app.utils.errors.error import LockTimeoutError
+from src.app.utils.logger.custom_logger import custom_logger
+from src.app.utils.logger.logger import Logger
+from src.app.utils.profiler.sampling_profiler import SamplingProfiler
+from src.app.utils.tracing.tracer import traced
+from src.app.utils.utils import Utils
+from src.app.config.custom_error_codes import VALIDATION_ERROR, SYSTEM_ERROR
+
+
+@traced
+@dataclass
+class AdminHandler:
+    sampling_profiler: SamplingProfiler
+    logger = Logger()
+
+    @classmethod
+    def create(cls, sampling_profiler):
+        return cls(sampling_profiler)
+
+    @custom_logger(logger)
+    @Utils.admin
+    def get_profiler_status(self):
+        """
+        Sampler of the worker serving the request, whose pid the response carries. Every worker
+        samples its own requests; settings changed through update_profiler reach all of them.
+        """
+        return CustomResponse(
+            status_code=200,
+            message="Profiler status retrieved successfully",
+            data=self.sampling_profiler.status()
+        ).object_to_dict(), 200
+
+    @custom_logger(logger)
+    @Utils.admin
+    def update_profiler(self):
+        try:
+            settings = ProfilerSettingsRequest(request.get_json(silent=True))
+            self.sampling_profiler.configure(settings.enabled, settings.interval_ms, settings.reset)
+
+            return CustomResponse(
+                status_code=200,
+                message="Profiler updated successfully",
+                data=self.sampling_profiler.status()
+            ).object_to_dict(), 200
+
+        except ValidationError as e:
+            return CustomResponse(
+                status_code=VALIDATION_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except LockTimeoutError as e:
+            return CustomResponse(
+                status_code=SYSTEM_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 503, {"Retry-After": "1"}
+
+    @custom_logger(logger)
+    @Utils.admin
+    def get_profiler_stacks(self):
+        """
+        Folded stacks for flamegraph tools, optionally for a single endpoint, sampled by the worker
+        in X-Worker-Pid
+        """
+        folded = self.sampling_profiler.folded(request.args.get("endpoint"))
+        return Response(folded, mimetype="text/plain", headers={"X-Worker-Pid": str(os.getpid())})
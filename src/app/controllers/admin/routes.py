@@ -0,0 +1,26 @@
+from flask import Blueprint
+
+from src.app.controllers.admin.handlers import AdminHandler
+from src.app.middleware.middleware import auth_middleware
+from src.app.utils.profiler.sampling_profiler import SamplingProfiler
+
+
+def create_admin_routes(sampling_profiler: SamplingProfiler) -> Blueprint:
+    admin_routes_blueprint = Blueprint('admin', __name__)
+    admin_routes_blueprint.before_request(auth_middleware)
+    admin_handler = AdminHandler.create(sampling_profiler)
+
+    # Profiler routes
+    admin_routes_blueprint.add_url_rule(
+        '/admin/profiler', 'profiler_status', admin_handler.get_profiler_status, methods=['GET']
+    )
+
+    admin_routes_blueprint.add_url_rule(
+        '/admin/profiler', 'update_profiler', admin_handler.update_profiler, methods=['POST']
+    )
+
+    admin_routes_blueprint.add_url_rule(
+        '/admin/profiler/stacks', 'profiler_stacks', admin_handler.get_profiler_stacks, methods=['GET']
+    )
+
+    return admin_routes_blueprint
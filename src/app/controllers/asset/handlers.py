@@ -1,22 +1,32 @@
 from dataclasses import dataclass
 
-from flask import request, jsonify
+from flask import current_app, request, jsonify
 from werkzeug.routing import ValidationError
 
 from src.app.models.asset import Asset
 from src.app.models.asset_assigned import AssetAssigned
-from src.app.models.request_objects import AssetRequest, AssignAssetRequest, UnassignAssetRequest
+from src.app.models.request_objects import (
+    AssetRequest,
+    AssignAssetRequest,
+    UnassignAssetRequest,
+    SearchRequest,
+    AssetHolderRequest,
+    AssignmentHistoryRequest
+)
 from src.app.models.response import CustomResponse
 from src.app.services.asset_service import AssetService
+from src.app.utils.cache.response_cache import ResponseCache, cached_response
 from src.app.utils.errors.error import (
     ExistsError,
     NotExistsError,
     NotAssignedError,
     AlreadyAssignedError,
-    DatabaseError
+    DatabaseError,
+    MissingFieldError
 )
 from src.app.utils.logger.custom_logger import custom_logger
 from src.app.utils.logger.logger import Logger
+from src.app.utils.tracing.tracer import traced
 from src.app.utils.utils import Utils
 from src.app.utils.validators.validators import Validators
 
@@ -27,24 +37,38 @@ from src.app.config.custom_error_codes import (
     RECORD_NOT_FOUND_ERROR,
     ASSET_ALREADY_ASSIGNED_ERROR,
     ASSET_NOT_ASSIGNED_ERROR,
-    DATABASE_OPERATION_ERROR
+    DATABASE_OPERATION_ERROR,
+    MISSING_FIELD_ERROR
 )
 
+@traced
 @dataclass
 class AssetHandler:
     asset_service: AssetService
+    response_cache: ResponseCache = None
+    # Pass through JSON encoded by SQLite instead of serializing models
+    sql_json: bool = False
     logger = Logger()
 
     @classmethod
-    def create(cls, asset_service):
-        return cls(asset_service)
+    def create(cls, asset_service, response_cache=None, sql_json=False):
+        return cls(asset_service, response_cache, sql_json)
+
+    @staticmethod
+    def _json_response(message: str, data: bytes):
+        envelope = CustomResponse(status_code=200, message=message, data=None).object_to_dict()
+        return current_app.json.spliced_response(envelope, data), 200
 
     @custom_logger(logger)
     @Utils.admin
+    @cached_response("assets")
+    @Utils.conditional(lambda handler: handler.asset_service.get_assets_version())
     def get_assets(self):
         try:
-            results = self.asset_service.get_assets()
-            results = [result.__dict__ for result in results] if results else []
+            if self.sql_json:
+                return self._json_response("Assets retrieved successfully", self.asset_service.get_assets_json())
+
+            results = self.asset_service.get_assets() or []
 
             if results is not None:
                 return CustomResponse(
@@ -60,6 +84,121 @@ class AssetHandler:
                 data=None
             ).object_to_dict(), 500
 
+    @custom_logger(logger)
+    @Utils.admin
+    @cached_response("assets")
+    @Utils.conditional(lambda handler: handler.asset_service.get_assets_version())
+    def search_assets(self):
+        """
+        Full-text search over asset names and descriptions
+        """
+        try:
+            search = SearchRequest(request.args)
+            page = self.asset_service.search_assets(search.q, search.limit, search.offset)
+
+            return CustomResponse(
+                status_code=200,
+                message="Assets searched successfully",
+                data=page
+            ).object_to_dict(), 200
+
+        except ValidationError as e:
+            return CustomResponse(
+                status_code=VALIDATION_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except (DatabaseError, Exception) as e:
+            return CustomResponse(
+                status_code=DATABASE_OPERATION_ERROR,
+                message="Error searching assets",
+                data=None
+            ).object_to_dict(), 500
+
+    @custom_logger(logger)
+    @Utils.admin
+    def asset_holder(self, asset_id):
+        """
+        Who held an asset at a given time
+        """
+        try:
+            holder_request = AssetHolderRequest(asset_id, request.args)
+            holder = self.asset_service.get_holder_at(holder_request.asset_id, holder_request.at)
+
+            return CustomResponse(
+                status_code=200,
+                message="Asset holder retrieved successfully",
+                data=holder
+            ).object_to_dict(), 200
+
+        except ValidationError as e:
+            return CustomResponse(
+                status_code=VALIDATION_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except MissingFieldError as e:
+            return CustomResponse(
+                status_code=MISSING_FIELD_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except NotExistsError as e:
+            return CustomResponse(
+                status_code=RECORD_NOT_FOUND_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 404
+
+        except (DatabaseError, Exception) as e:
+            return CustomResponse(
+                status_code=DATABASE_OPERATION_ERROR,
+                message="Error fetching assignment history",
+                data=None
+            ).object_to_dict(), 500
+
+    @custom_logger(logger)
+    @Utils.admin
+    def user_assignment_history(self, user_id):
+        """
+        Every asset a user held during a time range
+        """
+        try:
+            history_request = AssignmentHistoryRequest(user_id, request.args)
+            history = self.asset_service.get_user_history(
+                history_request.user_id, history_request.start, history_request.end
+            ) or []
+
+            return CustomResponse(
+                status_code=200,
+                message="Assignment history retrieved successfully",
+                data=history
+            ).object_to_dict(), 200
+
+        except ValidationError as e:
+            return CustomResponse(
+                status_code=VALIDATION_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except MissingFieldError as e:
+            return CustomResponse(
+                status_code=MISSING_FIELD_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except (DatabaseError, Exception) as e:
+            return CustomResponse(
+                status_code=DATABASE_OPERATION_ERROR,
+                message="Error fetching assignment history",
+                data=None
+            ).object_to_dict(), 500
+
     @custom_logger(logger)
     @Utils.admin
     def add_asset(self):
@@ -78,7 +217,7 @@ class AssetHandler:
             return CustomResponse(
                 status_code=200,
                 message="Asset added successfully",
-                data=asset.__dict__
+                data=asset
             ).object_to_dict(), 200
 
         except ExistsError as e:
@@ -112,7 +251,7 @@ class AssetHandler:
                 return CustomResponse(
                     status_code=200,
                     message="Asset deleted successfully",
-                    data=deleted_asset.__dict__
+                    data=deleted_asset
                 ).object_to_dict(), 200
 
             else:
@@ -236,6 +375,10 @@ class AssetHandler:
         try:
             is_valid = Validators.is_valid_UUID(user_id)
             if is_valid:
+                if self.sql_json:
+                    return self._json_response("Assigned assets retrieved successfully",
+                                               self.asset_service.view_assigned_assets_json(user_id))
+
                 results = self.asset_service.view_assigned_assets(user_id)
 
                 if results is not None:
@@ -275,8 +418,14 @@ class AssetHandler:
 
     @custom_logger(logger)
     @Utils.admin
+    @cached_response("users", "assets_assigned")
+    @Utils.conditional(lambda handler: handler.asset_service.get_all_assigned_assets_version())
     def assigned_all_assets(self):
         try:
+            if self.sql_json:
+                return self._json_response("All assigned assets retrieved successfully",
+                                           self.asset_service.view_all_assigned_assets_json())
+
             results = self.asset_service.view_all_assigned_assets()
 
             if results is not None:
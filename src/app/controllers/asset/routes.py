@@ -10,12 +10,16 @@ from src.app.services.asset_issue_service import IssueService
 def create_asset_routes(asset_service: AssetService) -> Blueprint:
     asset_routes_blueprint = Blueprint('asset', __name__)
     asset_routes_blueprint.before_request(auth_middleware)
-    asset_handler = AssetHandler.create(asset_service)
+    asset_handler = AssetHandler.create(asset_service, asset_service.response_cache, asset_service.sql_json)
     # asset-related routes
     asset_routes_blueprint.add_url_rule(
         '/assets', 'assets', asset_handler.get_assets, methods=['GET']
     )
 
+    asset_routes_blueprint.add_url_rule(
+        '/assets/search', 'search_assets', asset_handler.search_assets, methods=['GET']
+    )
+
     asset_routes_blueprint.add_url_rule(
         '/add-asset', 'add-asset', asset_handler.add_asset, methods=['POST']
     )
@@ -40,4 +44,13 @@ def create_asset_routes(asset_service: AssetService) -> Blueprint:
         '/assigned-assets/all', 'all_assigned_assets', asset_handler.assigned_all_assets, methods=['GET']
     )
 
+    asset_routes_blueprint.add_url_rule(
+        '/assignment-history/assets/<asset_id>', 'asset_holder', asset_handler.asset_holder, methods=['GET']
+    )
+
+    asset_routes_blueprint.add_url_rule(
+        '/assignment-history/users/<user_id>', 'user_assignment_history', asset_handler.user_assignment_history,
+        methods=['GET']
+    )
+
     return asset_routes_blueprint
@@ -4,12 +4,14 @@ from dataclasses import dataclass
 from werkzeug.routing import ValidationError
 
 from src.app.models.asset_issue import Issue
-from src.app.models.request_objects import ReportIssueRequest
+from src.app.models.request_objects import ReportIssueRequest, SearchRequest
 from src.app.models.response import CustomResponse
 from src.app.services.asset_issue_service import IssueService
+from src.app.utils.cache.response_cache import ResponseCache, cached_response
 from src.app.utils.errors.error import NotExistsError, DatabaseError, NotAssignedError
 from src.app.utils.logger.custom_logger import custom_logger
 from src.app.utils.logger.logger import Logger
+from src.app.utils.tracing.tracer import traced
 from src.app.utils.utils import Utils
 from src.app.utils.validators.validators import Validators
 from src.app.config.custom_error_codes import (
@@ -21,14 +23,16 @@ from src.app.config.custom_error_codes import (
 )
 
 
+@traced
 @dataclass
 class IssueHandler:
     issue_service: IssueService
+    response_cache: ResponseCache = None
     logger = Logger()
 
     @classmethod
-    def create(cls, issue_service):
-        return cls(issue_service)
+    def create(cls, issue_service, response_cache=None):
+        return cls(issue_service, response_cache)
 
     @custom_logger(logger)
     def get_user_issues(self, user_id: str):
@@ -38,8 +42,7 @@ class IssueHandler:
         try:
             valid_id = Validators.is_valid_UUID(user_id)
             if valid_id:
-                issues = self.issue_service.get_user_issues(user_id)
-                issues = [issue.__dict__ for issue in issues] if issues else []
+                issues = self.issue_service.get_user_issues(user_id) or []
 
                 if issues is not None:
                     return CustomResponse(
@@ -71,10 +74,11 @@ class IssueHandler:
 
     @custom_logger(logger)
     @Utils.admin
+    @cached_response("issues")
+    @Utils.conditional(lambda handler: handler.issue_service.get_issues_version())
     def get_issues(self):
         try:
-            issues = self.issue_service.get_issues()
-            issues = [issue.__dict__ for issue in issues] if issues else []
+            issues = self.issue_service.get_issues() or []
 
             if issues is not None:
                 return CustomResponse(
@@ -90,6 +94,38 @@ class IssueHandler:
                 data=None
             ).object_to_dict(), 500
 
+    @custom_logger(logger)
+    @Utils.admin
+    @cached_response("issues")
+    @Utils.conditional(lambda handler: handler.issue_service.get_issues_version())
+    def search_issues(self):
+        """
+        Full-text search over issue descriptions
+        """
+        try:
+            search = SearchRequest(request.args)
+            page = self.issue_service.search_issues(search.q, search.limit, search.offset)
+
+            return CustomResponse(
+                status_code=200,
+                message="Issues searched successfully",
+                data=page
+            ).object_to_dict(), 200
+
+        except ValidationError as e:
+            return CustomResponse(
+                status_code=VALIDATION_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except (DatabaseError, Exception) as e:
+            return CustomResponse(
+                status_code=DATABASE_OPERATION_ERROR,
+                message="Error searching issues",
+                data=None
+            ).object_to_dict(), 500
+
     @custom_logger(logger)
     def report_issue(self):
         """
@@ -8,12 +8,16 @@ from src.app.services.asset_issue_service import IssueService
 def create_issue_routes(issue_service: IssueService) -> Blueprint:
     issue_routes_blueprint = Blueprint('asset_issue', __name__)
     issue_routes_blueprint.before_request(auth_middleware)
-    issue_handler = IssueHandler.create(issue_service)
+    issue_handler = IssueHandler.create(issue_service, issue_service.response_cache)
     # Issue-related routes
     issue_routes_blueprint.add_url_rule(
         '/report-issue', 'report_issue', issue_handler.report_issue, methods=['POST']
     )
 
+    issue_routes_blueprint.add_url_rule(
+        '/issues/search', 'search_issues', issue_handler.search_issues, methods=['GET']
+    )
+
     issue_routes_blueprint.add_url_rule(
         '/issues/<user_id>', 'get_user_issues', issue_handler.get_user_issues, methods=['GET']
     )
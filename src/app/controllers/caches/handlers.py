@@ -0,0 +1,99 @@
+import os
+from dataclasses import dataclass
+
+from flask import request, Response
+from werkzeug.routing import ValidationError
+
+from src.app.models.request_objects import CacheSettingsRequest
+from src.app.models.response import CustomResponse
+from src.app.utils.cache.registry import CacheRegistry
+from src.app.utils.errors.error import NotExistsError, InvalidOperationError, LockTimeoutError
+from src.app.utils.logger.custom_logger import custom_logger
+from src.app.utils.logger.logger import Logger
+from src.app.utils.tracing.tracer import traced
+from src.app.utils.utils import Utils
+from src.app.config.custom_error_codes import VALIDATION_ERROR, RECORD_NOT_FOUND_ERROR, SYSTEM_ERROR
+
+
+@traced
+@dataclass
+class CacheHandler:
+    cache_registry: CacheRegistry
+    logger = Logger()
+
+    @classmethod
+    def create(cls, cache_registry):
+        return cls(cache_registry)
+
+    @custom_logger(logger)
+    @Utils.admin
+    def get_caches(self):
+        """
+        Caches of the worker serving the request, whose pid the response carries. Every worker
+        has its own; resizes and flushes reach all of them.
+        """
+        return CustomResponse(
+            status_code=200,
+            message="Caches retrieved successfully",
+            data=self.cache_registry.stats()
+        ).object_to_dict(), 200
+
+    @custom_logger(logger)
+    @Utils.admin
+    def get_cache_metrics(self):
+        """
+        Counters of every cache in the Prometheus text format, for the worker in X-Worker-Pid
+        """
+        return Response(self.cache_registry.metrics(), mimetype="text/plain",
+                        headers={"X-Worker-Pid": str(os.getpid())})
+
+    @custom_logger(logger)
+    @Utils.admin
+    def get_cache(self, name):
+        try:
+            return CustomResponse(
+                status_code=200,
+                message="Cache retrieved successfully",
+                data={**self.cache_registry.cache_stats(name), "pid": os.getpid()}
+            ).object_to_dict(), 200
+
+        except NotExistsError as e:
+            return CustomResponse(
+                status_code=RECORD_NOT_FOUND_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 404
+
+    @custom_logger(logger)
+    @Utils.admin
+    def update_cache(self, name):
+        try:
+            settings = CacheSettingsRequest(request.get_json(silent=True))
+            self.cache_registry.update(name, settings.max_bytes, settings.flush)
+
+            return CustomResponse(
+                status_code=200,
+                message="Cache updated successfully",
+                data={**self.cache_registry.cache_stats(name), "pid": os.getpid()}
+            ).object_to_dict(), 200
+
+        except NotExistsError as e:
+            return CustomResponse(
+                status_code=RECORD_NOT_FOUND_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 404
+
+        except (ValidationError, InvalidOperationError) as e:
+            return CustomResponse(
+                status_code=VALIDATION_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except LockTimeoutError as e:
+            return CustomResponse(
+                status_code=SYSTEM_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 503, {"Retry-After": "1"}
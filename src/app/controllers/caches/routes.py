@@ -0,0 +1,29 @@
+from flask import Blueprint
+
+from src.app.controllers.caches.handlers import CacheHandler
+from src.app.middleware.middleware import auth_middleware
+from src.app.utils.cache.registry import CacheRegistry
+
+
+def create_cache_routes(cache_registry: CacheRegistry) -> Blueprint:
+    cache_routes_blueprint = Blueprint('caches', __name__)
+    cache_routes_blueprint.before_request(auth_middleware)
+    cache_handler = CacheHandler.create(cache_registry)
+
+    cache_routes_blueprint.add_url_rule(
+        '/admin/caches', 'get_caches', cache_handler.get_caches, methods=['GET']
+    )
+
+    cache_routes_blueprint.add_url_rule(
+        '/admin/caches/metrics', 'get_cache_metrics', cache_handler.get_cache_metrics, methods=['GET']
+    )
+
+    cache_routes_blueprint.add_url_rule(
+        '/admin/caches/<name>', 'get_cache', cache_handler.get_cache, methods=['GET']
+    )
+
+    cache_routes_blueprint.add_url_rule(
+        '/admin/caches/<name>', 'update_cache', cache_handler.update_cache, methods=['POST']
+    )
+
+    return cache_routes_blueprint
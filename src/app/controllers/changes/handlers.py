@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+from flask import request
+from werkzeug.routing import ValidationError
+
+from src.app.models.request_objects import ChangesRequest
+from src.app.models.response import CustomResponse
+from src.app.services.change_service import ChangeService
+from src.app.utils.errors.error import DatabaseError
+from src.app.utils.logger.custom_logger import custom_logger
+from src.app.utils.logger.logger import Logger
+from src.app.utils.tracing.tracer import traced
+from src.app.utils.utils import Utils
+from src.app.config.custom_error_codes import VALIDATION_ERROR, DATABASE_OPERATION_ERROR
+
+
+@traced
+@dataclass
+class ChangeHandler:
+    change_service: ChangeService
+    logger = Logger()
+
+    @classmethod
+    def create(cls, change_service):
+        return cls(change_service)
+
+    @custom_logger(logger)
+    @Utils.admin
+    def get_changes(self):
+        try:
+            changes_request = ChangesRequest(request.args)
+            page = self.change_service.get_changes(changes_request.since, changes_request.limit)
+
+            return CustomResponse(
+                status_code=200,
+                message="Changes retrieved successfully",
+                data=page
+            ).object_to_dict(), 200
+
+        except ValidationError as e:
+            return CustomResponse(
+                status_code=VALIDATION_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except (DatabaseError, Exception) as e:
+            return CustomResponse(
+                status_code=DATABASE_OPERATION_ERROR,
+                message="Error fetching changes",
+                data=None
+            ).object_to_dict(), 500
@@ -0,0 +1,18 @@
+from flask import Blueprint
+
+from src.app.controllers.changes.handlers import ChangeHandler
+from src.app.middleware.middleware import auth_middleware
+from src.app.services.change_service import ChangeService
+
+
+def create_change_routes(change_service: ChangeService) -> Blueprint:
+    change_routes_blueprint = Blueprint('changes', __name__)
+    change_routes_blueprint.before_request(auth_middleware)
+    change_handler = ChangeHandler.create(change_service)
+
+    # Delta sync for mirrors
+    change_routes_blueprint.add_url_rule(
+        '/changes', 'changes', change_handler.get_changes, methods=['GET']
+    )
+
+    return change_routes_blueprint
@@ -0,0 +1,78 @@
+import math
+import time
+from dataclasses import dataclass
+
+from flask import request, g, Response
+
+import src.app.config.events_config as config
+from src.app.models.response import CustomResponse
+from src.app.utils.errors.error import DatabaseError, StreamLimitError
+from src.app.utils.events.event_bus import EventBus, Subscription
+from src.app.utils.logger.custom_logger import custom_logger
+from src.app.utils.logger.logger import Logger
+from src.app.utils.tracing.tracer import traced
+from src.app.config.custom_error_codes import DATABASE_OPERATION_ERROR, SYSTEM_ERROR
+
+
+@traced
+@dataclass
+class EventHandler:
+    event_bus: EventBus
+    logger = Logger()
+
+    @classmethod
+    def create(cls, event_bus):
+        return cls(event_bus)
+
+    @custom_logger(logger)
+    def stream_events(self):
+        """
+        Server-Sent Events stream of the events visible to the caller's role. A reconnecting
+        client sends Last-Event-ID, to any worker, and first receives the events it missed.
+        """
+        last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+        try:
+            subscription = self.event_bus.subscribe(g.get("role"), g.get("user_id"), last_event_id)
+
+        except StreamLimitError as e:
+            return CustomResponse(
+                status_code=SYSTEM_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 503, {"Retry-After": str(math.ceil(config.EVENTS_RETRY_MS / 1000))}
+
+        except DatabaseError:
+            return CustomResponse(
+                status_code=DATABASE_OPERATION_ERROR,
+                message="Error reading the changes log",
+                data=None
+            ).object_to_dict(), 500
+
+        return Response(
+            self._frames(subscription),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    @staticmethod
+    def _frames(subscription: Subscription):
+        # Runs after the request context is gone, so everything it needs is on the subscription
+        try:
+            yield f"retry: {config.EVENTS_RETRY_MS}\n\n".encode("utf-8")
+            if subscription.reset:
+                # The missed events are no longer available; the client has to refetch its lists
+                yield b"event: reset\ndata: {}\n\n"
+
+            deadline = time.monotonic() + config.EVENTS_MAX_STREAM_SECONDS
+            while (remaining := deadline - time.monotonic()) > 0:
+                events = subscription.get(min(config.EVENTS_HEARTBEAT_SECONDS, remaining))
+                dropped = subscription.take_dropped()
+                if dropped:
+                    yield f"event: overflow\ndata: {{\"dropped\":{dropped}}}\n\n".encode("utf-8")
+                if events:
+                    yield b"".join(event.frame for event in events)
+                else:
+                    yield b": heartbeat\n\n"
+        finally:
+            # Also reached when the client disconnects and the server closes the generator
+            subscription.close()
@@ -0,0 +1,18 @@
+from flask import Blueprint
+
+from src.app.controllers.events.handlers import EventHandler
+from src.app.middleware.middleware import auth_middleware
+from src.app.utils.events.event_bus import EventBus
+
+
+def create_event_routes(event_bus: EventBus) -> Blueprint:
+    event_routes_blueprint = Blueprint('events', __name__)
+    event_routes_blueprint.before_request(auth_middleware)
+    event_handler = EventHandler.create(event_bus)
+
+    # Server-Sent Events stream
+    event_routes_blueprint.add_url_rule(
+        '/events', 'events', event_handler.stream_events, methods=['GET']
+    )
+
+    return event_routes_blueprint
@@ -1,42 +1,138 @@
+import importlib
+
 from flask import Flask
 
-from src.app.controllers.asset.routes import create_asset_routes
-from src.app.controllers.asset_issue.routes import create_issue_routes
-from src.app.controllers.users.routes import create_user_routes
-from src.app.repositories.asset_repository import AssetRepository
-from src.app.repositories.asset_issue_repository import IssueRepository
-from src.app.repositories.user_repository import UserRepository
-from src.app.services.asset_service import AssetService
-from src.app.services.asset_issue_service import IssueService
-from src.app.services.user_service import UserService
-from src.app.utils.db.db import DB
+from src.app.config.app_config import AppConfig
+
+# Blueprint name -> (routes module, factory). Route modules pull in their handlers, services and
+# repositories, so they are imported inside create_app() and only for the blueprints enabled.
+BLUEPRINT_ROUTES = {
+    "users": ("src.app.controllers.users.routes", "create_user_routes"),
+    "issues": ("src.app.controllers.asset_issue.routes", "create_issue_routes"),
+    "assets": ("src.app.controllers.asset.routes", "create_asset_routes"),
+    "admin": ("src.app.controllers.admin.routes", "create_admin_routes"),
+    "changes": ("src.app.controllers.changes.routes", "create_change_routes"),
+    "events": ("src.app.controllers.events.routes", "create_event_routes"),
+    "caches": ("src.app.controllers.caches.routes", "create_cache_routes"),
+    "stats": ("src.app.controllers.stats.routes", "create_stats_routes"),
+}
 
 
-def create_app():
+def create_app(config: AppConfig = None):
+    # Imported here rather than at module level so that importing this module stays cheap
+    from src.app.middleware.capture import TrafficRecorder, init_traffic_capture
+    from src.app.middleware.compression import Compressor, init_compression
+    from src.app.middleware.profiler import ProfilerMiddleware
+    from src.app.repositories.asset_read_model import AssetReadModel
+    from src.app.repositories.asset_repository import AssetRepository
+    from src.app.repositories.asset_issue_repository import IssueRepository
+    from src.app.repositories.user_repository import UserRepository
+    from src.app.repositories.change_repository import ChangeRepository
+    from src.app.repositories.stats_repository import StatsRepository
+    from src.app.services.asset_service import AssetService
+    from src.app.services.asset_issue_service import IssueService
+    from src.app.services.user_service import UserService
+    from src.app.services.change_service import ChangeService
+    from src.app.services.stats_service import StatsService
+    from src.app.utils.cache.coherence import CacheCoherence
+    from src.app.utils.cache.object_cache import VersionedCache, create_backend
+    from src.app.utils.cache.registry import CacheRegistry
+    from src.app.utils.cache.response_cache import ResponseCache
+    from src.app.utils.cache.single_flight import flights
+    import src.app.config.cache_config as cache_config
+    from src.app.utils.control_block import ControlBlock, init_control_block
+    from src.app.utils.db.db import DB
+    from src.app.utils.events.event_bus import EventBus
+    from src.app.utils.json_provider import FastJSONProvider
+    from src.app.utils.logger.logger import Logger
+    from src.app.utils.profiler.sampling_profiler import SamplingProfiler, init_sampling_profiler
+    from src.app.utils.tracing.tracer import Tracer, JsonlSpanExporter, init_tracing
+
+    config = config if config else AppConfig()
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    Logger().configure(config.log_file)
+
+    # Admin commands a worker is sent, replayed by every other worker before its next request
+    control_block = init_control_block(app, ControlBlock())
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, profile_dir=config.profile_dir)
+    init_tracing(app, Tracer(JsonlSpanExporter(config.trace_file), enabled=config.trace_enabled))
+    sampling_profiler = init_sampling_profiler(app, SamplingProfiler(control_block=control_block), enabled=config.sampler_enabled)
+    if config.capture_enabled:
+        init_traffic_capture(app, TrafficRecorder(config.capture_file))
+    if config.compression_enabled:
+        init_compression(app, Compressor())
 
-    db = DB()
+    db = DB(config.db_path)
 
     user_repository = UserRepository(db)
     issue_repository = IssueRepository(db)
     asset_repository = AssetRepository(db)
+    change_repository = ChangeRepository(db)
+    stats_repository = StatsRepository(db)
+    # Loaded here, before the server forks, so every worker starts from the master's copy
+    asset_read_model = None
+    if config.read_model_enabled:
+        asset_read_model = AssetReadModel(db)
+        asset_read_model.load()
 
-    user_service = UserService(user_repository)
-    asset_service = AssetService(asset_repository, user_service)
-    issue_service = IssueService(issue_repository, asset_service, user_service)
+    # Other workers' writes reach the in-process caches through the shared table_versions counters
+    coherence = None
+    if config.cache_coherence_enabled:
+        coherence = CacheCoherence(db)
+        coherence.register(flights.forget)
+    # Every cache below takes its memory out of one budget, and can be inspected, resized or
+    # flushed by name through /admin/caches
+    cache_registry = CacheRegistry(config.cache_memory_budget_bytes, control_block=control_block)
+    # Shared by the services, whose writes invalidate it, and the list handlers that read it
+    response_cache = cache_registry.register("responses", ResponseCache(config.response_cache_bytes, coherence=coherence))
 
-    # Register blueprints
-    app.register_blueprint(
-        create_user_routes(user_service)
-    )
+    def object_cache(name):
+        # Local caches are sized by the registry; shared memory tables have a fixed size
+        backend = create_backend(config.object_cache_backend, name)
+        if backend is not None:
+            share = cache_config.CACHE_SHARES.get(name, 1) if config.object_cache_backend == "local" else None
+            cache_registry.register(name, backend, share)
+        return backend
+
+    # Verified tokens, users and assets; the "shared" backend gives every worker one warm copy.
+    # User and asset entries are checked against the change counters, so they need coherence.
+    token_cache = object_cache("tokens")
+    if token_cache is not None:
+        app.extensions["token_cache"] = token_cache
+    user_cache = asset_cache = None
+    if coherence is not None and config.object_cache_backend:
+        user_cache = VersionedCache(object_cache("users"), ["users"], coherence)
+        if asset_read_model is None:
+            asset_cache = VersionedCache(object_cache("assets"), ["assets"], coherence)
+    # GET /events streams the changes log through it; service writes wake it up
+    event_bus = EventBus(change_repository)
 
-    app.register_blueprint(
-        create_issue_routes(issue_service)
-    )
+    user_service = UserService(user_repository, response_cache, event_bus, user_cache=user_cache)
+    asset_service = AssetService(asset_repository, user_service, response_cache, event_bus,
+                                 sql_json=config.sql_json_enabled, read_model=asset_read_model,
+                                 asset_cache=asset_cache)
+    issue_service = IssueService(issue_repository, asset_service, user_service, response_cache, event_bus)
+    change_service = ChangeService(change_repository)
+    stats_service = StatsService(stats_repository)
 
-    app.register_blueprint(
-        create_asset_routes(asset_service)
-    )
+    # Register blueprints
+    route_dependencies = {
+        "users": user_service,
+        "issues": issue_service,
+        "assets": asset_service,
+        "admin": sampling_profiler,
+        "changes": change_service,
+        "events": event_bus,
+        "caches": cache_registry,
+        "stats": stats_service,
+    }
+    for name in config.blueprints:
+        module_name, factory_name = BLUEPRINT_ROUTES[name]
+        create_routes = getattr(importlib.import_module(module_name), factory_name)
+        app.register_blueprint(
+            create_routes(route_dependencies[name])
+        )
 
     return app
 
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+from flask import request
+from werkzeug.routing import ValidationError
+
+from src.app.models.request_objects import StatsRequest
+from src.app.models.response import CustomResponse
+from src.app.services.stats_service import StatsService
+from src.app.utils.errors.error import DatabaseError
+from src.app.utils.logger.custom_logger import custom_logger
+from src.app.utils.logger.logger import Logger
+from src.app.utils.tracing.tracer import traced
+from src.app.utils.utils import Utils
+from src.app.config.custom_error_codes import VALIDATION_ERROR, DATABASE_OPERATION_ERROR
+
+
+@traced
+@dataclass
+class StatsHandler:
+    stats_service: StatsService
+    logger = Logger()
+
+    @classmethod
+    def create(cls, stats_service):
+        return cls(stats_service)
+
+    @custom_logger(logger)
+    @Utils.admin
+    def get_stats(self):
+        try:
+            stats_request = StatsRequest(request.args)
+
+            return CustomResponse(
+                status_code=200,
+                message="Stats retrieved successfully",
+                data=self.stats_service.get_stats(stats_request.top)
+            ).object_to_dict(), 200
+
+        except ValidationError as e:
+            return CustomResponse(
+                status_code=VALIDATION_ERROR,
+                message=str(e),
+                data=None
+            ).object_to_dict(), 400
+
+        except (DatabaseError, Exception) as e:
+            return CustomResponse(
+                status_code=DATABASE_OPERATION_ERROR,
+                message="Error fetching stats",
+                data=None
+            ).object_to_dict(), 500
@@ -0,0 +1,18 @@
+from flask import Blueprint
+
+from src.app.controllers.stats.handlers import StatsHandler
+from src.app.middleware.middleware import auth_middleware
+from src.app.services.stats_service import StatsService
+
+
+def create_stats_routes(stats_service: StatsService) -> Blueprint:
+    stats_routes_blueprint = Blueprint('stats', __name__)
+    stats_routes_blueprint.before_request(auth_middleware)
+    stats_handler = StatsHandler.create(stats_service)
+
+    # Dashboard counts
+    stats_routes_blueprint.add_url_rule(
+        '/stats', 'stats', stats_handler.get_stats, methods=['GET']
+    )
+
+    return stats_routes_blueprint
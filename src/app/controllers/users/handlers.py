@@ -6,9 +6,11 @@ from src.app.models.request_objects import LoginRequest, SignupRequest
 from src.app.models.response import CustomResponse
 from src.app.models.user import User
 from src.app.services.user_service import UserService
+from src.app.utils.cache.response_cache import ResponseCache, cached_response
 from src.app.utils.logger.custom_logger import custom_logger
 from src.app.utils.utils import Utils
 from src.app.utils.logger.logger import Logger
+from src.app.utils.tracing.tracer import traced
 from src.app.utils.errors.error import (
     UserExistsError,
     InvalidCredentialsError, MissingFieldError, DatabaseError,
@@ -26,14 +28,16 @@ from src.app.config.custom_error_codes import (
     USER_NOT_FOUND_ERROR
 )
 
+@traced
 @dataclass
 class UserHandler:
     user_service: UserService
+    response_cache: ResponseCache = None
     logger = Logger()
 
     @classmethod
-    def create(cls, user_service):
-        return cls(user_service)
+    def create(cls, user_service, response_cache=None):
+        return cls(user_service, response_cache)
 
     @custom_logger(logger)
     def login(self):
@@ -136,10 +140,10 @@ class UserHandler:
 
     @custom_logger(logger)
     @Utils.admin
+    @cached_response("users")
     def get_users(self):
         try:
-            results = self.user_service.get_users()
-            results = [result.__dict__ for result in results] if results else []
+            results = self.user_service.get_users() or []
 
             if results is not None:
                 return CustomResponse(
@@ -158,7 +162,7 @@ class UserHandler:
     @custom_logger(logger)
     def get_user(self, user_id: str):
         try:
-            result = self.user_service.get_user_by_id(user_id).__dict__
+            result = self.user_service.get_user_by_id(user_id)
 
             if result is not None:
                 return CustomResponse(
@@ -8,7 +8,7 @@ from src.app.services.user_service import UserService
 def create_user_routes(user_service: UserService) -> Blueprint:
     user_routes_blueprint = Blueprint('user_routes', __name__)
     user_routes_blueprint.before_request(auth_middleware)
-    user_handler = UserHandler.create(user_service)
+    user_handler = UserHandler.create(user_service, user_service.response_cache)
 
     # Authentication routes
     user_routes_blueprint.add_url_rule(
@@ -0,0 +1,63 @@
+import json
+import random
+import time
+from threading import Lock
+
+from flask import Flask, request, g
+
+import src.app.config.traffic_config as config
+from src.app.utils.logger.logger import Logger
+
+
+class TrafficRecorder:
+    """
+    Appends one sanitized JSON record per request to a JSONL file, for replay with
+    `src.app.scripts.replay_traffic`. Tokens are never recorded; only the user id and role
+    they carried, so the replay driver can mint fresh ones.
+    """
+
+    def __init__(self, path: str = None, sample_rate: float = None):
+        self.path = path if path else config.CAPTURE_FILE
+        self.sample_rate = config.CAPTURE_SAMPLE_RATE if sample_rate is None else sample_rate
+        self._lock = Lock()
+
+    def should_record(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def record(self, entry: dict):
+        line = json.dumps(entry, separators=(",", ":"), default=str)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as capture_file:
+                capture_file.write(line + "\n")
+
+
+def init_traffic_capture(app: Flask, recorder: TrafficRecorder):
+    """Register request hooks recording every (sampled) request and its timing"""
+    logger = Logger()
+
+    @app.before_request
+    def start_capture():
+        if recorder.should_record():
+            g.capture_started = time.perf_counter()
+
+    @app.after_request
+    def capture_request(response):
+        started = g.get("capture_started")
+        if started is None:
+            return response
+
+        recorder.record({
+            "ts": time.time(),
+            "method": request.method,
+            "path": request.path,
+            "query": request.query_string.decode("utf-8", "replace"),
+            "route": request.url_rule.rule if request.url_rule else None,
+            "body": logger.sanitize_body(request.get_json(silent=True)),
+            "user_id": g.get("user_id"),
+            "role": g.get("role"),
+            "status": response.status_code,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        })
+        return response
+
+    return recorder
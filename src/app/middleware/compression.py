@@ -0,0 +1,64 @@
+import gzip
+import zlib
+
+from flask import Flask, request, g, Response
+
+import src.app.config.compression_config as config
+
+# In order of preference when the client accepts both equally
+ENCODINGS = ("gzip", "deflate")
+
+
+class Compressor:
+    def __init__(self, min_size: int = None, level: int = None, mimetypes: tuple = None):
+        self.min_size = config.COMPRESSION_MIN_BYTES if min_size is None else min_size
+        self.level = config.COMPRESSION_LEVEL if level is None else level
+        self.mimetypes = frozenset(config.COMPRESSIBLE_MIMETYPES if mimetypes is None else mimetypes)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "gzip":
+            # mtime=0 keeps the output identical for identical bodies
+            return gzip.compress(body, compresslevel=self.level, mtime=0)
+        return zlib.compress(body, self.level)
+
+    def should_compress(self, response: Response) -> bool:
+        return (
+            response.status_code == 200
+            and response.mimetype in self.mimetypes
+            # Streams (the event stream included) are never buffered here
+            and not response.is_streamed
+            and not response.direct_passthrough
+            and "Content-Encoding" not in response.headers
+            and (response.content_length or 0) >= self.min_size
+        )
+
+
+def init_compression(app: Flask, compressor: Compressor):
+    """Register a hook compressing response bodies for clients that accept gzip or deflate"""
+
+    @app.after_request
+    def compress_response(response):
+        if response.mimetype in compressor.mimetypes:
+            response.vary.add("Accept-Encoding")
+        if not compressor.should_compress(response):
+            return response
+        encoding = request.accept_encodings.best_match(ENCODINGS)
+        if encoding is None:
+            return response
+
+        # A cached response is compressed once per encoding and the result kept with it
+        cached = g.get("cached_response")
+        if cached is not None:
+            cache, key, entry = cached
+            body = entry.encoded.get(encoding)
+            if body is None:
+                body = compressor.compress(entry.body, encoding)
+                cache.add_encoding(key, entry, encoding, body)
+        else:
+            body = compressor.compress(response.get_data(), encoding)
+
+        response.set_data(body)
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    return compressor
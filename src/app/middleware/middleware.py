@@ -1,11 +1,36 @@
-import jwt
-from flask import request, jsonify, g
+import hashlib
+import time
+
+from flask import current_app, request, jsonify, g
 
 from src.app.config.custom_error_codes import INVALID_TOKEN_ERROR, INVALID_TOKEN_PAYLOAD_ERROR, EXPIRED_TOKEN_ERROR
 from src.app.models.response import CustomResponse
+from src.app.utils.tracing.tracer import trace_function
 from src.app.utils.utils import Utils
 
+def verify_token(token: str) -> dict:
+    """
+    Claims of a valid token. Tokens already verified are served from the app's token cache, if
+    it has one, until they expire, sparing the signature check.
+    """
+    token_cache = current_app.extensions.get("token_cache")
+    if token_cache is None:
+        return Utils.decode_jwt_token(token)
+
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    claims = token_cache.get(key)
+    if claims is None:
+        claims = Utils.decode_jwt_token(token)
+        ttl = claims.get("exp", 0) - time.time()
+        if ttl > 0:
+            token_cache.set(key, claims, ttl=ttl)
+    return claims
+
+
+@trace_function("auth_middleware")
 def auth_middleware():
+    import jwt
+
     if request.path in ['/login', '/signup']:
         return None
 
@@ -20,7 +45,7 @@ def auth_middleware():
     token = auth_token.split(' ')[1]
     try:
         # Decode the token using the secret key
-        decoded_token = Utils.decode_jwt_token(token)
+        decoded_token = verify_token(token)
 
         # Extract user_id and role from the decoded token
         user_id = decoded_token.get("user_id")
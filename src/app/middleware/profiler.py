@@ -0,0 +1,125 @@
+import cProfile
+import os
+import time
+import uuid
+from collections import deque
+from threading import Lock
+from urllib.parse import parse_qs
+
+from werkzeug.wsgi import FileWrapper
+
+import src.app.config.profiling_config as config
+from src.app.config.types import Role
+from src.app.utils.utils import Utils
+
+
+class ProfilerMiddleware:
+    """
+    WSGI middleware that runs a single request under cProfile when an admin asks for it
+    with the `X-Profile: 1` header (or a `profile=1` query flag).
+
+    The whole Flask request (before_request hooks, handler and response building) is profiled,
+    the stats are dumped to `<profile_dir>/<profile_id>.prof` and the id is returned in the
+    `X-Profile-Id` response header. A streamed body is not generated under the profiler.
+    Requests without the flag only pay for one environ lookup.
+    """
+    HEADER_ENVIRON_KEY = "HTTP_" + config.PROFILE_HEADER.upper().replace("-", "_")
+
+    def __init__(self, wsgi_app, profile_dir: str = config.PROFILE_DIR,
+                 rate_limit: int = config.PROFILE_RATE_LIMIT,
+                 rate_window: float = config.PROFILE_RATE_WINDOW_SECONDS):
+        self.wsgi_app = wsgi_app
+        self.profile_dir = profile_dir
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self._recent_profiles = deque()
+        self._lock = Lock()
+
+    def __call__(self, environ, start_response):
+        if environ.get(self.HEADER_ENVIRON_KEY) != "1" and not self._query_flag(environ.get("QUERY_STRING", "")):
+            return self.wsgi_app(environ, start_response)
+
+        if not self._is_admin(environ):
+            return self.wsgi_app(environ, start_response)
+
+        if not self._acquire_slot():
+            return self.wsgi_app(environ, self._with_headers(start_response, [("X-Profile-Status", "rate-limited")]))
+
+        return self._profile(environ, start_response)
+
+    @staticmethod
+    def _query_flag(query_string: str) -> bool:
+        # The substring test spares parsing the query of almost every request
+        if config.PROFILE_QUERY_PARAM not in query_string:
+            return False
+        return "1" in parse_qs(query_string).get(config.PROFILE_QUERY_PARAM, [])
+
+    @staticmethod
+    def _is_admin(environ) -> bool:
+        auth_token = environ.get("HTTP_AUTHORIZATION", "")
+        if not auth_token.startswith("Bearer "):
+            return False
+        import jwt
+
+        try:
+            return Utils.decode_jwt_token(auth_token.split(" ")[1]).get("role") == Role.ADMIN.value
+        except jwt.InvalidTokenError:
+            return False
+
+    def _acquire_slot(self) -> bool:
+        """Sliding-window rate limit on the number of profiled requests"""
+        now = time.monotonic()
+        with self._lock:
+            while self._recent_profiles and now - self._recent_profiles[0] > self.rate_window:
+                self._recent_profiles.popleft()
+            if len(self._recent_profiles) >= self.rate_limit:
+                return False
+            self._recent_profiles.append(now)
+            return True
+
+    @staticmethod
+    def _with_headers(start_response, extra_headers):
+        def wrapped_start_response(status, headers, exc_info=None):
+            return start_response(status, list(headers) + extra_headers, exc_info)
+
+        return wrapped_start_response
+
+    @staticmethod
+    def _is_streamed(environ, headers, app_iter) -> bool:
+        """An event stream, a file sent as is, or a generated body of unknown length"""
+        headers = {name.lower(): value for name, value in headers}
+        if headers.get("content-type", "").startswith("text/event-stream") or "content-length" not in headers:
+            return True
+        file_wrapper = environ.get("wsgi.file_wrapper", FileWrapper)
+        if isinstance(file_wrapper, type) and isinstance(app_iter, file_wrapper):
+            return True
+        return isinstance(app_iter, FileWrapper)
+
+    def _profile(self, environ, start_response):
+        profile_id = str(uuid.uuid4())
+        profiler = cProfile.Profile()
+        response_headers = []
+
+        def wrapped_start_response(status, headers, exc_info=None):
+            response_headers[:] = headers
+            return start_response(status, list(headers) + [("X-Profile-Id", profile_id)], exc_info)
+
+        profiler.enable()
+        try:
+            app_iter = self.wsgi_app(environ, wrapped_start_response)
+            # A streamed body is left to the server: buffering it would hold an event stream open
+            # until it ends and keep a whole file in memory
+            if self._is_streamed(environ, response_headers, app_iter):
+                return app_iter
+            # Materialize the body so response generation is part of the profile
+            try:
+                body = list(app_iter)
+            finally:
+                if hasattr(app_iter, "close"):
+                    app_iter.close()
+        finally:
+            profiler.disable()
+            os.makedirs(self.profile_dir, exist_ok=True)
+            profiler.dump_stats(os.path.join(self.profile_dir, f"{profile_id}.prof"))
+
+        return body
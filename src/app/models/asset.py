@@ -1,16 +1,16 @@
 import uuid
+from dataclasses import dataclass
 from typing import Optional
 from src.app.config.types import AssetStatus
 
+
+@dataclass(slots=True)
 class Asset:
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        serial_number: str = None,
-        status: str = AssetStatus.AVAILABLE.value
-    ):
-        self.serial_number = serial_number if serial_number else str(uuid.uuid4())
-        self.name = name
-        self.description = description
-        self.status = status
+    name: str
+    description: str
+    serial_number: Optional[str] = None
+    status: str = AssetStatus.AVAILABLE.value
+
+    def __post_init__(self):
+        if not self.serial_number:
+            self.serial_number = str(uuid.uuid4())
@@ -1,16 +1,18 @@
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Optional
 
 
+@dataclass(slots=True)
 class AssetAssigned:
-    def __init__(
-        self,
-        user_id: str,
-        asset_id: str,
-        asset_assigned_id: str = None,
-        assigned_date: datetime = None
-    ):
-        self.asset_assigned_id = asset_assigned_id if asset_assigned_id else str(uuid.uuid4())
-        self.user_id = user_id
-        self.asset_id = asset_id
-        self.assigned_date = assigned_date if assigned_date else datetime.now(timezone.utc)
+    user_id: str
+    asset_id: str
+    asset_assigned_id: Optional[str] = None
+    assigned_date: Optional[datetime] = None
+
+    def __post_init__(self):
+        if not self.asset_assigned_id:
+            self.asset_assigned_id = str(uuid.uuid4())
+        if not self.assigned_date:
+            self.assigned_date = datetime.now(timezone.utc)
@@ -3,19 +3,17 @@ from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime, timezone
 
-@dataclass
+
+@dataclass(slots=True)
 class Issue:
+    asset_id: str
+    description: str
+    user_id: Optional[str] = None
+    issue_id: Optional[str] = None
+    report_date: Optional[datetime] = None
 
-    def __init__(
-        self,
-        asset_id: str,
-        description: str,
-        user_id: Optional[str] = None,
-        issue_id: Optional[str] = None,
-        report_date: Optional[datetime] = None,
-    ):
-        self.issue_id = issue_id if issue_id else str(uuid.uuid4())
-        self.user_id = user_id
-        self.asset_id = asset_id
-        self.description = description
-        self.report_date = report_date if report_date else datetime.now(timezone.utc)
\ No newline at end of file
+    def __post_init__(self):
+        if not self.issue_id:
+            self.issue_id = str(uuid.uuid4())
+        if not self.report_date:
+            self.report_date = datetime.now(timezone.utc)
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class AssignmentHistory:
+    asset_assigned_id: str
+    asset_id: str
+    user_id: str
+    # UTC, "YYYY-MM-DD HH:MM:SS.SSS"
+    assigned_at: str
+    # None while the user still holds the asset
+    returned_at: Optional[str] = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class Change:
+    version: int
+    table_name: str
+    operation: str
+    row_id: str
+    # The row after the change; None for deletes
+    data: Optional[dict]
+    changed_at: str
@@ -1,5 +1,10 @@
+from datetime import datetime, timezone
+
 from werkzeug.routing import ValidationError
 
+import src.app.config.search_config as search_config
+import src.app.config.stats_config as stats_config
+import src.app.config.sync_config as sync_config
 from src.app.utils.errors.error import MissingFieldError
 from src.app.utils.validators.validators import Validators
 
@@ -92,3 +97,114 @@ class UnassignAssetRequest:
             raise ValidationError('Invalid user id')
         if not Validators.is_valid_UUID(self.asset_id):
             raise ValidationError('Invalid asset id')
+
+
+class ProfilerSettingsRequest:
+    def __init__(self, data):
+        if not isinstance(data, dict):
+            raise ValidationError('Request body must be a JSON object')
+
+        self.enabled = data.get('enabled')
+        self.interval_ms = data.get('interval_ms')
+        self.reset = data.get('reset', False)
+
+        if self.enabled is not None and not isinstance(self.enabled, bool):
+            raise ValidationError('enabled must be a boolean')
+        if self.interval_ms is not None and (
+                isinstance(self.interval_ms, bool) or not isinstance(self.interval_ms, (int, float))
+                or self.interval_ms <= 0):
+            raise ValidationError('interval_ms must be a positive number')
+        if not isinstance(self.reset, bool):
+            raise ValidationError('reset must be a boolean')
+
+
+class ChangesRequest:
+    def __init__(self, args):
+        try:
+            self.since = int(args.get('since', 0))
+            self.limit = int(args.get('limit', sync_config.CHANGES_DEFAULT_LIMIT))
+        except ValueError:
+            raise ValidationError('since and limit must be integers')
+
+        if self.since < 0:
+            raise ValidationError('since cannot be negative')
+        if not 1 <= self.limit <= sync_config.CHANGES_MAX_LIMIT:
+            raise ValidationError(f'limit must be between 1 and {sync_config.CHANGES_MAX_LIMIT}')
+
+
+class SearchRequest:
+    def __init__(self, args):
+        self.q = args.get('q', '').strip()
+        try:
+            self.limit = int(args.get('limit', search_config.SEARCH_DEFAULT_LIMIT))
+            self.offset = int(args.get('offset', 0))
+        except ValueError:
+            raise ValidationError('limit and offset must be integers')
+
+        if not self.q:
+            raise ValidationError('q is required')
+        if self.offset < 0:
+            raise ValidationError('offset cannot be negative')
+        if not 1 <= self.limit <= search_config.SEARCH_MAX_LIMIT:
+            raise ValidationError(f'limit must be between 1 and {search_config.SEARCH_MAX_LIMIT}')
+
+
+class CacheSettingsRequest:
+    def __init__(self, data):
+        if not isinstance(data, dict):
+            raise ValidationError('Request body must be a JSON object')
+
+        self.max_bytes = data.get('max_bytes')
+        self.flush = data.get('flush', False)
+
+        if self.max_bytes is not None and (
+                isinstance(self.max_bytes, bool) or not isinstance(self.max_bytes, int) or self.max_bytes < 0):
+            raise ValidationError('max_bytes must be a non-negative integer')
+        if not isinstance(self.flush, bool):
+            raise ValidationError('flush must be a boolean')
+
+
+class StatsRequest:
+    def __init__(self, args):
+        try:
+            self.top = int(args.get('top', stats_config.STATS_DEFAULT_TOP))
+        except ValueError:
+            raise ValidationError('top must be an integer')
+
+        if not 0 <= self.top <= stats_config.STATS_MAX_TOP:
+            raise ValidationError(f'top must be between 0 and {stats_config.STATS_MAX_TOP}')
+
+
+def _history_time(args, name: str) -> str:
+    """Query parameter `name` as an ISO 8601 time, in the UTC format of the assignment history"""
+    value = args.get(name)
+    if not value:
+        raise MissingFieldError(f"Missing query parameter: {name}")
+    try:
+        time = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f'{name} must be an ISO 8601 date or time')
+    # Times without an offset are taken as UTC, like the stored ones
+    if time.tzinfo is not None:
+        time = time.astimezone(timezone.utc)
+    return time.strftime("%Y-%m-%d %H:%M:%S.") + f"{time.microsecond // 1000:03d}"
+
+
+class AssetHolderRequest:
+    def __init__(self, asset_id, args):
+        if not Validators.is_valid_UUID(asset_id):
+            raise ValidationError('Invalid asset id')
+        self.asset_id = asset_id
+        self.at = _history_time(args, 'at')
+
+
+class AssignmentHistoryRequest:
+    def __init__(self, user_id, args):
+        if not Validators.is_valid_UUID(user_id):
+            raise ValidationError('Invalid user id')
+        self.user_id = user_id
+        self.start = _history_time(args, 'from')
+        self.end = _history_time(args, 'to')
+
+        if self.start > self.end:
+            raise ValidationError('from must not be after to')
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class AssetSearchResult:
+    serial_number: str
+    name: str
+    description: Optional[str]
+    status: str
+    # Matched terms highlighted; see search_config
+    snippet: str
+    # BM25 score, lower is more relevant
+    rank: float
+
+
+@dataclass(slots=True)
+class IssueSearchResult:
+    issue_id: str
+    user_id: str
+    asset_id: str
+    description: str
+    report_date: datetime
+    snippet: str
+    rank: float
@@ -1,9 +1,12 @@
 import uuid
-from typing import Optional
-from src.app.config.types import Role, AssetStatus
+from dataclasses import dataclass
+from src.app.config.types import Role
 
 
 class User:
+    # Deliberately not a dataclass: it carries the password hash and must never be serialized
+    __slots__ = ("id", "name", "email", "department", "password", "role")
+
     def __init__(
             self,
             name: str,
@@ -21,15 +24,9 @@ class User:
         self.role = role
 
 
+@dataclass(slots=True)
 class UserDTO:
-    def __init__(
-            self,
-            id: str,
-            name: str,
-            email: str,
-            department: str,
-    ):
-        self.id = id
-        self.name = name
-        self.email = email
-        self.department = department
+    id: str
+    name: str
+    email: str
+    department: str
@@ -3,10 +3,18 @@ from typing import List
 
 from src.app.config.db_config import DB
 from src.app.models.asset_issue import Issue
+from src.app.models.search_result import IssueSearchResult
 from src.app.utils.errors.error import DatabaseError
+from src.app.utils.db.fts import match_expression, snippet, highlight
 from src.app.utils.db.query_builder import GenericQueryBuilder
+from src.app.utils.db.row_mapper import row_mapper
+from src.app.utils.db.table_versions import fetch_table_versions
+from src.app.utils.tracing.tracer import traced
 
+ISSUE_COLUMNS = ["issue_id", "user_id", "asset_id", "description", "report_date"]
+ISSUE_SEARCH_COLUMNS = ISSUE_COLUMNS + ["snippet", "rank"]
 
+@traced
 class IssueRepository:
     def __init__(self, database: DB):
         self.db = database
@@ -36,20 +44,10 @@ class IssueRepository:
             conn = self.db.get_connection()
             with conn:
                 cursor = conn.cursor()
-                columns = ["issue_id", "user_id", "asset_id", "description", "report_date"]
-                query, values = GenericQueryBuilder.select("issues", columns=columns)
+                cursor.row_factory = row_mapper(Issue, ISSUE_COLUMNS)
+                query, values = GenericQueryBuilder.select("issues", columns=ISSUE_COLUMNS)
                 cursor.execute(query, values)
-                results = cursor.fetchall()
-
-            return [
-                Issue(
-                    issue_id=row[0],
-                    user_id=row[1],
-                    asset_id=row[2],
-                    description=row[3],
-                    report_date=row[4],
-                ) for row in results
-            ]
+                return cursor.fetchall()
 
         except Exception as e:
             raise DatabaseError(f"Error retrieving user issues: {str(e)}")
@@ -60,25 +58,56 @@ class IssueRepository:
             conn = self.db.get_connection()
             with conn:
                 cursor = conn.cursor()
-                columns = ["issue_id", "user_id", "asset_id", "description", "report_date"]
+                cursor.row_factory = row_mapper(Issue, ISSUE_COLUMNS)
                 where_clause = {"user_id": user_id}
                 query, values = GenericQueryBuilder.select(
                     "issues",
-                    columns=columns,
+                    columns=ISSUE_COLUMNS,
                     where=where_clause
                 )
                 cursor.execute(query, values)
+                return cursor.fetchall()
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving user issues: {str(e)}")
+
+    def search_issues(self, text: str, limit: int, offset: int) -> List[IssueSearchResult]:
+        """Issues whose description matches the words of `text`, most relevant first"""
+        expression = match_expression(text)
+        if expression is None:
+            return []
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.row_factory = row_mapper(IssueSearchResult, ISSUE_SEARCH_COLUMNS)
+                # Ranked in the index; only the page's rows are then read from issues, by rowid
+                cursor.execute(f'''
+                    SELECT i.issue_id, i.user_id, i.asset_id, i.description, i.report_date, m.snippet, m.rank
+                    FROM (
+                        SELECT rowid, {snippet("issues_fts", 0)} AS snippet, rank
+                        FROM issues_fts
+                        WHERE issues_fts MATCH ?
+                        ORDER BY rank
+                        LIMIT ? OFFSET ?
+                    ) AS m
+                    JOIN issues i ON i.rowid = m.rowid
+                    ORDER BY m.rank
+                ''', (expression, limit, offset))
                 results = cursor.fetchall()
 
-                return [
-                    Issue(
-                        issue_id=row[0],
-                        user_id=row[1],
-                        asset_id=row[2],
-                        description=row[3],
-                        report_date=row[4],
-                    ) for row in results
-                ]
+            for result in results:
+                result.snippet = highlight(result.snippet)
+            return results
 
         except Exception as e:
-            raise DatabaseError(f"Error retrieving user issues: {str(e)}")
+            raise DatabaseError(f"Error searching issues: {str(e)}")
+
+    def fetch_table_versions(self, tables: List[str]) -> tuple:
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                return fetch_table_versions(conn, tables)
+
+        except Exception as e:
+            raise DatabaseError(f"Failed to fetch table versions: {str(e)}")
@@ -0,0 +1,215 @@
+import json
+import os
+import threading
+from typing import List, Union
+
+import src.app.config.read_model_config as config
+from src.app.config.db_config import DB
+from src.app.config.types import AssetStatus
+from src.app.models.asset import Asset
+from src.app.repositories.asset_repository import ASSET_COLUMNS
+from src.app.utils.db.row_mapper import row_mapper
+from src.app.utils.db.table_versions import fetch_table_versions
+from src.app.utils.errors.error import DatabaseError
+from src.app.utils.tracing.tracer import traced
+
+READ_MODEL_TABLES = ["assets", "assets_assigned"]
+
+
+@traced
+class AssetReadModel:
+    """
+    In-process copy of the assets and assignments tables, answering the asset reads of
+    `AssetRepository` from memory: assets by serial number, the assets of each user and the
+    serial numbers of each status.
+
+    Every read first checks `PRAGMA data_version` on the model's own connection, which changes
+    whenever any other connection, in this process or another, commits. Only then is the changes
+    log replayed from the last change applied, so a read never sees data older than the last
+    commit. The table_versions counters, bumped once per changed row by the same triggers, must
+    move by exactly the number of changes replayed; if they do not (the versions are reset after a
+    bulk load without triggers) or too many changes are pending, the model reloads the tables
+    instead.
+    """
+
+    def __init__(self, database: DB, max_replay: int = None):
+        self.db = database
+        self.max_replay = config.READ_MODEL_MAX_REPLAY if max_replay is None else max_replay
+        self._lock = threading.RLock()
+        self._conn = None
+        self._pid = None
+        self._data_version = None
+        self._change_version = 0
+        self._table_versions = None
+
+        self.assets = {}  # serial number -> Asset
+        self.by_status = {}  # status -> serial numbers
+        self.by_user = {}  # user id -> serial numbers
+        self._assignments = {}  # asset_assigned_id -> (user id, serial number)
+
+        self.reloads = 0
+        self.applied_changes = 0
+
+    def _connection(self):
+        # SQLite connections must not cross a fork: a worker opens its own and catches up from the
+        # changes log, keeping the dicts loaded before the fork
+        if self._pid != os.getpid():
+            self._conn = self.db.get_connection(check_same_thread=False)
+            self._pid = os.getpid()
+            self._data_version = None
+        return self._conn
+
+    def load(self):
+        """(Re)load both tables from scratch"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                self._data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                conn.execute("BEGIN")
+                try:
+                    cursor = conn.cursor()
+                    cursor.row_factory = row_mapper(Asset, ASSET_COLUMNS)
+                    assets = cursor.execute(f"SELECT {', '.join(ASSET_COLUMNS)} FROM assets").fetchall()
+                    assignments = conn.execute(
+                        "SELECT asset_assigned_id, user_id, asset_id FROM assets_assigned"
+                    ).fetchall()
+                    self._change_version = conn.execute("SELECT COALESCE(MAX(version), 0) FROM changes").fetchone()[0]
+                    self._table_versions = fetch_table_versions(conn, READ_MODEL_TABLES)
+                finally:
+                    conn.execute("COMMIT")
+
+                self.assets = {asset.serial_number: asset for asset in assets}
+                self.by_status = {}
+                for asset in assets:
+                    self.by_status.setdefault(asset.status, set()).add(asset.serial_number)
+                self.by_user = {}
+                self._assignments = {}
+                for assigned_id, user_id, asset_id in assignments:
+                    self._assignments[assigned_id] = (user_id, asset_id)
+                    self.by_user.setdefault(user_id, set()).add(asset_id)
+                self.reloads += 1
+
+        except Exception as e:
+            raise DatabaseError(f"Error loading the asset read model: {str(e)}")
+
+    def sync(self):
+        """Apply whatever other connections committed since the last call"""
+        try:
+            with self._lock:
+                if self._table_versions is None:
+                    self.load()
+                    return
+                conn = self._connection()
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version == self._data_version:
+                    return
+                self._data_version = data_version
+
+                conn.execute("BEGIN")
+                try:
+                    changes = conn.execute(
+                        f"SELECT table_name, operation, row_id, data FROM changes "
+                        f"WHERE version > ? AND table_name IN ({', '.join('?' for _ in READ_MODEL_TABLES)}) "
+                        f"ORDER BY version LIMIT ?",
+                        (self._change_version, *READ_MODEL_TABLES, self.max_replay + 1)
+                    ).fetchall()
+                    change_version = conn.execute("SELECT COALESCE(MAX(version), 0) FROM changes").fetchone()[0]
+                    table_versions = fetch_table_versions(conn, READ_MODEL_TABLES)
+                finally:
+                    conn.execute("COMMIT")
+
+                expected = tuple(
+                    version + sum(1 for change in changes if change[0] == table)
+                    for table, version in zip(READ_MODEL_TABLES, self._table_versions)
+                )
+                if len(changes) > self.max_replay or expected != table_versions:
+                    self.load()
+                    return
+
+                for table_name, operation, row_id, data in changes:
+                    data = json.loads(data) if data is not None else None
+                    if table_name == "assets":
+                        self._apply_asset(operation, row_id, data)
+                    else:
+                        self._apply_assignment(operation, row_id, data)
+                self.applied_changes += len(changes)
+                self._change_version = change_version
+                self._table_versions = table_versions
+
+        except DatabaseError:
+            raise
+        except Exception as e:
+            raise DatabaseError(f"Error syncing the asset read model: {str(e)}")
+
+    def _apply_asset(self, operation: str, serial_number: str, data: Union[dict, None]):
+        # Assets are replaced, never mutated, so lists already handed out stay consistent. Updates
+        # keep their place in the dict, the table order a fresh load would give.
+        previous = self.assets.get(serial_number)
+        if previous is not None:
+            self.by_status[previous.status].discard(serial_number)
+        if operation == "delete":
+            self.assets.pop(serial_number, None)
+        else:
+            self.assets[serial_number] = Asset(**data)
+            self.by_status.setdefault(data["status"], set()).add(serial_number)
+
+    def _apply_assignment(self, operation: str, assigned_id: str, data: Union[dict, None]):
+        previous = self._assignments.pop(assigned_id, None)
+        if previous is not None:
+            user_id, asset_id = previous
+            self.by_user[user_id].discard(asset_id)
+            if not self.by_user[user_id]:
+                del self.by_user[user_id]
+        if operation != "delete":
+            self._assignments[assigned_id] = (data["user_id"], data["asset_id"])
+            self.by_user.setdefault(data["user_id"], set()).add(data["asset_id"])
+
+    # Reads, named after the AssetRepository methods they stand in for
+
+    def fetch_all_assets(self) -> List[Asset]:
+        self.sync()
+        with self._lock:
+            return list(self.assets.values())
+
+    def fetch_asset_by_id(self, asset_id: str) -> Union[Asset, None]:
+        self.sync()
+        return self.assets.get(asset_id)
+
+    def fetch_assets_by_status(self, status: str) -> List[Asset]:
+        self.sync()
+        with self._lock:
+            return [self.assets[serial_number] for serial_number in self.by_status.get(status, ())]
+
+    def check_asset_availability(self, asset_id: str) -> bool:
+        asset = self.fetch_asset_by_id(asset_id)
+        return asset is not None and asset.status == AssetStatus.AVAILABLE.value
+
+    def is_asset_assigned(self, user_id: str, asset_id: str) -> bool:
+        self.sync()
+        with self._lock:
+            return asset_id in self.by_user.get(user_id, ())
+
+    def view_assigned_assets(self, user_id: str) -> dict:
+        self.sync()
+        with self._lock:
+            assets = [self.assets[serial_number] for serial_number in self.by_user.get(user_id, ())]
+        return {
+            "user_id": user_id,
+            "assets": [
+                {
+                    "serial_number": asset.serial_number,
+                    "name": asset.name,
+                    "description": asset.description,
+                    "status": asset.status
+                } for asset in assets
+            ]
+        }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "assets": len(self.assets),
+                "assignments": len(self._assignments),
+                "reloads": self.reloads,
+                "applied_changes": self.applied_changes,
+            }
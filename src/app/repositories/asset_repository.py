@@ -4,10 +4,25 @@ from src.app.config.db_config import DB
 from src.app.config.types import AssetStatus
 from src.app.models.asset import Asset
 from src.app.models.asset_assigned import AssetAssigned
+from src.app.models.assignment_history import AssignmentHistory
+from src.app.models.search_result import AssetSearchResult
 from src.app.utils.errors.error import DatabaseError, AssetAlreadyAssignedError
+from src.app.utils.db.fts import match_expression, snippet, highlight
 from src.app.utils.db.query_builder import GenericQueryBuilder
-
-
+from src.app.utils.db.row_mapper import row_mapper
+from src.app.utils.db.table_versions import fetch_table_versions
+from src.app.utils.tracing.tracer import traced
+
+ASSET_COLUMNS = ["serial_number", "name", "description", "status"]
+ASSET_SEARCH_COLUMNS = ASSET_COLUMNS + ["snippet", "rank"]
+HISTORY_COLUMNS = ["asset_assigned_id", "asset_id", "user_id", "assigned_at", "returned_at"]
+# json_object() arguments emitting an asset in the field order of the `Asset` encoder
+ASSET_JSON_OBJECT = "json_object('name', a.name, 'description', a.description, " \
+                    "'serial_number', a.serial_number, 'status', a.status)"
+ASSIGNED_ASSET_JSON_OBJECT = "json_object('serial_number', a.serial_number, 'name', a.name, " \
+                             "'description', a.description, 'status', a.status)"
+
+@traced
 class AssetRepository:
     def __init__(self, database: DB):
         self.db = database
@@ -34,19 +49,22 @@ class AssetRepository:
             conn = self.db.get_connection()
             with conn:
                 cursor = conn.cursor()
-                columns = ["serial_number", "name", "description", "status"]
-                query, values = GenericQueryBuilder.select("assets", columns=columns)
+                cursor.row_factory = row_mapper(Asset, ASSET_COLUMNS)
+                query, values = GenericQueryBuilder.select("assets", columns=ASSET_COLUMNS)
                 cursor.execute(query, values)
-                results = cursor.fetchall()
+                return cursor.fetchall()
 
-                return [
-                    Asset(
-                        serial_number=row[0],
-                        name=row[1],
-                        description=row[2],
-                        status=row[3]
-                    ) for row in results
-                ]
+        except Exception as e:
+            raise DatabaseError("Error retrieving assets")
+
+    def fetch_all_assets_json(self) -> bytes:
+        """All assets as a JSON array encoded by SQLite, in the shape `fetch_all_assets` serializes to"""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT json_group_array({ASSET_JSON_OBJECT}) FROM assets a")
+                return cursor.fetchone()[0].encode("utf-8")
 
         except Exception as e:
             raise DatabaseError("Error retrieving assets")
@@ -56,26 +74,15 @@ class AssetRepository:
             conn = self.db.get_connection()
             with conn:
                 cursor = conn.cursor()
-                columns = ["serial_number", "name", "description", "status"]
+                cursor.row_factory = row_mapper(Asset, ASSET_COLUMNS)
                 where_clause = {"serial_number": asset_id}
                 query, values = GenericQueryBuilder.select(
                     "assets",
-                    columns=columns,
+                    columns=ASSET_COLUMNS,
                     where=where_clause
                 )
                 cursor.execute(query, values)
-                result = cursor.fetchone()
-
-                if result is not None:
-                    return Asset(
-                            serial_number=result[0],
-                            name=result[1],
-                            description=result[2],
-                            status=result[3]
-                        )
-
-                else:
-                    return None
+                return cursor.fetchone()
 
         except Exception as e:
             raise DatabaseError(f"Error retrieving assets {str(e)}")
@@ -234,3 +241,126 @@ class AssetRepository:
 
         except Exception as e:
             raise DatabaseError(f"Error retrieving assigned assets: {str(e)}")
+
+    def view_assigned_assets_json(self, user_id: str) -> bytes:
+        """`view_assigned_assets` as a JSON object encoded by SQLite"""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                # Subquery results lose their JSON subtype, so json() marks the array as JSON again
+                cursor.execute(f'''
+                    SELECT json_object('user_id', ?, 'assets', json((
+                        SELECT json_group_array({ASSIGNED_ASSET_JSON_OBJECT})
+                        FROM assets a
+                        JOIN assets_assigned aa ON a.serial_number = aa.asset_id
+                        WHERE aa.user_id = ?
+                    )))
+                ''', (user_id, user_id))
+                return cursor.fetchone()[0].encode("utf-8")
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving assigned assets: {str(e)}")
+
+    def view_all_assigned_assets_json(self) -> bytes:
+        """`view_all_assigned_assets` as a JSON array encoded by SQLite"""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT json_group_array(json_object('user_id', user_id, 'asset_ids', json(asset_ids)))
+                    FROM (
+                        SELECT u.id AS user_id,
+                               json_group_array(aa.asset_id) AS asset_ids
+                        FROM users u
+                        JOIN assets_assigned aa ON u.id = aa.user_id
+                        GROUP BY u.id
+                    )
+                ''')
+                return cursor.fetchone()[0].encode("utf-8")
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving assigned assets: {str(e)}")
+
+    def fetch_holder_at(self, asset_id: str, at: str) -> Union[AssignmentHistory, None]:
+        """The assignment of `asset_id` in force at time `at`, if it was held then"""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.row_factory = row_mapper(AssignmentHistory, HISTORY_COLUMNS)
+                # The asset's last assignment before `at` is the only one that can cover it
+                cursor.execute(f'''
+                    SELECT {', '.join(HISTORY_COLUMNS)} FROM (
+                        SELECT {', '.join(HISTORY_COLUMNS)}
+                        FROM assignment_history
+                        WHERE asset_id = ? AND assigned_at <= ?
+                        ORDER BY assigned_at DESC
+                        LIMIT 1
+                    )
+                    WHERE returned_at IS NULL OR returned_at > ?
+                ''', (asset_id, at, at))
+                return cursor.fetchone()
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving assignment history: {str(e)}")
+
+    def fetch_user_history(self, user_id: str, start: str, end: str) -> List[AssignmentHistory]:
+        """Assignments of `user_id` in force at any time between `start` and `end`, oldest first"""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.row_factory = row_mapper(AssignmentHistory, HISTORY_COLUMNS)
+                cursor.execute(f'''
+                    SELECT {', '.join(HISTORY_COLUMNS)}
+                    FROM assignment_history
+                    WHERE user_id = ? AND assigned_at <= ? AND (returned_at IS NULL OR returned_at >= ?)
+                    ORDER BY assigned_at
+                ''', (user_id, end, start))
+                return cursor.fetchall()
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving assignment history: {str(e)}")
+
+    def search_assets(self, text: str, limit: int, offset: int) -> List[AssetSearchResult]:
+        """Assets matching the words of `text` in their name or description, most relevant first"""
+        expression = match_expression(text)
+        if expression is None:
+            return []
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.row_factory = row_mapper(AssetSearchResult, ASSET_SEARCH_COLUMNS)
+                # Ranked in the index; only the page's rows are then read from assets, by rowid
+                cursor.execute(f'''
+                    SELECT a.serial_number, a.name, a.description, a.status, m.snippet, m.rank
+                    FROM (
+                        SELECT rowid, {snippet("assets_fts")} AS snippet, rank
+                        FROM assets_fts
+                        WHERE assets_fts MATCH ?
+                        ORDER BY rank
+                        LIMIT ? OFFSET ?
+                    ) AS m
+                    JOIN assets a ON a.rowid = m.rowid
+                    ORDER BY m.rank
+                ''', (expression, limit, offset))
+                results = cursor.fetchall()
+
+            for result in results:
+                result.snippet = highlight(result.snippet)
+            return results
+
+        except Exception as e:
+            raise DatabaseError(f"Error searching assets: {str(e)}")
+
+    def fetch_table_versions(self, tables: List[str]) -> tuple:
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                return fetch_table_versions(conn, tables)
+
+        except Exception as e:
+            raise DatabaseError(f"Failed to fetch table versions: {str(e)}")
@@ -0,0 +1,94 @@
+import json
+from typing import List
+
+from src.app.config.db_config import DB
+from src.app.models.change import Change
+from src.app.utils.errors.error import DatabaseError
+from src.app.utils.db.row_mapper import row_mapper
+from src.app.utils.tracing.tracer import traced
+
+CHANGE_COLUMNS = ["version", "table_name", "operation", "row_id", "data", "changed_at"]
+# Kept by SQLite for the AUTOINCREMENT key of changes, including versions since deleted
+LAST_ISSUED_VERSION = "SELECT seq FROM sqlite_sequence WHERE name = 'changes'"
+
+
+@traced
+class ChangeRepository:
+    def __init__(self, database: DB):
+        self.db = database
+
+    def fetch_changes(self, since: int, limit: int) -> List[Change]:
+        """Changes with a version greater than `since`, oldest first"""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.row_factory = row_mapper(Change, CHANGE_COLUMNS)
+                # A range scan on the primary key: the cost follows the number of changes returned
+                cursor.execute(
+                    f"SELECT {', '.join(CHANGE_COLUMNS)} FROM changes WHERE version > ? ORDER BY version LIMIT ?",
+                    (since, limit)
+                )
+                changes = cursor.fetchall()
+
+            for change in changes:
+                if change.data is not None:
+                    change.data = json.loads(change.data)
+            return changes
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving changes: {str(e)}")
+
+    def fetch_event_changes(self, since: int, limit: int) -> List[Change]:
+        """
+        `fetch_changes` for the event stream: a delete from assets_assigned carries the asset_id
+        and user_id of the assignment, read from the history, as its data
+        """
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.row_factory = row_mapper(Change, CHANGE_COLUMNS)
+                cursor.execute(
+                    """SELECT c.version, c.table_name, c.operation, c.row_id,
+                              CASE WHEN h.asset_assigned_id IS NULL THEN c.data
+                                   ELSE json_object('asset_id', h.asset_id, 'user_id', h.user_id) END,
+                              c.changed_at
+                        FROM changes c
+                        LEFT JOIN assignment_history h ON c.table_name = 'assets_assigned'
+                            AND c.operation = 'delete' AND h.asset_assigned_id = c.row_id
+                        WHERE c.version > ? ORDER BY c.version LIMIT ?""",
+                    (since, limit)
+                )
+                changes = cursor.fetchall()
+
+            for change in changes:
+                change.data = json.loads(change.data) if change.data is not None else None
+            return changes
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving changes: {str(e)}")
+
+    def fetch_latest_version(self) -> int:
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                # Versions are never reused, so an emptied log still reports the last one handed out
+                cursor.execute(f"SELECT COALESCE(MAX(version), ({LAST_ISSUED_VERSION}), 0) FROM changes")
+                return cursor.fetchone()[0]
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving the latest change version: {str(e)}")
+
+    def fetch_oldest_version(self) -> int:
+        """The oldest version still in the log, or the next one to be issued when it is empty"""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT COALESCE(MIN(version), ({LAST_ISSUED_VERSION}) + 1, 1) FROM changes")
+                return cursor.fetchone()[0]
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving the oldest change version: {str(e)}")
@@ -0,0 +1,48 @@
+from typing import List
+
+from src.app.config.db_config import DB
+from src.app.utils.errors.error import DatabaseError
+from src.app.utils.tracing.tracer import traced
+
+
+@traced
+class StatsRepository:
+    """Reads of the counters table, kept up to date by triggers (see COUNTERS in create_tables)"""
+
+    def __init__(self, database: DB):
+        self.db = database
+
+    def fetch_counters(self, names: List[str]) -> dict:
+        """{name: {key: count}} of every key of the counters `names`"""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                # Primary key range seeks, one per counter
+                cursor.execute(
+                    f"SELECT name, key, count FROM counters WHERE name IN ({', '.join('?' for _ in names)})",
+                    names
+                )
+                counters = {name: {} for name in names}
+                for name, key, count in cursor.fetchall():
+                    counters[name][key] = count
+                return counters
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving counters: {str(e)}")
+
+    def fetch_top_counts(self, name: str, limit: int) -> List[dict]:
+        """The `limit` keys of counter `name` with the highest counts, highest first"""
+        try:
+            conn = self.db.get_connection()
+            with conn:
+                cursor = conn.cursor()
+                # Walks idx_counters_count backwards: reads `limit` entries however many keys there are
+                cursor.execute(
+                    "SELECT key, count FROM counters WHERE name = ? ORDER BY count DESC LIMIT ?",
+                    (name, limit)
+                )
+                return [{"key": key, "count": count} for key, count in cursor.fetchall()]
+
+        except Exception as e:
+            raise DatabaseError(f"Error retrieving counters: {str(e)}")
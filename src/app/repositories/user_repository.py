@@ -5,8 +5,13 @@ from src.app.config.db_config import DB
 from src.app.config.types import Role
 from src.app.utils.errors.error import DatabaseError
 from src.app.utils.db.query_builder import GenericQueryBuilder
+from src.app.utils.db.row_mapper import row_mapper
+from src.app.utils.tracing.tracer import traced
 
+USER_COLUMNS = ["id", "name", "email", "password", "role", "department"]
+USER_DTO_COLUMNS = ["id", "name", "email", "department"]
 
+@traced
 class UserRepository:
     def __init__(self, database: DB):
         self.db = database
@@ -55,26 +60,15 @@ class UserRepository:
             conn = self.db.get_connection()
             with conn:
                 cursor = conn.cursor()
+                cursor.row_factory = row_mapper(UserDTO, USER_DTO_COLUMNS)
                 where_clause = {"role": Role.USER.value}
-                columns = ["id", "name", "email", "department"]
                 query, values = GenericQueryBuilder.select(
                     "users",
-                    columns=columns,
+                    columns=USER_DTO_COLUMNS,
                     where=where_clause
                 )
                 cursor.execute(query, values)
-                results = cursor.fetchall()
-
-                if results:
-                    return [
-                        UserDTO(
-                            id=result[0],
-                            name=result[1],
-                            email=result[2],
-                            department=result[3]
-                        ) for result in results
-                    ]
-                return []
+                return cursor.fetchall()
 
         except Exception as e:
             raise DatabaseError(f"Error fetching users: {str(e)}")
@@ -85,26 +79,15 @@ class UserRepository:
             conn = self.db.get_connection()
             with conn:
                 cursor = conn.cursor()
+                cursor.row_factory = row_mapper(User, USER_COLUMNS)
                 where_clause = {"email": email}
-                columns = ["id", "name", "email", "password", "role", "department"]
                 query, values = GenericQueryBuilder.select(
                     "users",
-                    columns=columns,
+                    columns=USER_COLUMNS,
                     where=where_clause
                 )
                 cursor.execute(query, values)
-                result = cursor.fetchone()
-
-            if result:
-                return User(
-                    id=result[0],
-                    name=result[1],
-                    email=result[2],
-                    password=result[3],
-                    role=result[4],
-                    department=result[5]
-                )
-            return None
+                return cursor.fetchone()
 
         except Exception as e:
             raise DatabaseError(f"Error fetching user: {str(e)}")
@@ -115,24 +98,15 @@ class UserRepository:
             conn = self.db.get_connection()
             with conn:
                 cursor = conn.cursor()
+                cursor.row_factory = row_mapper(UserDTO, USER_DTO_COLUMNS)
                 where_clause = {"id": user_id}
-                columns = ["id", "name", "email", "department"]
                 query, values = GenericQueryBuilder.select(
                     "users",
-                    columns=columns,
+                    columns=USER_DTO_COLUMNS,
                     where=where_clause
                 )
                 cursor.execute(query, values)
-                result = cursor.fetchone()
-
-            if result:
-                return UserDTO(
-                    id=result[0],
-                    name=result[1],
-                    email=result[2],
-                    department=result[3]
-                )
-            return None
+                return cursor.fetchone()
 
         except Exception as e:
             raise DatabaseError(f"Error fetching user: {str(e)}")
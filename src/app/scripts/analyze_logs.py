@@ -0,0 +1,260 @@
+"""
+Reconstruct per-endpoint latency and error statistics from the multi-line `app.log` records
+written by `custom_logger`.
+
+Logs are streamed line by line, so memory stays constant in the size of the logs: only
+in-flight requests (an "Entering" record without its "Exiting" yet) and fixed-size latency
+histograms are kept. Rotated files are read oldest first (`app.log.3`, `.2`, `.1`, `app.log`).
+
+A request counts as failed when its handler raised (an "Error occurred in" record) or, for logs
+written since the success record carries `status=`, when it answered with a 4xx/5xx status.
+Durations have the millisecond resolution of the log timestamps.
+
+Usage:
+    python -m src.app.scripts.analyze_logs app.log
+    python -m src.app.scripts.analyze_logs app.log --format csv --output endpoints.csv
+"""
+import argparse
+import bisect
+import csv
+import io
+import json
+import os
+import re
+import sys
+from collections import Counter, deque
+from datetime import datetime
+
+RECORD_PATTERN = re.compile(r"^(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3}) - (DEBUG|INFO|WARNING|ERROR|CRITICAL) - (.*)$")
+CONTEXT_PATTERN = re.compile(r"(?:^| )- for user_id=(.*) \| role=(.*)$")
+FIELD_PATTERN = re.compile(r"^\s+- (user_id|role|method|path|handler): (.*)$")
+STATUS_PATTERN = re.compile(r"executed successfully\. status=(\d{3})")
+ID_SEGMENT_PATTERN = re.compile(r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S,%f"
+
+# Upper bounds (ms) of the latency histogram buckets: 1-2-5 steps from 1ms to 60s
+BUCKET_BOUNDS_MS = [float(scale * step) for scale in (1, 10, 100, 1000, 10000) for step in (1, 2, 5)] + [60000.0]
+MAX_IN_FLIGHT = 10_000
+TOP_USERS = 10
+
+CSV_FIELDS = ["endpoint", "count", "errors", "error_rate", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+
+
+def rotated_files(path: str, backups: int = 3) -> list:
+    """`path` and its existing `RotatingFileHandler` backups, oldest first"""
+    candidates = [f"{path}.{index}" for index in range(backups, 0, -1)] + [path]
+    return [candidate for candidate in candidates if os.path.exists(candidate)]
+
+
+def normalize_path(path: str) -> str:
+    return ID_SEGMENT_PATTERN.sub("/<id>", path)
+
+
+class EndpointStats:
+    """Counts, error count and a fixed-bucket latency histogram for one endpoint"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, duration_ms: float, failed: bool):
+        self.count += 1
+        self.errors += failed
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket holding the nearest-rank percentile, capped at the observed max"""
+        rank = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                bound = BUCKET_BOUNDS_MS[index] if index < len(BUCKET_BOUNDS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.count, 4) if self.count else 0.0,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+        }
+
+
+class LogAnalyzer:
+    def __init__(self, max_in_flight: int = MAX_IN_FLIGHT):
+        self.max_in_flight = max_in_flight
+        self.endpoints = {}
+        self.failing_users = Counter()
+        self.records = 0
+        self.unmatched = 0
+        # (function, context) -> FIFO of requests entered but not exited yet
+        self._in_flight = {}
+        self._in_flight_count = 0
+        self._record = None
+
+    def feed_file(self, path: str):
+        with open(path, encoding="utf-8", errors="replace") as log_file:
+            for line in log_file:
+                self.feed_line(line.rstrip("\n"))
+        # A record cut off by rotation never gets its context line; drop it
+        self._record = None
+
+    def feed_line(self, line: str):
+        match = RECORD_PATTERN.match(line)
+        if match:
+            timestamp, level, message = match.groups()
+            self._record = {"timestamp": timestamp, "level": level, "message": message, "fields": {}}
+            line = message
+        elif self._record is None:
+            return
+        else:
+            field = FIELD_PATTERN.match(line)
+            if field:
+                self._record["fields"].setdefault(field.group(1), field.group(2))
+
+        context = CONTEXT_PATTERN.search(line)
+        if context:
+            record, self._record = self._record, None
+            if record["message"] is line:
+                record["message"] = line[:context.start()]
+            self.records += 1
+            self._handle(record, context.group(0).lstrip(" - "), context.group(1))
+
+    def _handle(self, record: dict, context: str, context_user_id: str):
+        message = record["message"]
+        first_line = message.split(" - for user_id=")[0]
+
+        if first_line.startswith("Entering "):
+            function = first_line[len("Entering "):].strip()
+            fields = record["fields"]
+            request = {
+                "started": self._parse_time(record["timestamp"]),
+                "endpoint": self._endpoint_name(function, fields),
+                "user_id": fields.get("user_id", context_user_id),
+                "status": None,
+                "failed": False,
+            }
+            self._in_flight.setdefault((function, context), deque()).append(request)
+            self._in_flight_count += 1
+            self._evict_if_full()
+        elif first_line.startswith("Exiting "):
+            request = self._pop_in_flight(first_line[len("Exiting "):].strip(), context)
+            if request is None:
+                self.unmatched += 1
+                return
+            duration_ms = max(0.0, (self._parse_time(record["timestamp"]) - request["started"]).total_seconds() * 1000)
+            failed = request["failed"] or (request["status"] is not None and request["status"] >= 400)
+            self.endpoints.setdefault(request["endpoint"], EndpointStats()).add(round(duration_ms, 3), failed)
+            if failed:
+                self.failing_users[request["user_id"]] += 1
+        elif record["level"] == "ERROR" and first_line.startswith("Error occurred in "):
+            request = self._peek_in_flight(first_line[len("Error occurred in "):].split(":")[0], context)
+            if request:
+                request["failed"] = True
+        else:
+            status = STATUS_PATTERN.search(first_line)
+            if status:
+                request = self._peek_in_flight(first_line.split(" executed successfully")[0], context)
+                if request:
+                    request["status"] = int(status.group(1))
+
+    @staticmethod
+    def _parse_time(timestamp: str) -> datetime:
+        return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+
+    @staticmethod
+    def _endpoint_name(function: str, fields: dict) -> str:
+        handler = fields.get("handler", "Unknown")
+        method = fields.get("method")
+        path = fields.get("path")
+        if method and path:
+            return f"{method} {normalize_path(path)} ({handler}.{function})"
+        return f"{handler}.{function}"
+
+    def _peek_in_flight(self, function: str, context: str):
+        # Status and error records belong to the oldest open call that has not settled yet
+        for request in self._in_flight.get((function, context), ()):
+            if request["status"] is None and not request["failed"]:
+                return request
+        return None
+
+    def _pop_in_flight(self, function: str, context: str):
+        key = (function, context)
+        pending = self._in_flight.get(key)
+        if not pending:
+            return None
+        request = pending.popleft()
+        if not pending:
+            del self._in_flight[key]
+        self._in_flight_count -= 1
+        return request
+
+    def _evict_if_full(self):
+        # Bound memory when exits are missing (crashes, truncated files): drop the stalest entry
+        while self._in_flight_count > self.max_in_flight:
+            key = min(self._in_flight, key=lambda k: self._in_flight[k][0]["started"])
+            self._pop_in_flight(*key)
+            self.unmatched += 1
+
+    def summary(self, top_users: int = TOP_USERS) -> dict:
+        self.unmatched += self._in_flight_count
+        self._in_flight.clear()
+        self._in_flight_count = 0
+        return {
+            "records": self.records,
+            "unmatched": self.unmatched,
+            "endpoints": {name: stats.to_dict() for name, stats in sorted(self.endpoints.items())},
+            "top_failing_users": [
+                {"user_id": user_id, "failures": failures}
+                for user_id, failures in self.failing_users.most_common(top_users)
+            ],
+        }
+
+
+def to_csv(summary: dict) -> str:
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for endpoint, stats in summary["endpoints"].items():
+        writer.writerow({"endpoint": endpoint, **stats})
+    return output.getvalue()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Per-endpoint latency and error statistics from app.log")
+    parser.add_argument("logs", nargs="+", help="log files; rotated backups of each are included automatically")
+    parser.add_argument("--format", choices=["summary", "csv"], default="summary")
+    parser.add_argument("--top-users", type=int, default=TOP_USERS)
+    parser.add_argument("--output", help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    analyzer = LogAnalyzer()
+    for log in args.logs:
+        files = rotated_files(log)
+        if not files:
+            parser.error(f"no such log file: {log}")
+        for path in files:
+            analyzer.feed_file(path)
+
+    summary = analyzer.summary(args.top_users)
+    report = to_csv(summary) if args.format == "csv" else json.dumps(summary, indent=2)
+    if args.output:
+        with open(args.output, "w", newline="") as output_file:
+            output_file.write(report)
+    print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,54 +1,440 @@
 import sqlite3
 import src.app.config.db_config as config
+from src.app.utils.db.table_versions import DATABASE_EPOCH
 
-# Open connection and enable foreign key support explicitly for SQLite
-conn = sqlite3.connect(config.DB)
-conn.execute("PRAGMA foreign_keys = ON;")
-
-with conn:
-    # Creating the users table
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            password TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            department TEXT,
-            role TEXT NOT NULL CHECK(role IN ('user', 'admin'))
-        );
-    ''')
-
-    # Creating the assets table
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS assets (
-            serial_number TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            description TEXT,
-            status TEXT NOT NULL CHECK(status IN ('available', 'assigned'))
-        );
-    ''')
-
-    # Creating the issues table
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS issues (
-            issue_id TEXT PRIMARY KEY,
-            report_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            user_id TEXT NOT NULL,
-            asset_id TEXT NOT NULL,
-            description TEXT NOT NULL,
-            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-            FOREIGN KEY (asset_id) REFERENCES assets(serial_number) ON DELETE CASCADE
-        );
-    ''')
-
-    # Creating the assets assigned table
-    conn.execute('''
-        CREATE TABLE IF NOT EXISTS assets_assigned (
-            asset_assigned_id TEXT PRIMARY KEY,
-            user_id TEXT NOT NULL,
-            asset_id TEXT NOT NULL,
-            assigned_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-            FOREIGN KEY (asset_id) REFERENCES assets(serial_number) ON DELETE CASCADE
-        );
-    ''')
+# Secondary indexes (name, definition); bulk loaders drop these and rebuild them afterwards
+INDEXES = [
+    ("idx_assets_assigned_user_id", "assets_assigned (user_id)"),
+    ("idx_assets_assigned_asset_id", "assets_assigned (asset_id)"),
+    ("idx_issues_user_id", "issues (user_id)"),
+    ("idx_issues_asset_id", "issues (asset_id)"),
+    ("idx_counters_count", "counters (name, count)"),
+    # "Who held asset X at T": one seek to the asset's last assignment before T
+    ("idx_assignment_history_asset", "assignment_history (asset_id, assigned_at)"),
+    # "What did user U hold between A and B": a range of the user's entries, filtered in the index
+    ("idx_assignment_history_user", "assignment_history (user_id, assigned_at, returned_at)"),
+]
+
+# Tables whose writes bump their row in table_versions; the versions back the list endpoints' ETags
+VERSIONED_TABLES = ["users", "assets", "issues", "assets_assigned"]
+# Upper bound of the random extra step `bump_versions` adds to each version
+VERSION_BUMP_RANGE = 1_000_000
+TRIGGER_EVENTS = ["INSERT", "UPDATE", "DELETE"]
+# Tables whose writes are recorded in the changes log: table -> (key column, columns in the
+# logged row). Passwords are never logged.
+CHANGE_LOG_COLUMNS = {
+    "users": ("id", ["id", "name", "email", "department", "role"]),
+    "assets": ("serial_number", ["serial_number", "name", "description", "status"]),
+    "issues": ("issue_id", ["issue_id", "user_id", "asset_id", "description", "report_date"]),
+    "assets_assigned": ("asset_assigned_id", ["asset_assigned_id", "user_id", "asset_id", "assigned_date"]),
+}
+
+# Aggregates kept in the counters table by triggers, for GET /stats: counter -> query computing its
+# (key, count) rows from scratch. Issues have no status, so every issue of an asset counts as open.
+COUNTERS = {
+    "assets_by_status": "SELECT status, COUNT(*) FROM assets GROUP BY status",
+    "assignments_by_department": "SELECT COALESCE(u.department, ''), COUNT(*) FROM assets_assigned aa "
+                                 "JOIN users u ON u.id = aa.user_id GROUP BY 1",
+    "issues_by_asset": "SELECT asset_id, COUNT(*) FROM issues GROUP BY asset_id",
+    "totals": "SELECT 'issues', COUNT(*) FROM issues HAVING COUNT(*) > 0",
+}
+
+# Timestamps in assignment_history: UTC, to the millisecond, so they compare as text
+HISTORY_TIME_FORMAT = "%Y-%m-%d %H:%M:%f"
+
+# Full-text indexes: FTS5 table -> (indexed table, columns, bm25 weight of each column). They are
+# external-content tables: only the index is stored, rows are read from the indexed table by rowid
+SEARCH_INDEXES = {
+    "assets_fts": ("assets", ["name", "description"], [10.0, 1.0]),
+    "issues_fts": ("issues", ["description"], [1.0]),
+}
+# Case and accent insensitive. Not stemmed: searches match words by prefix, and a stemmer's output
+# for a partial word is often no prefix of its output for the whole word ("overheat", "overh").
+# The prefix indexes answer short prefixes ("la*") with one lookup instead of a scan of every term.
+SEARCH_TOKENIZER = "unicode61 remove_diacritics 2"
+SEARCH_PREFIXES = "2 3"
+
+
+def _trigger_definitions() -> list:
+    """
+    (name, definition) of the triggers maintaining table_versions, the changes log, the search
+    indexes, the counters and the assignment history
+    """
+    triggers = []
+    for table in VERSIONED_TABLES:
+        for event in TRIGGER_EVENTS:
+            triggers.append((f"{table}_{event.lower()}_version", f'''
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE table_versions SET version = version + 1 WHERE table_name = '{table}';
+                END
+            '''))
+    for table, (key, columns) in CHANGE_LOG_COLUMNS.items():
+        for event in TRIGGER_EVENTS:
+            row = "OLD" if event == "DELETE" else "NEW"
+            data = "NULL" if event == "DELETE" else \
+                "json_object(" + ", ".join(f"'{column}', NEW.{column}" for column in columns) + ")"
+            triggers.append((f"{table}_{event.lower()}_changelog", f'''
+                AFTER {event} ON {table}
+                BEGIN
+                    INSERT INTO changes (table_name, operation, row_id, data)
+                    VALUES ('{table}', '{event.lower()}', {row}.{key}, {data});
+                END
+            '''))
+    for fts, (table, columns, _) in SEARCH_INDEXES.items():
+        names = ", ".join(columns)
+        new = ", ".join(f"NEW.{column}" for column in columns)
+        old = ", ".join(f"OLD.{column}" for column in columns)
+        insert = f"INSERT INTO {fts} (rowid, {names}) VALUES (NEW.rowid, {new});"
+        # External-content tables are given the old values to take out of the index
+        delete = f"INSERT INTO {fts} ({fts}, rowid, {names}) VALUES ('delete', OLD.rowid, {old});"
+        triggers.append((f"{table}_insert_search", f"AFTER INSERT ON {table} BEGIN {insert} END"))
+        triggers.append((f"{table}_delete_search", f"AFTER DELETE ON {table} BEGIN {delete} END"))
+        # Only writes to indexed columns touch the index, not e.g. status changes
+        triggers.append((f"{table}_update_search", f"AFTER UPDATE OF {names} ON {table} BEGIN {delete} {insert} END"))
+    return triggers + _counter_triggers() + _history_triggers()
+
+
+def _history_triggers() -> list:
+    """(name, definition) of the triggers writing assignment_history and keeping it append-only"""
+    assigned_at = f"COALESCE(strftime('{HISTORY_TIME_FORMAT}', NEW.assigned_date), strftime('{HISTORY_TIME_FORMAT}', 'now'))"
+    return [
+        ("assets_assigned_insert_history", f'''
+            AFTER INSERT ON assets_assigned
+            BEGIN
+                INSERT INTO assignment_history (asset_assigned_id, asset_id, user_id, assigned_at)
+                VALUES (NEW.asset_assigned_id, NEW.asset_id, NEW.user_id, {assigned_at});
+            END
+        '''),
+        # Also closes the assignments ON DELETE CASCADE removes with their user or asset
+        ("assets_assigned_delete_history", f'''
+            AFTER DELETE ON assets_assigned
+            BEGIN
+                UPDATE assignment_history SET returned_at = strftime('{HISTORY_TIME_FORMAT}', 'now')
+                WHERE asset_assigned_id = OLD.asset_assigned_id AND returned_at IS NULL;
+            END
+        '''),
+        ("assignment_history_delete_guard", '''
+            BEFORE DELETE ON assignment_history
+            BEGIN SELECT RAISE(ABORT, 'assignment_history is append-only'); END
+        '''),
+        # The only change allowed is recording the return of an open assignment
+        ("assignment_history_update_guard", '''
+            BEFORE UPDATE ON assignment_history
+            WHEN OLD.returned_at IS NOT NULL OR NEW.asset_assigned_id IS NOT OLD.asset_assigned_id
+                OR NEW.asset_id IS NOT OLD.asset_id OR NEW.user_id IS NOT OLD.user_id
+                OR NEW.assigned_at IS NOT OLD.assigned_at
+            BEGIN SELECT RAISE(ABORT, 'assignment_history is append-only'); END
+        '''),
+    ]
+
+
+def _add(counter: str, key: str, amount: str = "1") -> str:
+    return (f"INSERT INTO counters (name, key, count) VALUES ('{counter}', {key}, {amount}) "
+            f"ON CONFLICT (name, key) DO UPDATE SET count = count + excluded.count;")
+
+
+def _subtract(counter: str, key: str, amount: str = "1") -> str:
+    # Keys counting nothing are removed, so per-asset counters do not pile up
+    return (f"UPDATE counters SET count = count - {amount} WHERE name = '{counter}' AND key = {key}; "
+            f"DELETE FROM counters WHERE name = '{counter}' AND key = {key} AND count <= 0;")
+
+
+def _counter_triggers() -> list:
+    """(name, definition) of the triggers maintaining the counters; see COUNTERS"""
+    def department(row):
+        return f"(SELECT COALESCE(department, '') FROM users WHERE id = {row}.user_id)"
+
+    assignments = "(SELECT COUNT(*) FROM assets_assigned WHERE user_id = OLD.id)"
+    return [
+        ("assets_insert_counters", f"AFTER INSERT ON assets BEGIN {_add('assets_by_status', 'NEW.status')} END"),
+        ("assets_delete_counters", f"AFTER DELETE ON assets BEGIN {_subtract('assets_by_status', 'OLD.status')} END"),
+        ("assets_update_counters", f'''
+            AFTER UPDATE OF status ON assets WHEN OLD.status IS NOT NEW.status
+            BEGIN {_subtract('assets_by_status', 'OLD.status')} {_add('assets_by_status', 'NEW.status')} END
+        '''),
+        ("assets_assigned_insert_counters", f'''
+            AFTER INSERT ON assets_assigned
+            BEGIN {_add('assignments_by_department', department('NEW'))} END
+        '''),
+        # Finds no department when the user is being deleted: the user trigger below has already
+        # taken all of the user's assignments off
+        ("assets_assigned_delete_counters", f'''
+            AFTER DELETE ON assets_assigned
+            BEGIN {_subtract('assignments_by_department', department('OLD'))} END
+        '''),
+        ("assets_assigned_update_counters", f'''
+            AFTER UPDATE OF user_id ON assets_assigned WHEN OLD.user_id IS NOT NEW.user_id
+            BEGIN
+                {_subtract('assignments_by_department', department('OLD'))}
+                {_add('assignments_by_department', department('NEW'))}
+            END
+        '''),
+        # Before, while the assignments ON DELETE CASCADE removes can still be counted
+        ("users_delete_counters", f'''
+            BEFORE DELETE ON users WHEN EXISTS (SELECT 1 FROM assets_assigned WHERE user_id = OLD.id)
+            BEGIN {_subtract('assignments_by_department', "COALESCE(OLD.department, '')", assignments)} END
+        '''),
+        ("users_update_counters", f'''
+            AFTER UPDATE OF department ON users
+            WHEN OLD.department IS NOT NEW.department AND EXISTS (SELECT 1 FROM assets_assigned WHERE user_id = OLD.id)
+            BEGIN
+                {_subtract('assignments_by_department', "COALESCE(OLD.department, '')", assignments)}
+                {_add('assignments_by_department', "COALESCE(NEW.department, '')", assignments)}
+            END
+        '''),
+        ("issues_insert_counters", f'''
+            AFTER INSERT ON issues
+            BEGIN {_add('issues_by_asset', 'NEW.asset_id')} {_add('totals', "'issues'")} END
+        '''),
+        ("issues_delete_counters", f'''
+            AFTER DELETE ON issues
+            BEGIN {_subtract('issues_by_asset', 'OLD.asset_id')} {_subtract('totals', "'issues'")} END
+        '''),
+        ("issues_update_counters", f'''
+            AFTER UPDATE OF asset_id ON issues WHEN OLD.asset_id IS NOT NEW.asset_id
+            BEGIN {_subtract('issues_by_asset', 'OLD.asset_id')} {_add('issues_by_asset', 'NEW.asset_id')} END
+        '''),
+    ]
+
+
+TRIGGERS = _trigger_definitions()
+
+
+def create_tables(conn: sqlite3.Connection):
+    """Create the application schema on the given connection (idempotent)"""
+    with conn:
+        # Creating the users table
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                password TEXT NOT NULL,
+                email TEXT UNIQUE NOT NULL,
+                department TEXT,
+                role TEXT NOT NULL CHECK(role IN ('user', 'admin'))
+            );
+        ''')
+
+        # Creating the assets table
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS assets (
+                serial_number TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                description TEXT,
+                status TEXT NOT NULL CHECK(status IN ('available', 'assigned'))
+            );
+        ''')
+
+        # Creating the issues table
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS issues (
+                issue_id TEXT PRIMARY KEY,
+                report_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                user_id TEXT NOT NULL,
+                asset_id TEXT NOT NULL,
+                description TEXT NOT NULL,
+                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+                FOREIGN KEY (asset_id) REFERENCES assets(serial_number) ON DELETE CASCADE
+            );
+        ''')
+
+        # Creating the assets assigned table
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS assets_assigned (
+                asset_assigned_id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                asset_id TEXT NOT NULL,
+                assigned_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+                FOREIGN KEY (asset_id) REFERENCES assets(serial_number) ON DELETE CASCADE
+            );
+        ''')
+
+        # Per-table change counters, maintained by the triggers below
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS table_versions (
+                table_name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            );
+        ''')
+        # Counters start at a random value so a recreated database does not reuse old versions
+        for table in VERSIONED_TABLES:
+            conn.execute(
+                "INSERT OR IGNORE INTO table_versions (table_name, version) VALUES (?, abs(random() >> 16));",
+                (table,)
+            )
+        conn.execute("INSERT OR IGNORE INTO table_versions (table_name, version) VALUES (?, abs(random()));",
+                     (DATABASE_EPOCH,))
+
+        # Ordered log of every row written, for mirrors syncing incrementally. AUTOINCREMENT
+        # keeps versions increasing even after the newest entries are deleted.
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS changes (
+                version INTEGER PRIMARY KEY AUTOINCREMENT,
+                table_name TEXT NOT NULL,
+                operation TEXT NOT NULL CHECK(operation IN ('insert', 'update', 'delete')),
+                row_id TEXT NOT NULL,
+                data TEXT,
+                changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        ''')
+
+    create_counters(conn)
+    create_assignment_history(conn)
+    create_indexes(conn)
+    create_search_indexes(conn)
+    create_triggers(conn)
+
+
+def create_counters(conn: sqlite3.Connection):
+    """Create the counters table, counting the rows already there when it is new"""
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'counters';").fetchone():
+        return
+    with conn:
+        conn.execute('''
+            CREATE TABLE counters (
+                name TEXT NOT NULL,
+                key TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (name, key)
+            ) WITHOUT ROWID;
+        ''')
+    rebuild_counters(conn)
+
+
+def create_assignment_history(conn: sqlite3.Connection):
+    """
+    Create the assignment history, starting it from the current assignments when it is new.
+    Rows are added and closed by triggers on assets_assigned and never deleted, so the history
+    outlives the users and assets it mentions.
+    """
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'assignment_history';").fetchone():
+        return
+    with conn:
+        conn.execute('''
+            CREATE TABLE assignment_history (
+                asset_assigned_id TEXT PRIMARY KEY,
+                asset_id TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                assigned_at TEXT NOT NULL,
+                returned_at TEXT
+            );
+        ''')
+    backfill_assignment_history(conn)
+
+
+def backfill_assignment_history(conn: sqlite3.Connection):
+    """Record the current assignments missing from the history, after writes made with the triggers dropped"""
+    with conn:
+        conn.execute(f'''
+            INSERT OR IGNORE INTO assignment_history (asset_assigned_id, asset_id, user_id, assigned_at)
+            SELECT asset_assigned_id, asset_id, user_id,
+                   COALESCE(strftime('{HISTORY_TIME_FORMAT}', assigned_date), strftime('{HISTORY_TIME_FORMAT}', 'now'))
+            FROM assets_assigned;
+        ''')
+
+
+def count_from_scratch(conn: sqlite3.Connection) -> dict:
+    """What the counters should hold: {(name, key): count}"""
+    return {(name, key): count
+            for name, query in COUNTERS.items()
+            for key, count in conn.execute(query)}
+
+
+def rebuild_counters(conn: sqlite3.Connection):
+    """Recompute every counter, after writes made with the triggers dropped"""
+    with conn:
+        conn.execute("DELETE FROM counters;")
+        for name, query in COUNTERS.items():
+            conn.execute(f"INSERT INTO counters (name, key, count) SELECT '{name}', * FROM ({query});")
+
+
+def create_search_indexes(conn: sqlite3.Connection):
+    """Create the full-text indexes, indexing the rows already there when one is new"""
+    for fts, (table, columns, weights) in SEARCH_INDEXES.items():
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?;", (fts,)).fetchone():
+            continue
+        with conn:
+            conn.execute(f'''
+                CREATE VIRTUAL TABLE {fts} USING fts5(
+                    {", ".join(columns)},
+                    content='{table}', content_rowid='rowid',
+                    tokenize='{SEARCH_TOKENIZER}', prefix='{SEARCH_PREFIXES}'
+                );
+            ''')
+            # Kept in the index's config, so `ORDER BY rank` ranks with these weights
+            conn.execute(f"INSERT INTO {fts} ({fts}, rank) VALUES ('rank', 'bm25({', '.join(map(str, weights))})');")
+        rebuild_search_indexes(conn, [fts])
+
+
+def rebuild_search_indexes(conn: sqlite3.Connection, names: list = None):
+    """
+    Re-index every row of the indexed tables, after writes made with the triggers dropped. Also
+    needed after a VACUUM, which may renumber the rowids the indexes refer to.
+    """
+    with conn:
+        for fts in names or SEARCH_INDEXES:
+            conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild');")
+            # Merges the index segments into one b-tree, the fastest layout to query
+            conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('optimize');")
+
+
+def create_triggers(conn: sqlite3.Connection):
+    """
+    Triggers run inside the writing statement's transaction, so table_versions and the changes
+    log are updated atomically with every row written, including rows removed by
+    ON DELETE CASCADE, whichever code path wrote them
+    """
+    with conn:
+        for name, definition in TRIGGERS:
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {definition};")
+
+
+def drop_triggers(conn: sqlite3.Connection):
+    with conn:
+        for name, _ in TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name};")
+
+
+def reset_changes_log(conn: sqlite3.Connection):
+    """
+    Empty the changes log after writes made with the triggers dropped, which it never recorded.
+    One version is skipped, so every mirror finds a gap after its `since` and resyncs in full.
+    """
+    with conn:
+        conn.execute("DELETE FROM changes;")
+        if not conn.execute("UPDATE sqlite_sequence SET seq = seq + 1 WHERE name = 'changes';").rowcount:
+            conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('changes', 1);")
+
+
+def bump_versions(conn: sqlite3.Connection):
+    """
+    Move every table's version forward after writes made with the triggers dropped. Versions only
+    ever grow: a value handed out before the writes, e.g. in an ETag, is never handed out again.
+    The random step keeps two reloads of the same database from reaching the same versions, and
+    the database epoch is replaced outright.
+    """
+    with conn:
+        conn.execute(f"UPDATE table_versions SET version = version + 1 + abs(random() % {VERSION_BUMP_RANGE}) "
+                     f"WHERE table_name != ?;", (DATABASE_EPOCH,))
+        conn.execute("UPDATE table_versions SET version = abs(random()) WHERE table_name = ?;", (DATABASE_EPOCH,))
+
+
+def create_indexes(conn: sqlite3.Connection):
+    with conn:
+        for name, definition in INDEXES:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {definition};")
+
+
+def drop_indexes(conn: sqlite3.Connection):
+    with conn:
+        for name, _ in INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name};")
+
+
+if __name__ == "__main__":
+    # Open connection and enable foreign key support explicitly for SQLite
+    conn = sqlite3.connect(config.DB)
+    conn.execute("PRAGMA foreign_keys = ON;")
+    create_tables(conn)
@@ -0,0 +1,246 @@
+"""
+Deterministic synthetic data generator for load and scale testing.
+
+The same seed and sizes always produce byte-identical rows, so benchmark runs are comparable. The
+table versions are not reproduced: they only move forward, so caches and ETags see every reload.
+Data is skewed like real inventories: a few users hold many assets and a few hot assets
+collect most of the issues.
+
+Usage:
+    python -m src.app.scripts.generate_data --db synthetic.db --users 100000 --assets 1000000 \\
+        --assignments 600000 --issues 1000000 --seed 42
+"""
+import argparse
+import random
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from bcrypt import hashpw
+
+import src.app.config.db_config as config
+from src.app.config.types import Role, AssetStatus, Department
+from src.app.scripts.create_tables import (
+    backfill_assignment_history,
+    create_tables,
+    create_indexes,
+    drop_indexes,
+    create_triggers,
+    drop_triggers,
+    rebuild_counters,
+    rebuild_search_indexes,
+    reset_changes_log,
+    bump_versions
+)
+
+ADMIN_EMAIL = "admin@watchguard.com"
+ADMIN_PASSWORD = "Admin@Pass1"
+# User i logs in with f"{USER_PASSWORD_PREFIX}{i % password_pool}"
+USER_PASSWORD_PREFIX = "Synth@Pass"
+BCRYPT_ALPHABET = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+START_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+FIRST_NAMES = ["aarav", "priya", "rohan", "ananya", "vikram", "meera", "arjun", "kavya", "rahul", "sneha",
+               "john", "emma", "liam", "olivia", "noah", "ava", "lucas", "mia", "ethan", "zoe"]
+ASSET_MODELS = ["dell latitude 5440", "macbook pro 14", "thinkpad t14", "hp elitebook 840", "dell u2723qe monitor",
+                "lg 27uk850 monitor", "logitech mx keys", "jabra evolve2 headset", "iphone 15", "pixel 8",
+                "ipad air", "yubikey 5 nfc", "dell wd19 dock", "logitech brio webcam"]
+ISSUE_TEMPLATES = ["cracked screen", "battery drains quickly", "does not power on", "keyboard keys sticking",
+                   "overheating under load", "wifi keeps disconnecting", "dead pixels on display",
+                   "charger not working", "fan is very loud", "bluetooth not pairing", "usb-c port loose",
+                   "microphone not detected"]
+
+
+class SyntheticDataGenerator:
+    def __init__(self, seed: int = 42, users: int = 1000, assets: int = 1000, assignments: int = 500,
+                 issues: int = 1000, skew: float = 3.0, password_pool: int = 16, bcrypt_rounds: int = 4,
+                 batch_size: int = 50_000):
+        if assignments > assets:
+            raise ValueError("assignments cannot exceed the number of assets")
+        if users < 1 or (issues and not assignments):
+            raise ValueError("issues need at least one user and one assignment")
+
+        self.seed = seed
+        self.users = users
+        self.assets = assets
+        self.assignments = assignments
+        self.issues = issues
+        self.skew = skew
+        self.password_pool = password_pool
+        self.bcrypt_rounds = bcrypt_rounds
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _sorted_uuids(self, n: int) -> list:
+        # Inserting in primary key order keeps the b-tree appends sequential
+        return sorted(self._uuid() for _ in range(n))
+
+    def _skewed_index(self, n: int) -> int:
+        """Power-law pick in [0, n): low indexes are chosen far more often than high ones"""
+        return min(n - 1, int(n * self.rng.random() ** self.skew))
+
+    def _timestamp(self, after: str = None, max_days: int = 365) -> str:
+        start = datetime.fromisoformat(after) if after else START_DATE
+        return str(start + timedelta(seconds=self.rng.randrange(max_days * 86400)))
+
+    def _bcrypt_hash(self, password: str) -> str:
+        # Salt drawn from the seeded RNG so hashes are reproducible; the 22nd character only carries 2 bits
+        salt = "".join(self.rng.choice(BCRYPT_ALPHABET) for _ in range(21)) + self.rng.choice(".Oeu")
+        return hashpw(password.encode("utf-8"), f"$2b${self.bcrypt_rounds:02d}${salt}".encode("utf-8")).decode("utf-8")
+
+    def _executemany(self, conn: sqlite3.Connection, query: str, rows):
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                conn.executemany(query, batch)
+                batch = []
+        if batch:
+            conn.executemany(query, batch)
+
+    def _user_rows(self, user_ids: list, password_hashes: list):
+        departments = [dept.value for dept in Department]
+        for i, user_id in enumerate(user_ids):
+            yield (user_id, f"{self.rng.choice(FIRST_NAMES)}{i % 1000}", password_hashes[i % len(password_hashes)],
+                   f"user{i}@watchguard.com", departments[self._skewed_index(len(departments))], Role.USER.value)
+
+    def _asset_rows(self, asset_ids: list, assigned: set):
+        for asset_id in asset_ids:
+            status = AssetStatus.ASSIGNED.value if asset_id in assigned else AssetStatus.AVAILABLE.value
+            model = self.rng.choice(ASSET_MODELS)
+            yield asset_id, model, f"{model} #{self.rng.randrange(10 ** 6):06d}", status
+
+    def generate(self, conn: sqlite3.Connection) -> dict:
+        """
+        Create the schema and bulk load every table.
+
+        Returns:
+            dict: row counts per table and the load time in seconds.
+        """
+        started = time.perf_counter()
+        create_tables(conn)
+
+        user_ids = self._sorted_uuids(self.users)
+        asset_ids = self._sorted_uuids(self.assets)
+        admin_id = self._uuid()
+        password_hashes = [self._bcrypt_hash(f"{USER_PASSWORD_PREFIX}{k}") for k in range(self.password_pool)]
+        admin_hash = self._bcrypt_hash(ADMIN_PASSWORD)
+
+        # Which assets are held, and by whom (skewed towards a few heavy users)
+        held_assets = self.rng.sample(asset_ids, self.assignments)
+        holders = [user_ids[self._skewed_index(self.users)] for _ in held_assets]
+        assigned_dates = [self._timestamp() for _ in held_assets]
+
+        conn.execute("PRAGMA foreign_keys = OFF;")
+        conn.execute("PRAGMA synchronous = OFF;")
+        conn.execute("PRAGMA journal_mode = MEMORY;")
+        drop_indexes(conn)
+        # The versions are bumped once at the end instead of by a trigger run per row, and
+        # the bulk load is not written to the changes log, which is reset: mirrors resync after a reload
+        drop_triggers(conn)
+
+        with conn:
+            conn.execute(
+                "INSERT INTO users (id, name, password, email, department, role) VALUES (?, ?, ?, ?, ?, ?)",
+                (admin_id, "admin", admin_hash, ADMIN_EMAIL, Department.CLOUD.value, Role.ADMIN.value)
+            )
+            self._executemany(
+                conn, "INSERT INTO users (id, name, password, email, department, role) VALUES (?, ?, ?, ?, ?, ?)",
+                self._user_rows(user_ids, password_hashes)
+            )
+            self._executemany(
+                conn, "INSERT INTO assets (serial_number, name, description, status) VALUES (?, ?, ?, ?)",
+                self._asset_rows(asset_ids, set(held_assets))
+            )
+            self._executemany(
+                conn,
+                "INSERT INTO assets_assigned (asset_assigned_id, user_id, asset_id, assigned_date) VALUES (?, ?, ?, ?)",
+                sorted((self._uuid(), holders[i], held_assets[i], assigned_dates[i])
+                       for i in range(self.assignments))
+            )
+            self._executemany(
+                conn,
+                "INSERT INTO issues (issue_id, report_date, user_id, asset_id, description) VALUES (?, ?, ?, ?, ?)",
+                sorted(self._issue_rows(held_assets, holders, assigned_dates))
+            )
+
+        create_indexes(conn)
+        create_triggers(conn)
+        rebuild_search_indexes(conn)
+        rebuild_counters(conn)
+        backfill_assignment_history(conn)
+        reset_changes_log(conn)
+        bump_versions(conn)
+        conn.execute("PRAGMA foreign_keys = ON;")
+        conn.execute("ANALYZE;")
+
+        return {
+            "users": self.users + 1,
+            "assets": self.assets,
+            "assets_assigned": self.assignments,
+            "issues": self.issues,
+            "seconds": round(time.perf_counter() - started, 2),
+        }
+
+    def _issue_rows(self, held_assets: list, holders: list, assigned_dates: list):
+        # Hot assets (low indexes) collect most of the issues, reported by whoever holds them
+        for _ in range(self.issues):
+            i = self._skewed_index(len(held_assets))
+            yield (self._uuid(), self._timestamp(assigned_dates[i], max_days=90), holders[i], held_assets[i],
+                   self.rng.choice(ISSUE_TEMPLATES))
+
+
+def truncate_tables(conn: sqlite3.Connection):
+    """
+    Delete every row before a reload. The triggers are dropped meanwhile, so the deletes are not
+    written to the changes log one by one (it is reset instead) and the append-only assignment
+    history can be emptied with the rows it refers to.
+    """
+    drop_triggers(conn)
+    with conn:
+        for table in ["issues", "assets_assigned", "assets", "users", "assignment_history"]:
+            conn.execute(f"DELETE FROM {table};")
+    bump_versions(conn)
+    rebuild_counters(conn)
+    rebuild_search_indexes(conn)
+    reset_changes_log(conn)
+    create_triggers(conn)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate deterministic synthetic data")
+    parser.add_argument("--db", default=config.DB, help="SQLite database to load")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--assets", type=int, default=1000)
+    parser.add_argument("--assignments", type=int, default=500)
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--skew", type=float, default=3.0, help="higher values concentrate assets and issues")
+    parser.add_argument("--password-pool", type=int, default=16)
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--truncate", action="store_true", help="delete existing rows first")
+    args = parser.parse_args(argv)
+
+    generator = SyntheticDataGenerator(
+        seed=args.seed, users=args.users, assets=args.assets, assignments=args.assignments, issues=args.issues,
+        skew=args.skew, password_pool=args.password_pool, bcrypt_rounds=args.bcrypt_rounds,
+        batch_size=args.batch_size
+    )
+
+    conn = sqlite3.connect(args.db)
+    try:
+        if args.truncate:
+            create_tables(conn)
+            truncate_tables(conn)
+        print(generator.generate(conn))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Delete old entries of the changes log behind GET /changes.
+
+Every write adds a row to the log, so it is pruned on a schedule (e.g. daily from cron). A mirror
+whose `since` falls before the oldest change kept is told to resync in full.
+
+Usage:
+    python -m src.app.scripts.prune_changes --db asset_management.db [--days 7]
+"""
+import argparse
+import sqlite3
+import sys
+
+import src.app.config.db_config as config
+import src.app.config.sync_config as sync_config
+from src.app.scripts.create_tables import create_tables
+
+
+def prune_changes(conn: sqlite3.Connection, retention_days: float) -> int:
+    """Delete the changes older than `retention_days`; returns how many"""
+    with conn:
+        # changed_at grows with the version, so this scan stops at the first change kept
+        kept = conn.execute(
+            "SELECT version FROM changes WHERE changed_at >= datetime('now', ?) ORDER BY version LIMIT 1",
+            (f"-{retention_days} days",)
+        ).fetchone()
+        if kept is None:
+            return conn.execute("DELETE FROM changes;").rowcount
+        return conn.execute("DELETE FROM changes WHERE version < ?;", (kept[0],)).rowcount
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Delete old entries of the changes log")
+    parser.add_argument("--db", default=config.DB, help="SQLite database")
+    parser.add_argument("--days", type=float, default=sync_config.CHANGES_RETENTION_DAYS,
+                        help="keep the changes of this many days")
+    args = parser.parse_args(argv)
+
+    conn = sqlite3.connect(args.db)
+    try:
+        create_tables(conn)
+        print(f"Pruned {prune_changes(conn, args.days)} changes")
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""
+Recompute the counters behind GET /stats from the tables, or check them against the tables.
+
+The counters are kept by triggers, so a rebuild is only needed after writes made with the
+triggers dropped or by hand. --check leaves them as they are and lists the counters that differ,
+exiting with status 1 if any do.
+
+Usage:
+    python -m src.app.scripts.rebuild_counters --db asset_management.db [--check]
+"""
+import argparse
+import sqlite3
+import sys
+
+import src.app.config.db_config as config
+from src.app.scripts.create_tables import create_tables, count_from_scratch, rebuild_counters
+
+
+def counter_drift(conn: sqlite3.Connection) -> list:
+    """(name, key, stored, actual) of every counter not matching the tables, sorted"""
+    stored = {(name, key): count for name, key, count in conn.execute("SELECT name, key, count FROM counters")}
+    actual = count_from_scratch(conn)
+    return sorted((name, key, stored.get((name, key), 0), actual.get((name, key), 0))
+                  for name, key in stored.keys() | actual.keys()
+                  if stored.get((name, key), 0) != actual.get((name, key), 0))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rebuild or check the counters behind GET /stats")
+    parser.add_argument("--db", default=config.DB, help="SQLite database")
+    parser.add_argument("--check", action="store_true", help="report counters that differ instead of rebuilding")
+    args = parser.parse_args(argv)
+
+    conn = sqlite3.connect(args.db)
+    try:
+        create_tables(conn)
+        if not args.check:
+            rebuild_counters(conn)
+            print("Counters rebuilt")
+            return 0
+
+        drift = counter_drift(conn)
+        for name, key, stored, actual in drift:
+            print(f"{name}[{key}]: stored {stored}, actual {actual}")
+        print(f"{len(drift)} counters differ" if drift else "Counters match")
+        return 1 if drift else 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
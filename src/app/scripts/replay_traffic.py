@@ -0,0 +1,152 @@
+"""
+Replay captured traffic (see `src.app.middleware.capture`) against a running server.
+
+Requests are re-issued with the recorded inter-arrival times divided by `--speedup`
+(0 sends as fast as the worker pool allows). Bearer tokens are re-minted with
+`Utils.create_jwt_token` for the recorded user and role. Recorded bodies are sanitized,
+so replayed logins carry a redacted password and exercise the failed-login path.
+
+Usage:
+    python -m src.app.scripts.replay_traffic traffic.jsonl --target http://127.0.0.1:5000 \\
+        --concurrency 16 --speedup 4
+"""
+import argparse
+import http.client
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from urllib.parse import urlsplit
+
+from src.app.utils.stats import summarize_latencies
+from src.app.utils.utils import Utils
+
+
+def load_records(path: str, limit: int = None) -> list:
+    records = []
+    with open(path, encoding="utf-8") as capture_file:
+        for line in capture_file:
+            line = line.strip()
+            if not line:
+                continue
+            records.append(json.loads(line))
+            if limit and len(records) >= limit:
+                break
+    records.sort(key=lambda record: record["ts"])
+    return records
+
+
+class ReplayDriver:
+    def __init__(self, target: str, concurrency: int = 8, speedup: float = 1.0, timeout: float = 30.0):
+        target = urlsplit(target)
+        self.host = target.hostname
+        self.port = target.port or (443 if target.scheme == "https" else 80)
+        self.connection_class = http.client.HTTPSConnection if target.scheme == "https" else http.client.HTTPConnection
+        self.concurrency = concurrency
+        self.speedup = speedup
+        self.timeout = timeout
+        self._tokens = {}
+        self._results = []
+        self._lock = Lock()
+
+    def _token(self, user_id: str, role: str) -> str:
+        key = (user_id, role)
+        if key not in self._tokens:
+            self._tokens[key] = Utils.create_jwt_token(user_id, role)
+        return self._tokens[key]
+
+    def _send(self, record: dict):
+        headers = {"Content-Type": "application/json"}
+        if record.get("user_id") and record.get("role"):
+            headers["Authorization"] = f"Bearer {self._token(record['user_id'], record['role'])}"
+        body = json.dumps(record["body"]) if record.get("body") is not None else None
+        path = record["path"] + (f"?{record['query']}" if record.get("query") else "")
+
+        started = time.perf_counter()
+        try:
+            conn = self.connection_class(self.host, self.port, timeout=self.timeout)
+            try:
+                conn.request(record["method"], path, body=body, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                status = response.status
+            finally:
+                conn.close()
+        except (OSError, http.client.HTTPException):
+            status = None
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self._results.append((record.get("route") or record["path"], record["method"], status,
+                                  record.get("status"), elapsed))
+
+    def run(self, records: list) -> dict:
+        """Replay `records` and return latency percentiles and error rates, overall and per route"""
+        self._results = []
+        started = time.perf_counter()
+        first_ts = records[0]["ts"] if records else 0
+
+        # Pre-mint tokens so signing cost does not show up as request latency
+        for record in records:
+            if record.get("user_id") and record.get("role"):
+                self._token(record["user_id"], record["role"])
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for record in records:
+                if self.speedup > 0:
+                    delay = (record["ts"] - first_ts) / self.speedup - (time.perf_counter() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+                executor.submit(self._send, record)
+
+        return self.report(time.perf_counter() - started)
+
+    def report(self, wall_seconds: float) -> dict:
+        by_route = {}
+        for route, method, status, _, elapsed in self._results:
+            by_route.setdefault(f"{method} {route}", []).append((status, elapsed))
+
+        def summarize(results):
+            summary = summarize_latencies([elapsed for _, elapsed in results])
+            errors = sum(1 for status, _ in results if status is None or status >= 500)
+            summary["errors"] = errors
+            summary["error_rate"] = round(errors / len(results), 4) if results else 0.0
+            return summary
+
+        overall = summarize([(status, elapsed) for _, _, status, _, elapsed in self._results])
+        overall["status_mismatches"] = sum(
+            1 for _, _, status, recorded, _ in self._results if recorded is not None and status != recorded
+        )
+        overall["throughput_rps"] = round(len(self._results) / wall_seconds, 2) if wall_seconds else 0.0
+        overall["wall_seconds"] = round(wall_seconds, 3)
+
+        return {
+            "overall": overall,
+            "routes": {route: summarize(results) for route, results in sorted(by_route.items())}
+        }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Replay captured traffic against a running server")
+    parser.add_argument("capture_file")
+    parser.add_argument("--target", default="http://127.0.0.1:5000")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--speedup", type=float, default=1.0, help="0 replays as fast as possible")
+    parser.add_argument("--limit", type=int, help="replay only the first N records")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    driver = ReplayDriver(args.target, concurrency=args.concurrency, speedup=args.speedup)
+    report = driver.run(load_records(args.capture_file, args.limit))
+
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(report_json)
+    print(report_json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
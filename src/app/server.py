@@ -0,0 +1,297 @@
+"""
+Production entry point: a preforking multi-process WSGI server.
+
+The master creates the Flask app once, freezes the GC so the objects built at startup stay in
+the permanent generation (collections in a worker then never write to those pages, keeping them
+shared copy-on-write), binds the listening socket and forks one worker per core. Workers accept
+from the shared socket and serve requests on a bounded thread pool. The master supervises them
+and restarts any that die.
+
+Signals (sent to the master):
+    SIGTERM, SIGINT  stop accepting, let workers drain in-flight requests, then exit
+    SIGHUP           graceful reload: rebuild the app, start a new generation of workers, then
+                     drain and retire the old one. Code changes still need a full restart.
+
+Usage:
+    python -m src.app.server --bind 0.0.0.0:5000 --workers 8 --threads 16
+"""
+import argparse
+import gc
+import importlib
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+import src.app.config.server_config as config
+from src.app.utils.process_lock import release_locks_held_by
+
+SUPERVISE_INTERVAL = 0.2
+MAX_RESPAWN_BACKOFF = 30.0
+
+log = logging.getLogger("server")
+
+
+class _RequestHandler(WSGIRequestHandler):
+    # One request per connection: an idle keep-alive connection would pin a pool thread
+    protocol_version = "HTTP/1.0"
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    WSGI server bound to an inherited socket that serves each connection on a fixed-size
+    thread pool. Accepting blocks while every thread is busy, leaving new connections in the
+    shared backlog for idle workers to pick up.
+    """
+
+    multithread = True
+    multiprocess = True
+
+    def __init__(self, app, fd: int, threads: int, master_pid: int = None):
+        listener = socket.socket(fileno=os.dup(fd))
+        host, port = listener.getsockname()[:2]
+        listener.close()
+        super().__init__(host, port, app, handler=_RequestHandler, fd=fd)
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="request")
+        self._slots = threading.BoundedSemaphore(threads)
+        self.master_pid = master_pid
+        self._orphaned = False
+
+    def process_request(self, request, client_address):
+        self._slots.acquire()
+        self.executor.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def service_actions(self):
+        # A worker whose master was killed outright must not keep serving unsupervised
+        if self.master_pid is not None and not self._orphaned and os.getppid() != self.master_pid:
+            self._orphaned = True
+            threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def drain(self):
+        """Wait for in-flight requests once `serve_forever` has returned"""
+        self.executor.shutdown(wait=True)
+        self.server_close()
+
+
+class PreforkServer:
+    def __init__(self, app_factory, host: str = None, port: int = None, workers: int = None,
+                 threads: int = None, graceful_timeout: float = None):
+        self.app_factory = app_factory
+        self.host = config.HOST if host is None else host
+        self.port = config.PORT if port is None else port
+        self.workers = workers if workers else config.WORKERS
+        self.threads = threads if threads else config.THREADS_PER_WORKER
+        self.graceful_timeout = config.GRACEFUL_TIMEOUT if graceful_timeout is None else graceful_timeout
+
+        self.app = None
+        self.socket = None
+        self.generation = 0
+        self._workers = {}  # pid -> (generation, started at)
+        self._retiring = {}  # pid -> kill deadline
+        self._stopping = False
+        self._reload_requested = False
+        self._respawn_backoff = 0.0
+        self._next_spawn_at = 0.0
+        self._wakeup = threading.Event()
+
+    # Master
+
+    def run(self) -> int:
+        self.socket = socket.create_server((self.host, self.port), backlog=config.LISTEN_BACKLOG)
+        # Several workers wait on the same socket; whoever loses the race must not block in accept()
+        self.socket.setblocking(False)
+        self.port = self.socket.getsockname()[1]
+        self._load_app()
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._request_stop)
+        signal.signal(signal.SIGHUP, self._request_reload)
+
+        log.info("Listening on http://%s:%s with %s workers x %s threads (master pid %s)",
+                 self.host, self.port, self.workers, self.threads, os.getpid())
+        try:
+            while not self._stopping:
+                self._reap_workers()
+                if self._reload_requested:
+                    self._reload()
+                self._spawn_missing_workers()
+                self._kill_overdue_workers()
+                self._wakeup.wait(SUPERVISE_INTERVAL)
+                self._wakeup.clear()
+            self._stop_workers()
+        finally:
+            self.socket.close()
+        log.info("Master %s stopped", os.getpid())
+        return 0
+
+    def _load_app(self):
+        gc.unfreeze()
+        self.app = self.app_factory()
+        gc.collect()
+        # Everything allocated so far moves to the permanent generation and is never scanned again,
+        # so the forked workers do not dirty the shared pages by touching their GC headers
+        gc.freeze()
+        self.generation += 1
+
+    def _request_stop(self, signum, frame):
+        self._stopping = True
+        self._wakeup.set()
+
+    def _request_reload(self, signum, frame):
+        self._reload_requested = True
+        self._wakeup.set()
+
+    def _reload(self):
+        self._reload_requested = False
+        log.info("Reloading: starting worker generation %s", self.generation + 1)
+        try:
+            self._load_app()
+        except Exception:
+            log.exception("Reload failed; keeping the current workers")
+            return
+        old_workers = [pid for pid, (generation, _) in self._workers.items() if generation < self.generation]
+        self._spawn_missing_workers(ignore_backoff=True)
+        for pid in old_workers:
+            self._retire(pid)
+
+    def _current_workers(self) -> list:
+        return [pid for pid, (generation, _) in self._workers.items()
+                if generation == self.generation and pid not in self._retiring]
+
+    def _spawn_missing_workers(self, ignore_backoff: bool = False):
+        if not ignore_backoff and time.monotonic() < self._next_spawn_at:
+            return
+        for _ in range(self.workers - len(self._current_workers())):
+            pid = os.fork()
+            if pid == 0:
+                self._worker_main()
+            self._workers[pid] = (self.generation, time.monotonic())
+
+    def _reap_workers(self):
+        while self._workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            generation, started_at = self._workers.pop(pid, (None, 0.0))
+            # A worker killed mid-write would otherwise lock every other worker out of shared memory
+            if release_locks_held_by(pid):
+                log.warning("Worker %s died holding a shared lock; released it", pid)
+            retired = self._retiring.pop(pid, None) is not None
+            if retired or self._stopping or generation != self.generation:
+                continue
+
+            # An unexpected exit: restart it, backing off if workers keep dying right after starting
+            log.warning("Worker %s exited unexpectedly (status %s); restarting", pid, status)
+            if time.monotonic() - started_at < config.MIN_WORKER_UPTIME:
+                self._respawn_backoff = min(MAX_RESPAWN_BACKOFF, max(0.1, self._respawn_backoff * 2))
+                self._next_spawn_at = time.monotonic() + self._respawn_backoff
+            else:
+                self._respawn_backoff = 0.0
+
+    def _retire(self, pid: int):
+        self._retiring[pid] = time.monotonic() + self.graceful_timeout
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def _kill_overdue_workers(self):
+        now = time.monotonic()
+        for pid, deadline in list(self._retiring.items()):
+            if now >= deadline:
+                log.warning("Worker %s did not drain within %ss; killing it", pid, self.graceful_timeout)
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                self._retiring[pid] = float("inf")
+
+    def _stop_workers(self):
+        log.info("Stopping: draining %s workers", len(self._workers))
+        for pid in list(self._workers):
+            self._retire(pid)
+        while self._workers:
+            self._reap_workers()
+            self._kill_overdue_workers()
+            time.sleep(SUPERVISE_INTERVAL / 4)
+
+    # Worker
+
+    def _worker_main(self):
+        exit_code = 0
+        master_pid = os.getppid()
+        try:
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            # Ctrl-C reaches the whole process group; only the master decides when workers stop
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            server = PooledWSGIServer(self.app, self.socket.fileno(), self.threads, master_pid)
+
+            def drain(signum, frame):
+                # shutdown() blocks until serve_forever() returns, so it cannot run on this thread
+                threading.Thread(target=server.shutdown, daemon=True).start()
+
+            signal.signal(signal.SIGTERM, drain)
+            server.serve_forever(poll_interval=0.5)
+            server.drain()
+        except BaseException:
+            log.exception("Worker %s crashed", os.getpid())
+            exit_code = 1
+        finally:
+            # Never return into the master's stack or run its exit handlers
+            os._exit(exit_code)
+
+
+def configure_logging():
+    """
+    Send the server's own messages to stderr. The root logger is left alone, so the application's
+    loggers keep writing only to their own handlers.
+    """
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s - %(process)d - %(levelname)s - %(message)s"))
+        log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+def load_factory(path: str):
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "create_app")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Preforking production server")
+    parser.add_argument("--bind", default=f"{config.HOST}:{config.PORT}", help="host:port to listen on")
+    parser.add_argument("--workers", type=int, default=config.WORKERS)
+    parser.add_argument("--threads", type=int, default=config.THREADS_PER_WORKER, help="threads per worker")
+    parser.add_argument("--graceful-timeout", type=float, default=config.GRACEFUL_TIMEOUT)
+    parser.add_argument("--factory", default="src.app.controllers.main:create_app", help="module:callable")
+    args = parser.parse_args(argv)
+
+    configure_logging()
+    host, _, port = args.bind.rpartition(":")
+    server = PreforkServer(load_factory(args.factory), host=host or config.HOST, port=int(port),
+                           workers=args.workers, threads=args.threads, graceful_timeout=args.graceful_timeout)
+    return server.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,25 +6,55 @@ from src.app.models.asset_issue import Issue
 from src.app.repositories.asset_issue_repository import IssueRepository
 from src.app.services.asset_service import AssetService
 from src.app.services.user_service import UserService
+from src.app.utils.cache.response_cache import ResponseCache, invalidates
+from src.app.utils.cache.single_flight import single_flight
+from src.app.utils.events.event_bus import EventBus
+from src.app.utils.db.table_versions import DATABASE_EPOCH
 from src.app.utils.errors.error import NotExistsError, NotAssignedError
+from src.app.utils.tracing.tracer import traced
 
 
+@traced
 class IssueService:
-    def __init__(self,issue_repository: IssueRepository, asset_service: AssetService, user_service: UserService):
+    def __init__(self,issue_repository: IssueRepository, asset_service: AssetService, user_service: UserService,
+                 response_cache: ResponseCache = None, event_bus: EventBus = None):
         self.issue_repository = issue_repository
         self.asset_service = asset_service
         self.user_service = user_service
+        self.response_cache = response_cache
+        self.event_bus = event_bus
 
+    def _notify_subscribers(self):
+        if self.event_bus is not None:
+            self.event_bus.wake()
+
+    @single_flight("issues")
     def get_issues(self):
         """Get all issues"""
         return self.issue_repository.fetch_all_issues()
 
+    def get_issues_version(self) -> tuple:
+        """Change version of the data behind `get_issues`"""
+        return self.issue_repository.fetch_table_versions([DATABASE_EPOCH, "issues"])
+
+    @single_flight("issues")
+    def search_issues(self, text: str, limit: int, offset: int) -> dict:
+        """One page of the issues matching `text`, most relevant first; paged like `search_assets`"""
+        results = self.issue_repository.search_issues(text, limit + 1, offset)
+        return {
+            "results": results[:limit],
+            "next_offset": offset + min(len(results), limit),
+            "has_more": len(results) > limit,
+        }
+
+    @single_flight("users", "issues")
     def get_user_issues(self, user_id: str):
         """Get all user specific issues"""
         if self.user_service.get_user_by_id(user_id) is None:
             raise NotExistsError("No such user exists")
         return self.issue_repository.fetch_user_issues(user_id)
 
+    @invalidates("issues")
     def report_issue(self, issue: Issue):
         """Report an issue"""
         if self.asset_service.get_asset_by_id(issue.asset_id) is None:
@@ -35,4 +65,6 @@ class IssueService:
             raise NotAssignedError("Asset not assigned to user")
 
         issue.report_date = datetime.now(timezone.utc)
-        return self.issue_repository.report_issue(issue)
+        result = self.issue_repository.report_issue(issue)
+        self._notify_subscribers()
+        return result
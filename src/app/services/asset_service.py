@@ -3,8 +3,16 @@ from typing import List
 from src.app.config.types import AssetStatus
 from src.app.models.asset import Asset
 from src.app.models.asset_assigned import AssetAssigned
+from src.app.models.assignment_history import AssignmentHistory
+from src.app.repositories.asset_read_model import AssetReadModel
 from src.app.repositories.asset_repository import AssetRepository
 from src.app.services.user_service import UserService
+from src.app.utils.cache.object_cache import VersionedCache
+from src.app.utils.cache.response_cache import ResponseCache, invalidates
+from src.app.utils.cache.single_flight import single_flight
+from src.app.utils.events.event_bus import EventBus
+from src.app.utils.db.table_versions import DATABASE_EPOCH
+from src.app.utils.tracing.tracer import traced
 from src.app.utils.errors.error import (
     ExistsError,
     NotExistsError,
@@ -13,38 +21,97 @@ from src.app.utils.errors.error import (
 )
 
 
+@traced
 class AssetService:
-    def __init__(self, asset_repository: AssetRepository, user_service: UserService):
+    def __init__(self, asset_repository: AssetRepository, user_service: UserService,
+                 response_cache: ResponseCache = None, event_bus: EventBus = None, sql_json: bool = False,
+                 read_model: AssetReadModel = None, asset_cache: VersionedCache = None):
         self.user_service = user_service
         self.asset_repository = asset_repository
-
+        self.response_cache = response_cache
+        self.event_bus = event_bus
+        self.read_model = read_model
+        # Asset and assignment reads go to the in-memory read model when there is one
+        self.asset_reads = asset_repository if read_model is None else read_model
+        # Serve the list reads as JSON encoded by SQLite (the `*_json` methods); the read model
+        # answers those from memory instead
+        self.sql_json = sql_json and read_model is None
+        # Assets by serial number; the read model makes it redundant
+        self.asset_cache = asset_cache if read_model is None else None
+
+    def _notify_subscribers(self):
+        # The events themselves are read from the changes log the write just added to
+        if self.event_bus is not None:
+            self.event_bus.wake()
+
+    def _fetch_asset(self, asset_id: str):
+        if self.asset_cache is not None:
+            return self.asset_cache.get_or_load(asset_id, lambda: self.asset_reads.fetch_asset_by_id(asset_id))
+        return self.asset_reads.fetch_asset_by_id(asset_id)
+
+    def _sync_read_model(self):
+        # Writes apply to the read model straight away, sparing the next read the catch-up
+        if self.read_model is not None:
+            self.read_model.sync()
+
+    @single_flight("assets")
     def get_assets(self):
         """Gets all assets"""
-        return self.asset_repository.fetch_all_assets()
+        return self.asset_reads.fetch_all_assets()
+
+    @single_flight("assets")
+    def get_assets_json(self) -> bytes:
+        """Gets all assets as encoded JSON"""
+        return self.asset_repository.fetch_all_assets_json()
 
+    def get_assets_version(self) -> tuple:
+        """Change version of the data behind `get_assets`"""
+        return self.asset_repository.fetch_table_versions([DATABASE_EPOCH, "assets"])
+
+    @single_flight("assets")
+    def search_assets(self, text: str, limit: int, offset: int) -> dict:
+        """
+        One page of the assets matching `text`, most relevant first. Callers pass `next_offset`
+        back as `offset` until `has_more` is false.
+        """
+        # One extra row tells whether another page follows without counting every match
+        results = self.asset_repository.search_assets(text, limit + 1, offset)
+        return {
+            "results": results[:limit],
+            "next_offset": offset + min(len(results), limit),
+            "has_more": len(results) > limit,
+        }
+
+    @invalidates("assets")
     def add_asset(self, asset: Asset):
         """Add a new asset"""
         # Check if the asset is already present
-        result = self.asset_repository.fetch_asset_by_id(asset.serial_number)
+        result = self._fetch_asset(asset.serial_number)
         if result is None:
             self.asset_repository.add_asset(asset)
+            self._sync_read_model()
         else:
             raise ExistsError("Asset already exist")
 
+    # Assignments and issues of the asset go with it (ON DELETE CASCADE)
+    @invalidates("assets", "assets_assigned", "issues")
     def delete_asset(self, asset_id: str):
         """Delete an existing asset"""
         # Check if the asset is even present or not
-        asset = self.asset_repository.fetch_asset_by_id(asset_id)
+        asset = self._fetch_asset(asset_id)
         if asset is None:
             raise NotExistsError("Asset does not exist")
         else:
             self.asset_repository.delete_asset(asset_id)
+            self._sync_read_model()
+            self._notify_subscribers()
             return asset
 
+    @invalidates("assets", "assets_assigned")
     def assign_asset(self, asset_assigned: AssetAssigned):
         """Assign an asset to a user"""
         # Check if the asset exists
-        result = self.asset_repository.fetch_asset_by_id(asset_assigned.asset_id)
+        result = self._fetch_asset(asset_assigned.asset_id)
         if result is None:
             raise NotExistsError("Asset does not exist")
 
@@ -54,19 +121,22 @@ class AssetService:
             raise NotExistsError("User does not exist")
 
         # Check if asset is assigned to any user
-        if self.asset_repository.check_asset_availability(asset_assigned.asset_id):
+        if self.asset_reads.check_asset_availability(asset_assigned.asset_id):
             self.asset_repository.assign_asset(asset_assigned)
             self.asset_repository.update_asset_status(asset_assigned.asset_id, AssetStatus.ASSIGNED.value)
+            self._sync_read_model()
+            self._notify_subscribers()
         else:
-            if self.asset_repository.is_asset_assigned(asset_assigned.user_id, asset_assigned.asset_id):
+            if self.asset_reads.is_asset_assigned(asset_assigned.user_id, asset_assigned.asset_id):
                 raise AlreadyAssignedError("Asset already assigned to the user")
             else:
                 raise AlreadyAssignedError("Asset already assigned to other user")
 
+    @invalidates("assets", "assets_assigned")
     def unassign_asset(self, user_id: str, asset_id: str):
         """Unassign an asset to a user"""
         # Check if the asset exists
-        result = self.asset_repository.fetch_asset_by_id(asset_id)
+        result = self._fetch_asset(asset_id)
         if result is None:
             raise NotExistsError("Asset does not exist")
 
@@ -75,12 +145,29 @@ class AssetService:
         if result is None:
             raise NotExistsError("User does not exist")
 
-        if self.asset_repository.is_asset_assigned(user_id, asset_id):
+        if self.asset_reads.is_asset_assigned(user_id, asset_id):
             self.asset_repository.unassign_asset(user_id, asset_id)
             self.asset_repository.update_asset_status(asset_id, AssetStatus.AVAILABLE.value)
+            self._sync_read_model()
+            self._notify_subscribers()
         else:
             raise NotAssignedError("Asset is not assigned to the user")
 
+    def get_holder_at(self, asset_id: str, at: str) -> AssignmentHistory:
+        """
+        Who held the asset at time `at`. Answered from the assignment history, which keeps the
+        assignments of deleted users and assets.
+        """
+        holder = self.asset_repository.fetch_holder_at(asset_id, at)
+        if holder is None:
+            raise NotExistsError("The asset was not assigned at that time")
+        return holder
+
+    def get_user_history(self, user_id: str, start: str, end: str) -> List[AssignmentHistory]:
+        """Everything the user held at some point between `start` and `end`"""
+        return self.asset_repository.fetch_user_history(user_id, start, end)
+
+    @single_flight("users", "assets", "assets_assigned")
     def view_assigned_assets(self, user_id: str) -> dict:
         """
         Retrieve all assets assigned to a user
@@ -89,13 +176,31 @@ class AssetService:
         if result is None:
             raise NotExistsError("User does not exist")
 
-        return self.asset_repository.view_assigned_assets(user_id)
+        return self.asset_reads.view_assigned_assets(user_id)
+
+    @single_flight("users", "assets", "assets_assigned")
+    def view_assigned_assets_json(self, user_id: str) -> bytes:
+        """`view_assigned_assets` as encoded JSON"""
+        result = self.user_service.get_user_by_id(user_id)
+        if result is None:
+            raise NotExistsError("User does not exist")
+
+        return self.asset_repository.view_assigned_assets_json(user_id)
 
+    @single_flight("users", "assets_assigned")
     def view_all_assigned_assets(self) -> List[dict]:
         return self.asset_repository.view_all_assigned_assets()
 
+    @single_flight("users", "assets_assigned")
+    def view_all_assigned_assets_json(self) -> bytes:
+        return self.asset_repository.view_all_assigned_assets_json()
+
+    def get_all_assigned_assets_version(self) -> tuple:
+        """Change version of the data behind `view_all_assigned_assets`"""
+        return self.asset_repository.fetch_table_versions([DATABASE_EPOCH, "users", "assets_assigned"])
+
     def get_asset_by_id(self, asset_id: str):
-        return self.asset_repository.fetch_asset_by_id(asset_id)
+        return self._fetch_asset(asset_id)
 
     def is_asset_assigned(self, user_id: str, asset_id: str):
-        return self.asset_repository.is_asset_assigned(user_id, asset_id)
+        return self.asset_reads.is_asset_assigned(user_id, asset_id)
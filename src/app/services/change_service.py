@@ -0,0 +1,27 @@
+from src.app.repositories.change_repository import ChangeRepository
+from src.app.utils.tracing.tracer import traced
+
+
+@traced
+class ChangeService:
+    def __init__(self, change_repository: ChangeRepository):
+        self.change_repository = change_repository
+
+    def get_changes(self, since: int, limit: int) -> dict:
+        """
+        One page of the changes log after version `since`. Callers pass `next_since` back as
+        `since` until `has_more` is false. `reset` means changes after `since` are no longer in
+        the log (pruned, or skipped by a bulk reload) and the mirror has to resync in full.
+        """
+        # One extra row tells whether another page follows without a COUNT over the log
+        changes = self.change_repository.fetch_changes(since, limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+        latest_version = self.change_repository.fetch_latest_version()
+        return {
+            "changes": changes,
+            "next_since": changes[-1].version if changes else since,
+            "has_more": has_more,
+            "latest_version": latest_version,
+            "reset": since + 1 < self.change_repository.fetch_oldest_version() or since > latest_version,
+        }
@@ -0,0 +1,24 @@
+from src.app.repositories.stats_repository import StatsRepository
+from src.app.utils.tracing.tracer import traced
+
+
+@traced
+class StatsService:
+    def __init__(self, stats_repository: StatsRepository):
+        self.stats_repository = stats_repository
+
+    def get_stats(self, top: int) -> dict:
+        """
+        Dashboard counts, read from counters maintained on every write rather than counted per
+        request, so the cost does not grow with the tables
+        """
+        counters = self.stats_repository.fetch_counters(["assets_by_status", "assignments_by_department", "totals"])
+        top_assets = self.stats_repository.fetch_top_counts("issues_by_asset", top)
+        return {
+            "assets_by_status": counters["assets_by_status"],
+            "assignments_by_department": counters["assignments_by_department"],
+            "open_issues": {
+                "total": counters["totals"].get("issues", 0),
+                "top_assets": [{"asset_id": row["key"], "count": row["count"]} for row in top_assets],
+            },
+        }
@@ -8,12 +8,28 @@ from src.app.utils.errors.error import (
     InvalidCredentialsError,
     AssetNotFoundError, NotExistsError
 )
+from src.app.utils.cache.object_cache import VersionedCache
+from src.app.utils.cache.response_cache import ResponseCache, invalidates
+from src.app.utils.cache.single_flight import single_flight
+from src.app.utils.events.event_bus import EventBus
 from src.app.utils.utils import Utils
+from src.app.utils.tracing.tracer import traced
 
+@traced
 class UserService:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, response_cache: ResponseCache = None,
+                 event_bus: EventBus = None, user_cache: VersionedCache = None):
         self.user_repository = user_repository
+        self.response_cache = response_cache
+        self.event_bus = event_bus
+        # Users by id, for the lookups every assignment and issue makes
+        self.user_cache = user_cache
 
+    def _notify_subscribers(self):
+        if self.event_bus is not None:
+            self.event_bus.wake()
+
+    @invalidates("users")
     def signup_user(self, user: User):
         """
         Register a new user
@@ -41,6 +57,8 @@ class UserService:
             raise InvalidCredentialsError("Email or password incorrect")
         return user
 
+    # Assignments and issues of the user go with it (ON DELETE CASCADE)
+    @invalidates("users", "assets_assigned", "issues")
     def delete_user_account(self, user_id: str) -> bool:
         """
         Delete user account
@@ -48,9 +66,13 @@ class UserService:
         """
         user = self.get_user_by_id(user_id)
         if user:
-            return self.user_repository.delete_user(user_id)
+            deleted = self.user_repository.delete_user(user_id)
+            if deleted:
+                self._notify_subscribers()
+            return deleted
         return False
 
+    @single_flight("users")
     def get_users(self) -> List[UserDTO]:
         """
         Get all users
@@ -62,6 +84,8 @@ class UserService:
         """
         Retrieve user by ID
         """
+        if self.user_cache is not None:
+            return self.user_cache.get_or_load(user_id, lambda: self.user_repository.fetch_user_by_id(user_id))
         user = self.user_repository.fetch_user_by_id(user_id)
         return user if user else None
 
@@ -0,0 +1,98 @@
+import os
+import time
+from threading import Lock
+from typing import Callable, Sequence
+
+import src.app.config.cache_config as config
+from src.app.config.db_config import DB
+from src.app.scripts.create_tables import VERSIONED_TABLES
+from src.app.utils.db.table_versions import fetch_table_versions
+from src.app.utils.errors.error import DatabaseError
+
+
+class CacheCoherence:
+    """
+    Table-granular invalidation of in-process caches across every worker process. The shared
+    change counters are the table_versions rows, bumped in the writing transaction by triggers
+    whatever process (or script) made the write.
+
+    `check()` runs `PRAGMA data_version` on a connection of its own, a cheap call whose result only
+    changes once another connection has committed. Only then are the counters read, and the
+    registered listeners are called with the tables whose counter moved. Caches call `check()`
+    before serving, so an entry built from a table another worker has since written is dropped
+    before it can be served.
+    """
+
+    def __init__(self, database: DB, tables: Sequence[str] = VERSIONED_TABLES, check_interval: float = None):
+        self.db = database
+        self.tables = tuple(tables)
+        self.check_interval = config.COHERENCE_CHECK_INTERVAL_SECONDS if check_interval is None else check_interval
+        self._listeners = []
+        self._lock = Lock()
+        self._conn = None
+        self._pid = None
+        self._data_version = None
+        self._versions = None
+        self._checked_at = None
+        self.checks = 0
+        self.version_reads = 0
+        self.invalidations = 0
+
+    def register(self, invalidate: Callable[..., None]):
+        """Call `invalidate(*tables)` whenever other connections have written to `tables`"""
+        self._listeners.append(invalidate)
+
+    def _connection(self):
+        # SQLite connections must not cross a fork; each worker checks on its own
+        if self._pid != os.getpid():
+            self._conn = self.db.get_connection(check_same_thread=False)
+            self._pid = os.getpid()
+            self._data_version = None
+        return self._conn
+
+    def check(self):
+        """Invalidate the listeners' entries for every table written since the last check"""
+        now = time.monotonic()
+        if self.check_interval and self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return
+        try:
+            with self._lock:
+                self._checked_at = now
+                self.checks += 1
+                conn = self._connection()
+                data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+                if data_version == self._data_version:
+                    return
+                self._data_version = data_version
+                versions = fetch_table_versions(conn, self.tables)
+                self.version_reads += 1
+                previous, self._versions = self._versions, versions
+
+                if previous is None:
+                    # First check in this process: nothing is known about what the caches hold
+                    changed = self.tables
+                else:
+                    changed = tuple(table for table, old, new in zip(self.tables, previous, versions) if old != new)
+                # Still under the lock, so no other check returns before the stale entries are gone
+                if changed:
+                    self.invalidations += 1
+                    for invalidate in self._listeners:
+                        invalidate(*changed)
+
+        except Exception as e:
+            raise DatabaseError(f"Failed to check table versions: {str(e)}")
+
+    def versions(self, tables: Sequence[str]) -> tuple:
+        """The change counters of `tables` as of a check made now"""
+        self.check()
+        with self._lock:
+            versions = dict(zip(self.tables, self._versions))
+        return tuple(versions[table] for table in tables)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "checks": self.checks,
+                "version_reads": self.version_reads,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,146 @@
+import pickle
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable
+
+import src.app.config.cache_config as config
+
+# Rough per-entry bookkeeping cost (key, dict slot, entry record) on top of the value
+ENTRY_OVERHEAD_BYTES = 128
+
+
+def pickled_size(value) -> int:
+    """Default size estimate: the value's pickled length"""
+    return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires")
+
+    def __init__(self, value, size: int, expires: float):
+        self.value = value
+        self.size = size
+        self.expires = expires
+
+
+class LRUCache:
+    """
+    In-process cache within a byte budget, evicting the least recently used entries to stay
+    under it. Entries can expire: after the cache's `ttl`, or a per-entry one given to `set`.
+    Entry sizes come from `sizeof`, the pickled length unless the caller passes its own.
+    `max_bytes` can be changed at runtime with `resize`; 0 turns the cache off.
+    """
+
+    def __init__(self, name: str = "cache", max_bytes: int = None, ttl: float = None,
+                 sizeof: Callable[[object], int] = None):
+        self.name = name
+        self.max_bytes = config.LOCAL_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof if sizeof is not None else pickled_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires and entry.expires <= time.time():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def peek(self, key):
+        """The value of `key` without counting a lookup or refreshing its recency"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.value if entry is not None else None
+
+    def set(self, key, value, ttl: float = None, size: int = None) -> bool:
+        """Store `value`, taking `size` bytes if given; False if it alone is over the budget"""
+        size = self.sizeof(value) + ENTRY_OVERHEAD_BYTES if size is None else size
+        if size > self.max_bytes:
+            return False
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = _Entry(value, size, time.time() + ttl if ttl else 0.0)
+            self.bytes += size
+            self.sets += 1
+            self._evict()
+            return True
+
+    def grow(self, key, delta: int):
+        """Account `delta` more bytes to an entry whose value grew in place"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.size += delta
+                self.bytes += delta
+                self._evict()
+
+    def delete(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def discard_where(self, predicate: Callable[[object, object], bool]) -> int:
+        """Drop the entries for which `predicate(key, value)` holds; returns how many"""
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if predicate(key, entry.value)]
+            for key in stale:
+                self._remove(key)
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def resize(self, max_bytes: int):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "local",
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def close(self):
+        self.clear()
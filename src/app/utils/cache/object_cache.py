@@ -0,0 +1,51 @@
+from typing import Callable, Sequence
+
+from src.app.utils.cache.coherence import CacheCoherence
+from src.app.utils.cache.lru_cache import LRUCache
+from src.app.utils.errors.error import DatabaseError
+
+BACKENDS = ("local", "shared")
+
+
+def create_backend(kind: str, name: str):
+    """An `LRUCache` or `SharedMemoryCache` named `name`; None when `kind` is empty"""
+    if not kind:
+        return None
+    if kind not in BACKENDS:
+        raise ValueError(f"Unknown cache backend {kind!r}, expected one of {BACKENDS}")
+    if kind == "shared":
+        # Only imported when used: creating the segment allocates it
+        from src.app.utils.cache.shared_memory_cache import SharedMemoryCache
+        return SharedMemoryCache(name)
+    return LRUCache(name)
+
+
+class VersionedCache:
+    """
+    Cache of values read from `tables`. Each value is stored with the tables' change counters as
+    they were before it was read, and only served while the counters are unchanged, so a write
+    from any process makes the entries of its table stale without anything being deleted. This
+    suits a shared backend, whose entries outlive the process that stored them.
+    """
+
+    def __init__(self, backend, tables: Sequence[str], coherence: CacheCoherence):
+        self.backend = backend
+        self.tables = tuple(tables)
+        self.coherence = coherence
+
+    def get_or_load(self, key, load: Callable):
+        """The cached value of `key`, or `load()`; None results are not cached"""
+        try:
+            versions = self.coherence.versions(self.tables)
+        except DatabaseError:
+            return load()
+        entry = self.backend.get(key)
+        if entry is not None and entry[0] == versions:
+            return entry[1]
+        value = load()
+        if value is not None:
+            self.backend.set(key, (versions, value))
+        return value
+
+    def stats(self) -> dict:
+        return self.backend.stats()
@@ -0,0 +1,129 @@
+import os
+from threading import Lock
+
+import src.app.config.cache_config as config
+from src.app.utils.errors.error import NotExistsError, InvalidOperationError
+
+# Counters and gauges exported by `metrics()`, as (stats key, metric name, type)
+METRICS = (
+    ("hits", "cache_hits_total", "counter"),
+    ("misses", "cache_misses_total", "counter"),
+    ("evictions", "cache_evictions_total", "counter"),
+    ("entries", "cache_entries", "gauge"),
+    ("bytes", "cache_bytes", "gauge"),
+    ("max_bytes", "cache_max_bytes", "gauge"),
+)
+
+
+class CacheRegistry:
+    """
+    The process's caches by name, within one memory budget. A cache registered with a `share` is
+    sized by the registry: whatever the fixed-size caches leave of the budget is divided across
+    them in proportion to their shares, and re-divided whenever that changes. A cache without a
+    share keeps its size, as does one given a size through `resize`.
+
+    Caches need `max_bytes`, `resize(max_bytes)`, `clear()` and `stats()`.
+
+    Each worker has its own registry and stats. Given a `ControlBlock`, `update` reaches every
+    worker: it applies here and is published for the others to apply before their next request.
+    """
+
+    def __init__(self, budget_bytes: int = None, control_block=None):
+        self.budget_bytes = config.CACHE_MEMORY_BUDGET_BYTES if budget_bytes is None else budget_bytes
+        self._caches = {}  # name -> cache
+        self._shares = {}  # name -> share, for the caches sized by the registry
+        self._lock = Lock()
+        self.control_block = control_block
+        if control_block is not None:
+            control_block.register("cache", self._update)
+
+    def register(self, name: str, cache, share: float = None):
+        with self._lock:
+            if name in self._caches:
+                raise ValueError(f"Cache {name!r} is already registered")
+            if share is None and self._fixed_bytes() + cache.max_bytes > self.budget_bytes:
+                raise ValueError(f"Cache {name!r} of {cache.max_bytes} bytes does not fit the remaining budget")
+            self._caches[name] = cache
+            if share is not None:
+                self._shares[name] = share
+            self._rebalance()
+        return cache
+
+    def get(self, name: str):
+        cache = self._caches.get(name)
+        if cache is None:
+            raise NotExistsError(f"No cache named {name!r}")
+        return cache
+
+    def names(self) -> list:
+        return list(self._caches)
+
+    def resize(self, name: str, max_bytes: int):
+        """Give `name` a fixed size of `max_bytes`, re-dividing the rest of the budget"""
+        cache = self.get(name)
+        with self._lock:
+            others = self._fixed_bytes() - (0 if name in self._shares else cache.max_bytes)
+            if others + max_bytes > self.budget_bytes:
+                raise InvalidOperationError(
+                    f"{max_bytes} bytes for {name!r} would exceed the cache budget of {self.budget_bytes} bytes"
+                )
+            cache.resize(max_bytes)
+            self._shares.pop(name, None)
+            self._rebalance()
+
+    def flush(self, name: str):
+        self.get(name).clear()
+
+    def update(self, name: str, max_bytes: int = None, flush: bool = False):
+        """Resize and/or flush `name` in every worker"""
+        self._update(name, max_bytes, flush)
+        if self.control_block is not None:
+            # A shared cache was flushed for every worker already
+            flush = flush and not getattr(self.get(name), "shared", False)
+            if max_bytes is not None or flush:
+                self.control_block.publish("cache", name=name, max_bytes=max_bytes, flush=flush)
+
+    def _update(self, name: str, max_bytes: int = None, flush: bool = False):
+        self.get(name)
+        if max_bytes is not None:
+            self.resize(name, max_bytes)
+        if flush:
+            self.flush(name)
+
+    def _fixed_bytes(self) -> int:
+        return sum(cache.max_bytes for name, cache in self._caches.items() if name not in self._shares)
+
+    def _rebalance(self):
+        if not self._shares:
+            return
+        free = max(self.budget_bytes - self._fixed_bytes(), 0)
+        total = sum(self._shares.values())
+        for name, share in self._shares.items():
+            self._caches[name].resize(int(free * share / total))
+
+    def cache_stats(self, name: str) -> dict:
+        stats = dict(self.get(name).stats())
+        stats["share"] = self._shares.get(name)
+        return stats
+
+    def stats(self) -> dict:
+        """The caches of this worker, named by `pid`"""
+        caches = {name: self.cache_stats(name) for name in self.names()}
+        return {
+            "pid": os.getpid(),
+            "budget_bytes": self.budget_bytes,
+            "allocated_bytes": sum(stats["max_bytes"] for stats in caches.values()),
+            "caches": caches,
+        }
+
+    def metrics(self) -> str:
+        """Every cache's counters in the Prometheus text format"""
+        caches = {name: self.get(name).stats() for name in self.names()}
+        lines = []
+        for key, metric, kind in METRICS:
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, stats in caches.items():
+                lines.append(f'{metric}{{cache="{name}"}} {stats.get(key, 0)}')
+        lines.append("# TYPE cache_budget_bytes gauge")
+        lines.append(f"cache_budget_bytes {self.budget_bytes}")
+        return "\n".join(lines) + "\n"
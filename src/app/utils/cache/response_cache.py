@@ -0,0 +1,173 @@
+import functools
+from threading import Lock
+
+from flask import request, g, current_app, after_this_request
+
+import src.app.config.cache_config as config
+from src.app.utils.cache.coherence import CacheCoherence
+from src.app.utils.cache.lru_cache import LRUCache
+from src.app.utils.cache.single_flight import flights
+from src.app.utils.errors.error import DatabaseError
+
+# Rough per-entry bookkeeping cost (key, headers, dict slot) on top of the body bytes
+ENTRY_OVERHEAD_BYTES = 512
+# Response headers kept with the body
+CACHED_HEADERS = ("Content-Type", "ETag")
+
+
+class CachedResponse:
+    __slots__ = ("body", "status", "headers", "tables", "encoded", "size")
+
+    def __init__(self, body: bytes, status: int, headers: list, tables: tuple):
+        self.body = body
+        self.status = status
+        self.headers = headers
+        self.tables = tables
+        # Content-Encoding -> compressed body, added on first request for that encoding
+        self.encoded = {}
+        self.size = len(body) + ENTRY_OVERHEAD_BYTES
+
+
+class ResponseCache:
+    """
+    Serialized responses, kept in an `LRUCache` of `max_bytes`. Each entry records the tables it
+    was built from; `invalidate(table)` drops every entry depending on that table.
+
+    Service writes invalidate in-process. Writes made by another worker process or directly in
+    the database are only seen with a `coherence` checker, consulted before every lookup.
+    """
+
+    def __init__(self, max_bytes: int = None, max_entry_bytes: int = None, coherence: CacheCoherence = None):
+        self.max_entry_bytes = config.RESPONSE_CACHE_MAX_ENTRY_BYTES if max_entry_bytes is None else max_entry_bytes
+        self.store = LRUCache(
+            "responses", config.RESPONSE_CACHE_MAX_BYTES if max_bytes is None else max_bytes,
+            sizeof=lambda entry: entry.size
+        )
+        self._generations = {}  # table -> number of invalidations so far
+        self._lock = Lock()
+        self.coherence = coherence
+        if coherence is not None:
+            coherence.register(self.invalidate)
+
+    @property
+    def max_bytes(self) -> int:
+        return self.store.max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        return self.store.max_bytes > 0
+
+    def get(self, key):
+        if self.coherence is not None:
+            try:
+                self.coherence.check()
+            except DatabaseError:
+                # Nothing cached can be trusted without the change counters
+                self.clear()
+        return self.store.get(key)
+
+    def generation(self, tables: tuple) -> tuple:
+        """Snapshot to pass to `put`, taken before the response is computed"""
+        with self._lock:
+            return tuple(self._generations.get(table, 0) for table in tables)
+
+    def put(self, key, entry: CachedResponse, generation: tuple) -> bool:
+        """
+        Store `entry` unless one of its tables was invalidated since `generation` was taken, in
+        which case the response may predate the write and is dropped
+        """
+        if entry.size > self.max_entry_bytes:
+            return False
+        with self._lock:
+            if tuple(self._generations.get(table, 0) for table in entry.tables) != generation:
+                return False
+            return self.store.set(key, entry, size=entry.size)
+
+    def add_encoding(self, key, entry: CachedResponse, encoding: str, body: bytes):
+        """Keep a compressed copy of `entry`'s body, if the entry is still cached"""
+        with self._lock:
+            if self.store.peek(key) is not entry or encoding in entry.encoded:
+                return
+            entry.encoded[encoding] = body
+            entry.size += len(body)
+            self.store.grow(key, len(body))
+
+    def invalidate(self, *tables: str):
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+            self.store.discard_where(lambda key, entry: not set(entry.tables).isdisjoint(tables))
+
+    def clear(self):
+        self.store.clear()
+
+    def resize(self, max_bytes: int):
+        self.store.resize(max_bytes)
+
+    def stats(self) -> dict:
+        return self.store.stats()
+
+
+def cached_response(*tables: str):
+    """
+    Serve a handler method from the handler's `response_cache`, keyed by endpoint, query
+    parameters and role. Only 200 responses are stored. `tables` are the tables the response is
+    built from; service writes to any of them invalidate it.
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapped_func(self, *args, **kwargs):
+            cache = self.response_cache
+            if cache is None or not cache.enabled:
+                return f(self, *args, **kwargs)
+
+            key = (request.endpoint, tuple(sorted(request.args.items(multi=True))), g.get("role"))
+            entry = cache.get(key)
+            if entry is not None:
+                # Lets the compression hook reuse or store the compressed body
+                g.cached_response = (cache, key, entry)
+                response = current_app.response_class(entry.body, status=entry.status, headers=entry.headers)
+                response.headers["X-Cache"] = "HIT"
+                # Answers If-None-Match from the stored ETag
+                return response.make_conditional(request.environ)
+
+            generation = cache.generation(tables)
+            result = f(self, *args, **kwargs)
+
+            # Registered after the handler ran so it sees headers set by the handler's own callbacks
+            @after_this_request
+            def store(response):
+                if response.status_code == 200 and not response.is_streamed:
+                    headers = [(name, response.headers[name]) for name in CACHED_HEADERS if name in response.headers]
+                    entry = CachedResponse(response.get_data(), 200, headers, tables)
+                    if cache.put(key, entry, generation):
+                        g.cached_response = (cache, key, entry)
+                response.headers["X-Cache"] = "MISS"
+                return response
+
+            return result
+
+        return wrapped_func
+
+    return decorator
+
+
+def invalidates(*tables: str):
+    """
+    Service method decorator: drop cached responses built from `tables` once the method has run,
+    and stop later reads from joining reads of those tables already in flight. Runs on failure
+    too, since a write may have partly gone through.
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapped_func(self, *args, **kwargs):
+            try:
+                return f(self, *args, **kwargs)
+            finally:
+                flights.forget(*tables)
+                if self.response_cache is not None:
+                    self.response_cache.invalidate(*tables)
+
+        return wrapped_func
+
+    return decorator
@@ -0,0 +1,248 @@
+import atexit
+import hashlib
+import os
+import pickle
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Union
+
+import src.app.config.cache_config as config
+from src.app.utils.errors.error import LockTimeoutError, InvalidOperationError
+from src.app.utils.process_lock import ProcessLock
+
+# Slot layout: sequence number, key hash, expiry (epoch seconds, 0 for none), key and value
+# lengths, then the key and pickled value bytes
+_SEQ = struct.Struct("<I")
+_HEADER = struct.Struct("<IQdHI")
+SLOT_HEADER_BYTES = 32
+EMPTY = 0
+TOMBSTONE = 1
+# Slots looked at for a key before giving up (reads) or evicting (writes)
+MAX_PROBES = 16
+READ_RETRIES = 64
+WRITE_LOCK_TIMEOUT_SECONDS = 0.05
+
+
+def _key_bytes(key: Union[str, bytes]) -> bytes:
+    return key if isinstance(key, bytes) else key.encode("utf-8")
+
+
+def _hash(key: bytes) -> int:
+    # Stable across processes, unlike hash(); 0 and 1 mark empty and deleted slots
+    value = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+    return value if value > TOMBSTONE else value + 2
+
+
+class SharedMemoryCache:
+    """
+    Fixed-size hash table in a shared-memory segment, shared by every process forked after it was
+    created. Open addressing with linear probing over `slots` slots of `slot_bytes` each; values
+    are pickled and must fit in a slot with their key, larger ones are not cached.
+
+    Reads take no lock. Each slot carries a sequence number a writer makes odd before changing the
+    slot and even again afterwards (a seqlock): a reader copies the slot, then re-reads the
+    sequence number and retries if it was odd or has moved. Writers, rarer, serialize on one lock
+    shared across processes; a `set` that cannot get it in time is skipped, a cache write being
+    optional, while `delete` and `clear` raise `LockTimeoutError`. A full probe window evicts the
+    key's home slot.
+
+    The lock is a `ProcessLock`: when a writer is killed holding it, it is released for it once
+    the slots it left half-written have been emptied.
+    """
+
+    # One table for every process: clearing it in one clears it for all
+    shared = True
+
+    def __init__(self, name: str = "cache", slots: int = None, slot_bytes: int = None):
+        self.name = name
+        self.slots = config.SHARED_CACHE_SLOTS if slots is None else slots
+        self.slot_bytes = config.SHARED_CACHE_SLOT_BYTES if slot_bytes is None else slot_bytes
+        if self.slot_bytes <= SLOT_HEADER_BYTES:
+            raise ValueError(f"slot_bytes must be larger than {SLOT_HEADER_BYTES}")
+        self.data_bytes = self.slot_bytes - SLOT_HEADER_BYTES
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slots * self.slot_bytes)
+        self._buf = self._shm.buf
+        # The segment is zero-filled: every slot starts empty with an even sequence number
+        self._write_lock = ProcessLock(on_recover=self._empty_half_written_slots)
+        self._owner_pid = os.getpid()
+        atexit.register(self.close)
+
+        # Counted per process
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.skipped_writes = 0
+
+    # Reads
+
+    def _find(self, key: bytes, key_hash: int):
+        """(offset, expires, value bytes) of `key`, or None"""
+        buf = self._buf
+        index = key_hash % self.slots
+        for _ in range(min(MAX_PROBES, self.slots)):
+            offset = index * self.slot_bytes
+            for _ in range(READ_RETRIES):
+                seq, slot_hash, expires, key_len, value_len = _HEADER.unpack_from(buf, offset)
+                if seq & 1:
+                    continue
+                if slot_hash != key_hash:
+                    break
+                if key_len + value_len > self.data_bytes:
+                    continue
+                start = offset + SLOT_HEADER_BYTES
+                slot_key = bytes(buf[start:start + key_len])
+                value = bytes(buf[start + key_len:start + key_len + value_len])
+                if _SEQ.unpack_from(buf, offset)[0] != seq:
+                    continue
+                if slot_key == key:
+                    return offset, expires, value
+                break
+            else:
+                # Kept changing under us: report a miss rather than spin
+                return None
+            if slot_hash == EMPTY:
+                return None
+            index = (index + 1) % self.slots
+        return None
+
+    def get(self, key: Union[str, bytes]):
+        key = _key_bytes(key)
+        found = self._find(key, _hash(key))
+        if found is None or (found[1] and found[1] <= time.time()):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(found[2])
+
+    # Writes
+
+    def _acquire(self) -> bool:
+        return self._write_lock.acquire(WRITE_LOCK_TIMEOUT_SECONDS)
+
+    def _release(self):
+        self._write_lock.release()
+
+    def _acquire_or_raise(self, operation: str):
+        if not self._acquire():
+            self.skipped_writes += 1
+            raise LockTimeoutError(f"Shared cache {self.name!r} is busy; {operation} was not applied")
+
+    def _write_slot(self, offset: int, key_hash: int, expires: float, key: bytes, value: bytes):
+        buf = self._buf
+        seq = _SEQ.unpack_from(buf, offset)[0]
+        # Odd while the slot changes; also recovers a slot left odd by a writer that died mid-write
+        seq = (seq | 1) & 0xFFFFFFFF
+        _SEQ.pack_into(buf, offset, seq)
+        start = offset + SLOT_HEADER_BYTES
+        buf[start:start + len(key)] = key
+        buf[start + len(key):start + len(key) + len(value)] = value
+        _HEADER.pack_into(buf, offset, seq, key_hash, expires, len(key), len(value))
+        _SEQ.pack_into(buf, offset, (seq + 1) & 0xFFFFFFFF)
+
+    def _slot(self, key: bytes, key_hash: int):
+        """Offset of the slot holding `key`, else of the slot to store it in, and whether that evicts"""
+        buf = self._buf
+        home = key_hash % self.slots
+        free = None
+        now = time.time()
+        for probe in range(min(MAX_PROBES, self.slots)):
+            offset = ((home + probe) % self.slots) * self.slot_bytes
+            _, slot_hash, expires, key_len, _ = _HEADER.unpack_from(buf, offset)
+            if slot_hash == EMPTY:
+                return (free if free is not None else offset), False
+            if slot_hash == key_hash:
+                start = offset + SLOT_HEADER_BYTES
+                if bytes(buf[start:start + key_len]) == key:
+                    return offset, False
+            if free is None and (slot_hash == TOMBSTONE or (expires and expires <= now)):
+                free = offset
+        if free is not None:
+            return free, False
+        return home * self.slot_bytes, True
+
+    def set(self, key: Union[str, bytes], value, ttl: float = None) -> bool:
+        """Store `value` under `key`, for `ttl` seconds if given. False if it was not stored."""
+        key = _key_bytes(key)
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(key) + len(data) > self.data_bytes:
+            return False
+        key_hash = _hash(key)
+        expires = time.time() + ttl if ttl else 0.0
+        if not self._acquire():
+            self.skipped_writes += 1
+            return False
+        try:
+            offset, evicts = self._slot(key, key_hash)
+            self._write_slot(offset, key_hash, expires, key, data)
+        finally:
+            self._release()
+        self.sets += 1
+        self.evictions += evicts
+        return True
+
+    def delete(self, key: Union[str, bytes]):
+        key = _key_bytes(key)
+        key_hash = _hash(key)
+        self._acquire_or_raise("delete")
+        try:
+            found = self._find(key, key_hash)
+            if found is not None:
+                self._write_slot(found[0], TOMBSTONE, 0.0, b"", b"")
+        finally:
+            self._release()
+
+    def clear(self):
+        self._acquire_or_raise("clear")
+        try:
+            for index in range(self.slots):
+                offset = index * self.slot_bytes
+                if _HEADER.unpack_from(self._buf, offset)[1] != EMPTY:
+                    self._write_slot(offset, EMPTY, 0.0, b"", b"")
+        finally:
+            self._release()
+
+    def _empty_half_written_slots(self):
+        if self._buf is None:
+            return
+        for index in range(self.slots):
+            offset = index * self.slot_bytes
+            if _SEQ.unpack_from(self._buf, offset)[0] & 1:
+                self._write_slot(offset, EMPTY, 0.0, b"", b"")
+
+    @property
+    def max_bytes(self) -> int:
+        return self.slots * self.slot_bytes
+
+    def resize(self, max_bytes: int):
+        raise InvalidOperationError(f"Shared cache {self.name!r} has a fixed size of {self.max_bytes} bytes")
+
+    def stats(self) -> dict:
+        used = sum(1 for index in range(self.slots)
+                   if _HEADER.unpack_from(self._buf, index * self.slot_bytes)[1] > TOMBSTONE)
+        lookups = self.hits + self.misses
+        return {
+            "backend": "shared",
+            "entries": used,
+            "slots": self.slots,
+            "bytes": self.max_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "skipped_writes": self.skipped_writes,
+        }
+
+    def close(self):
+        """Detach from the segment; the creating process also removes it"""
+        if self._buf is None:
+            return
+        self._buf.release()
+        self._buf = None
+        self._shm.close()
+        if os.getpid() == self._owner_pid:
+            self._shm.unlink()
+        atexit.unregister(self.close)
+
@@ -0,0 +1,104 @@
+import functools
+from threading import Event, Lock
+
+import src.app.config.cache_config as config
+from src.app.utils.errors.error import InFlightTimeoutError
+
+
+class _Call:
+    __slots__ = ("tables", "done", "result", "error", "waiters")
+
+    def __init__(self, tables: tuple):
+        self.tables = tables
+        self.done = Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: the first caller for a key runs the function, callers
+    arriving while it runs wait for it and get the same result, or the same exception.
+    """
+
+    def __init__(self, timeout: float = None):
+        self.timeout = config.SINGLE_FLIGHT_TIMEOUT_SECONDS if timeout is None else timeout
+        self._calls = {}
+        self._lock = Lock()
+        self.calls = 0
+        self.coalesced = 0
+        self.timeouts = 0
+
+    def do(self, key, fn, tables: tuple = (), timeout: float = None):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call(tables)
+                self.calls += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call.result = fn()
+                return call.result
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    if self._calls.get(key) is call:
+                        del self._calls[key]
+                call.done.set()
+
+        if not call.done.wait(self.timeout if timeout is None else timeout):
+            with self._lock:
+                self.timeouts += 1
+            raise InFlightTimeoutError(f"Timed out waiting for in-flight call {key[0]}")
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def forget(self, *tables: str):
+        """
+        Stop new callers joining flights that read `tables`. Called after a write, so a read that
+        started before it is not shared with callers that expect to see it.
+        """
+        with self._lock:
+            for key in [key for key, call in self._calls.items() if set(call.tables) & set(tables)]:
+                del self._calls[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "timeouts": self.timeouts,
+            }
+
+
+# Process-wide group used by the service decorators
+flights = SingleFlight()
+
+
+def single_flight(*tables: str, timeout: float = None):
+    """
+    Service method decorator coalescing concurrent calls with the same instance and arguments.
+    `tables` are the tables the method reads; writes to them stop new callers joining a flight
+    already in progress. Callers share the returned object, so it must not be mutated.
+    """
+    def decorator(f):
+        name = f.__qualname__
+
+        @functools.wraps(f)
+        def wrapped_func(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            return flights.do(key, lambda: f(*args, **kwargs), tables, timeout)
+
+        return wrapped_func
+
+    return decorator
@@ -0,0 +1,107 @@
+import json
+import multiprocessing
+import os
+import threading
+from typing import Callable
+
+from flask import Flask
+
+import src.app.config.server_config as config
+from src.app.utils.errors.error import LockTimeoutError
+from src.app.utils.process_lock import ProcessLock
+
+_LENGTH_BYTES = 4
+
+
+class ControlBlock:
+    """
+    Admin commands for every worker of the prefork server. A worker that changes its own state
+    on an admin request (resizes a cache, turns the profiler on) publishes the command here, in
+    memory shared by every process forked after the block was created, and every other worker
+    applies it before serving its next request.
+
+    The last `slots` commands are kept in a ring. A worker started later begins from the
+    master's state and replays them, so commands must be idempotent: set a size, not add to it.
+
+    Readers take no lock: a reader that finds a slot was overwritten while it read skips the
+    command, as it would one that had fallen out of the ring.
+    """
+
+    def __init__(self, slots: int = None, command_bytes: int = None):
+        self.slots = config.CONTROL_COMMAND_SLOTS if slots is None else slots
+        self.command_bytes = config.CONTROL_COMMAND_BYTES if command_bytes is None else command_bytes
+        self._sequence = multiprocessing.RawValue("Q", 0)
+        self._ring = multiprocessing.RawArray("B", self.slots * (_LENGTH_BYTES + self.command_bytes))
+        self._write_lock = ProcessLock()
+        self._handlers = {}  # kind -> handler(**args)
+        self._apply_lock = threading.Lock()
+        # Counted per process; a forked worker starts from its parent's count
+        self._applied = 0
+        self.failed = 0
+
+    def register(self, kind: str, handler: Callable):
+        """Apply commands of `kind` published by other processes with `handler(**args)`"""
+        self._handlers[kind] = handler
+
+    def publish(self, kind: str, **args):
+        """Record a command the calling process has already applied, for the other workers"""
+        command = json.dumps({"kind": kind, "args": args, "pid": os.getpid()}).encode("utf-8")
+        if len(command) > self.command_bytes:
+            raise ValueError(f"Command of {len(command)} bytes does not fit a {self.command_bytes} byte slot")
+        if not self._write_lock.acquire(config.CONTROL_LOCK_TIMEOUT_SECONDS):
+            raise LockTimeoutError("Admin commands are busy; the command was only applied to this worker")
+        try:
+            sequence = self._sequence.value + 1
+            offset = self._offset(sequence)
+            self._ring[offset:offset + _LENGTH_BYTES] = len(command).to_bytes(_LENGTH_BYTES, "little")
+            self._ring[offset + _LENGTH_BYTES:offset + _LENGTH_BYTES + len(command)] = command
+            # Made visible only once the slot is complete
+            self._sequence.value = sequence
+        finally:
+            self._write_lock.release()
+
+    def _offset(self, sequence: int) -> int:
+        return (sequence % self.slots) * (_LENGTH_BYTES + self.command_bytes)
+
+    def _read(self, sequence: int) -> bytes:
+        offset = self._offset(sequence)
+        length = int.from_bytes(bytes(self._ring[offset:offset + _LENGTH_BYTES]), "little")
+        return bytes(self._ring[offset + _LENGTH_BYTES:offset + _LENGTH_BYTES + length])
+
+    def apply_pending(self) -> int:
+        """Apply the commands other processes published since the last call; the number applied"""
+        if self._sequence.value == self._applied:
+            return 0
+        with self._apply_lock:
+            latest = self._sequence.value
+            first = max(self._applied + 1, latest - self.slots + 1)
+            commands = [(sequence, self._read(sequence)) for sequence in range(first, latest + 1)]
+            # Slots reused by writers while they were read hold newer commands, seen on a later call
+            oldest_intact = self._sequence.value - self.slots + 1
+            self._applied = latest
+
+        applied = 0
+        for sequence, command in commands:
+            if sequence < oldest_intact:
+                continue
+            command = json.loads(command)
+            handler = self._handlers.get(command["kind"])
+            if handler is None or command["pid"] == os.getpid():
+                continue
+            try:
+                handler(**command["args"])
+                applied += 1
+            except Exception:
+                # Another worker's command need not suit this one; it keeps its current state
+                self.failed += 1
+        return applied
+
+
+def init_control_block(app: Flask, control_block: ControlBlock) -> ControlBlock:
+    """Apply the other workers' admin commands before each request"""
+
+    @app.before_request
+    def apply_admin_commands():
+        control_block.apply_pending()
+
+    return control_block
@@ -3,11 +3,12 @@ import src.app.config.db_config as config
 
 
 class DB:
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path if db_path else config.DB
 
-    @staticmethod
-    def get_connection():
-        """Return the singleton DB connection."""
-        conn = sqlite3.connect(config.DB)
+    def get_connection(self, check_same_thread: bool = True):
+        """Return a new DB connection."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=check_same_thread)
         conn.execute("PRAGMA foreign_keys = ON;")
         conn.row_factory = sqlite3.Row
         return conn
@@ -0,0 +1,39 @@
+import html
+import re
+from typing import Optional
+
+import src.app.config.search_config as config
+
+WORD = re.compile(r"\w+")
+# Private-use characters marking the matches in the snippets SQLite builds; the text around them
+# is HTML-escaped before they are replaced by the real markers, which SQLite cannot do
+MATCH_OPEN = "\ue000"
+MATCH_CLOSE = "\ue001"
+
+
+def match_expression(text: str) -> Optional[str]:
+    """
+    FTS5 query for free text typed by a user: rows containing every word of `text`, each as a
+    prefix so partial words match. Words are quoted, so FTS5 operators and syntax in `text` are
+    searched for as plain words. None if `text` has no words.
+    """
+    words = WORD.findall(text)
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def snippet(fts_table: str, column: int = -1) -> str:
+    """
+    SQL for the snippet of a match in `column` of `fts_table`, -1 for the best one. The matches
+    are between sentinels: pass the result through `highlight` before returning it.
+    """
+    return (f"snippet({fts_table}, {column}, '{MATCH_OPEN}', '{MATCH_CLOSE}', "
+            f"'{config.SNIPPET_ELLIPSIS}', {config.SNIPPET_TOKENS})")
+
+
+def highlight(raw_snippet: Optional[str]) -> Optional[str]:
+    """A snippet from `snippet` as HTML: the stored text escaped, the matches between the markers"""
+    if raw_snippet is None:
+        return None
+    return html.escape(raw_snippet).replace(MATCH_OPEN, config.SNIPPET_OPEN).replace(MATCH_CLOSE, config.SNIPPET_CLOSE)
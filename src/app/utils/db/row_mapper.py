@@ -0,0 +1,36 @@
+from functools import lru_cache
+from typing import Sequence
+
+
+def _slots(model: type) -> tuple:
+    return tuple(slot for cls in reversed(model.__mro__) for slot in getattr(cls, "__slots__", ()))
+
+
+@lru_cache(maxsize=None)
+def _compile(model: type, columns: tuple):
+    targets = ", ".join(f"obj.{column}" for column in columns)
+    source = (
+        "def map_row(cursor, row):\n"
+        "    obj = new(model)\n"
+        f"    {targets}, = row\n"
+        "    return obj\n"
+    )
+    namespace = {"new": object.__new__, "model": model}
+    exec(compile(source, f"<row_mapper {model.__name__}>", "exec"), namespace)
+    return namespace["map_row"]
+
+
+def row_mapper(model: type, columns: Sequence[str]):
+    """
+    Return a sqlite3 `row_factory` that builds `model` instances directly from rows selected as
+    `columns`, in that order. The mapper unpacks each row straight into the instance's slots
+    without going through `__init__`, so defaults are never computed for loaded rows.
+    Mappers are compiled once per model and column list.
+    """
+    columns = tuple(columns)
+    slots = _slots(model)
+    if not slots:
+        raise TypeError(f"{model.__name__} has no __slots__")
+    if sorted(columns) != sorted(slots):
+        raise ValueError(f"Columns {columns} do not match the fields of {model.__name__}: {slots}")
+    return _compile(model, columns)
@@ -0,0 +1,20 @@
+import sqlite3
+from typing import Sequence
+
+# table_versions row standing for the database as a whole: a random id set when the schema is
+# created and replaced by every bulk reload. Versions read together with it never match those of
+# another database, or of the same one before a reload.
+DATABASE_EPOCH = "database"
+
+
+def fetch_table_versions(conn: sqlite3.Connection, tables: Sequence[str]) -> tuple:
+    """
+    Return the change versions of `tables`, in the order given. Only the small table_versions
+    table is read, so this stays cheap however large the tables themselves are.
+    """
+    placeholders = ", ".join("?" for _ in tables)
+    rows = conn.execute(
+        f"SELECT table_name, version FROM table_versions WHERE table_name IN ({placeholders})", tuple(tables)
+    ).fetchall()
+    versions = dict((row[0], row[1]) for row in rows)
+    return tuple(versions[table] for table in tables)
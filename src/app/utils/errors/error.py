@@ -77,3 +77,24 @@ class MissingFieldError(Exception):
 
     def __init__(self, message: str):
         super().__init__(message)
+
+
+class InFlightTimeoutError(DatabaseError):
+    """Raised when a coalesced read does not finish within its timeout"""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class LockTimeoutError(Exception):
+    """Raised when a lock shared across processes cannot be taken in time"""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+class StreamLimitError(Exception):
+    """Raised when a process already serves as many event streams as it may"""
+
+    def __init__(self, message: str):
+        super().__init__(message)
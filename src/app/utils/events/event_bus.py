@@ -0,0 +1,223 @@
+import json
+import os
+import threading
+import weakref
+from collections import deque
+from threading import Condition, Lock
+
+import src.app.config.events_config as config
+from src.app.config.types import Role
+from src.app.models.change import Change
+from src.app.repositories.change_repository import ChangeRepository
+from src.app.utils.errors.error import DatabaseError, StreamLimitError
+
+# Changes published on the stream: (table, operation) -> (event type, name of the row key in the
+# event, fields of the event's data). Events whose data has a user_id concern that user.
+CHANGE_EVENTS = {
+    ("issues", "insert"): ("issue.reported", "issue_id",
+                           ("issue_id", "asset_id", "user_id", "description", "report_date")),
+    ("assets", "delete"): ("asset.deleted", "asset_id", ("asset_id",)),
+    ("assets_assigned", "insert"): ("asset.assigned", "asset_assigned_id", ("asset_id", "user_id")),
+    ("assets_assigned", "delete"): ("asset.unassigned", "asset_assigned_id", ("asset_id", "user_id")),
+    ("users", "delete"): ("user.deleted", "user_id", ("user_id",)),
+}
+
+
+class Event:
+    __slots__ = ("id", "version", "type", "user_id", "frame")
+
+    def __init__(self, version: int, event_type: str, data: dict, user_id: str = None):
+        # The version of the change in the changes log, the same in every process
+        self.version = version
+        self.id = str(version)
+        self.type = event_type
+        # Subject of the event; users only receive events about themselves
+        self.user_id = user_id
+        # Encoded once here rather than once per subscriber
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+        self.frame = f"id: {self.id}\nevent: {event_type}\ndata: {payload}\n\n".encode("utf-8")
+
+    @classmethod
+    def from_change(cls, change: Change):
+        """The event published for `change`, or None if it is not one the stream carries"""
+        published = CHANGE_EVENTS.get((change.table_name, change.operation))
+        if published is None:
+            return None
+        event_type, key, fields = published
+        row = dict(change.data or {})
+        row[key] = change.row_id
+        data = {field: row.get(field) for field in fields}
+        return cls(change.version, event_type, data, data.get("user_id"))
+
+    def visible_to(self, role: str, user_id: str) -> bool:
+        return role == Role.ADMIN.value or (self.user_id is not None and self.user_id == user_id)
+
+
+class Subscription:
+    """Bounded queue of one client's events; when it is full the oldest event is dropped"""
+
+    def __init__(self, bus: "EventBus", role: str, user_id: str, queue_size: int):
+        self.bus = bus
+        self.role = role
+        self.user_id = user_id
+        self.dropped = 0
+        # Set when the client's Last-Event-ID is no longer in the changes log, or not from it
+        self.reset = False
+        # Version of the last change the client has seen
+        self.after = 0
+        self._queue = deque(maxlen=queue_size)
+        self._ready = Condition(Lock())
+
+    def _offer(self, event: Event):
+        if event.version <= self.after or not event.visible_to(self.role, self.user_id):
+            return
+        with self._ready:
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped += 1
+            self._queue.append(event)
+            self._ready.notify()
+
+    def get(self, timeout: float) -> list:
+        """Wait up to `timeout` seconds for events and return all of those queued"""
+        with self._ready:
+            if not self._queue:
+                self._ready.wait(timeout)
+            events = list(self._queue)
+            self._queue.clear()
+            return events
+
+    def take_dropped(self) -> int:
+        with self._ready:
+            dropped, self.dropped = self.dropped, 0
+            return dropped
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    """
+    The event stream, read from the changes log. While a process has subscribers, a thread polls
+    the log for changes after the last one it saw and hands the events to the subscribers; writes
+    served by the process itself `wake` it at once.
+
+    Event ids are change versions, the same in every worker, so a client reconnecting to any of
+    them with Last-Event-ID is replayed what it missed straight from the log. An id the log no
+    longer covers (pruned, or reset by a bulk reload) or one too far behind flags the subscription
+    `reset` instead.
+
+    A process takes at most `max_subscribers` subscribers; `subscribe` raises `StreamLimitError`
+    beyond that.
+    """
+
+    def __init__(self, change_repository: ChangeRepository, queue_size: int = None, replay_limit: int = None,
+                 poll_seconds: float = None, max_subscribers: int = None):
+        self.change_repository = change_repository
+        self.max_subscribers = config.EVENTS_MAX_STREAMS if max_subscribers is None else max_subscribers
+        self.queue_size = config.EVENTS_QUEUE_SIZE if queue_size is None else queue_size
+        self.replay_limit = config.EVENTS_REPLAY_LIMIT if replay_limit is None else replay_limit
+        self.poll_seconds = config.EVENTS_POLL_SECONDS if poll_seconds is None else poll_seconds
+        self._reset_state()
+        reset = weakref.WeakMethod(self._reset_state)
+        # The poller thread does not survive a fork, nor should the master's subscribers
+        os.register_at_fork(after_in_child=lambda: reset() and reset()())
+
+    def _reset_state(self):
+        self._lock = Lock()
+        self._wakeup = threading.Event()
+        self._subscribers = set()
+        self._poller = None
+        # Version of the last change handed to subscribers; None while nobody is subscribed
+        self._cursor = None
+        self.published = 0
+        self.poll_errors = 0
+
+    def subscribe(self, role: str, user_id: str = None, last_event_id: str = None) -> Subscription:
+        """Register a subscriber, first queueing the events it missed after `last_event_id`"""
+        subscription = Subscription(self, role, user_id, self.queue_size)
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                raise StreamLimitError(f"This worker already serves {self.max_subscribers} event streams")
+            if self._cursor is None:
+                self._cursor = self.change_repository.fetch_latest_version()
+            subscription.after = self._cursor
+            if last_event_id:
+                missed = self._missed_since(last_event_id)
+                if missed is None:
+                    subscription.reset = True
+                else:
+                    subscription.after = int(last_event_id)
+                    for event in missed:
+                        subscription._offer(event)
+                    subscription.after = max(subscription.after, self._cursor)
+            self._subscribers.add(subscription)
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._poll_loop, name="event-poller", daemon=True)
+                self._poller.start()
+        return subscription
+
+    def _missed_since(self, last_event_id: str):
+        """Events after `last_event_id` up to the cursor, or None if they cannot be replayed"""
+        if not last_event_id.isdigit():
+            return None
+        since = int(last_event_id)
+        if since > self.change_repository.fetch_latest_version() or \
+                since + 1 < self.change_repository.fetch_oldest_version():
+            return None
+        if since >= self._cursor:
+            # Already seen, or newer than this process has polled so far: the poller delivers the rest
+            return []
+        changes = [change for change in self.change_repository.fetch_event_changes(since, self.replay_limit + 1)
+                   if change.version <= self._cursor]
+        if len(changes) > self.replay_limit:
+            return None
+        return [event for event in map(Event.from_change, changes) if event is not None]
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def wake(self):
+        """Poll now rather than at the next interval, after a write made by this process"""
+        self._wakeup.set()
+
+    def poll(self) -> int:
+        """Hand the changes logged since the last poll to the subscribers; the number of events"""
+        published = 0
+        with self._lock:
+            while self._cursor is not None:
+                changes = self.change_repository.fetch_event_changes(self._cursor, config.EVENTS_POLL_BATCH)
+                for event in map(Event.from_change, changes):
+                    if event is None:
+                        continue
+                    for subscription in self._subscribers:
+                        subscription._offer(event)
+                    published += 1
+                if changes:
+                    self._cursor = changes[-1].version
+                if len(changes) < config.EVENTS_POLL_BATCH:
+                    break
+            self.published += published
+        return published
+
+    def _poll_loop(self):
+        wakeup = self._wakeup
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    # The next subscriber starts over from the latest change
+                    self._poller = None
+                    self._cursor = None
+                    return
+            try:
+                self.poll()
+            except DatabaseError:
+                # Tried again at the next interval; the subscribers only see a delay
+                self.poll_errors += 1
+            wakeup.wait(self.poll_seconds)
+            wakeup.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"subscribers": len(self._subscribers), "published": self.published,
+                    "cursor": self._cursor, "poll_errors": self.poll_errors}
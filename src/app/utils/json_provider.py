@@ -0,0 +1,112 @@
+import dataclasses
+import decimal
+import enum
+import json
+import uuid
+from datetime import date
+
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+from src.app.models.asset import Asset
+from src.app.models.asset_assigned import AssetAssigned
+from src.app.models.asset_issue import Issue
+from src.app.models.change import Change
+from src.app.models.user import UserDTO
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+
+def field_encoder(model: type):
+    """
+    Compile an encoder returning a dataclass model's fields as a dict in declaration order, the
+    same shape orjson emits for dataclasses natively. Slotted models have no `__dict__` to reuse.
+    """
+    items = ", ".join(f"{field.name!r}: obj.{field.name}" for field in dataclasses.fields(model))
+    namespace = {}
+    exec(compile(f"def encode(obj):\n    return {{{items}}}\n", f"<encoder {model.__name__}>", "exec"), namespace)
+    return namespace["encode"]
+
+
+class FastJSONProvider(JSONProvider):
+    """
+    Compact JSON provider: no key sorting, no whitespace, and models serialized by registered
+    per-type encoders, so handlers can return `Asset`/`Issue`/`UserDTO` objects as response data.
+    Uses orjson when it is installed; output is the same JSON either way, and datetimes keep
+    Flask's HTTP date format.
+    """
+    mimetype = "application/json"
+
+    def __init__(self, app, use_orjson: bool = None):
+        super().__init__(app)
+        self.use_orjson = orjson is not None if use_orjson is None else use_orjson and orjson is not None
+        self._encoders = {}
+        for model in (Asset, Issue, UserDTO, AssetAssigned, Change):
+            self.register_encoder(model, field_encoder(model))
+
+    def register_encoder(self, cls: type, encoder):
+        """Serialize instances of `cls` (and its subclasses) as `encoder(obj)`"""
+        self._encoders[cls] = encoder
+
+    def default(self, obj):
+        # Called once per model object, so the registered exact type is looked up first
+        encoder = self._encoders.get(type(obj))
+        if encoder is not None:
+            return encoder(obj)
+        return self._fallback(obj)
+
+    def _fallback(self, obj):
+        encoder = next((self._encoders[cls] for cls in type(obj).__mro__[1:] if cls in self._encoders), None)
+        if encoder is not None:
+            self._encoders[type(obj)] = encoder
+            return encoder(obj)
+        if isinstance(obj, date):
+            return http_date(obj)
+        if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+            return str(obj)
+        if isinstance(obj, enum.Enum):
+            return obj.value
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return dataclasses.asdict(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps_bytes(self, obj) -> bytes:
+        if self.use_orjson:
+            return orjson.dumps(
+                obj, default=self.default,
+                # orjson encodes the dataclass models natively; datetimes go through default() so
+                # both encoders agree on the HTTP date format
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+            )
+        return self.dumps(obj).encode("utf-8")
+
+    def dumps(self, obj, **kwargs) -> str:
+        if self.use_orjson and not kwargs:
+            return self.dumps_bytes(obj).decode("utf-8")
+        kwargs.setdefault("default", self.default)
+        kwargs.setdefault("separators", (",", ":"))
+        kwargs.setdefault("ensure_ascii", False)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj) + b"\n", mimetype=self.mimetype)
+
+    def spliced_response(self, envelope: dict, data: bytes):
+        """
+        Respond with `envelope` and `data`, JSON already encoded elsewhere (by SQLite, say), added
+        as its "data" member without being decoded again. Empty arrays are left out, as
+        `CustomResponse.object_to_dict` leaves out empty data.
+        """
+        body = self.dumps_bytes(envelope)
+        if data and data != b"[]":
+            body = body[:-1] + (b',"data":' if envelope else b'"data":') + data + b"}"
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
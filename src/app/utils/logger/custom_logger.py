@@ -24,7 +24,6 @@ def custom_logger(logger: Logger):
                     f"  - method: {request.method}\n"
                     f"  - path: {request.path}\n"
                     f"  - client_ip: {request.remote_addr}\n"
-                    f"  - headers: {dict(request.headers)}\n"
                     f"  - body: {sanitized_body}\n"
                     f"Function Context:\n"
                     f"  - handler: {type(args[0]).__name__ if args else 'Unknown'}\n"
@@ -33,8 +32,9 @@ def custom_logger(logger: Logger):
                 # Execute the function
                 result = func(*args, **kwargs)
 
-                # Log successful execution
-                logger.info(f"{func.__name__} executed successfully.")
+                # Log successful execution with the response status, for log analysis
+                status = result[1] if isinstance(result, tuple) and len(result) > 1 else getattr(result, "status_code", None)
+                logger.info(f"{func.__name__} executed successfully. status={status}")
                 return result
             except Exception as e:
                 # Handle and log exceptions with request details
@@ -1,8 +1,9 @@
 import logging
-from logging.handlers import RotatingFileHandler
 from threading import Lock
 from flask import g
 
+import src.app.config.logging_config as config
+
 
 class Logger:
     _instance = None
@@ -18,19 +19,51 @@ class Logger:
     def _initialize_logger(self):
         self.logger = logging.getLogger("ThreadSafeLogger")
         self.logger.setLevel(logging.DEBUG)  # Set to the lowest level to capture all logs
+        self.logger.addHandler(logging.NullHandler())
+        # Records go to the log file only, never to whatever handlers the root logger has
+        self.logger.propagate = False
+
+        # Handlers create the Logger at class definition, so the log file is only set up on the first record
+        self.log_file = config.LOG_FILE
+        self.file_handler = None
+        self._configured = False
+
+    def configure(self, log_file: str):
+        """Write to `log_file` from the next record on; None or an empty string disables file logging."""
+        with self._lock:
+            self.log_file = log_file
+            self._configured = False
+
+    def _setup_file_handler(self):
+        with self._lock:
+            if self._configured:
+                return
+
+            if self.file_handler is not None:
+                self.logger.removeHandler(self.file_handler)
+                self.file_handler.close()
+                self.file_handler = None
+
+            if self.log_file:
+                from logging.handlers import RotatingFileHandler
+
+                # Rotating File Handler (Thread-Safe)
+                file_handler = RotatingFileHandler(
+                    self.log_file, maxBytes=config.LOG_MAX_BYTES, backupCount=config.LOG_BACKUP_COUNT, delay=True
+                )
+                file_handler.setLevel(logging.DEBUG)
 
-        # Rotating File Handler (Thread-Safe)
-        file_handler = RotatingFileHandler("app.log", maxBytes=5 * 1024 * 1024, backupCount=3)
-        file_handler.setLevel(logging.DEBUG)
+                # Custom Formatter with extra fields
+                formatter = logging.Formatter(
+                    "%(asctime)s - %(levelname)s - %(message)s - %(context)s"
+                )
+                file_handler.setFormatter(formatter)
 
-        # Custom Formatter with extra fields
-        formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s - %(context)s"
-        )
-        file_handler.setFormatter(formatter)
+                # Adding Handler
+                self.logger.addHandler(file_handler)
+                self.file_handler = file_handler
 
-        # Adding Handler
-        self.logger.addHandler(file_handler)
+            self._configured = True
 
     def sanitize_body(self, body):
         """
@@ -54,13 +87,21 @@ class Logger:
 
     # Convenience methods for logging
     def info(self, message: str):
+        if not self._configured:
+            self._setup_file_handler()
         self.logger.info(message, extra={"context": self._get_context()})
 
     def error(self, message: str):
+        if not self._configured:
+            self._setup_file_handler()
         self.logger.error(message, extra={"context": self._get_context()})
 
     def warning(self, message: str):
+        if not self._configured:
+            self._setup_file_handler()
         self.logger.warning(message, extra={"context": self._get_context()})
 
     def debug(self, message: str):
+        if not self._configured:
+            self._setup_file_handler()
         self.logger.debug(message, extra={"context": self._get_context()})
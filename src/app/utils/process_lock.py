@@ -0,0 +1,46 @@
+import multiprocessing
+import os
+import weakref
+from typing import Callable
+
+# Every lock created in this process, for `release_locks_held_by`
+_locks = weakref.WeakSet()
+
+
+class ProcessLock:
+    """
+    Lock shared by every process forked after it was created, which records the pid holding it.
+    A process killed while holding a plain multiprocessing lock locks every other one out for
+    good; whoever reaps it calls `release_locks_held_by(pid)` to release this one on its behalf,
+    after `on_recover` has repaired whatever the dead holder left half-written.
+    """
+
+    def __init__(self, on_recover: Callable[[], None] = None):
+        self._lock = multiprocessing.Lock()
+        self._holder = multiprocessing.RawValue("i", 0)
+        self.on_recover = on_recover
+        _locks.add(self)
+
+    def acquire(self, timeout: float) -> bool:
+        if not self._lock.acquire(timeout=timeout):
+            return False
+        self._holder.value = os.getpid()
+        return True
+
+    def release(self):
+        self._holder.value = 0
+        self._lock.release()
+
+    def release_if_held_by(self, pid: int) -> bool:
+        """Release the lock if `pid`, a process that has exited, died holding it"""
+        if self._holder.value != pid:
+            return False
+        if self.on_recover is not None:
+            self.on_recover()
+        self.release()
+        return True
+
+
+def release_locks_held_by(pid: int) -> int:
+    """Release the locks `pid`, a process that has exited, still held; the number released"""
+    return sum(lock.release_if_held_by(pid) for lock in list(_locks))
@@ -0,0 +1,182 @@
+import os
+import sys
+import threading
+import weakref
+from collections import Counter
+
+from flask import Flask, request
+
+import src.app.config.profiling_config as config
+
+
+class SamplingProfiler:
+    """
+    Background thread that periodically snapshots the stacks of threads currently serving a request
+    and aggregates them as collapsed stacks per Flask endpoint.
+
+    The output of `folded()` is the "folded stacks" text format consumed by flamegraph.pl / speedscope.
+
+    Each worker samples its own requests. Given a `ControlBlock`, `configure` reaches every worker.
+    """
+
+    def __init__(self, interval_ms: float = config.SAMPLER_INTERVAL_MS,
+                 max_depth: int = config.SAMPLER_MAX_STACK_DEPTH, control_block=None):
+        self.interval_ms = interval_ms
+        self.max_depth = max_depth
+        self.sample_count = 0
+        self._active_requests = {}  # thread id -> endpoint being served
+        self._stacks = {}  # endpoint -> Counter of collapsed stacks
+        self._lock = threading.Lock()
+        # Each sampler thread gets its own stop event, so stopping one never touches its successor
+        self._stop_event = None
+        self._thread = None
+        self._fork_hook_registered = False
+        self.control_block = control_block
+        if control_block is not None:
+            control_block.register("profiler", self._configure)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        with self._lock:
+            if self.running:
+                return
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stop_event,), name="sampling-profiler",
+                                            daemon=True)
+            self._thread.start()
+            if not self._fork_hook_registered:
+                restart = weakref.WeakMethod(self._restart_after_fork)
+                os.register_at_fork(after_in_child=lambda: restart() and restart()())
+                self._fork_hook_registered = True
+
+    def _restart_after_fork(self):
+        # Threads do not survive fork(); a sampler started in a prefork master resumes in each worker
+        self._lock = threading.Lock()
+        self._active_requests = {}
+        if self._thread is not None:
+            self._thread = None
+            self.start()
+
+    def stop(self):
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+            if thread is not None:
+                self._stop_event.set()
+        if thread is not None:
+            thread.join()
+
+    def set_interval(self, interval_ms: float):
+        if interval_ms <= 0:
+            raise ValueError("Sampling interval must be positive")
+        self.interval_ms = interval_ms
+
+    def reset(self):
+        with self._lock:
+            self._stacks = {}
+            self.sample_count = 0
+
+    def configure(self, enabled: bool = None, interval_ms: float = None, reset: bool = False):
+        """Change the interval, reset the samples and/or start or stop the sampler in every worker"""
+        self._configure(enabled, interval_ms, reset)
+        if self.control_block is not None and (enabled is not None or interval_ms is not None or reset):
+            self.control_block.publish("profiler", enabled=enabled, interval_ms=interval_ms, reset=reset)
+
+    def _configure(self, enabled: bool = None, interval_ms: float = None, reset: bool = False):
+        if interval_ms is not None:
+            self.set_interval(interval_ms)
+        if reset:
+            self.reset()
+        if enabled is True:
+            self.start()
+        elif enabled is False:
+            self.stop()
+
+    def track_request(self, endpoint: str):
+        """Mark the calling thread as serving `endpoint`; no-op while the sampler is off"""
+        if self._thread is not None:
+            self._active_requests[threading.get_ident()] = endpoint or "unknown"
+
+    def untrack_request(self):
+        self._active_requests.pop(threading.get_ident(), None)
+
+    def _run(self, stop_event: threading.Event):
+        while not stop_event.wait(self.interval_ms / 1000):
+            self.sample_once()
+
+    def _collapse(self, frame) -> str:
+        frames = []
+        while frame is not None and len(frames) < self.max_depth:
+            code = frame.f_code
+            frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        return ";".join(reversed(frames))
+
+    def sample_once(self):
+        active_requests = dict(self._active_requests)
+        if not active_requests:
+            return
+
+        current_frames = sys._current_frames()
+        samples = []
+        for thread_id, endpoint in active_requests.items():
+            frame = current_frames.get(thread_id)
+            if frame is not None:
+                samples.append((endpoint, self._collapse(frame)))
+        del current_frames
+
+        with self._lock:
+            for endpoint, stack in samples:
+                self._stacks.setdefault(endpoint, Counter())[stack] += 1
+            self.sample_count += len(samples)
+
+    def endpoints(self) -> dict:
+        with self._lock:
+            return {endpoint: sum(stacks.values()) for endpoint, stacks in self._stacks.items()}
+
+    def folded(self, endpoint: str = None) -> str:
+        """
+        Return collapsed stacks, one `frame;frame;frame count` line per stack.
+        Without an endpoint every route is included with the endpoint name as the root frame.
+        """
+        with self._lock:
+            if endpoint is not None:
+                stacks = self._stacks.get(endpoint, Counter())
+                lines = [f"{stack} {count}" for stack, count in stacks.items()]
+            else:
+                lines = [
+                    f"{name};{stack} {count}"
+                    for name, stacks in self._stacks.items()
+                    for stack, count in stacks.items()
+                ]
+        return "\n".join(sorted(lines)) + ("\n" if lines else "")
+
+    def status(self) -> dict:
+        """The sampler of this worker, named by `pid`"""
+        return {
+            "pid": os.getpid(),
+            "enabled": self.running,
+            "interval_ms": self.interval_ms,
+            "sample_count": self.sample_count,
+            "endpoints": self.endpoints()
+        }
+
+
+def init_sampling_profiler(app: Flask, profiler: SamplingProfiler, enabled: bool = None):
+    """Register request hooks that tell the sampler which endpoint each thread is serving"""
+
+    @app.before_request
+    def track_sampled_request():
+        profiler.track_request(request.endpoint)
+
+    @app.teardown_request
+    def untrack_sampled_request(error=None):
+        profiler.untrack_request()
+
+    if config.SAMPLER_ENABLED if enabled is None else enabled:
+        profiler.start()
+
+    return profiler
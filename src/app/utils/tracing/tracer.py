@@ -0,0 +1,267 @@
+import contextvars
+import functools
+import json
+import os
+import random
+import re
+import time
+from threading import Lock
+
+from flask import Flask, request, g
+
+import src.app.config.tracing_config as config
+
+TRACEPARENT_REGEX = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# Span that is currently open in this thread / request
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+def parse_traceparent(header: str):
+    """
+    Parse a W3C `traceparent` header.
+
+    Returns:
+        tuple: (trace_id, parent_span_id, sampled) or None if the header is invalid.
+    """
+    if not header:
+        return None
+
+    match = TRACEPARENT_REGEX.match(header.strip().lower())
+    if not match:
+        return None
+
+    version, trace_id, parent_span_id, flags = match.groups()
+    if version == "ff" or trace_id == "0" * 32 or parent_span_id == "0" * 16:
+        return None
+
+    return trace_id, parent_span_id, bool(int(flags, 16) & 0x01)
+
+
+def format_traceparent(trace_id: str, span_id: str, sampled: bool) -> str:
+    return f"00-{trace_id}-{span_id}-{'01' if sampled else '00'}"
+
+
+class Span:
+    def __init__(self, trace_id: str, name: str, parent_span_id: str = None, kind: str = "internal",
+                 attributes: dict = None):
+        self.trace_id = trace_id
+        self.span_id = _new_id(8)
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.attributes = dict(attributes) if attributes else {}
+        self.start_time = time.time_ns()
+        self.end_time = None
+        self.error = None
+        self.children = []
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException):
+        self.error = f"{type(error).__name__}: {error}"
+
+    def end(self):
+        if self.end_time is None:
+            self.end_time = time.time_ns()
+
+    def iter_spans(self):
+        """Yield this span and all of its descendants"""
+        yield self
+        for child in self.children:
+            yield from child.iter_spans()
+
+
+class JsonlSpanExporter:
+    """
+    Appends finished traces to a JSONL file, one OTLP/JSON `resourceSpans` document per trace.
+    """
+    _KINDS = {"internal": 1, "server": 2, "client": 3}
+
+    def __init__(self, path: str, service_name: str = config.TRACE_SERVICE_NAME):
+        self.path = path
+        self.service_name = service_name
+        self._lock = Lock()
+
+    @staticmethod
+    def _attribute_value(value):
+        if isinstance(value, bool):
+            return {"boolValue": value}
+        if isinstance(value, int):
+            return {"intValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        return {"stringValue": str(value)}
+
+    def span_to_dict(self, span: Span) -> dict:
+        span_dict = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": self._KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_time),
+            "endTimeUnixNano": str(span.end_time or span.start_time),
+            "attributes": [
+                {"key": key, "value": self._attribute_value(value)}
+                for key, value in span.attributes.items()
+            ],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent_span_id:
+            span_dict["parentSpanId"] = span.parent_span_id
+        return span_dict
+
+    def trace_to_dict(self, root: Span) -> dict:
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": self.service_name}},
+                        {"key": "process.pid", "value": {"intValue": str(os.getpid())}},
+                    ]
+                },
+                "scopeSpans": [{
+                    "scope": {"name": __name__},
+                    "spans": [self.span_to_dict(span) for span in root.iter_spans()]
+                }]
+            }]
+        }
+
+    def export(self, root: Span):
+        line = json.dumps(self.trace_to_dict(root), separators=(",", ":"))
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as trace_file:
+                trace_file.write(line + "\n")
+
+
+class Tracer:
+    def __init__(self, exporter: JsonlSpanExporter = None, sample_rate: float = None, enabled: bool = None):
+        self.exporter = exporter
+        self.sample_rate = config.TRACE_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.enabled = config.TRACE_ENABLED if enabled is None else enabled
+
+    def should_sample(self, parent) -> bool:
+        """Parent-based sampling: honor the caller's decision, otherwise sample by ratio"""
+        if not self.enabled:
+            return False
+        if parent is not None:
+            return parent[2]
+        return random.random() < self.sample_rate
+
+    def start_trace(self, name: str, traceparent: str = None, attributes: dict = None):
+        """
+        Open the root span of a new trace and make it current.
+
+        Returns:
+            tuple: (root span or None when not sampled, context token to pass to `end_trace`)
+        """
+        parent = parse_traceparent(traceparent)
+        if not self.should_sample(parent):
+            return None, None
+
+        trace_id, parent_span_id = (parent[0], parent[1]) if parent else (_new_id(16), None)
+        root = Span(trace_id, name, parent_span_id=parent_span_id, kind="server", attributes=attributes)
+        return root, _current_span.set(root)
+
+    def end_trace(self, root: Span, token, error: BaseException = None):
+        if root is None:
+            return
+
+        if error is not None:
+            root.record_error(error)
+        root.end()
+        _current_span.reset(token)
+
+        if self.exporter is not None:
+            self.exporter.export(root)
+
+
+def current_span():
+    return _current_span.get()
+
+
+def _call_in_span(name: str, func, args, kwargs):
+    parent = _current_span.get()
+    if parent is None:
+        return func(*args, **kwargs)
+
+    span = Span(parent.trace_id, name, parent_span_id=parent.span_id)
+    parent.children.append(span)
+    token = _current_span.set(span)
+    try:
+        return func(*args, **kwargs)
+    except BaseException as e:
+        span.record_error(e)
+        raise
+    finally:
+        span.end()
+        _current_span.reset(token)
+
+
+def trace_function(name: str = None):
+    """Decorator opening a child span around a function when a trace is active"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapped_func(*args, **kwargs):
+            return _call_in_span(span_name, func, args, kwargs)
+
+        return wrapped_func
+
+    return decorator
+
+
+def traced(cls):
+    """
+    Class decorator opening a span named `<Class>.<method>` around every public method.
+    Used on the *Handler, *Service and *Repository classes.
+    """
+    for attr_name, attr in list(vars(cls).items()):
+        if attr_name.startswith("_") or not callable(attr) or isinstance(attr, (staticmethod, classmethod, type)):
+            continue
+        setattr(cls, attr_name, trace_function(f"{cls.__name__}.{attr_name}")(attr))
+    return cls
+
+
+def init_tracing(app: Flask, tracer: Tracer):
+    """Register request hooks that open a root span per request and export it on teardown"""
+
+    @app.before_request
+    def start_request_trace():
+        root, token = tracer.start_trace(
+            f"{request.method} {request.url_rule.rule if request.url_rule else request.path}",
+            traceparent=request.headers.get("traceparent"),
+            attributes={
+                "http.method": request.method,
+                "http.target": request.path,
+                "http.route": request.url_rule.rule if request.url_rule else "",
+                "flask.endpoint": request.endpoint or "",
+            }
+        )
+        g.trace_root = root
+        g.trace_token = token
+
+    @app.after_request
+    def tag_trace_response(response):
+        root = g.get("trace_root")
+        if root is not None:
+            root.set_attribute("http.status_code", response.status_code)
+            response.headers["traceparent"] = format_traceparent(root.trace_id, root.span_id, True)
+        return response
+
+    @app.teardown_request
+    def end_request_trace(error=None):
+        root = g.get("trace_root")
+        if root is not None:
+            root.set_attribute("enduser.id", g.get("user_id", "unknown"))
+            root.set_attribute("enduser.role", g.get("role", "unknown"))
+            tracer.end_trace(root, g.get("trace_token"), error)
+            g.trace_root = None
+
+    return tracer
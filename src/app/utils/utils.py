@@ -1,13 +1,13 @@
-from bcrypt import hashpw, checkpw, gensalt
-import jwt
+import functools
 import datetime
 
-from flask import jsonify,g
+from flask import jsonify, g, request, after_this_request
 
 from src.app.config.types import Role
 
 
 class Utils:
+    # bcrypt and jwt are imported on first use so that importing the app stays cheap
     SECRET_KEY = "SECRET"
 
     @staticmethod
@@ -15,6 +15,8 @@ class Utils:
         """
         Hash a password using bcrypt.
         """
+        from bcrypt import hashpw, gensalt
+
         return hashpw(password.encode('utf-8'), gensalt()).decode('utf-8')
 
     @staticmethod
@@ -22,6 +24,8 @@ class Utils:
         """
         Verify a password against a hashed password.
         """
+        from bcrypt import checkpw
+
         return checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
 
     @staticmethod
@@ -36,6 +40,8 @@ class Utils:
         Returns:
             str: The generated JWT token.
         """
+        import jwt
+
         try:
             # Define the payload
             payload = {
@@ -55,10 +61,13 @@ class Utils:
 
     @staticmethod
     def decode_jwt_token(token: str) -> dict:
+        import jwt
+
         return jwt.decode(token, Utils.SECRET_KEY, algorithms=["HS256"])
 
     @staticmethod
     def admin(f):
+        @functools.wraps(f)
         def wrapped_func(*args, **kwargs):
             # Check if the user role in g is 'admin'
             if g.get("role") != Role.ADMIN.value:
@@ -66,3 +75,33 @@ class Utils:
             return f(*args, **kwargs)
 
         return wrapped_func
+
+    @staticmethod
+    def conditional(get_version):
+        """
+        Conditional GET for a handler method. `get_version(handler)` returns the change version of
+        the data the method serves; it becomes the response's ETag, and a request whose
+        If-None-Match matches it gets an empty 304 without the method running.
+        """
+        def decorator(f):
+            @functools.wraps(f)
+            def wrapped_func(self, *args, **kwargs):
+                try:
+                    etag = "-".join(str(version) for version in get_version(self))
+                except Exception:
+                    # Without a version the request is simply served in full
+                    return f(self, *args, **kwargs)
+
+                @after_this_request
+                def set_etag(response):
+                    if response.status_code in (200, 304):
+                        response.set_etag(etag, weak=True)
+                    return response
+
+                if request.if_none_match.contains_weak(etag):
+                    return "", 304
+                return f(self, *args, **kwargs)
+
+            return wrapped_func
+
+        return decorator
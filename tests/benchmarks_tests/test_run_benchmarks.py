@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from benchmarks.run_benchmarks import compare_with_baseline, run_benchmarks, UNBENCHMARKED_ROUTES
+from benchmarks.seed import seed_database
+
+
+class TestCompareWithBaseline(unittest.TestCase):
+    def test_regression_is_flagged(self):
+        results = {"routes": {"GET /assets": {"p95_ms": 20.0}, "GET /users": {"p95_ms": 5.0}}}
+        baseline = {"routes": {"GET /assets": {"p95_ms": 10.0}, "GET /users": {"p95_ms": 5.0}}}
+
+        regressions = compare_with_baseline(results, baseline, threshold=0.2)
+
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("GET /assets"))
+
+    def test_small_absolute_change_is_noise(self):
+        results = {"routes": {"GET /user/<user_id>": {"p95_ms": 0.9}}}
+        baseline = {"routes": {"GET /user/<user_id>": {"p95_ms": 0.5}}}
+
+        self.assertEqual(compare_with_baseline(results, baseline), [])
+
+    def test_new_route_without_baseline_is_ignored(self):
+        results = {"routes": {"GET /stats": {"p95_ms": 100.0}}}
+
+        self.assertEqual(compare_with_baseline(results, {"routes": {}}), [])
+
+
+class TestSeedDatabase(unittest.TestCase):
+    def test_seed_database_row_counts(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "bench.db")
+            ids = seed_database(db_path, 10)
+
+            conn = sqlite3.connect(db_path)
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ["users", "assets", "assets_assigned", "issues"]
+            }
+            held = conn.execute(
+                "SELECT user_id FROM assets_assigned WHERE asset_id = ?", (ids["assigned_asset_id"],)
+            ).fetchone()[0]
+            conn.close()
+
+        self.assertEqual(counts, {"users": 11, "assets": 10, "assets_assigned": 5, "issues": 10})
+        self.assertEqual(held, ids["user_id"])
+        self.assertEqual(len(ids["available_asset_ids"]), 5)
+
+
+class TestRunBenchmarks(unittest.TestCase):
+    def test_every_route_is_benchmarked_without_errors(self):
+        from src.app.config.app_config import AppConfig
+        from src.app.controllers.main import create_app
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as work_dir:
+            try:
+                results = run_benchmarks(20, 1, work_dir)
+                app = create_app(AppConfig.for_testing(db_path=os.path.join(work_dir, "benchmark.db")))
+            finally:
+                os.chdir(cwd)
+
+        routes = {f"{method} {rule.rule}" for rule in app.url_map.iter_rules() if rule.endpoint != "static"
+                  for method in rule.methods - {"HEAD", "OPTIONS"}}
+        self.assertEqual(set(results["routes"]) | UNBENCHMARKED_ROUTES, routes)
+        self.assertEqual({route: stats["errors"] for route, stats in results["routes"].items() if stats["errors"]}, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,11 @@
+import pytest
+
+from src.app.utils.logger.logger import Logger
+
+
+@pytest.fixture(autouse=True)
+def no_log_file():
+    """Keep tests from writing to the application log, whatever app configuration they create"""
+    Logger().configure(None)
+    yield
+    Logger().configure(None)
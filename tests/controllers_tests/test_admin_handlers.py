@@ -0,0 +1,82 @@
+import os
+import unittest
+from unittest.mock import MagicMock
+
+from flask import Flask, g
+
+from src.app.config.custom_error_codes import VALIDATION_ERROR, SYSTEM_ERROR
+from src.app.controllers.admin.handlers import AdminHandler
+from src.app.utils.errors.error import LockTimeoutError
+from src.app.utils.profiler.sampling_profiler import SamplingProfiler
+
+
+class TestAdminHandler(unittest.TestCase):
+
+    def setUp(self):
+        """Set up Flask app and mock profiler."""
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.mock_profiler = MagicMock(spec=SamplingProfiler)
+        self.mock_profiler.status.return_value = {"enabled": True, "interval_ms": 10}
+        self.admin_handler = AdminHandler.create(self.mock_profiler)
+
+    def test_get_profiler_status(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+            response, status_code = self.admin_handler.get_profiler_status()
+
+            self.assertEqual(status_code, 200)
+            self.assertEqual(response["data"], {"enabled": True, "interval_ms": 10})
+
+    def test_get_profiler_status_requires_admin(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'user'
+            response, status_code = self.admin_handler.get_profiler_status()
+
+            self.assertEqual(status_code, 403)
+
+    def test_update_profiler_enable_with_interval(self):
+        with self.app.test_request_context(method="POST", json={"enabled": True, "interval_ms": 5}):
+            g.role = 'admin'
+            response, status_code = self.admin_handler.update_profiler()
+
+            self.assertEqual(status_code, 200)
+            self.mock_profiler.configure.assert_called_once_with(True, 5, False)
+
+    def test_update_profiler_disable_and_reset(self):
+        with self.app.test_request_context(method="POST", json={"enabled": False, "reset": True}):
+            g.role = 'admin'
+            response, status_code = self.admin_handler.update_profiler()
+
+            self.assertEqual(status_code, 200)
+            self.mock_profiler.configure.assert_called_once_with(False, None, True)
+
+    def test_update_profiler_invalid_interval(self):
+        with self.app.test_request_context(method="POST", json={"interval_ms": -1}):
+            g.role = 'admin'
+            response, status_code = self.admin_handler.update_profiler()
+
+            self.assertEqual(status_code, 400)
+            self.assertEqual(response["status_code"], VALIDATION_ERROR)
+            self.mock_profiler.configure.assert_not_called()
+
+    def test_update_profiler_while_admin_commands_are_busy(self):
+        self.mock_profiler.configure.side_effect = LockTimeoutError("busy")
+        with self.app.test_request_context(method="POST", json={"enabled": True}):
+            g.role = 'admin'
+            response, status_code, headers = self.admin_handler.update_profiler()
+
+            self.assertEqual(status_code, 503)
+            self.assertEqual(response["status_code"], SYSTEM_ERROR)
+            self.assertEqual(headers["Retry-After"], "1")
+
+    def test_get_profiler_stacks(self):
+        self.mock_profiler.folded.return_value = "asset.assets;main.py:run 3\n"
+        with self.app.test_request_context("/admin/profiler/stacks?endpoint=asset.assets", method="GET"):
+            g.role = 'admin'
+            response = self.admin_handler.get_profiler_stacks()
+
+            self.assertEqual(response.mimetype, "text/plain")
+            self.assertEqual(response.get_data(as_text=True), "asset.assets;main.py:run 3\n")
+            self.assertEqual(response.headers["X-Worker-Pid"], str(os.getpid()))
+            self.mock_profiler.folded.assert_called_once_with("asset.assets")
@@ -5,13 +5,15 @@ from flask import Flask, g
 from werkzeug.routing import ValidationError
 
 from src.app.config.custom_error_codes import DATABASE_OPERATION_ERROR, ASSET_NOT_ASSIGNED_ERROR, VALIDATION_ERROR, \
-    RECORD_NOT_FOUND_ERROR
+    RECORD_NOT_FOUND_ERROR, MISSING_FIELD_ERROR
 from src.app.models.asset import Asset
+from src.app.models.assignment_history import AssignmentHistory
 from src.app.repositories.asset_repository import AssetRepository
 from src.app.services.asset_service import AssetService
 from src.app.controllers.asset.handlers import AssetHandler
 from src.app.services.user_service import UserService
 from src.app.utils.errors.error import AlreadyAssignedError, NotAssignedError, DatabaseError, NotExistsError
+from src.app.utils.json_provider import FastJSONProvider
 
 
 class TestAssetHandler(unittest.TestCase):
@@ -175,6 +177,48 @@ class TestAssetHandler(unittest.TestCase):
             self.assertEqual(len(response["data"]), 1)
             self.mock_asset_service.get_assets.assert_called_once()
 
+    def test_get_assets_not_modified(self):
+        """Test a matching If-None-Match returns 304 without reading the assets."""
+        self.mock_asset_service.get_assets_version.return_value = (12,)
+
+        with self.app.test_request_context(method="GET", headers={"If-None-Match": 'W/"12"'}):
+            g.role = 'admin'
+            response, status_code = self.asset_handler.get_assets()
+
+            self.assertEqual(status_code, 304)
+            self.mock_asset_service.get_assets.assert_not_called()
+
+    def test_search_assets_success(self):
+        """Test a search returns the service's page."""
+        page = {"results": [], "next_offset": 0, "has_more": False}
+        self.mock_asset_service.search_assets.return_value = page
+
+        with self.app.test_request_context(method="GET", query_string={"q": "dell", "limit": "5", "offset": "10"}):
+            g.role = 'admin'
+            response, status_code = self.asset_handler.search_assets()
+
+            self.assertEqual(status_code, 200)
+            self.assertEqual(response["data"], page)
+            self.mock_asset_service.search_assets.assert_called_once_with("dell", 5, 10)
+
+    def test_search_assets_requires_a_query(self):
+        """Test a search without q is rejected."""
+        with self.app.test_request_context(method="GET", query_string={"q": "  "}):
+            g.role = 'admin'
+            response, status_code = self.asset_handler.search_assets()
+
+            self.assertEqual(status_code, 400)
+            self.assertEqual(response["status_code"], VALIDATION_ERROR)
+            self.mock_asset_service.search_assets.assert_not_called()
+
+    def test_search_assets_limit_out_of_range(self):
+        """Test a search with a page size above the maximum is rejected."""
+        with self.app.test_request_context(method="GET", query_string={"q": "dell", "limit": "100000"}):
+            g.role = 'admin'
+            response, status_code = self.asset_handler.search_assets()
+
+            self.assertEqual(status_code, 400)
+
     def test_unassign_asset_not_exists_error(self):
         """Test unassignment when user or asset does not exist."""
         user_id = str(uuid.uuid4())
@@ -462,3 +506,109 @@ class TestAssetHandler(unittest.TestCase):
             self.assertEqual(response["status_code"], DATABASE_OPERATION_ERROR)
             self.assertEqual(response["message"], "Error fetching assigned assets")
 
+
+    def test_get_assets_passes_sql_json_through(self):
+        """Test that in SQL JSON mode the encoded assets are returned as the response data."""
+        self.app.json = FastJSONProvider(self.app)
+        handler = AssetHandler.create(self.mock_asset_service, sql_json=True)
+        self.mock_asset_service.get_assets_json.return_value = b'[{"name":"Laptop"}]'
+
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+
+            response, status_code = handler.get_assets()
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(response.get_data(),
+                         b'{"status_code":200,"message":"Assets retrieved successfully","data":[{"name":"Laptop"}]}\n')
+        self.mock_asset_service.get_assets.assert_not_called()
+
+    def test_assigned_all_assets_sql_json_leaves_out_empty_data(self):
+        """Test that an empty encoded list is left out, as in the default mode."""
+        self.app.json = FastJSONProvider(self.app)
+        handler = AssetHandler.create(self.mock_asset_service, sql_json=True)
+        self.mock_asset_service.view_all_assigned_assets_json.return_value = b"[]"
+
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+
+            response, status_code = handler.assigned_all_assets()
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(response.get_json(), {"status_code": 200,
+                                               "message": "All assigned assets retrieved successfully"})
+
+    def test_assigned_assets_sql_json_not_exists(self):
+        """Test that SQL JSON mode reports a missing user like the default mode."""
+        handler = AssetHandler.create(self.mock_asset_service, sql_json=True)
+        self.mock_asset_service.view_assigned_assets_json.side_effect = NotExistsError("User not found")
+
+        with self.app.test_request_context(method="GET"):
+            response, status_code = handler.assigned_assets(str(uuid.uuid4()))
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual(response["message"], "User not found")
+
+    def test_asset_holder_success(self):
+        """Test that the holder lookup takes the time as UTC milliseconds."""
+        asset_id = str(uuid.uuid4())
+        self.mock_asset_service.get_holder_at.return_value = AssignmentHistory(
+            asset_assigned_id="A1", asset_id=asset_id, user_id="U1", assigned_at="2026-01-01 09:00:00.000"
+        )
+
+        with self.app.test_request_context(method="GET", query_string={"at": "2026-01-02T10:00:00+02:00"}):
+            g.role = 'admin'
+            response, status_code = self.asset_handler.asset_holder(asset_id)
+
+        self.assertEqual(status_code, 200)
+        self.assertEqual(response["message"], "Asset holder retrieved successfully")
+        self.mock_asset_service.get_holder_at.assert_called_once_with(asset_id, "2026-01-02 08:00:00.000")
+
+    def test_asset_holder_invalid_time(self):
+        """Test that a missing or malformed time is rejected before the lookup."""
+        asset_id = str(uuid.uuid4())
+        cases = [({}, MISSING_FIELD_ERROR), ({"at": "yesterday"}, VALIDATION_ERROR)]
+
+        for query, error in cases:
+            with self.app.test_request_context(method="GET", query_string=query):
+                g.role = 'admin'
+                response, status_code = self.asset_handler.asset_holder(asset_id)
+
+            self.assertEqual(status_code, 400)
+            self.assertEqual(response["status_code"], error)
+        self.mock_asset_service.get_holder_at.assert_not_called()
+
+    def test_asset_holder_not_assigned(self):
+        """Test that an asset nobody held at the time is reported as not found."""
+        self.mock_asset_service.get_holder_at.side_effect = NotExistsError("The asset was not assigned at that time")
+
+        with self.app.test_request_context(method="GET", query_string={"at": "2026-01-02"}):
+            g.role = 'admin'
+            response, status_code = self.asset_handler.asset_holder(str(uuid.uuid4()))
+
+        self.assertEqual(status_code, 404)
+        self.assertEqual(response["status_code"], RECORD_NOT_FOUND_ERROR)
+
+    def test_user_assignment_history_success(self):
+        """Test retrieval of what a user held within a range."""
+        user_id = str(uuid.uuid4())
+        self.mock_asset_service.get_user_history.return_value = []
+
+        with self.app.test_request_context(method="GET", query_string={"from": "2026-01-01", "to": "2026-02-01"}):
+            g.role = 'admin'
+            response, status_code = self.asset_handler.user_assignment_history(user_id)
+
+        self.assertEqual(status_code, 200)
+        self.mock_asset_service.get_user_history.assert_called_once_with(
+            user_id, "2026-01-01 00:00:00.000", "2026-02-01 00:00:00.000"
+        )
+
+    def test_user_assignment_history_reversed_range(self):
+        """Test that a range ending before it starts is rejected."""
+        with self.app.test_request_context(method="GET", query_string={"from": "2026-02-01", "to": "2026-01-01"}):
+            g.role = 'admin'
+            response, status_code = self.asset_handler.user_assignment_history(str(uuid.uuid4()))
+
+        self.assertEqual(status_code, 400)
+        self.assertEqual(response["status_code"], VALIDATION_ERROR)
+        self.mock_asset_service.get_user_history.assert_not_called()
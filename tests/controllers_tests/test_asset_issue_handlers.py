@@ -67,7 +67,7 @@ class TestIssueHandler:
         assert response["status_code"] == 200
         assert response["message"] == "User issues fetched successfully"
         assert len(response["data"]) == 2
-        assert response["data"][0]["description"] == "First issue"
+        assert response["data"][0].description == "First issue"
 
         issue_handler.issue_service.get_user_issues.assert_called_once_with(valid_user_id)
 
@@ -134,6 +134,39 @@ class TestIssueHandler:
         assert response["status_code"] == DATABASE_OPERATION_ERROR
         assert response["message"] == "Error fetching all issues"
 
+    def test_search_issues_success(self, app, issue_handler):
+        """Test a search returns the service's page"""
+        page = {"results": [], "next_offset": 0, "has_more": False}
+        issue_handler.issue_service.search_issues.return_value = page
+
+        with app.test_request_context(query_string={"q": "cracked screen"}):
+            g.role = 'admin'
+            response, status_code = issue_handler.search_issues()
+
+        assert status_code == 200
+        assert response["data"] == page
+        issue_handler.issue_service.search_issues.assert_called_once_with("cracked screen", 20, 0)
+
+    def test_search_issues_invalid_offset(self, app, issue_handler):
+        """Test a search with a negative offset is rejected"""
+        with app.test_request_context(query_string={"q": "cracked", "offset": "-1"}):
+            g.role = 'admin'
+            response, status_code = issue_handler.search_issues()
+
+        assert status_code == 400
+        assert response["status_code"] == VALIDATION_ERROR
+
+    def test_search_issues_database_error(self, app, issue_handler):
+        """Test search with database error"""
+        issue_handler.issue_service.search_issues.side_effect = DatabaseError("Database error")
+
+        with app.test_request_context(query_string={"q": "cracked"}):
+            g.role = 'admin'
+            response, status_code = issue_handler.search_issues()
+
+        assert status_code == 500
+        assert response["message"] == "Error searching issues"
+
     def test_report_issue_success(self, app, issue_handler, sample_issue):
         """Test successful issue reporting"""
         request_data = {
@@ -0,0 +1,99 @@
+import os
+import unittest
+
+from flask import Flask, g
+
+from src.app.config.custom_error_codes import VALIDATION_ERROR, RECORD_NOT_FOUND_ERROR, SYSTEM_ERROR
+from src.app.controllers.caches.handlers import CacheHandler
+from src.app.utils.cache.lru_cache import LRUCache
+from src.app.utils.cache.shared_memory_cache import SharedMemoryCache
+from src.app.utils.cache.registry import CacheRegistry
+
+
+class TestCacheHandler(unittest.TestCase):
+
+    def setUp(self):
+        """Set up Flask app and a registry of two caches."""
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.registry = CacheRegistry(budget_bytes=1000)
+        self.users = self.registry.register("users", LRUCache("users"), share=1)
+        self.assets = self.registry.register("assets", LRUCache("assets"), share=1)
+        self.cache_handler = CacheHandler.create(self.registry)
+
+    def test_get_caches(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+            response, status_code = self.cache_handler.get_caches()
+
+            self.assertEqual(status_code, 200)
+            self.assertEqual(list(response["data"]["caches"]), ["users", "assets"])
+            self.assertEqual(response["data"]["pid"], os.getpid())
+
+    def test_get_caches_requires_admin(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'user'
+            response, status_code = self.cache_handler.get_caches()
+
+            self.assertEqual(status_code, 403)
+
+    def test_get_cache_metrics(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+            response = self.cache_handler.get_cache_metrics()
+
+            self.assertEqual(response.mimetype, "text/plain")
+            self.assertEqual(response.headers["X-Worker-Pid"], str(os.getpid()))
+            self.assertIn(b'cache_hits_total{cache="users"} 0', response.data)
+
+    def test_get_unknown_cache(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+            response, status_code = self.cache_handler.get_cache("sessions")
+
+            self.assertEqual(status_code, 404)
+            self.assertEqual(response["status_code"], RECORD_NOT_FOUND_ERROR)
+
+    def test_update_cache_resizes_and_flushes(self):
+        self.users.set("U1", "mia")
+        with self.app.test_request_context(method="POST", json={"max_bytes": 300, "flush": True}):
+            g.role = 'admin'
+            response, status_code = self.cache_handler.update_cache("users")
+
+            self.assertEqual(status_code, 200)
+            self.assertEqual(response["data"]["max_bytes"], 300)
+            self.assertEqual(response["data"]["entries"], 0)
+            self.assertEqual(self.assets.max_bytes, 700)
+            self.assertEqual(response["data"]["pid"], os.getpid())
+
+    def test_update_cache_over_budget(self):
+        with self.app.test_request_context(method="POST", json={"max_bytes": 5000}):
+            g.role = 'admin'
+            response, status_code = self.cache_handler.update_cache("users")
+
+            self.assertEqual(status_code, 400)
+            self.assertEqual(response["status_code"], VALIDATION_ERROR)
+
+    def test_update_cache_invalid_size(self):
+        with self.app.test_request_context(method="POST", json={"max_bytes": "big"}):
+            g.role = 'admin'
+            response, status_code = self.cache_handler.update_cache("users")
+
+            self.assertEqual(status_code, 400)
+
+    def test_flush_of_a_busy_shared_cache(self):
+        shared = self.registry.register("tokens", SharedMemoryCache("tokens", slots=4, slot_bytes=64))
+        self.addCleanup(shared.close)
+        shared._acquire()
+        self.addCleanup(shared._release)
+        with self.app.test_request_context(method="POST", json={"flush": True}):
+            g.role = 'admin'
+            response, status_code, headers = self.cache_handler.update_cache("tokens")
+
+            self.assertEqual(status_code, 503)
+            self.assertEqual(response["status_code"], SYSTEM_ERROR)
+            self.assertEqual(headers["Retry-After"], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
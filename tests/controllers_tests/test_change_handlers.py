@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import MagicMock
+
+from flask import Flask, g
+
+from src.app.config.custom_error_codes import VALIDATION_ERROR, DATABASE_OPERATION_ERROR
+from src.app.controllers.changes.handlers import ChangeHandler
+from src.app.services.change_service import ChangeService
+from src.app.utils.errors.error import DatabaseError
+
+
+class TestChangeHandler(unittest.TestCase):
+
+    def setUp(self):
+        """Set up Flask app and mock service."""
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.mock_change_service = MagicMock(spec=ChangeService)
+        self.mock_change_service.get_changes.return_value = {
+            "changes": [], "next_since": 7, "has_more": False, "latest_version": 7
+        }
+        self.change_handler = ChangeHandler.create(self.mock_change_service)
+
+    def test_get_changes_with_defaults(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+            response, status_code = self.change_handler.get_changes()
+
+            self.assertEqual(status_code, 200)
+            self.assertEqual(response["data"]["next_since"], 7)
+            self.mock_change_service.get_changes.assert_called_once_with(0, 500)
+
+    def test_get_changes_with_since_and_limit(self):
+        with self.app.test_request_context(method="GET", query_string={"since": "5", "limit": "20"}):
+            g.role = 'admin'
+            self.change_handler.get_changes()
+
+            self.mock_change_service.get_changes.assert_called_once_with(5, 20)
+
+    def test_get_changes_validation_error(self):
+        for query in ({"since": "abc"}, {"since": "-1"}, {"limit": "0"}, {"limit": "100000"}):
+            with self.app.test_request_context(method="GET", query_string=query):
+                g.role = 'admin'
+                response, status_code = self.change_handler.get_changes()
+
+                self.assertEqual(status_code, 400)
+                self.assertEqual(response["status_code"], VALIDATION_ERROR)
+
+    def test_get_changes_database_error(self):
+        self.mock_change_service.get_changes.side_effect = DatabaseError("Database error")
+
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+            response, status_code = self.change_handler.get_changes()
+
+            self.assertEqual(status_code, 500)
+            self.assertEqual(response["status_code"], DATABASE_OPERATION_ERROR)
+
+    def test_get_changes_requires_admin(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'user'
+            response, status_code = self.change_handler.get_changes()
+
+            self.assertEqual(status_code, 403)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.app.config.app_config import AppConfig
+from src.app.controllers.main import create_app
+from src.app.scripts.create_tables import create_tables
+from src.app.scripts.generate_data import SyntheticDataGenerator, truncate_tables
+from src.app.utils.utils import Utils
+
+
+class TestETags(unittest.TestCase):
+    """ETags come from the table versions, so they have to change with the database itself"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.token = Utils.create_jwt_token("admin-1", "admin")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def database(self, name: str) -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        conn = sqlite3.connect(path)
+        create_tables(conn)
+        conn.close()
+        return path
+
+    def client(self, db_path: str):
+        # No response cache: every request reads the versions from the database
+        app = create_app(AppConfig.for_testing(db_path=db_path, response_cache_bytes=0))
+        return app.test_client()
+
+    def get_assets(self, client, etag: str = None):
+        headers = {"Authorization": f"Bearer {self.token}"}
+        if etag:
+            headers["If-None-Match"] = etag
+        return client.get("/assets", headers=headers)
+
+    def test_reload_invalidates_the_old_etag(self):
+        path = self.database("app.db")
+        client = self.client(path)
+        etag = self.get_assets(client).headers["ETag"]
+        self.assertEqual(self.get_assets(client, etag).status_code, 304)
+
+        conn = sqlite3.connect(path)
+        truncate_tables(conn)
+        SyntheticDataGenerator(seed=7, users=5, assets=8, assignments=4, issues=6, password_pool=1).generate(conn)
+        conn.close()
+
+        response = self.get_assets(client, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_databases_with_equal_table_versions_have_different_etags(self):
+        paths = [self.database("first.db"), self.database("second.db")]
+        for path in paths:
+            conn = sqlite3.connect(path)
+            with conn:
+                conn.execute("UPDATE table_versions SET version = 7 WHERE table_name != 'database'")
+            conn.close()
+
+        first, second = (self.get_assets(self.client(path)).headers["ETag"] for path in paths)
+
+        self.assertNotEqual(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from flask import Flask, g
+
+from src.app.controllers.events.handlers import EventHandler
+from src.app.models.asset import Asset
+from src.app.repositories.asset_repository import AssetRepository
+from src.app.repositories.change_repository import ChangeRepository
+from src.app.scripts.create_tables import create_tables
+from src.app.utils.db.db import DB
+from src.app.utils.events.event_bus import EventBus
+
+
+class TestEventHandler(unittest.TestCase):
+
+    def setUp(self):
+        """Serve the stream with the role that auth_middleware would have set."""
+        self.app = Flask(__name__)
+        self.app.testing = True
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+        db = DB(self.db_path)
+        self.asset_repository = AssetRepository(db)
+        self.bus = EventBus(ChangeRepository(db), poll_seconds=0.01)
+        self.role = "admin"
+
+        @self.app.before_request
+        def authenticate():
+            g.role = self.role
+            g.user_id = "u-1"
+
+        self.app.add_url_rule("/events", "events", EventHandler.create(self.bus).stream_events)
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def delete_asset(self, serial_number: str):
+        self.asset_repository.add_asset(Asset(name="laptop", description="dell", serial_number=serial_number))
+        self.asset_repository.delete_asset(serial_number)
+        self.bus.poll()
+
+    def test_stream_sends_retry_then_events(self):
+        response = self.client.get("/events", buffered=False)
+        chunks = iter(response.response)
+
+        self.assertEqual(response.mimetype, "text/event-stream")
+        self.assertEqual(next(chunks), b"retry: 3000\n\n")
+        self.delete_asset("SN1")
+        self.assertIn(b"event: asset.deleted\ndata: {\"asset_id\":\"SN1\"}", next(chunks))
+        response.close()
+
+    @patch("src.app.config.events_config.EVENTS_HEARTBEAT_SECONDS", 0.01)
+    def test_idle_stream_sends_heartbeats(self):
+        response = self.client.get("/events", buffered=False)
+        chunks = iter(response.response)
+        next(chunks)
+
+        self.assertEqual(next(chunks), b": heartbeat\n\n")
+        response.close()
+
+    def test_resume_from_last_event_id(self):
+        self.delete_asset("SN1")
+        seen = ChangeRepository(DB(self.db_path)).fetch_latest_version()
+        self.delete_asset("SN2")
+
+        response = self.client.get("/events", headers={"Last-Event-ID": str(seen)}, buffered=False)
+        chunks = iter(response.response)
+        next(chunks)
+
+        self.assertEqual(next(chunks), f'id: {seen + 2}\nevent: asset.deleted\ndata: {{"asset_id":"SN2"}}\n\n'.encode())
+        response.close()
+
+    def test_unknown_last_event_id_sends_reset(self):
+        response = self.client.get("/events", headers={"Last-Event-ID": "9"}, buffered=False)
+        chunks = iter(response.response)
+        next(chunks)
+
+        self.assertEqual(next(chunks), b"event: reset\ndata: {}\n\n")
+        response.close()
+
+    @patch("src.app.config.events_config.EVENTS_MAX_STREAM_SECONDS", 0.05)
+    @patch("src.app.config.events_config.EVENTS_HEARTBEAT_SECONDS", 0.01)
+    def test_stream_ends_and_unsubscribes(self):
+        response = self.client.get("/events")
+
+        self.assertTrue(response.data.startswith(b"retry: 3000\n\n"))
+        self.assertEqual(self.bus.stats()["subscribers"], 0)
+
+    def test_disconnect_unsubscribes(self):
+        response = self.client.get("/events", buffered=False)
+        next(iter(response.response))
+        self.assertEqual(self.bus.stats()["subscribers"], 1)
+
+        response.close()
+
+        self.assertEqual(self.bus.stats()["subscribers"], 0)
+
+    def test_unreadable_changes_log_is_a_server_error(self):
+        self.bus.change_repository = ChangeRepository(DB(os.path.join(self.db_path, "missing.db")))
+
+        response = self.client.get("/events")
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.bus.stats()["subscribers"], 0)
+
+    def test_streams_beyond_the_limit_are_refused(self):
+        self.bus.max_subscribers = 1
+        first = self.client.get("/events", buffered=False)
+        next(iter(first.response))
+
+        response = self.client.get("/events")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "3")
+        first.close()
+        self.assertEqual(self.client.get("/events", buffered=False).status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
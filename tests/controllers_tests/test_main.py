@@ -1,7 +1,20 @@
+import os
+import re
+import subprocess
+import sys
+import tempfile
 import unittest
 from flask import Flask
+from src.app.config.app_config import AppConfig
 from src.app.controllers.main import create_app
 
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Total self time of our own modules when importing the app module
+IMPORT_BUDGET_MS = 50
+# Loaded on first use or only by the blueprints, never by `import src.app.controllers.main`
+LAZY_MODULES = re.compile(r"^(bcrypt|jwt|logging\.handlers|src\.app\.controllers\.\w+\.(handlers|routes)"
+                          r"|src\.app\.repositories\..*|src\.app\.services\..*)$")
+
 
 class TestAppFactory(unittest.TestCase):
     def test_create_app_returns_flask_app(self):
@@ -9,7 +22,7 @@ class TestAppFactory(unittest.TestCase):
         Test that create_app returns a Flask application
         """
         # Act
-        app = create_app()
+        app = create_app(AppConfig.for_testing())
 
         # Assert
         self.assertIsInstance(app, Flask)
@@ -21,7 +34,7 @@ class TestAppFactory(unittest.TestCase):
         # Act & Assert
         try:
             # This would have happened during app creation
-            app = create_app()
+            app = create_app(AppConfig.for_testing())
         except Exception as e:
             self.fail(f"create_app() raised {type(e).__name__} unexpectedly: {e}")
 
@@ -30,14 +43,14 @@ class TestAppFactory(unittest.TestCase):
         Verify that services are created with their correct dependencies
         """
         # Act
-        app = create_app()
+        app = create_app(AppConfig.for_testing())
 
         # We'll use the blueprint registration as a proxy to verify dependency injection
         # Since we can't directly access the services, we're checking that the app
         # was created without any dependency injection errors
         try:
             # This would have happened during app creation
-            app = create_app()
+            app = create_app(AppConfig.for_testing())
         except Exception as e:
             self.fail(f"Dependency injection failed: {type(e).__name__} - {e}")
 
@@ -48,7 +61,7 @@ class TestAppFactory(unittest.TestCase):
         # Act & Assert
         try:
             # This would have happened during app creation
-            app = create_app()
+            app = create_app(AppConfig.for_testing())
         except Exception as e:
             self.fail(f"Database initialization failed: {type(e).__name__} - {e}")
 
@@ -57,7 +70,7 @@ class TestAppFactory(unittest.TestCase):
         Verify that all expected routes are registered
         """
         # Arrange
-        app = create_app()
+        app = create_app(AppConfig.for_testing())
 
         # Expected route prefixes
         expected_routes = [
@@ -72,3 +85,40 @@ class TestAppFactory(unittest.TestCase):
             for route in expected_routes:
                 self.assertTrue(any(route in r for r in routes),
                                 f"Route {route} not found in registered routes")
+
+    def test_only_configured_blueprints_are_registered(self):
+        app = create_app(AppConfig.for_testing(blueprints=("users",)))
+
+        self.assertEqual(set(app.blueprints), {"user_routes"})
+
+    def test_app_does_not_touch_disk(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                app = create_app(AppConfig.for_testing())
+                app.test_client().post("/login", json={"email": "not-an-email"})
+                created = os.listdir(tmp_dir)
+            finally:
+                os.chdir(cwd)
+
+        self.assertEqual(created, [])
+
+
+class TestImportTime(unittest.TestCase):
+    def test_app_module_import_is_lazy_and_within_budget(self):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import src.app.controllers.main"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+        )
+
+        modules = {}
+        for line in result.stderr.splitlines():
+            match = re.match(r"import time:\s+(\d+) \|\s+\d+ \|\s*(\S+)$", line)
+            if match:
+                modules[match.group(2)] = int(match.group(1))
+
+        self.assertIn("src.app.controllers.main", modules)
+        self.assertEqual([name for name in modules if LAZY_MODULES.match(name)], [])
+        own_ms = sum(us for name, us in modules.items() if name.startswith("src.")) / 1000
+        self.assertLess(own_ms, IMPORT_BUDGET_MS)
@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import MagicMock
+
+from flask import Flask, g
+
+from src.app.config.custom_error_codes import VALIDATION_ERROR, DATABASE_OPERATION_ERROR
+from src.app.controllers.stats.handlers import StatsHandler
+from src.app.services.stats_service import StatsService
+from src.app.utils.errors.error import DatabaseError
+
+
+class TestStatsHandler(unittest.TestCase):
+
+    def setUp(self):
+        """Set up Flask app and mock service."""
+        self.app = Flask(__name__)
+        self.app.testing = True
+        self.mock_stats_service = MagicMock(spec=StatsService)
+        self.mock_stats_service.get_stats.return_value = {"assets_by_status": {"available": 3}}
+        self.stats_handler = StatsHandler.create(self.mock_stats_service)
+
+    def test_get_stats_with_defaults(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+            response, status_code = self.stats_handler.get_stats()
+
+            self.assertEqual(status_code, 200)
+            self.assertEqual(response["data"], {"assets_by_status": {"available": 3}})
+            self.mock_stats_service.get_stats.assert_called_once_with(10)
+
+    def test_get_stats_requires_admin(self):
+        with self.app.test_request_context(method="GET"):
+            g.role = 'user'
+            response, status_code = self.stats_handler.get_stats()
+
+            self.assertEqual(status_code, 403)
+
+    def test_get_stats_invalid_top(self):
+        with self.app.test_request_context(method="GET", query_string={"top": "1000"}):
+            g.role = 'admin'
+            response, status_code = self.stats_handler.get_stats()
+
+            self.assertEqual(status_code, 400)
+            self.assertEqual(response["status_code"], VALIDATION_ERROR)
+
+    def test_get_stats_database_error(self):
+        self.mock_stats_service.get_stats.side_effect = DatabaseError("no counters table")
+
+        with self.app.test_request_context(method="GET"):
+            g.role = 'admin'
+            response, status_code = self.stats_handler.get_stats()
+
+            self.assertEqual(status_code, 500)
+            self.assertEqual(response["status_code"], DATABASE_OPERATION_ERROR)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -201,7 +201,7 @@ class TestUserHandler:
         assert status_code == 200
         assert response["status_code"] == 200
         assert response["message"] == "User details retrieved successfully"
-        assert response["data"]["email"] == sample_user.email
+        assert response["data"].email == sample_user.email
 
     def test_get_user_not_found(self, app, user_handler):
         """Test get user with non-existent user"""
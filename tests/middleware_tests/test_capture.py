@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import unittest
+
+from flask import Flask, g
+
+from src.app.middleware.capture import TrafficRecorder, init_traffic_capture
+
+
+class TestTrafficCapture(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "traffic.jsonl")
+        self.app = Flask(__name__)
+
+        @self.app.before_request
+        def fake_auth():
+            g.user_id = "user-1"
+            g.role = "admin"
+
+        self.app.add_url_rule("/login", "login", lambda: ("ok", 200), methods=["POST"])
+        self.app.add_url_rule("/user/<user_id>", "user", lambda user_id: ("ok", 200), methods=["GET"])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _records(self):
+        with open(self.path) as capture_file:
+            return [json.loads(line) for line in capture_file]
+
+    def test_request_is_recorded_and_sanitized(self):
+        init_traffic_capture(self.app, TrafficRecorder(self.path, sample_rate=1.0))
+
+        self.app.test_client().post(
+            "/login", json={"email": "a@watchguard.com", "password": "Secret@123"},
+            headers={"Authorization": "Bearer secret-token"}
+        )
+
+        record = self._records()[0]
+        self.assertEqual(record["method"], "POST")
+        self.assertEqual(record["path"], "/login")
+        self.assertEqual(record["body"], {"email": "a@watchguard.com", "password": "***"})
+        self.assertEqual(record["user_id"], "user-1")
+        self.assertEqual(record["role"], "admin")
+        self.assertEqual(record["status"], 200)
+        self.assertIn("duration_ms", record)
+        self.assertNotIn("secret-token", json.dumps(record))
+
+    def test_route_and_query_are_recorded(self):
+        init_traffic_capture(self.app, TrafficRecorder(self.path, sample_rate=1.0))
+
+        self.app.test_client().get("/user/42?verbose=1")
+
+        record = self._records()[0]
+        self.assertEqual(record["route"], "/user/<user_id>")
+        self.assertEqual(record["query"], "verbose=1")
+        self.assertIsNone(record["body"])
+
+    def test_zero_sample_rate_records_nothing(self):
+        init_traffic_capture(self.app, TrafficRecorder(self.path, sample_rate=0.0))
+
+        self.app.test_client().get("/user/42")
+
+        self.assertFalse(os.path.exists(self.path))
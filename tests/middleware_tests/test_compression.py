@@ -0,0 +1,74 @@
+import gzip
+import unittest
+import zlib
+from unittest.mock import patch
+
+from flask import Flask, Response
+
+from src.app.middleware.compression import Compressor, init_compression
+from src.app.utils.cache.response_cache import ResponseCache, cached_response
+
+PAYLOAD = {"data": [{"name": "dell latitude 5440", "status": "available"}] * 200}
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        init_compression(self.app, Compressor(min_size=1024, level=6))
+        self.app.add_url_rule("/assets", "assets", lambda: PAYLOAD)
+        self.app.add_url_rule("/small", "small", lambda: {"ok": True})
+        self.app.add_url_rule("/stream", "stream", lambda: Response(iter([b"x" * 4096]), mimetype="text/plain"))
+        self.client = self.app.test_client()
+
+    def test_gzip_is_negotiated(self):
+        response = self.client.get("/assets", headers={"Accept-Encoding": "gzip, deflate, br"})
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual(int(response.headers["Content-Length"]), len(response.data))
+        self.assertEqual(gzip.decompress(response.data), self.client.get("/assets").data)
+
+    def test_deflate_when_preferred(self):
+        response = self.client.get("/assets", headers={"Accept-Encoding": "gzip;q=0.5, deflate"})
+
+        self.assertEqual(response.headers["Content-Encoding"], "deflate")
+        self.assertEqual(zlib.decompress(response.data), self.client.get("/assets").data)
+
+    def test_identity_without_accept_encoding_or_when_refused(self):
+        for headers in ({}, {"Accept-Encoding": "br"}, {"Accept-Encoding": "gzip;q=0, deflate;q=0"}):
+            response = self.client.get("/assets", headers=headers)
+
+            self.assertNotIn("Content-Encoding", response.headers)
+            self.assertEqual(response.get_json(), PAYLOAD)
+
+    def test_small_and_streamed_responses_are_not_compressed(self):
+        for path in ("/small", "/stream"):
+            response = self.client.get(path, headers={"Accept-Encoding": "gzip"})
+
+            self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_cached_response_is_compressed_once(self):
+        cache = ResponseCache(max_bytes=1_000_000)
+
+        class Handler:
+            response_cache = cache
+
+            @cached_response("assets")
+            def get_assets(self):
+                return PAYLOAD
+
+        self.app.add_url_rule("/cached", "cached", Handler().get_assets)
+        headers = {"Accept-Encoding": "gzip"}
+
+        with patch.object(Compressor, "compress", autospec=True, side_effect=Compressor.compress) as compress:
+            first = self.client.get("/cached", headers=headers)
+            second = self.client.get("/cached", headers=headers)
+
+        self.assertEqual(second.headers["X-Cache"], "HIT")
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(compress.call_count, 1)
+        self.assertGreater(cache.stats()["bytes"], len(first.data) + len(gzip.decompress(first.data)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
+import time
 import unittest
 from unittest.mock import patch
 from flask import Flask, g
 import jwt
 from src.app.middleware.middleware import auth_middleware
+from src.app.utils.cache.lru_cache import LRUCache
+from src.app.utils.utils import Utils
 from src.app.config.custom_error_codes import (
     INVALID_TOKEN_ERROR,
     INVALID_TOKEN_PAYLOAD_ERROR,
@@ -88,3 +91,41 @@ class TestAuthMiddleware(unittest.TestCase):
         with app.test_request_context('/signup'):
             response = auth_middleware()
             self.assertIsNone(response)
+
+
+class TestTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.extensions["token_cache"] = LRUCache()
+
+    def request(self, token: str):
+        return self.app.test_request_context('/some/protected/route', headers={'Authorization': f'Bearer {token}'})
+
+    @patch('src.app.utils.utils.Utils.decode_jwt_token')
+    def test_verified_token_is_not_decoded_again(self, mock_decode):
+        mock_decode.return_value = {"user_id": "123", "role": "admin", "exp": time.time() + 60}
+        for _ in range(2):
+            with self.request("valid.token.here"):
+                self.assertIsNone(auth_middleware())
+                self.assertEqual(g.user_id, "123")
+
+        mock_decode.assert_called_once_with("valid.token.here")
+
+    @patch('src.app.utils.utils.Utils.decode_jwt_token')
+    def test_invalid_tokens_are_not_cached(self, mock_decode):
+        mock_decode.side_effect = jwt.InvalidTokenError()
+        for _ in range(2):
+            with self.request("bad.token"):
+                response, status_code = auth_middleware()
+                self.assertEqual(status_code, 401)
+
+        self.assertEqual(mock_decode.call_count, 2)
+
+    def test_cached_claims_match_the_token(self):
+        token = Utils.create_jwt_token("u-1", "user")
+        with self.request(token):
+            auth_middleware()
+        with self.request(token):
+            auth_middleware()
+            self.assertEqual((g.user_id, g.role), ("u-1", "user"))
@@ -0,0 +1,105 @@
+import io
+import os
+import pstats
+import tempfile
+import unittest
+
+from flask import Flask, Response, send_file
+
+from src.app.middleware.profiler import ProfilerMiddleware
+from src.app.utils.utils import Utils
+
+
+class TestProfilerMiddleware(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.app = Flask(__name__)
+        self.app.add_url_rule("/ping", "ping", lambda: "pong")
+        self.middleware = ProfilerMiddleware(self.app.wsgi_app, profile_dir=self.tmp_dir.name,
+                                             rate_limit=2, rate_window=60)
+        self.app.wsgi_app = self.middleware
+        self.client = self.app.test_client()
+        self.admin_headers = {
+            "Authorization": f"Bearer {Utils.create_jwt_token('1', 'admin')}",
+            "X-Profile": "1"
+        }
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_request_without_flag_is_not_profiled(self):
+        response = self.client.get("/ping")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Profile-Id", response.headers)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_admin_request_is_profiled(self):
+        response = self.client.get("/ping", headers=self.admin_headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, b"pong")
+        profile_id = response.headers["X-Profile-Id"]
+        stats = pstats.Stats(os.path.join(self.tmp_dir.name, f"{profile_id}.prof"))
+        self.assertGreater(stats.total_calls, 0)
+
+    def test_query_flag_triggers_profile(self):
+        response = self.client.get("/ping?profile=1", headers={"Authorization": self.admin_headers["Authorization"]})
+
+        self.assertIn("X-Profile-Id", response.headers)
+
+    def test_flag_text_in_other_parameters_does_not_profile(self):
+        for query in ["q=profile=1", "myprofile=1", "profile=10", "x=1&q=ab-profile%3D1"]:
+            response = self.client.get(f"/ping?{query}",
+                                       headers={"Authorization": self.admin_headers["Authorization"]})
+
+            self.assertNotIn("X-Profile-Id", response.headers, query)
+
+    def test_non_admin_request_is_not_profiled(self):
+        headers = {
+            "Authorization": f"Bearer {Utils.create_jwt_token('1', 'user')}",
+            "X-Profile": "1"
+        }
+        response = self.client.get("/ping", headers=headers)
+
+        self.assertNotIn("X-Profile-Id", response.headers)
+
+    def test_invalid_token_is_not_profiled(self):
+        response = self.client.get("/ping", headers={"Authorization": "Bearer invalid", "X-Profile": "1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Profile-Id", response.headers)
+
+    def test_rate_limit(self):
+        self.client.get("/ping", headers=self.admin_headers)
+        self.client.get("/ping", headers=self.admin_headers)
+        response = self.client.get("/ping", headers=self.admin_headers)
+
+        self.assertNotIn("X-Profile-Id", response.headers)
+        self.assertEqual(response.headers["X-Profile-Status"], "rate-limited")
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
+
+    def test_streamed_responses_are_not_buffered(self):
+        generated = []
+
+        def events():
+            for chunk in ("data: 1\n\n", "data: 2\n\n"):
+                generated.append(chunk)
+                yield chunk
+
+        self.app.add_url_rule("/events", "events", lambda: Response(events(), mimetype="text/event-stream"))
+        self.app.add_url_rule("/file", "file", lambda: send_file(io.BytesIO(b"x" * 10), mimetype="text/csv"))
+
+        response = self.client.get("/events", headers=self.admin_headers, buffered=False)
+
+        self.assertIn("X-Profile-Id", response.headers)
+        # The test client reads the first chunk itself; the middleware read none of the rest
+        self.assertEqual(len(generated), 1)
+        self.assertEqual(response.get_data(), b"data: 1\n\ndata: 2\n\n")
+        response.close()
+
+        response = self.client.get("/file", headers=self.admin_headers)
+
+        self.assertEqual(response.data, b"x" * 10)
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
@@ -0,0 +1,17 @@
+from unittest.mock import MagicMock
+
+
+def apply_row_factory(cursor: MagicMock) -> MagicMock:
+    """
+    Make a mocked cursor behave like sqlite3's: rows given as `fetchall`/`fetchone` return values
+    are passed through whatever `row_factory` the repository set on the cursor.
+    """
+    def convert(row):
+        factory = cursor.row_factory
+        if row is None or isinstance(factory, MagicMock):
+            return row
+        return factory(cursor, row)
+
+    cursor.fetchall.side_effect = lambda: [convert(row) for row in cursor.fetchall.return_value]
+    cursor.fetchone.side_effect = lambda: convert(cursor.fetchone.return_value)
+    return cursor
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, patch
+from tests.repository_tests.helpers import apply_row_factory
 from datetime import datetime
 from src.app.repositories.asset_issue_repository import IssueRepository
 from src.app.models.asset_issue import Issue
@@ -14,7 +15,7 @@ class TestIssueRepository(unittest.TestCase):
 
         # Mock DB connection and cursor
         self.mock_conn = MagicMock()
-        self.mock_cursor = MagicMock()
+        self.mock_cursor = apply_row_factory(MagicMock())
         self.mock_db.get_connection.return_value = self.mock_conn
         self.mock_conn.cursor.return_value = self.mock_cursor
 
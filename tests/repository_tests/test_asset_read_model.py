@@ -0,0 +1,149 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.app.config.app_config import AppConfig
+from src.app.controllers.main import create_app
+from src.app.models.asset import Asset
+from src.app.models.asset_assigned import AssetAssigned
+from src.app.models.user import User
+from src.app.repositories.asset_read_model import AssetReadModel
+from src.app.repositories.asset_repository import AssetRepository
+from src.app.repositories.user_repository import UserRepository
+from src.app.scripts.create_tables import create_tables, create_triggers, drop_triggers, bump_versions
+from src.app.utils.db.db import DB
+from src.app.utils.utils import Utils
+
+
+class TestAssetReadModel(unittest.TestCase):
+    """The read model follows the changes log, so these tests run against a real database"""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+
+        self.db = DB(self.db_path)
+        self.asset_repository = AssetRepository(self.db)
+        self.user_repository = UserRepository(self.db)
+        self.user_repository.save_user(User(id="U1", name="mia", email="mia@x.com", password="hash", department="IT"))
+        for i in range(3):
+            self.asset_repository.add_asset(Asset(name="Laptop", description=f"Dell {i}", serial_number=f"SN{i}"))
+        self.assign("U1", "SN0", "A0")
+
+        self.read_model = AssetReadModel(self.db)
+        self.read_model.load()
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def assign(self, user_id: str, asset_id: str, assigned_id: str):
+        self.asset_repository.assign_asset(AssetAssigned(user_id=user_id, asset_id=asset_id,
+                                                         asset_assigned_id=assigned_id))
+        self.asset_repository.update_asset_status(asset_id, "assigned")
+
+    def assert_matches_database(self):
+        self.assertEqual(self.read_model.fetch_all_assets(), self.asset_repository.fetch_all_assets())
+        self.assertEqual(self.read_model.view_assigned_assets("U1"), self.asset_repository.view_assigned_assets("U1"))
+
+    def test_load_answers_the_repository_reads(self):
+        self.assert_matches_database()
+        self.assertEqual(self.read_model.fetch_asset_by_id("SN1"), self.asset_repository.fetch_asset_by_id("SN1"))
+        self.assertIsNone(self.read_model.fetch_asset_by_id("missing"))
+        self.assertTrue(self.read_model.is_asset_assigned("U1", "SN0"))
+        self.assertFalse(self.read_model.check_asset_availability("SN0"))
+        self.assertTrue(self.read_model.check_asset_availability("SN1"))
+        self.assertEqual([asset.serial_number for asset in self.read_model.fetch_assets_by_status("assigned")], ["SN0"])
+
+    def test_writes_from_other_connections_are_replayed_without_reloading(self):
+        self.assign("U1", "SN1", "A1")
+        self.asset_repository.unassign_asset("U1", "SN0")
+        self.asset_repository.update_asset_status("SN0", "available")
+        self.asset_repository.add_asset(Asset(name="Monitor", description="Dell", serial_number="SN9"))
+        self.asset_repository.delete_asset("SN2")
+
+        self.assert_matches_database()
+        self.assertFalse(self.read_model.is_asset_assigned("U1", "SN0"))
+        self.assertCountEqual([asset.serial_number for asset in self.read_model.fetch_assets_by_status("available")],
+                              ["SN0", "SN9"])
+        self.assertEqual(self.read_model.reloads, 1)
+        self.assertEqual(self.read_model.applied_changes, 6)
+
+    def test_updates_keep_the_table_order(self):
+        self.asset_repository.update_asset_status("SN1", "assigned")
+
+        self.assertEqual([asset.serial_number for asset in self.read_model.fetch_all_assets()], ["SN0", "SN1", "SN2"])
+
+    def test_cascaded_deletes_remove_assignments(self):
+        self.user_repository.delete_user("U1")
+
+        self.assertEqual(self.read_model.view_assigned_assets("U1"), {"user_id": "U1", "assets": []})
+        self.assertEqual(self.read_model.stats()["assignments"], 0)
+
+    def test_no_commit_means_no_changes_read(self):
+        self.read_model.fetch_all_assets()
+        applied = self.read_model.applied_changes
+
+        self.read_model.fetch_all_assets()
+
+        self.assertEqual(self.read_model.applied_changes, applied)
+
+    def test_bulk_load_without_triggers_causes_a_reload(self):
+        # What generate_data does: the versions are bumped once the triggers are back
+        conn = sqlite3.connect(self.db_path)
+        drop_triggers(conn)
+        with conn:
+            conn.execute("INSERT INTO assets VALUES ('SN7', 'Phone', 'Pixel', 'available')")
+        create_triggers(conn)
+        bump_versions(conn)
+        conn.close()
+
+        self.assert_matches_database()
+        self.assertEqual(self.read_model.reloads, 2)
+
+    def test_too_many_pending_changes_cause_a_reload(self):
+        self.read_model.max_replay = 2
+        for i in range(3):
+            self.asset_repository.update_asset_status(f"SN{i}", "assigned")
+
+        self.assert_matches_database()
+        self.assertEqual(self.read_model.reloads, 2)
+        self.assertEqual(self.read_model.applied_changes, 0)
+
+    def test_first_read_loads_the_model(self):
+        read_model = AssetReadModel(self.db)
+
+        self.assertEqual(len(read_model.fetch_all_assets()), 3)
+        self.assertEqual(read_model.reloads, 1)
+
+
+class TestAssetReadModelInApp(unittest.TestCase):
+    """Asset endpoints served from the read model, with AssetService writes applied straight away"""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+        config = AppConfig.for_testing(db_path=self.db_path, blueprints=("assets",), read_model_enabled=True,
+                                       response_cache_bytes=0)
+        self.client = create_app(config).test_client()
+        self.headers = {"Authorization": f"Bearer {Utils.create_jwt_token('admin-1', 'admin')}"}
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def test_added_asset_is_listed(self):
+        self.client.post("/add-asset", json={"name": "Laptop", "description": "Dell XPS"}, headers=self.headers)
+
+        response = self.client.get("/assets", headers=self.headers)
+
+        self.assertEqual([asset["name"] for asset in response.get_json()["data"]], ["laptop"])
+
+
+if __name__ == "__main__":
+    unittest.main()
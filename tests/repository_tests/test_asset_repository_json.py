@@ -0,0 +1,73 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from flask import Flask
+
+from src.app.models.asset import Asset
+from src.app.models.asset_assigned import AssetAssigned
+from src.app.models.user import User
+from src.app.repositories.asset_repository import AssetRepository
+from src.app.repositories.user_repository import UserRepository
+from src.app.scripts.create_tables import create_tables
+from src.app.utils.db.db import DB
+from src.app.utils.json_provider import FastJSONProvider
+
+
+class TestAssetRepositoryJSON(unittest.TestCase):
+    """The SQLite-encoded reads must produce the bytes the Python path serializes to"""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+
+        db = DB(self.db_path)
+        self.asset_repository = AssetRepository(db)
+        self.user_repository = UserRepository(db)
+        self.provider = FastJSONProvider(Flask(__name__))
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def add_assigned_assets(self):
+        for user_id in ("U1", "U2", "U3"):
+            self.user_repository.save_user(User(id=user_id, name="mia", email=f"{user_id}@x.com", password="hash",
+                                                department="IT"))
+        for i in range(4):
+            self.asset_repository.add_asset(Asset(name="Laptop ü", description=f'Dell "XPS"\t{i}',
+                                                  serial_number=f"SN{i}"))
+        for i, user_id in enumerate(["U1", "U1", "U2"]):
+            self.asset_repository.assign_asset(AssetAssigned(user_id=user_id, asset_id=f"SN{i}",
+                                                             asset_assigned_id=f"A{i}"))
+
+    def test_fetch_all_assets_json_matches_models(self):
+        self.add_assigned_assets()
+
+        self.assertEqual(self.asset_repository.fetch_all_assets_json(),
+                         self.provider.dumps_bytes(self.asset_repository.fetch_all_assets()))
+
+    def test_view_assigned_assets_json_matches_dicts(self):
+        self.add_assigned_assets()
+
+        for user_id in ("U1", "U3"):
+            self.assertEqual(self.asset_repository.view_assigned_assets_json(user_id),
+                             self.provider.dumps_bytes(self.asset_repository.view_assigned_assets(user_id)))
+
+    def test_view_all_assigned_assets_json_matches_dicts(self):
+        self.add_assigned_assets()
+
+        self.assertEqual(self.asset_repository.view_all_assigned_assets_json(),
+                         self.provider.dumps_bytes(self.asset_repository.view_all_assigned_assets()))
+
+    def test_empty_tables_give_empty_arrays(self):
+        self.assertEqual(self.asset_repository.fetch_all_assets_json(), b"[]")
+        self.assertEqual(self.asset_repository.view_all_assigned_assets_json(), b"[]")
+        self.assertEqual(self.asset_repository.view_assigned_assets_json("U1"), b'{"user_id":"U1","assets":[]}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from src.app.models.asset import Asset
+from src.app.models.asset_assigned import AssetAssigned
+from src.app.models.user import User
+from src.app.repositories.asset_repository import AssetRepository
+from src.app.repositories.user_repository import UserRepository
+from src.app.scripts.create_tables import create_tables
+from src.app.utils.db.db import DB
+
+
+class TestAssignmentHistory(unittest.TestCase):
+    """The history is written by triggers on assets_assigned and read through its indexes"""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+
+        db = DB(self.db_path)
+        self.asset_repository = AssetRepository(db)
+        self.user_repository = UserRepository(db)
+
+        for user_id in ("U1", "U2"):
+            self.user_repository.save_user(User(id=user_id, name=user_id, email=f"{user_id}@x.com",
+                                                password="hash", department="IT"))
+        self.asset_repository.add_asset(Asset(name="laptop", description="dell", serial_number="SN1"))
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def execute(self, sql, params=()):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def assign(self, user_id, day):
+        self.asset_repository.assign_asset(AssetAssigned(
+            user_id=user_id, asset_id="SN1", assigned_date=datetime(2026, 1, day, 9, tzinfo=timezone.utc)
+        ))
+
+    def unassign(self, user_id, day):
+        self.asset_repository.unassign_asset(user_id, "SN1")
+        # Returns are stamped with the current time; move them to the scenario's day
+        self.execute("DROP TRIGGER IF EXISTS assignment_history_update_guard")
+        self.execute("UPDATE assignment_history SET returned_at = ? WHERE user_id = ? AND returned_at >= ?",
+                     (f"2026-01-{day:02d} 17:00:00.000", user_id, "2026-02"))
+
+    def holder(self, at):
+        history = self.asset_repository.fetch_holder_at("SN1", at)
+        return history.user_id if history else None
+
+    def test_assign_and_unassign_open_and_close_a_row(self):
+        self.assign("U1", 1)
+        history = self.asset_repository.fetch_user_history("U1", "2026-01-01", "2026-12-31")
+
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history[0].assigned_at, "2026-01-01 09:00:00.000")
+        self.assertIsNone(history[0].returned_at)
+
+        self.asset_repository.unassign_asset("U1", "SN1")
+        history = self.asset_repository.fetch_user_history("U1", "2026-01-01", "9999-12-31")
+
+        self.assertIsNotNone(history[0].returned_at)
+
+    def test_holder_at(self):
+        self.assign("U1", 1)
+        self.unassign("U1", 5)
+        self.assign("U2", 10)
+
+        self.assertIsNone(self.holder("2025-12-31 00:00:00.000"))
+        self.assertEqual(self.holder("2026-01-01 09:00:00.000"), "U1")
+        self.assertEqual(self.holder("2026-01-03 00:00:00.000"), "U1")
+        self.assertIsNone(self.holder("2026-01-05 17:00:00.000"))
+        self.assertIsNone(self.holder("2026-01-07 00:00:00.000"))
+        self.assertEqual(self.holder("2026-06-01 00:00:00.000"), "U2")
+
+    def test_user_history_returns_assignments_overlapping_the_range(self):
+        self.assign("U1", 1)
+        self.unassign("U1", 5)
+        self.assign("U1", 10)
+
+        def held(start, end):
+            return [h.assigned_at[:10] for h in self.asset_repository.fetch_user_history("U1", start, end)]
+
+        self.assertEqual(held("2026-01-02 00:00:00.000", "2026-01-03 00:00:00.000"), ["2026-01-01"])
+        self.assertEqual(held("2026-01-06 00:00:00.000", "2026-01-08 00:00:00.000"), [])
+        self.assertEqual(held("2026-01-04 00:00:00.000", "2026-01-20 00:00:00.000"), ["2026-01-01", "2026-01-10"])
+        self.assertEqual(held("2026-03-01 00:00:00.000", "2026-03-02 00:00:00.000"), ["2026-01-10"])
+        self.assertEqual(self.asset_repository.fetch_user_history("U2", "2026-01-01", "2026-12-31"), [])
+
+    def test_history_outlives_the_user_and_the_asset(self):
+        self.assign("U1", 1)
+
+        self.user_repository.delete_user("U1")
+        self.asset_repository.delete_asset("SN1")
+
+        history = self.asset_repository.fetch_user_history("U1", "2026-01-01", "9999-12-31")
+        self.assertEqual(len(history), 1)
+        self.assertIsNotNone(history[0].returned_at)
+
+    def test_history_is_append_only(self):
+        self.assign("U1", 1)
+        self.asset_repository.unassign_asset("U1", "SN1")
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.execute("DELETE FROM assignment_history")
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.execute("UPDATE assignment_history SET returned_at = '2030-01-01 00:00:00.000'")
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.execute("UPDATE assignment_history SET user_id = 'U2'")
+
+    def test_existing_assignments_are_backfilled(self):
+        self.assign("U1", 1)
+        self.execute("DROP TABLE assignment_history")
+
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+
+        self.assertEqual(self.holder("2026-01-02 00:00:00.000"), "U1")
+
+    def test_queries_seek_the_history_indexes(self):
+        def plan(sql, params):
+            return " ".join(row[-1] for row in self.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+        self.assertIn("USING INDEX idx_assignment_history_asset (asset_id=? AND assigned_at<?)", plan(
+            "SELECT user_id FROM assignment_history WHERE asset_id = ? AND assigned_at <= ? "
+            "ORDER BY assigned_at DESC LIMIT 1", ("SN1", "2026")
+        ))
+        self.assertIn("USING INDEX idx_assignment_history_user (user_id=? AND assigned_at<?)", plan(
+            "SELECT asset_id FROM assignment_history WHERE user_id = ? AND assigned_at <= ? "
+            "AND (returned_at IS NULL OR returned_at >= ?) ORDER BY assigned_at", ("U1", "2026", "2025")
+        ))
+
+
+if __name__ == "__main__":
+    unittest.main()
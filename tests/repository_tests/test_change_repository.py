@@ -0,0 +1,104 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.app.models.asset import Asset
+from src.app.models.asset_assigned import AssetAssigned
+from src.app.models.user import User
+from src.app.repositories.asset_repository import AssetRepository
+from src.app.repositories.change_repository import ChangeRepository
+from src.app.repositories.user_repository import UserRepository
+from src.app.scripts.create_tables import create_tables, reset_changes_log
+from src.app.utils.db.db import DB
+from src.app.utils.errors.error import DatabaseError
+
+
+class TestChangeRepository(unittest.TestCase):
+    """The changes log is written by triggers, so these tests run against a real database"""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+
+        db = DB(self.db_path)
+        self.change_repository = ChangeRepository(db)
+        self.asset_repository = AssetRepository(db)
+        self.user_repository = UserRepository(db)
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def test_repository_writes_are_logged_in_order(self):
+        self.asset_repository.add_asset(Asset(name="Laptop", description="Dell XPS", serial_number="SN1"))
+        self.asset_repository.update_asset_status("SN1", "assigned")
+        self.asset_repository.delete_asset("SN1")
+
+        changes = self.change_repository.fetch_changes(0, 10)
+
+        self.assertEqual([(c.table_name, c.operation, c.row_id) for c in changes],
+                         [("assets", "insert", "SN1"), ("assets", "update", "SN1"), ("assets", "delete", "SN1")])
+        self.assertEqual(changes[1].data, {"serial_number": "SN1", "name": "Laptop", "description": "Dell XPS",
+                                           "status": "assigned"})
+        self.assertIsNone(changes[2].data)
+        self.assertEqual([c.version for c in changes], sorted(c.version for c in changes))
+
+    def test_user_changes_never_include_the_password(self):
+        self.user_repository.save_user(User(id="U1", name="mia", email="mia@x.com", password="hash",
+                                            department="IT"))
+
+        change = self.change_repository.fetch_changes(0, 10)[0]
+
+        self.assertEqual(change.table_name, "users")
+        self.assertNotIn("password", change.data)
+
+    def test_cascaded_deletes_are_logged(self):
+        self.user_repository.save_user(User(id="U1", name="mia", email="mia@x.com", password="hash",
+                                            department="IT"))
+        self.asset_repository.add_asset(Asset(name="Laptop", description="Dell XPS", serial_number="SN1"))
+        self.asset_repository.assign_asset(AssetAssigned(user_id="U1", asset_id="SN1", asset_assigned_id="A1"))
+        since = self.change_repository.fetch_latest_version()
+
+        self.user_repository.delete_user("U1")
+
+        changes = self.change_repository.fetch_changes(since, 10)
+        self.assertCountEqual([(c.table_name, c.operation, c.row_id) for c in changes],
+                              [("users", "delete", "U1"), ("assets_assigned", "delete", "A1")])
+
+    def test_fetch_changes_pages_from_since(self):
+        for i in range(5):
+            self.asset_repository.add_asset(Asset(name="Laptop", description="Dell", serial_number=f"SN{i}"))
+        first_page = self.change_repository.fetch_changes(0, 2)
+
+        second_page = self.change_repository.fetch_changes(first_page[-1].version, 2)
+
+        self.assertEqual([c.row_id for c in first_page + second_page], ["SN0", "SN1", "SN2", "SN3"])
+        self.assertEqual(self.change_repository.fetch_latest_version(), first_page[0].version + 4)
+
+    def test_reset_log_leaves_a_gap_after_every_version_issued(self):
+        self.assertEqual((self.change_repository.fetch_oldest_version(),
+                          self.change_repository.fetch_latest_version()), (1, 0))
+        self.asset_repository.add_asset(Asset(name="Laptop", description="Dell", serial_number="SN1"))
+        latest = self.change_repository.fetch_latest_version()
+
+        conn = sqlite3.connect(self.db_path)
+        reset_changes_log(conn)
+        conn.close()
+
+        self.assertEqual(self.change_repository.fetch_changes(0, 10), [])
+        self.assertEqual(self.change_repository.fetch_latest_version(), latest + 1)
+        self.assertEqual(self.change_repository.fetch_oldest_version(), latest + 2)
+
+        self.asset_repository.add_asset(Asset(name="Laptop", description="Dell", serial_number="SN2"))
+        self.assertEqual(self.change_repository.fetch_oldest_version(), latest + 2)
+
+    def test_missing_table_raises_database_error(self):
+        with self.assertRaises(DatabaseError):
+            ChangeRepository(DB(":memory:")).fetch_changes(0, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
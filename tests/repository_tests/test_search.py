@@ -0,0 +1,168 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.app.models.asset import Asset
+from src.app.models.asset_issue import Issue
+from src.app.models.user import User
+from src.app.repositories.asset_issue_repository import IssueRepository
+from src.app.repositories.asset_repository import AssetRepository
+from src.app.repositories.user_repository import UserRepository
+from src.app.scripts.create_tables import create_tables, drop_triggers, create_triggers, rebuild_search_indexes
+from src.app.utils.db.db import DB
+from src.app.utils.db.fts import match_expression, highlight, MATCH_OPEN, MATCH_CLOSE
+
+
+class TestMatchExpression(unittest.TestCase):
+    def test_every_word_is_a_quoted_prefix(self):
+        self.assertEqual(match_expression("Laptops with  cracked"), '"Laptops"* "with"* "cracked"*')
+
+    def test_query_syntax_is_searched_as_words(self):
+        self.assertEqual(match_expression('name:"dell" OR (x*'), '"name"* "dell"* "OR"* "x"*')
+
+    def test_no_words(self):
+        self.assertIsNone(match_expression(' "*: '))
+
+
+class TestHighlight(unittest.TestCase):
+    def test_text_is_escaped_and_matches_marked(self):
+        self.assertEqual(highlight(f"a <b> & {MATCH_OPEN}c{MATCH_CLOSE}"), "a &lt;b&gt; &amp; <mark>c</mark>")
+
+    def test_no_snippet(self):
+        self.assertIsNone(highlight(None))
+
+
+class TestSearch(unittest.TestCase):
+    """Search runs against the FTS5 indexes kept in sync by triggers"""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+
+        db = DB(self.db_path)
+        self.asset_repository = AssetRepository(db)
+        self.issue_repository = IssueRepository(db)
+        self.user_repository = UserRepository(db)
+
+        self.user_repository.save_user(User(id="U1", name="mia", email="mia@x.com", password="hash",
+                                            department="IT"))
+        self.asset_repository.add_asset(Asset(name="Dell Latitude", description="14 inch laptop",
+                                              serial_number="SN1"))
+        self.asset_repository.add_asset(Asset(name="Laptop stand", description="aluminium",
+                                              serial_number="SN2"))
+        self.asset_repository.add_asset(Asset(name="Monitor", description="27 inch", serial_number="SN3"))
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def serials(self, text, limit=10, offset=0):
+        return [result.serial_number for result in self.asset_repository.search_assets(text, limit, offset)]
+
+    def report(self, issue_id, asset_id, description):
+        self.issue_repository.report_issue(Issue(issue_id=issue_id, user_id="U1", asset_id=asset_id,
+                                                 description=description))
+
+    def test_name_matches_rank_above_description_matches(self):
+        self.assertEqual(self.serials("laptop"), ["SN2", "SN1"])
+
+    def test_partial_words_match(self):
+        self.assertEqual(self.serials("lati"), ["SN1"])
+        self.assertEqual(self.serials("LAP"), ["SN2", "SN1"])
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self.serials("inch laptop"), ["SN1"])
+        self.assertEqual(self.serials("inch stand"), [])
+
+    def test_snippet_highlights_the_matched_words(self):
+        result = self.asset_repository.search_assets("latitude", 10, 0)[0]
+
+        self.assertEqual(result.snippet, "Dell <mark>Latitude</mark>")
+        self.assertEqual(result.name, "Dell Latitude")
+        self.assertLess(result.rank, 0)
+
+    def test_snippet_escapes_markup_in_the_stored_text(self):
+        self.report("I1", "SN1", 'Screen <script>alert("x")</script> cracked')
+
+        result = self.issue_repository.search_issues("cracked", 10, 0)[0]
+
+        self.assertNotIn("<script>", result.snippet)
+        self.assertEqual(result.snippet,
+                         "Screen &lt;script&gt;alert(&quot;x&quot;)&lt;/script&gt; <mark>cracked</mark>")
+        self.assertEqual(result.description, 'Screen <script>alert("x")</script> cracked')
+
+    def test_paging(self):
+        self.assertEqual(self.serials("laptop", limit=1), ["SN2"])
+        self.assertEqual(self.serials("laptop", limit=1, offset=1), ["SN1"])
+
+    def test_deleted_and_edited_assets_are_reindexed(self):
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("UPDATE assets SET description = 'ultrawide' WHERE serial_number = 'SN3'")
+            conn.execute("DELETE FROM assets WHERE serial_number = 'SN2'")
+        conn.close()
+
+        self.assertEqual(self.serials("laptop"), ["SN1"])
+        self.assertEqual(self.serials("inch"), ["SN1"])
+        self.assertEqual(self.serials("ultrawide"), ["SN3"])
+
+    def test_status_changes_keep_assets_searchable(self):
+        self.asset_repository.update_asset_status("SN1", "assigned")
+
+        result = self.asset_repository.search_assets("latitude", 10, 0)[0]
+
+        self.assertEqual(result.status, "assigned")
+
+    def test_issue_search(self):
+        self.report("I1", "SN1", "Screen is cracked after a fall")
+        self.report("I2", "SN1", "Battery drains quickly")
+        self.report("I3", "SN3", "Cracked casing, screen flickers")
+        self.report("I4", "SN3", "Overheating under load")
+
+        self.assertEqual([result.issue_id for result in self.issue_repository.search_issues("overheat", 10, 0)],
+                         ["I4"])
+
+        results = self.issue_repository.search_issues("cracked screen", 10, 0)
+
+        self.assertEqual(sorted(result.issue_id for result in results), ["I1", "I3"])
+        self.assertIn("<mark>cracked</mark>", results[0].snippet.lower())
+        self.assertEqual(results[0].user_id, "U1")
+
+    def test_issues_of_deleted_assets_leave_the_index(self):
+        self.report("I1", "SN1", "Screen is cracked")
+
+        self.asset_repository.delete_asset("SN1")
+
+        self.assertEqual(self.issue_repository.search_issues("cracked", 10, 0), [])
+
+    def test_rows_loaded_without_triggers_are_found_after_a_rebuild(self):
+        conn = sqlite3.connect(self.db_path)
+        drop_triggers(conn)
+        with conn:
+            conn.execute("INSERT INTO assets VALUES ('SN4', 'Thinkpad', NULL, 'available')")
+        create_triggers(conn)
+        self.assertEqual(self.serials("thinkpad"), [])
+
+        rebuild_search_indexes(conn)
+        conn.close()
+
+        self.assertEqual(self.serials("thinkpad"), ["SN4"])
+
+    def test_indexes_created_on_an_existing_database_index_its_rows(self):
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("DROP TABLE assets_fts")
+        create_tables(conn)
+        conn.close()
+
+        self.assertEqual(self.serials("monitor"), ["SN3"])
+
+    def test_words_only_in_query_syntax_find_nothing(self):
+        self.assertEqual(self.serials('"*'), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import MagicMock, patch
+from tests.repository_tests.helpers import apply_row_factory
 from src.app.repositories.user_repository import UserRepository
 from src.app.models.user import User, UserDTO
 from src.app.utils.errors.error import DatabaseError
@@ -16,7 +17,7 @@ class TestUserRepository(unittest.TestCase):
 
         # Mock DB connection and cursor
         self.mock_conn = MagicMock()
-        self.mock_cursor = MagicMock()
+        self.mock_cursor = apply_row_factory(MagicMock())
         self.mock_db.get_connection.return_value = self.mock_conn
         self.mock_conn.cursor.return_value = self.mock_cursor
 
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+
+from src.app.scripts.analyze_logs import LogAnalyzer, rotated_files, to_csv, main
+
+USER_ID = "0f8fad5b-d9cb-469f-a165-70867728950e"
+
+
+def entry(ts: str, function: str, path: str, user_id: str = USER_ID, handler: str = "AssetHandler") -> str:
+    return (
+        f"{ts} - DEBUG - Entering {function}\n"
+        f"User Context:\n"
+        f"  - user_id: {user_id}\n"
+        f"  - role: user\n"
+        f"Request Context:\n"
+        f"  - method: GET\n"
+        f"  - path: {path}\n"
+        f"  - client_ip: 127.0.0.1\n"
+        f"  - headers: {{'Host': 'localhost'}}\n"
+        f"  - body: {{}}\n"
+        f"Function Context:\n"
+        f"  - handler: {handler}\n"
+        f" - for user_id={user_id} | role=user\n"
+    )
+
+
+def success(ts: str, function: str, status: int = None, user_id: str = USER_ID) -> str:
+    status_suffix = f" status={status}" if status else ""
+    return (
+        f"{ts} - INFO - {function} executed successfully.{status_suffix} - for user_id={user_id} | role=user\n"
+        f"{ts} - DEBUG - Exiting {function} - for user_id={user_id} | role=user\n"
+    )
+
+
+def failure(ts: str, function: str, user_id: str = USER_ID) -> str:
+    return (
+        f"{ts} - ERROR - Error occurred in {function}: boom\n"
+        f"User Context:\n"
+        f"  - user_id: {user_id}\n"
+        f"  - role: user\n"
+        f"Request Context:\n"
+        f"  - method: GET\n"
+        f"  - path: /assets\n"
+        f"  - client_ip: 127.0.0.1\n"
+        f"  - body: {{}} - for user_id={user_id} | role=user\n"
+        f"{ts} - DEBUG - Exiting {function} - for user_id={user_id} | role=user\n"
+    )
+
+
+class TestLogAnalyzer(unittest.TestCase):
+
+    def feed(self, analyzer: LogAnalyzer, text: str):
+        for line in text.splitlines():
+            analyzer.feed_line(line)
+
+    def test_pairs_entry_and_exit_and_normalizes_ids(self):
+        analyzer = LogAnalyzer()
+        self.feed(analyzer, entry("2024-12-17 16:11:31,200", "get_user", f"/user/{USER_ID}", handler="UserHandler"))
+        self.feed(analyzer, success("2024-12-17 16:11:31,215", "get_user", 200))
+
+        summary = analyzer.summary()
+
+        stats = summary["endpoints"]["GET /user/<id> (UserHandler.get_user)"]
+        self.assertEqual(stats["count"], 1)
+        self.assertEqual(stats["max_ms"], 15.0)
+        self.assertEqual(stats["p50_ms"], 15.0)
+        self.assertEqual(stats["errors"], 0)
+        self.assertEqual(summary["unmatched"], 0)
+
+    def test_error_records_and_error_statuses_count_as_failures(self):
+        analyzer = LogAnalyzer()
+        self.feed(analyzer, entry("2024-12-17 16:11:31,000", "get_assets", "/assets"))
+        self.feed(analyzer, failure("2024-12-17 16:11:31,010", "get_assets"))
+        self.feed(analyzer, entry("2024-12-17 16:11:32,000", "get_assets", "/assets", user_id="other"))
+        self.feed(analyzer, success("2024-12-17 16:11:32,004", "get_assets", 500, user_id="other"))
+        self.feed(analyzer, entry("2024-12-17 16:11:33,000", "get_assets", "/assets"))
+        self.feed(analyzer, success("2024-12-17 16:11:33,004", "get_assets"))
+
+        summary = analyzer.summary()
+
+        stats = summary["endpoints"]["GET /assets (AssetHandler.get_assets)"]
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["errors"], 2)
+        self.assertEqual(stats["error_rate"], 0.6667)
+        self.assertEqual(
+            summary["top_failing_users"],
+            [{"user_id": USER_ID, "failures": 1}, {"user_id": "other", "failures": 1}]
+        )
+
+    def test_exit_without_entry_and_open_entries_are_unmatched(self):
+        analyzer = LogAnalyzer(max_in_flight=1)
+        self.feed(analyzer, success("2024-12-17 16:11:31,000", "login"))
+        self.feed(analyzer, entry("2024-12-17 16:11:31,000", "login", "/login"))
+        self.feed(analyzer, entry("2024-12-17 16:11:31,001", "signup", "/signup"))
+
+        summary = analyzer.summary()
+
+        self.assertEqual(summary["endpoints"], {})
+        self.assertEqual(summary["unmatched"], 3)
+
+    def test_rotated_files_are_read_oldest_first(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "app.log")
+            with open(path + ".1", "w") as older:
+                older.write(entry("2024-12-17 16:11:31,000", "get_assets", "/assets"))
+            with open(path, "w") as newest:
+                newest.write(success("2024-12-17 16:11:31,020", "get_assets", 200))
+            output = os.path.join(tmp_dir, "report.csv")
+
+            self.assertEqual(rotated_files(path), [path + ".1", path])
+            main([path, "--format", "csv", "--output", output])
+
+            with open(output) as report:
+                lines = report.read().splitlines()
+
+        self.assertEqual(lines[0], "endpoint,count,errors,error_rate,mean_ms,p50_ms,p95_ms,p99_ms,max_ms")
+        self.assertTrue(lines[1].startswith("GET /assets (AssetHandler.get_assets),1,0,0.0,20.0,"))
+
+    def test_to_csv_has_one_row_per_endpoint(self):
+        analyzer = LogAnalyzer()
+        self.feed(analyzer, entry("2024-12-17 16:11:31,000", "get_assets", "/assets"))
+        self.feed(analyzer, success("2024-12-17 16:11:31,001", "get_assets", 200))
+
+        self.assertEqual(len(to_csv(analyzer.summary()).splitlines()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
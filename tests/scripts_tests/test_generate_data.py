@@ -0,0 +1,158 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from bcrypt import checkpw
+
+from src.app.config.types import Department
+from src.app.scripts.create_tables import INDEXES, create_tables
+from src.app.scripts.rebuild_counters import counter_drift
+from src.app.utils.db.table_versions import DATABASE_EPOCH
+from src.app.scripts.generate_data import (
+    SyntheticDataGenerator,
+    main,
+    truncate_tables,
+    ADMIN_EMAIL,
+    ADMIN_PASSWORD,
+    USER_PASSWORD_PREFIX
+)
+
+
+def generate(**kwargs):
+    conn = sqlite3.connect(":memory:")
+    options = dict(seed=7, users=50, assets=80, assignments=40, issues=120, password_pool=2)
+    options.update(kwargs)
+    summary = SyntheticDataGenerator(**options).generate(conn)
+    return conn, summary
+
+
+class TestSyntheticDataGenerator(unittest.TestCase):
+    def test_row_counts(self):
+        conn, summary = generate()
+
+        for table in ["users", "assets", "assets_assigned", "issues"]:
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            self.assertEqual(count, summary[table])
+        self.assertEqual(summary["users"], 51)
+
+    def test_counters_are_built_after_the_bulk_load(self):
+        conn, summary = generate()
+
+        self.assertEqual(counter_drift(conn), [])
+        self.assertEqual(conn.execute("SELECT count FROM counters WHERE name = 'totals'").fetchone()[0],
+                         summary["issues"])
+
+    def test_same_seed_is_reproducible(self):
+        def rows(conn):
+            # Versions are random on purpose, so no two loads hand out the same ones
+            return [line for line in conn.iterdump() if "table_versions" not in line]
+
+        first, _ = generate()
+        second, _ = generate()
+        other, _ = generate(seed=8)
+
+        self.assertEqual(rows(first), rows(second))
+        self.assertNotEqual(rows(first), rows(other))
+
+    def test_reload_moves_every_version_forward(self):
+        conn, _ = generate()
+        before = dict(conn.execute("SELECT table_name, version FROM table_versions"))
+
+        truncate_tables(conn)
+        after_truncate = dict(conn.execute("SELECT table_name, version FROM table_versions"))
+        SyntheticDataGenerator(seed=7, users=50, assets=80, assignments=40, issues=120,
+                               password_pool=2).generate(conn)
+        after_reload = dict(conn.execute("SELECT table_name, version FROM table_versions"))
+
+        epoch = before.pop(DATABASE_EPOCH)
+        for table, version in before.items():
+            self.assertGreater(after_truncate[table], version)
+            self.assertGreater(after_reload[table], after_truncate[table])
+        # The epoch is replaced rather than bumped
+        self.assertEqual(len({epoch, after_truncate[DATABASE_EPOCH], after_reload[DATABASE_EPOCH]}), 3)
+
+    def test_data_is_consistent(self):
+        conn, _ = generate()
+
+        # Every assigned asset is marked assigned and every other asset available
+        mismatched = conn.execute('''
+            SELECT COUNT(*) FROM assets a
+            LEFT JOIN assets_assigned aa ON aa.asset_id = a.serial_number
+            WHERE (aa.asset_id IS NULL) != (a.status = 'available')
+        ''').fetchone()[0]
+        self.assertEqual(mismatched, 0)
+
+        # Issues are reported by the user holding the asset
+        foreign = conn.execute('''
+            SELECT COUNT(*) FROM issues i
+            LEFT JOIN assets_assigned aa ON aa.asset_id = i.asset_id AND aa.user_id = i.user_id
+            WHERE aa.asset_id IS NULL
+        ''').fetchone()[0]
+        self.assertEqual(foreign, 0)
+        self.assertEqual(conn.execute("PRAGMA foreign_key_check").fetchall(), [])
+
+        departments = {row[0] for row in conn.execute("SELECT DISTINCT department FROM users")}
+        self.assertTrue(departments <= {dept.value for dept in Department})
+
+    def test_distribution_is_skewed(self):
+        conn, _ = generate(users=200, assets=1000, assignments=800, issues=2000)
+
+        top_holder = conn.execute(
+            "SELECT COUNT(*) n FROM assets_assigned GROUP BY user_id ORDER BY n DESC LIMIT 1"
+        ).fetchone()[0]
+        hottest_asset = conn.execute(
+            "SELECT COUNT(*) n FROM issues GROUP BY asset_id ORDER BY n DESC LIMIT 1"
+        ).fetchone()[0]
+        self.assertGreater(top_holder, 800 / 200 * 10)
+        self.assertGreater(hottest_asset, 2000 / 800 * 10)
+
+    def test_passwords_are_valid_bcrypt_hashes(self):
+        conn, _ = generate()
+
+        admin_hash = conn.execute("SELECT password FROM users WHERE email = ?", (ADMIN_EMAIL,)).fetchone()[0]
+        user_hash = conn.execute("SELECT password FROM users WHERE email = 'user1@watchguard.com'").fetchone()[0]
+        self.assertTrue(checkpw(ADMIN_PASSWORD.encode(), admin_hash.encode()))
+        self.assertTrue(checkpw(f"{USER_PASSWORD_PREFIX}1".encode(), user_hash.encode()))
+
+    def test_indexes_are_rebuilt(self):
+        conn, _ = generate()
+
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({name for name, _ in INDEXES} <= indexes)
+
+    def test_truncate_clears_the_history_and_the_changes_log(self):
+        handle, path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        try:
+            conn = sqlite3.connect(path)
+            create_tables(conn)
+            with conn:
+                conn.execute("INSERT INTO users (id, name, password, email, role) VALUES ('U1', 'mia', 'x', 'm@x.com', 'user')")
+                conn.execute("INSERT INTO assets (serial_number, name, status) VALUES ('SN1', 'laptop', 'assigned')")
+                conn.execute("INSERT INTO assets_assigned (asset_assigned_id, user_id, asset_id) VALUES ('A1', 'U1', 'SN1')")
+                conn.execute("DELETE FROM assets_assigned")
+            conn.close()
+
+            main(["--db", path, "--truncate", "--users", "5", "--assets", "8", "--assignments", "4",
+                  "--issues", "6", "--password-pool", "1"])
+
+            conn = sqlite3.connect(path)
+            history = conn.execute("SELECT asset_assigned_id FROM assignment_history ORDER BY 1").fetchall()
+            assigned = conn.execute("SELECT asset_assigned_id FROM assets_assigned ORDER BY 1").fetchall()
+            changes = conn.execute("SELECT COUNT(*) FROM changes").fetchone()[0]
+            drift = counter_drift(conn)
+            conn.close()
+            self.assertEqual(len(assigned), 4)
+            self.assertEqual(history, assigned)
+            # Neither the truncated rows nor the reloaded ones are in the log; mirrors resync instead
+            self.assertEqual(changes, 0)
+            self.assertEqual(drift, [])
+        finally:
+            os.remove(path)
+
+    def test_invalid_sizes_raise(self):
+        with self.assertRaises(ValueError):
+            SyntheticDataGenerator(assets=10, assignments=20)
+        with self.assertRaises(ValueError):
+            SyntheticDataGenerator(assignments=0, issues=5)
@@ -0,0 +1,51 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.app.scripts.create_tables import create_tables
+from src.app.scripts.prune_changes import prune_changes, main
+
+
+class TestPruneChanges(unittest.TestCase):
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.conn = sqlite3.connect(self.db_path)
+        create_tables(self.conn)
+        with self.conn:
+            for i in range(5):
+                self.conn.execute("INSERT INTO assets (serial_number, name, status) VALUES (?, 'laptop', 'available')",
+                                  (f"SN{i}",))
+            # The first three were written ten days ago
+            self.conn.execute("UPDATE changes SET changed_at = datetime('now', '-10 days') WHERE version <= 3")
+
+    def tearDown(self):
+        self.conn.close()
+        os.remove(self.db_path)
+
+    def versions(self):
+        return [row[0] for row in self.conn.execute("SELECT version FROM changes ORDER BY version")]
+
+    def test_changes_older_than_the_retention_are_deleted(self):
+        self.assertEqual(prune_changes(self.conn, 7), 3)
+        self.assertEqual(self.versions(), [4, 5])
+
+    def test_pruning_everything_keeps_issuing_new_versions(self):
+        with self.conn:
+            self.conn.execute("UPDATE changes SET changed_at = datetime('now', '-10 days')")
+
+        self.assertEqual(prune_changes(self.conn, 7), 5)
+
+        with self.conn:
+            self.conn.execute("INSERT INTO assets (serial_number, name, status) VALUES ('SN9', 'dock', 'available')")
+
+        self.assertEqual(self.versions(), [6])
+
+    def test_main(self):
+        self.assertEqual(main(["--db", self.db_path, "--days", "7"]), 0)
+        self.assertEqual(self.versions(), [4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.app.scripts.create_tables import create_tables, count_from_scratch
+from src.app.scripts.rebuild_counters import counter_drift, main
+
+
+def stored(conn):
+    return {(name, key): count for name, key, count in conn.execute("SELECT name, key, count FROM counters")}
+
+
+class TestCounterTriggers(unittest.TestCase):
+    """Every write keeps the counters equal to a count from scratch"""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("PRAGMA foreign_keys = ON;")
+        create_tables(self.conn)
+        with self.conn:
+            self.conn.executescript('''
+                INSERT INTO users VALUES ('U1', 'mia', 'hash', 'mia@x.com', 'IT', 'user'),
+                                         ('U2', 'leo', 'hash', 'leo@x.com', NULL, 'user');
+                INSERT INTO assets VALUES ('SN1', 'laptop', NULL, 'assigned'), ('SN2', 'laptop', NULL, 'assigned'),
+                                          ('SN3', 'monitor', NULL, 'assigned'), ('SN4', 'dock', NULL, 'available');
+                INSERT INTO assets_assigned (asset_assigned_id, user_id, asset_id)
+                    VALUES ('A1', 'U1', 'SN1'), ('A2', 'U1', 'SN2'), ('A3', 'U2', 'SN3');
+                INSERT INTO issues (issue_id, user_id, asset_id, description)
+                    VALUES ('I1', 'U1', 'SN1', 'cracked'), ('I2', 'U1', 'SN1', 'loose'), ('I3', 'U2', 'SN3', 'dim');
+            ''')
+
+    def assertCountersMatch(self):
+        self.assertEqual(stored(self.conn), count_from_scratch(self.conn))
+
+    def test_inserts(self):
+        self.assertEqual(stored(self.conn), {
+            ("assets_by_status", "assigned"): 3,
+            ("assets_by_status", "available"): 1,
+            ("assignments_by_department", "IT"): 2,
+            ("assignments_by_department", ""): 1,
+            ("issues_by_asset", "SN1"): 2,
+            ("issues_by_asset", "SN3"): 1,
+            ("totals", "issues"): 3,
+        })
+        self.assertCountersMatch()
+
+    def test_unassign(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM assets_assigned WHERE asset_assigned_id = 'A3'")
+            self.conn.execute("UPDATE assets SET status = 'available' WHERE serial_number = 'SN3'")
+
+        self.assertNotIn(("assignments_by_department", ""), stored(self.conn))
+        self.assertCountersMatch()
+
+    def test_department_change_moves_the_users_assignments(self):
+        with self.conn:
+            self.conn.execute("UPDATE users SET department = 'HR' WHERE id = 'U1'")
+
+        self.assertEqual(stored(self.conn)[("assignments_by_department", "HR")], 2)
+        self.assertCountersMatch()
+
+    def test_deleting_a_user_cascades_to_their_assignments_and_issues(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM users WHERE id = 'U1'")
+
+        self.assertNotIn(("assignments_by_department", "IT"), stored(self.conn))
+        self.assertCountersMatch()
+
+    def test_deleting_an_asset_cascades(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM assets WHERE serial_number = 'SN1'")
+
+        self.assertNotIn(("issues_by_asset", "SN1"), stored(self.conn))
+        self.assertCountersMatch()
+
+    def test_moving_an_issue_and_an_assignment(self):
+        with self.conn:
+            self.conn.execute("UPDATE issues SET asset_id = 'SN3' WHERE issue_id = 'I1'")
+            self.conn.execute("UPDATE assets_assigned SET user_id = 'U2' WHERE asset_assigned_id = 'A1'")
+
+        self.assertCountersMatch()
+
+
+class TestRebuildCounters(unittest.TestCase):
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        self.conn = sqlite3.connect(self.db_path)
+        create_tables(self.conn)
+        with self.conn:
+            self.conn.execute("INSERT INTO assets VALUES ('SN1', 'laptop', NULL, 'available')")
+            # Written behind the triggers' back
+            self.conn.execute("UPDATE counters SET count = 5 WHERE name = 'assets_by_status'")
+
+    def tearDown(self):
+        self.conn.close()
+        os.remove(self.db_path)
+
+    def test_drift_is_reported(self):
+        self.assertEqual(counter_drift(self.conn), [("assets_by_status", "available", 5, 1)])
+
+    def test_check_leaves_the_counters(self):
+        self.assertEqual(main(["--db", self.db_path, "--check"]), 1)
+
+        self.assertEqual(counter_drift(self.conn), [("assets_by_status", "available", 5, 1)])
+
+    def test_rebuild_recomputes_the_counters(self):
+        self.assertEqual(main(["--db", self.db_path]), 0)
+
+        self.assertEqual(counter_drift(self.conn), [])
+        self.assertEqual(main(["--db", self.db_path, "--check"]), 0)
+
+    def test_counters_created_on_an_existing_database_count_its_rows(self):
+        with self.conn:
+            self.conn.execute("DROP TABLE counters")
+        create_tables(self.conn)
+
+        self.assertEqual(stored(self.conn), {("assets_by_status", "available"): 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
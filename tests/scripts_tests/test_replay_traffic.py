@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from flask import Flask, request, g
+from werkzeug.serving import make_server
+
+from src.app.scripts.replay_traffic import ReplayDriver, load_records
+from src.app.utils.utils import Utils
+
+
+class TestReplayTraffic(unittest.TestCase):
+
+    def setUp(self):
+        self.seen = []
+        app = Flask(__name__)
+
+        @app.route("/assets")
+        def assets():
+            token = request.headers.get("Authorization", "").split(" ")[-1]
+            self.seen.append(Utils.decode_jwt_token(token))
+            return {"data": []}
+
+        @app.route("/boom", methods=["POST"])
+        def boom():
+            return {"message": "error"}, 500
+
+        self.server = make_server("127.0.0.1", 0, app, threaded=True)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.target = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+
+    def test_load_records_sorted_and_limited(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "traffic.jsonl")
+            with open(path, "w") as capture_file:
+                for ts in [3, 1, 2]:
+                    capture_file.write(json.dumps({"ts": ts, "method": "GET", "path": "/assets"}) + "\n")
+                capture_file.write("\n")
+
+            self.assertEqual([record["ts"] for record in load_records(path)], [1, 2, 3])
+            self.assertEqual(len(load_records(path, limit=2)), 2)
+
+    def test_replay_reports_latency_and_errors(self):
+        records = [
+            {"ts": 0.0, "method": "GET", "path": "/assets", "route": "/assets", "user_id": "u1", "role": "admin",
+             "status": 200},
+            {"ts": 0.01, "method": "GET", "path": "/assets", "route": "/assets", "user_id": "u2", "role": "user",
+             "status": 200},
+            {"ts": 0.02, "method": "POST", "path": "/boom", "route": "/boom", "body": {"a": 1}, "status": 200},
+        ]
+
+        report = ReplayDriver(self.target, concurrency=2, speedup=10).run(records)
+
+        self.assertEqual(report["overall"]["count"], 3)
+        self.assertEqual(report["overall"]["errors"], 1)
+        self.assertEqual(report["overall"]["status_mismatches"], 1)
+        self.assertEqual(report["routes"]["GET /assets"]["error_rate"], 0.0)
+        self.assertEqual(report["routes"]["POST /boom"]["error_rate"], 1.0)
+        self.assertEqual(sorted((claims["user_id"], claims["role"]) for claims in self.seen),
+                         [("u1", "admin"), ("u2", "user")])
+
+    def test_unreachable_target_counts_as_error(self):
+        records = [{"ts": 0.0, "method": "GET", "path": "/assets"}]
+
+        report = ReplayDriver("http://127.0.0.1:1", concurrency=1, speedup=0, timeout=1).run(records)
+
+        self.assertEqual(report["overall"]["error_rate"], 1.0)
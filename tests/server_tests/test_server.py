@@ -0,0 +1,103 @@
+import os
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+import unittest
+import urllib.request
+
+from flask import Flask
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def create_test_app():
+    app = Flask(__name__)
+    app.add_url_rule("/pid", "pid", lambda: str(os.getpid()))
+    app.add_url_rule("/slow", "slow", lambda: (time.sleep(1.0), "done")[1])
+    return app
+
+
+class TestPreforkServer(unittest.TestCase):
+
+    def setUp(self):
+        self.master = subprocess.Popen(
+            [sys.executable, "-m", "src.app.server", "--bind", "127.0.0.1:0", "--workers", "2", "--threads", "2",
+             "--graceful-timeout", "5", "--factory", "tests.server_tests.test_server:create_test_app"],
+            cwd=PROJECT_ROOT, stderr=subprocess.PIPE, text=True
+        )
+        port = None
+        while port is None:
+            line = self.master.stderr.readline()
+            if not line:
+                self.fail("server exited before listening")
+            match = re.search(r"Listening on http://127\.0\.0\.1:(\d+)", line)
+            port = match and match.group(1)
+        self.base_url = f"http://127.0.0.1:{port}"
+        # Keep draining the request log so workers never block on a full pipe
+        self.stderr_reader = threading.Thread(target=self.master.stderr.read, daemon=True)
+        self.stderr_reader.start()
+
+    def tearDown(self):
+        if self.master.poll() is None:
+            self.master.terminate()
+        try:
+            self.master.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.master.kill()
+            self.master.wait()
+        # The pipe closes once every worker has exited too
+        self.stderr_reader.join(timeout=10)
+        self.assertFalse(self.stderr_reader.is_alive())
+
+    def get(self, path: str) -> str:
+        with urllib.request.urlopen(self.base_url + path, timeout=10) as response:
+            return response.read().decode()
+
+    def wait_for(self, condition, timeout: float = 10.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return
+            time.sleep(0.05)
+        self.fail("condition not met in time")
+
+    def test_requests_are_served_by_forked_workers(self):
+        pid = int(self.get("/pid"))
+
+        self.assertNotEqual(pid, self.master.pid)
+
+    def test_killed_worker_is_replaced(self):
+        pid = int(self.get("/pid"))
+        os.kill(pid, signal.SIGKILL)
+
+        self.wait_for(lambda: int(self.get("/pid")) != pid)
+        self.assertIsNone(self.master.poll())
+
+    def test_reload_replaces_every_worker(self):
+        old_pids = {int(self.get("/pid")) for _ in range(20)}
+        self.master.send_signal(signal.SIGHUP)
+
+        def old_workers_gone():
+            return all(not os.path.exists(f"/proc/{pid}") for pid in old_pids)
+
+        self.wait_for(old_workers_gone)
+        self.assertNotIn(int(self.get("/pid")), old_pids)
+
+    def test_sigterm_drains_in_flight_requests(self):
+        results = []
+        slow_request = threading.Thread(target=lambda: results.append(self.get("/slow")))
+        slow_request.start()
+        time.sleep(0.3)
+
+        self.master.send_signal(signal.SIGTERM)
+        slow_request.join()
+
+        self.assertEqual(results, ["done"])
+        self.assertEqual(self.master.wait(timeout=10), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ from flask import Flask, g
 from src.app.models.asset_issue import Issue
 from src.app.services.asset_issue_service import IssueService
 from src.app.utils.errors.error import NotExistsError, NotAssignedError
+from src.app.utils.events.event_bus import EventBus
 
 
 class TestIssueService(unittest.TestCase):
@@ -129,6 +130,17 @@ class TestIssueService(unittest.TestCase):
             self.assertIsNotNone(result.report_date)
             self.assertIsNotNone(result.issue_id)
 
+    def test_report_issue_wakes_the_event_stream(self):
+        self.issue_service.event_bus = MagicMock(spec=EventBus)
+        with self.app.test_request_context():
+            g.user_id = "user1"
+            self.mock_asset_service.is_asset_assigned.return_value = True
+            issue = Issue(asset_id="asset1", description="Test issue description")
+
+            self.issue_service.report_issue(issue)
+
+        self.issue_service.event_bus.wake.assert_called_once_with()
+
     def test_report_issue_raises_error_for_nonexistent_asset(self):
         # Arrange
         user_id = "user1"
@@ -4,8 +4,10 @@ import uuid
 
 from src.app.models.asset import Asset
 from src.app.models.asset_assigned import AssetAssigned
+from src.app.models.assignment_history import AssignmentHistory
 from src.app.services.asset_service import AssetService
 from src.app.config.types import AssetStatus
+from src.app.utils.events.event_bus import EventBus
 from src.app.utils.errors.error import (
     ExistsError,
     NotExistsError,
@@ -42,6 +44,30 @@ class TestAssetService(unittest.TestCase):
         self.assertEqual(result, expected_assets)
         self.mock_asset_repository.fetch_all_assets.assert_called_once()
 
+    def test_search_assets_pages_with_one_extra_row(self):
+        """
+        Test a search page reports whether another page follows
+        """
+        # Arrange
+        self.mock_asset_repository.search_assets.return_value = ["r1", "r2", "r3"]
+
+        # Act
+        page = self.asset_service.search_assets("dell", 2, 4)
+
+        # Assert
+        self.assertEqual(page, {"results": ["r1", "r2"], "next_offset": 6, "has_more": True})
+        self.mock_asset_repository.search_assets.assert_called_once_with("dell", 3, 4)
+
+    def test_search_assets_last_page(self):
+        """
+        Test the last search page
+        """
+        self.mock_asset_repository.search_assets.return_value = ["r1"]
+
+        page = self.asset_service.search_assets("dell", 2, 4)
+
+        self.assertEqual(page, {"results": ["r1"], "next_offset": 5, "has_more": False})
+
     def test_add_asset_successful(self):
         """
         Test adding a new asset successfully
@@ -120,6 +146,19 @@ class TestAssetService(unittest.TestCase):
         self.assertEqual(str(context.exception), "Asset does not exist")
         self.mock_asset_repository.delete_asset.assert_not_called()
 
+    def test_assign_and_unassign_wake_the_event_stream(self):
+        """
+        Test assignment changes reach the event stream without waiting for its next poll
+        """
+        self.asset_service.event_bus = MagicMock(spec=EventBus)
+        self.mock_asset_repository.check_asset_availability.return_value = True
+        self.mock_asset_repository.is_asset_assigned.return_value = True
+
+        self.asset_service.assign_asset(AssetAssigned(asset_id="SN006", user_id="u-1"))
+        self.asset_service.unassign_asset("u-1", "SN006")
+
+        self.assertEqual(self.asset_service.event_bus.wake.call_count, 2)
+
     def test_assign_asset_successful(self):
         """
         Test assigning an asset to a user successfully
@@ -340,3 +379,66 @@ class TestAssetService(unittest.TestCase):
         # Assert
         self.assertTrue(result)
         self.mock_asset_repository.is_asset_assigned.assert_called_once_with(user_id, asset_id)
+
+    def test_get_holder_at(self):
+        holder = AssignmentHistory(asset_assigned_id="A1", asset_id="SN1", user_id="U1",
+                                   assigned_at="2026-01-01 09:00:00.000")
+        self.mock_asset_repository.fetch_holder_at.return_value = holder
+
+        self.assertEqual(self.asset_service.get_holder_at("SN1", "2026-01-02 00:00:00.000"), holder)
+        self.mock_asset_repository.fetch_holder_at.assert_called_once_with("SN1", "2026-01-02 00:00:00.000")
+
+    def test_get_holder_at_raises_not_exists_error_when_unassigned(self):
+        self.mock_asset_repository.fetch_holder_at.return_value = None
+
+        with self.assertRaises(NotExistsError):
+            self.asset_service.get_holder_at("SN1", "2026-01-02 00:00:00.000")
+
+    def test_get_user_history(self):
+        self.mock_asset_repository.fetch_user_history.return_value = []
+
+        self.assertEqual(self.asset_service.get_user_history("U1", "2026-01-01", "2026-02-01"), [])
+        self.mock_asset_repository.fetch_user_history.assert_called_once_with("U1", "2026-01-01", "2026-02-01")
+
+
+class TestAssetServiceWithReadModel(unittest.TestCase):
+    def setUp(self):
+        self.mock_asset_repository = MagicMock()
+        self.mock_user_service = MagicMock()
+        self.mock_read_model = MagicMock()
+        self.asset_service = AssetService(
+            asset_repository=self.mock_asset_repository,
+            user_service=self.mock_user_service,
+            sql_json=True,
+            read_model=self.mock_read_model
+        )
+
+    def test_reads_are_served_by_the_read_model(self):
+        self.mock_read_model.fetch_all_assets.return_value = [Asset(name="Laptop", description="Dell")]
+
+        self.assertEqual(self.asset_service.get_assets(), self.mock_read_model.fetch_all_assets.return_value)
+        self.asset_service.view_assigned_assets("U1")
+        self.mock_read_model.view_assigned_assets.assert_called_once_with("U1")
+        self.mock_asset_repository.fetch_all_assets.assert_not_called()
+        self.mock_asset_repository.view_assigned_assets.assert_not_called()
+
+    def test_sql_json_is_turned_off(self):
+        self.assertFalse(self.asset_service.sql_json)
+
+    def test_assign_checks_availability_in_memory_and_syncs_after_writing(self):
+        self.mock_read_model.check_asset_availability.return_value = True
+
+        self.asset_service.assign_asset(AssetAssigned(user_id="U1", asset_id="SN1"))
+
+        self.mock_read_model.check_asset_availability.assert_called_once_with("SN1")
+        self.mock_asset_repository.check_asset_availability.assert_not_called()
+        self.mock_asset_repository.assign_asset.assert_called_once()
+        self.mock_read_model.sync.assert_called_once()
+
+    def test_failed_write_checks_do_not_sync(self):
+        self.mock_read_model.fetch_asset_by_id.return_value = None
+
+        with self.assertRaises(NotExistsError):
+            self.asset_service.delete_asset("SN1")
+
+        self.mock_read_model.sync.assert_not_called()
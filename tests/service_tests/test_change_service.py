@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.app.models.change import Change
+from src.app.services.change_service import ChangeService
+
+
+def change(version: int) -> Change:
+    return Change(version, "assets", "insert", f"SN{version}", {"serial_number": f"SN{version}"}, "2024-12-17")
+
+
+class TestChangeService(unittest.TestCase):
+    def setUp(self):
+        self.mock_change_repository = MagicMock()
+        self.mock_change_repository.fetch_latest_version.return_value = 42
+        self.mock_change_repository.fetch_oldest_version.return_value = 5
+        self.change_service = ChangeService(self.mock_change_repository)
+
+    def test_full_page_reports_more_changes(self):
+        self.mock_change_repository.fetch_changes.return_value = [change(11), change(12), change(13)]
+
+        page = self.change_service.get_changes(10, 2)
+
+        self.mock_change_repository.fetch_changes.assert_called_once_with(10, 3)
+        self.assertEqual([c.version for c in page["changes"]], [11, 12])
+        self.assertEqual(page["next_since"], 12)
+        self.assertTrue(page["has_more"])
+        self.assertEqual(page["latest_version"], 42)
+
+    def test_last_page(self):
+        self.mock_change_repository.fetch_changes.return_value = [change(11)]
+
+        page = self.change_service.get_changes(10, 2)
+
+        self.assertEqual(page["next_since"], 11)
+        self.assertFalse(page["has_more"])
+
+    def test_no_changes_keeps_since(self):
+        self.mock_change_repository.fetch_changes.return_value = []
+
+        page = self.change_service.get_changes(42, 100)
+
+        self.assertEqual(page["changes"], [])
+        self.assertEqual(page["next_since"], 42)
+        self.assertFalse(page["has_more"])
+
+    def test_since_before_the_oldest_change_kept_is_a_reset(self):
+        self.mock_change_repository.fetch_changes.return_value = [change(5)]
+
+        self.assertFalse(self.change_service.get_changes(4, 10)["reset"])
+        self.assertTrue(self.change_service.get_changes(3, 10)["reset"])
+
+    def test_since_after_the_latest_version_is_a_reset(self):
+        self.mock_change_repository.fetch_changes.return_value = []
+
+        self.assertFalse(self.change_service.get_changes(42, 10)["reset"])
+        self.assertTrue(self.change_service.get_changes(43, 10)["reset"])
+
+
+if __name__ == "__main__":
+    unittest.main()
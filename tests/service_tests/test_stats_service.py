@@ -0,0 +1,58 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.app.repositories.stats_repository import StatsRepository
+from src.app.scripts.create_tables import create_tables
+from src.app.services.stats_service import StatsService
+from src.app.utils.db.db import DB
+
+
+class TestStatsService(unittest.TestCase):
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        with conn:
+            conn.executescript('''
+                INSERT INTO users VALUES ('U1', 'mia', 'hash', 'mia@x.com', 'IT', 'user');
+                INSERT INTO assets VALUES ('SN1', 'laptop', NULL, 'assigned'), ('SN2', 'monitor', NULL, 'assigned'),
+                                          ('SN3', 'dock', NULL, 'available');
+                INSERT INTO assets_assigned (asset_assigned_id, user_id, asset_id)
+                    VALUES ('A1', 'U1', 'SN1'), ('A2', 'U1', 'SN2');
+                INSERT INTO issues (issue_id, user_id, asset_id, description)
+                    VALUES ('I1', 'U1', 'SN1', 'cracked'), ('I2', 'U1', 'SN2', 'dim'), ('I3', 'U1', 'SN2', 'flicker');
+            ''')
+        conn.close()
+        self.stats_service = StatsService(StatsRepository(DB(self.db_path)))
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def test_get_stats(self):
+        stats = self.stats_service.get_stats(top=1)
+
+        self.assertEqual(stats, {
+            "assets_by_status": {"assigned": 2, "available": 1},
+            "assignments_by_department": {"IT": 2},
+            "open_issues": {"total": 3, "top_assets": [{"asset_id": "SN2", "count": 2}]},
+        })
+
+    def test_empty_database(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA foreign_keys = ON;")
+        with conn:
+            conn.execute("DELETE FROM users")
+            conn.execute("DELETE FROM assets")
+        conn.close()
+
+        stats = self.stats_service.get_stats(top=10)
+
+        self.assertEqual(stats["assignments_by_department"], {})
+        self.assertEqual(stats["open_issues"], {"total": 0, "top_assets": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -218,6 +218,21 @@ class TestUserService(unittest.TestCase):
         self.assertEqual(result, expected_user)
         self.mock_user_repository.fetch_user_by_id.assert_called_once_with(user_id)
 
+    def test_get_user_by_id_uses_the_user_cache(self):
+        """
+        Test get_user_by_id reads through the user cache
+        """
+        user_cache = MagicMock()
+        user_cache.get_or_load.side_effect = lambda key, load: load()
+        user_service = UserService(self.mock_user_repository, user_cache=user_cache)
+        self.mock_user_repository.fetch_user_by_id.return_value = "user"
+
+        result = user_service.get_user_by_id("U1")
+
+        self.assertEqual(result, "user")
+        user_cache.get_or_load.assert_called_once()
+        self.mock_user_repository.fetch_user_by_id.assert_called_once_with("U1")
+
     def test_get_user_by_id_returns_none(self):
         """
         Test get_user_by_id returns None when no user found
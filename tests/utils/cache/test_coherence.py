@@ -0,0 +1,106 @@
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.app.scripts.create_tables import create_tables
+from src.app.utils.cache.coherence import CacheCoherence
+from src.app.utils.cache.response_cache import ResponseCache, CachedResponse
+from src.app.utils.db.db import DB
+from src.app.utils.errors.error import DatabaseError
+
+
+def add_asset(db_path: str, serial_number: str):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute("INSERT INTO assets VALUES (?, 'Laptop', 'Dell', 'available')", (serial_number,))
+    conn.close()
+
+
+class TestCacheCoherence(unittest.TestCase):
+    """The change counters are maintained by triggers, so these tests run against a real database"""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+
+        self.coherence = CacheCoherence(DB(self.db_path))
+        self.listener = MagicMock()
+        self.coherence.register(self.listener)
+        self.coherence.check()
+        self.listener.reset_mock()
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def test_first_check_invalidates_every_table(self):
+        coherence = CacheCoherence(DB(self.db_path))
+        listener = MagicMock()
+        coherence.register(listener)
+
+        coherence.check()
+
+        listener.assert_called_once_with("users", "assets", "issues", "assets_assigned")
+
+    def test_nothing_is_invalidated_or_read_without_a_commit(self):
+        self.coherence.check()
+
+        self.listener.assert_not_called()
+        self.assertEqual(self.coherence.stats()["version_reads"], 1)
+
+    def test_only_written_tables_are_invalidated(self):
+        add_asset(self.db_path, "SN1")
+
+        self.coherence.check()
+
+        self.listener.assert_called_once_with("assets")
+
+    def test_writes_from_another_process_are_seen(self):
+        writer = multiprocessing.get_context("fork").Process(target=add_asset, args=(self.db_path, "SN1"))
+        writer.start()
+        writer.join()
+
+        self.coherence.check()
+
+        self.listener.assert_called_once_with("assets")
+
+    def test_check_interval_defers_checks(self):
+        coherence = CacheCoherence(DB(self.db_path), check_interval=3600)
+        listener = MagicMock()
+        coherence.register(listener)
+        coherence.check()
+        add_asset(self.db_path, "SN1")
+
+        coherence.check()
+
+        listener.assert_called_once()
+        self.assertEqual(coherence.stats()["checks"], 1)
+
+    def test_response_cache_drops_entries_of_tables_written_elsewhere(self):
+        cache = ResponseCache(max_bytes=10_000, coherence=self.coherence)
+        for key, table in (("assets", "assets"), ("issues", "issues")):
+            cache.put(key, CachedResponse(b"[]", 200, [], (table,)), cache.generation((table,)))
+
+        add_asset(self.db_path, "SN1")
+
+        self.assertIsNone(cache.get("assets"))
+        self.assertIsNotNone(cache.get("issues"))
+
+
+class TestResponseCacheCoherenceFailure(unittest.TestCase):
+    def test_failed_check_clears_the_cache(self):
+        coherence = MagicMock()
+        coherence.check.side_effect = DatabaseError("no table_versions")
+        cache = ResponseCache(max_bytes=10_000, coherence=coherence)
+        cache.put("a", CachedResponse(b"[]", 200, [], ("assets",)), cache.generation(("assets",)))
+
+        self.assertIsNone(cache.get("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
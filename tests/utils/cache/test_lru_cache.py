@@ -0,0 +1,98 @@
+import time
+import unittest
+
+from src.app.utils.cache.lru_cache import LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUCache(max_bytes=200)
+        cache.set("a", 1, size=100)
+        cache.set("b", 2, size=100)
+        cache.get("a")
+
+        cache.set("c", 3, size=100)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertEqual(cache.stats()["bytes"], 200)
+
+    def test_entries_expire(self):
+        cache = LRUCache()
+        cache.set("a", 1, ttl=0.01)
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["expirations"], 1)
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+    def test_cache_ttl_applies_to_every_entry(self):
+        cache = LRUCache(ttl=0.01)
+        cache.set("a", 1)
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get("a"))
+
+    def test_value_larger_than_the_budget_is_not_stored(self):
+        cache = LRUCache(max_bytes=100)
+
+        self.assertFalse(cache.set("a", "x" * 1000))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_sizes_come_from_sizeof(self):
+        cache = LRUCache(max_bytes=1000, sizeof=len)
+        cache.set("a", "x" * 10)
+
+        self.assertGreater(cache.stats()["bytes"], 10)
+
+    def test_replacing_a_key_replaces_its_size(self):
+        cache = LRUCache(max_bytes=1000)
+        cache.set("a", 1, size=100)
+        cache.set("a", 2, size=300)
+
+        self.assertEqual(cache.stats()["bytes"], 300)
+        self.assertEqual(cache.get("a"), 2)
+
+    def test_grow_evicts_when_over_budget(self):
+        cache = LRUCache(max_bytes=250)
+        cache.set("a", 1, size=100)
+        cache.set("b", 2, size=100)
+
+        cache.grow("b", 100)
+
+        self.assertIsNone(cache.peek("a"))
+        self.assertEqual(cache.stats()["bytes"], 200)
+
+    def test_discard_where_drops_matching_entries(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        self.assertEqual(cache.discard_where(lambda key, value: value > 1), 1)
+
+        self.assertIsNone(cache.peek("b"))
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+    def test_shrinking_evicts_down_to_the_new_size(self):
+        cache = LRUCache(max_bytes=1000)
+        for key in "abcd":
+            cache.set(key, key, size=100)
+
+        cache.resize(200)
+
+        self.assertEqual([cache.peek(key) for key in "abcd"], [None, None, "c", "d"])
+        self.assertEqual(cache.stats()["max_bytes"], 200)
+
+    def test_peek_does_not_count_as_a_lookup(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+
+        cache.peek("a")
+
+        self.assertEqual(cache.stats()["hits"], 0)
+        self.assertEqual(cache.stats()["misses"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
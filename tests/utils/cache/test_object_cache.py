@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.app.utils.cache.lru_cache import LRUCache
+from src.app.utils.cache.object_cache import VersionedCache, create_backend
+from src.app.utils.cache.shared_memory_cache import SharedMemoryCache
+from src.app.utils.errors.error import DatabaseError
+
+
+class TestCreateBackend(unittest.TestCase):
+    def test_kinds(self):
+        self.assertIsNone(create_backend("", "users"))
+        self.assertIsInstance(create_backend("local", "users"), LRUCache)
+        shared = create_backend("shared", "users")
+        try:
+            self.assertIsInstance(shared, SharedMemoryCache)
+        finally:
+            shared.close()
+        with self.assertRaises(ValueError):
+            create_backend("redis", "users")
+
+
+class TestVersionedCache(unittest.TestCase):
+    def setUp(self):
+        self.coherence = MagicMock()
+        self.coherence.versions.return_value = (1,)
+        self.cache = VersionedCache(LRUCache(), ["users"], self.coherence)
+        self.load = MagicMock(return_value="mia")
+
+    def test_value_is_loaded_once_while_versions_hold(self):
+        self.assertEqual(self.cache.get_or_load("U1", self.load), "mia")
+        self.assertEqual(self.cache.get_or_load("U1", self.load), "mia")
+
+        self.load.assert_called_once()
+        self.coherence.versions.assert_called_with(("users",))
+
+    def test_write_to_the_table_makes_entries_stale(self):
+        self.cache.get_or_load("U1", self.load)
+        self.coherence.versions.return_value = (2,)
+
+        self.cache.get_or_load("U1", self.load)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_missing_values_are_not_cached(self):
+        self.load.return_value = None
+
+        self.cache.get_or_load("U1", self.load)
+        self.cache.get_or_load("U1", self.load)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_unreadable_versions_bypass_the_cache(self):
+        self.coherence.versions.side_effect = DatabaseError("no table_versions")
+
+        self.assertEqual(self.cache.get_or_load("U1", self.load), "mia")
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
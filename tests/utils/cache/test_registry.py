@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+import unittest
+
+from src.app.utils.cache.lru_cache import LRUCache
+from src.app.utils.cache.registry import CacheRegistry
+from src.app.utils.cache.shared_memory_cache import SharedMemoryCache
+from src.app.utils.control_block import ControlBlock
+from src.app.utils.errors.error import NotExistsError, InvalidOperationError
+
+
+def stats_after_update(registry: CacheRegistry, updated, results):
+    # A worker forked before the update, applying it as it would before its next request
+    updated.wait(5)
+    registry.control_block.apply_pending()
+    results.put(registry.stats())
+
+
+class TestCacheRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = CacheRegistry(budget_bytes=1000)
+        self.responses = self.registry.register("responses", LRUCache("responses", max_bytes=400))
+        self.users = self.registry.register("users", LRUCache("users"), share=1)
+        self.assets = self.registry.register("assets", LRUCache("assets"), share=2)
+
+    def test_budget_left_by_fixed_caches_is_divided_by_share(self):
+        self.assertEqual(self.responses.max_bytes, 400)
+        self.assertEqual(self.users.max_bytes, 200)
+        self.assertEqual(self.assets.max_bytes, 400)
+
+    def test_resize_pins_the_cache_and_rebalances_the_others(self):
+        self.registry.resize("users", 300)
+
+        self.assertEqual(self.users.max_bytes, 300)
+        self.assertEqual(self.assets.max_bytes, 300)
+        self.assertIsNone(self.registry.cache_stats("users")["share"])
+
+    def test_resize_beyond_the_budget_is_refused(self):
+        with self.assertRaises(InvalidOperationError):
+            self.registry.resize("responses", 1001)
+
+        self.assertEqual(self.responses.max_bytes, 400)
+
+    def test_fixed_cache_over_the_budget_cannot_be_registered(self):
+        with self.assertRaises(ValueError):
+            self.registry.register("tokens", LRUCache("tokens", max_bytes=700))
+
+    def test_shared_memory_cache_cannot_be_resized(self):
+        registry = CacheRegistry(budget_bytes=1 << 20)
+        shared = registry.register("tokens", SharedMemoryCache("tokens", slots=16, slot_bytes=128))
+        try:
+            with self.assertRaises(InvalidOperationError):
+                registry.resize("tokens", 1024)
+            self.assertEqual(registry.cache_stats("tokens")["max_bytes"], 16 * 128)
+        finally:
+            shared.close()
+
+    def test_flush_empties_the_cache(self):
+        self.users.set("U1", "mia")
+
+        self.registry.flush("users")
+
+        self.assertIsNone(self.users.get("U1"))
+
+    def test_unknown_cache(self):
+        with self.assertRaises(NotExistsError):
+            self.registry.flush("sessions")
+
+    def test_stats(self):
+        stats = self.registry.stats()
+
+        self.assertEqual(stats["pid"], os.getpid())
+        self.assertEqual(stats["budget_bytes"], 1000)
+        self.assertEqual(stats["allocated_bytes"], 1000)
+        self.assertEqual(list(stats["caches"]), ["responses", "users", "assets"])
+
+    def test_metrics_export_counters_per_cache(self):
+        self.users.get("U1")
+        self.users.set("U1", "mia")
+        self.users.get("U1")
+
+        metrics = self.registry.metrics()
+
+        self.assertIn('cache_hits_total{cache="users"} 1', metrics)
+        self.assertIn('cache_misses_total{cache="users"} 1', metrics)
+        self.assertIn('cache_max_bytes{cache="assets"} 400', metrics)
+        self.assertIn("# TYPE cache_evictions_total counter", metrics)
+
+    def fan_out(self):
+        control_block = ControlBlock(slots=4)
+        self.registry.control_block = control_block
+        control_block.register("cache", self.registry._update)
+        return control_block
+
+    def test_update_is_applied_here_and_in_the_other_workers(self):
+        self.fan_out()
+        self.users.set("U1", "mia")
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        updated = context.Event()
+        worker = context.Process(target=stats_after_update, args=(self.registry, updated, results))
+        worker.start()
+
+        self.registry.update("users", max_bytes=100, flush=True)
+        updated.set()
+        stats = results.get(timeout=5)
+        worker.join(5)
+
+        self.assertEqual(self.users.max_bytes, 100)
+        self.assertEqual(stats["caches"]["users"]["max_bytes"], 100)
+        self.assertEqual(stats["caches"]["users"]["entries"], 0)
+        self.assertEqual(stats["caches"]["assets"]["max_bytes"], 500)
+        self.assertNotEqual(stats["pid"], os.getpid())
+
+    def test_refused_update_is_not_published(self):
+        control_block = self.fan_out()
+
+        with self.assertRaises(InvalidOperationError):
+            self.registry.update("users", max_bytes=5000)
+        self.registry.update("users")
+
+        self.assertEqual(control_block._sequence.value, 0)
+
+    def test_flush_of_a_shared_memory_cache_is_not_published(self):
+        control_block = self.fan_out()
+        shared = SharedMemoryCache("tokens", slots=4, slot_bytes=64)
+        self.addCleanup(shared.close)
+        self.registry.register("tokens", shared)
+
+        self.registry.update("tokens", flush=True)
+
+        self.assertEqual(control_block._sequence.value, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+
+from src.app.config.app_config import AppConfig
+from src.app.controllers.main import create_app
+from src.app.repositories.asset_repository import AssetRepository
+from src.app.scripts.create_tables import create_tables
+from src.app.utils.cache.response_cache import ResponseCache, CachedResponse, ENTRY_OVERHEAD_BYTES, cached_response
+from src.app.utils.utils import Utils
+
+
+def entry(size: int, *tables: str) -> CachedResponse:
+    return CachedResponse(b"x" * (size - ENTRY_OVERHEAD_BYTES), 200, [], tables or ("assets",))
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_get_returns_stored_entry_and_counts_hits(self):
+        cache = ResponseCache(max_bytes=10_000)
+        cache.put("a", entry(1000), cache.generation(("assets",)))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_least_recently_used_entry_is_evicted_over_budget(self):
+        cache = ResponseCache(max_bytes=2500)
+        for key in ("a", "b"):
+            cache.put(key, entry(1000), cache.generation(("assets",)))
+        cache.get("a")
+
+        cache.put("c", entry(1000), cache.generation(("assets",)))
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertLessEqual(cache.stats()["bytes"], 2500)
+
+    def test_oversized_entry_is_not_stored(self):
+        cache = ResponseCache(max_bytes=10_000, max_entry_bytes=1000)
+
+        self.assertFalse(cache.put("a", entry(2000), cache.generation(("assets",))))
+
+    def test_invalidate_drops_only_dependent_entries(self):
+        cache = ResponseCache(max_bytes=10_000)
+        cache.put("assets", entry(1000, "assets"), cache.generation(("assets",)))
+        cache.put("assigned", entry(1000, "users", "assets_assigned"), cache.generation(("users", "assets_assigned")))
+
+        cache.invalidate("assets_assigned")
+
+        self.assertIsNotNone(cache.get("assets"))
+        self.assertIsNone(cache.get("assigned"))
+        self.assertEqual(cache.stats()["bytes"], 1000)
+
+    def test_response_computed_before_a_write_is_not_stored(self):
+        cache = ResponseCache(max_bytes=10_000)
+        generation = cache.generation(("assets",))
+
+        cache.invalidate("assets")
+
+        self.assertFalse(cache.put("a", entry(1000), generation))
+        self.assertIsNone(cache.get("a"))
+
+
+class TestCachedResponseDecorator(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(max_bytes=10_000)
+        cache = self.cache
+
+        class Handler:
+            response_cache = cache
+            calls = 0
+
+            @cached_response("assets")
+            def get_items(self):
+                Handler.calls += 1
+                return {"items": [Handler.calls]}, 200
+
+        self.handler_class = Handler
+        app = Flask(__name__)
+        app.add_url_rule("/items", "items", Handler().get_items)
+        self.client = app.test_client()
+
+    def test_repeat_request_is_served_from_cache(self):
+        first = self.client.get("/items")
+        second = self.client.get("/items")
+
+        self.assertEqual(first.headers["X-Cache"], "MISS")
+        self.assertEqual(second.headers["X-Cache"], "HIT")
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.mimetype, "application/json")
+        self.assertEqual(self.handler_class.calls, 1)
+
+    def test_query_parameters_are_part_of_the_key(self):
+        self.client.get("/items?page=1")
+        response = self.client.get("/items?page=2")
+
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+        self.assertEqual(self.handler_class.calls, 2)
+
+    def test_invalidation_recomputes_the_response(self):
+        self.client.get("/items")
+        self.cache.invalidate("assets")
+
+        response = self.client.get("/items")
+
+        self.assertEqual(response.get_json(), {"items": [2]})
+
+
+class TestResponseCacheInApp(unittest.TestCase):
+    """GET /assets through the whole app, with AssetService writes invalidating the cache"""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+        self.client = create_app(AppConfig.for_testing(db_path=self.db_path, blueprints=("assets",))).test_client()
+        self.headers = {"Authorization": f"Bearer {Utils.create_jwt_token('admin-1', 'admin')}"}
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def test_reads_skip_the_database_until_a_write(self):
+        with patch.object(AssetRepository, "fetch_all_assets_json", autospec=True,
+                          side_effect=AssetRepository.fetch_all_assets_json) as fetch_all_assets_json:
+            self.client.get("/assets", headers=self.headers)
+            cached = self.client.get("/assets", headers=self.headers)
+            self.assertEqual(cached.headers["X-Cache"], "HIT")
+            self.assertEqual(fetch_all_assets_json.call_count, 1)
+
+            self.client.post("/add-asset", json={"name": "Laptop", "description": "Dell XPS"}, headers=self.headers)
+            fresh = self.client.get("/assets", headers=self.headers)
+
+        self.assertEqual(fresh.headers["X-Cache"], "MISS")
+        self.assertEqual(len(fresh.get_json()["data"]), 1)
+        self.assertEqual(fetch_all_assets_json.call_count, 2)
+
+    def test_cached_response_answers_conditional_requests(self):
+        first = self.client.get("/assets", headers=self.headers)
+
+        response = self.client.get("/assets", headers={**self.headers, "If-None-Match": first.headers["ETag"]})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["X-Cache"], "HIT")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import multiprocessing
+import time
+import unittest
+
+from src.app.models.asset import Asset
+from src.app.models.user import User
+from src.app.utils.cache.shared_memory_cache import SharedMemoryCache, MAX_PROBES, _SEQ, _hash
+from src.app.utils.errors.error import LockTimeoutError
+from src.app.utils.process_lock import release_locks_held_by
+
+
+def store(cache: SharedMemoryCache, key: str, value):
+    cache.set(key, value)
+
+
+def die_mid_write(cache: SharedMemoryCache, key: str, locked):
+    # Take the lock and start on a slot the way a write does, then hang until killed
+    cache._acquire()
+    offset = (_hash(key.encode()) % cache.slots) * cache.slot_bytes
+    _SEQ.pack_into(cache._buf, offset, _SEQ.unpack_from(cache._buf, offset)[0] | 1)
+    locked.set()
+    time.sleep(60)
+
+
+class TestSharedMemoryCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = SharedMemoryCache("test", slots=64, slot_bytes=256)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_get_returns_what_was_set(self):
+        asset = Asset(name="laptop", description="dell", serial_number="SN1")
+        self.cache.set("SN1", asset)
+
+        self.assertEqual(self.cache.get("SN1"), asset)
+        self.assertIsNone(self.cache.get("SN2"))
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_slotted_user_round_trips(self):
+        self.cache.set(b"U1", User(id="U1", name="mia", email="mia@x.com", password="hash", department="IT"))
+
+        self.assertEqual(self.cache.get(b"U1").email, "mia@x.com")
+
+    def test_set_replaces_the_value_of_a_key(self):
+        self.cache.set("k", 1)
+        self.cache.set("k", 2)
+
+        self.assertEqual(self.cache.get("k"), 2)
+        self.assertEqual(self.cache.stats()["entries"], 1)
+
+    def test_entries_expire(self):
+        self.cache.set("k", 1, ttl=0.01)
+        time.sleep(0.02)
+
+        self.assertIsNone(self.cache.get("k"))
+
+    def test_delete_keeps_later_keys_of_the_probe_chain_reachable(self):
+        for i in range(40):
+            self.cache.set(f"k{i}", i)
+
+        for i in range(0, 40, 2):
+            self.cache.delete(f"k{i}")
+
+        self.assertEqual([self.cache.get(f"k{i}") for i in range(1, 40, 2)], list(range(1, 40, 2)))
+        self.assertIsNone(self.cache.get("k0"))
+
+    def test_values_too_large_for_a_slot_are_not_stored(self):
+        self.assertFalse(self.cache.set("k", "x" * 1000))
+        self.assertIsNone(self.cache.get("k"))
+
+    def test_full_probe_window_evicts(self):
+        cache = SharedMemoryCache("small", slots=MAX_PROBES, slot_bytes=128)
+        try:
+            for i in range(MAX_PROBES + 1):
+                self.assertTrue(cache.set(f"k{i}", i))
+
+            self.assertEqual(cache.get(f"k{MAX_PROBES}"), MAX_PROBES)
+            self.assertEqual(cache.stats()["evictions"], 1)
+            self.assertEqual(cache.stats()["entries"], MAX_PROBES)
+        finally:
+            cache.close()
+
+    def test_slot_being_written_reads_as_a_miss_until_rewritten(self):
+        self.cache.set("k", 1)
+        offset = (_hash(b"k") % self.cache.slots) * self.cache.slot_bytes
+        # A writer that died half-way leaves the sequence number odd
+        _SEQ.pack_into(self.cache._buf, offset, _SEQ.unpack_from(self.cache._buf, offset)[0] + 1)
+
+        self.assertIsNone(self.cache.get("k"))
+        self.cache.set("k", 2)
+        self.assertEqual(self.cache.get("k"), 2)
+
+    def test_clear_empties_the_table(self):
+        self.cache.set("k", 1)
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("k"))
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_forked_processes_share_entries(self):
+        self.cache.set("parent", 1)
+        child = multiprocessing.get_context("fork").Process(target=store, args=(self.cache, "child", 2))
+        child.start()
+        child.join()
+
+        self.assertEqual(child.exitcode, 0)
+        self.assertEqual(self.cache.get("child"), 2)
+        self.assertEqual(self.cache.get("parent"), 1)
+
+    def test_lock_held_by_a_killed_process_is_released_for_it(self):
+        self.cache.set("k", 1)
+        context = multiprocessing.get_context("fork")
+        locked = context.Event()
+        child = context.Process(target=die_mid_write, args=(self.cache, "k", locked))
+        child.start()
+        self.assertTrue(locked.wait(10))
+        child.kill()
+        child.join()
+
+        self.assertFalse(self.cache.set("other", 2))
+        with self.assertRaises(LockTimeoutError):
+            self.cache.clear()
+        with self.assertRaises(LockTimeoutError):
+            self.cache.delete("k")
+        self.assertEqual(self.cache.stats()["skipped_writes"], 3)
+
+        self.assertEqual(release_locks_held_by(child.pid), 1)
+
+        self.assertIsNone(self.cache.get("k"))
+        self.assertTrue(self.cache.set("other", 2))
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_locks_of_live_or_other_processes_are_left_alone(self):
+        self.assertEqual(release_locks_held_by(12345), 0)
+
+        self.cache._acquire()
+        try:
+            self.assertEqual(release_locks_held_by(12345), 0)
+        finally:
+            self.cache._release()
+        self.assertTrue(self.cache.set("k", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.app.utils.cache import single_flight as single_flight_module
+from src.app.utils.cache.single_flight import SingleFlight, single_flight
+from src.app.utils.errors.error import InFlightTimeoutError, DatabaseError
+
+WAIT_SECONDS = 5
+
+
+def wait_until(predicate):
+    deadline = time.monotonic() + WAIT_SECONDS
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.group = SingleFlight()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def slow_read(self):
+        self.calls += 1
+        self.release.wait(WAIT_SECONDS)
+        return ["asset"]
+
+    def run_concurrently(self, n: int, fn):
+        """Start `n` calls, let the first one enter `fn`, then release it once the rest are queued"""
+        with ThreadPoolExecutor(n) as pool:
+            futures = [pool.submit(fn)]
+            wait_until(lambda: self.group.stats()["in_flight"] != 0)
+            futures += [pool.submit(fn) for _ in range(n - 1)]
+            wait_until(lambda: self.group.stats()["coalesced"] >= n - 1)
+            self.release.set()
+            return [future.exception() or future.result() for future in futures]
+
+    def test_concurrent_calls_share_one_computation(self):
+        results = self.run_concurrently(8, lambda: self.group.do("assets", self.slow_read))
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.group.stats()["coalesced"], 7)
+        self.assertEqual(self.group.stats()["in_flight"], 0)
+
+    def test_error_is_raised_in_every_caller(self):
+        def failing_read():
+            self.slow_read()
+            raise DatabaseError("disk I/O error")
+
+        results = self.run_concurrently(4, lambda: self.group.do("assets", failing_read))
+
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(result, DatabaseError) for result in results))
+
+    def test_sequential_calls_are_not_coalesced(self):
+        self.release.set()
+
+        self.group.do("assets", self.slow_read)
+        self.group.do("assets", self.slow_read)
+
+        self.assertEqual(self.calls, 2)
+
+    def test_waiting_caller_times_out(self):
+        leader = threading.Thread(target=self.group.do, args=("assets", self.slow_read))
+        leader.start()
+        wait_until(lambda: self.group.stats()["in_flight"] != 0)
+
+        with self.assertRaises(InFlightTimeoutError):
+            self.group.do("assets", self.slow_read, timeout=0.01)
+
+        self.release.set()
+        leader.join()
+        self.assertEqual(self.group.stats()["timeouts"], 1)
+
+    def test_forget_starts_a_new_flight_for_later_callers(self):
+        leader = threading.Thread(target=self.group.do, args=("assets", self.slow_read, ("assets",)))
+        leader.start()
+        wait_until(lambda: self.group.stats()["in_flight"] != 0)
+
+        self.group.forget("assets")
+        self.release.set()
+        self.group.do("assets", self.slow_read, ("assets",))
+        leader.join()
+
+        self.assertEqual(self.calls, 2)
+
+
+class TestSingleFlightDecorator(unittest.TestCase):
+    def test_calls_with_different_arguments_do_not_share_a_flight(self):
+        release = threading.Event()
+        seen = []
+
+        class Service:
+            @single_flight("issues")
+            def get_user_issues(self, user_id):
+                seen.append(user_id)
+                release.wait(WAIT_SECONDS)
+                return user_id
+
+        service = Service()
+        with ThreadPoolExecutor(2) as pool:
+            first = pool.submit(service.get_user_issues, "u-1")
+            second = pool.submit(service.get_user_issues, "u-2")
+            wait_until(lambda: single_flight_module.flights.stats()["in_flight"] >= 2)
+            release.set()
+
+        self.assertEqual((first.result(), second.result()), ("u-1", "u-2"))
+        self.assertCountEqual(seen, ["u-1", "u-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
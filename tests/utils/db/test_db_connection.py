@@ -1,7 +1,23 @@
+import os
+import tempfile
+
 from src.app.utils.db.db import DB
 
 
-def test_db_connection():
-    conn = DB.get_connection()
+def test_db_connection(tmp_path, monkeypatch):
+    # The default path is the developer's own database; point it at a scratch file
+    monkeypatch.setattr("src.app.config.db_config.DB", str(tmp_path / "asset_management.db"))
+    conn = DB().get_connection()
+    conn.close()
+
+    assert conn is not None
+    assert (tmp_path / "asset_management.db").exists()
+
+
+def test_db_connection_custom_path():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "test.db")
+        conn = DB(db_path).get_connection()
+        conn.close()
 
-    assert conn is not None
\ No newline at end of file
+        assert os.path.exists(db_path)
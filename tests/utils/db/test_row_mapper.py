@@ -0,0 +1,74 @@
+import sqlite3
+import unittest
+
+from src.app.models.asset import Asset
+from src.app.models.asset_issue import Issue
+from src.app.models.user import User
+from src.app.utils.db.row_mapper import row_mapper
+
+
+class TestRowMapper(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE assets (serial_number TEXT, name TEXT, description TEXT, status TEXT)")
+        self.conn.executemany(
+            "INSERT INTO assets VALUES (?, ?, ?, ?)",
+            [("SN001", "Laptop", "Dell XPS", "available"), ("SN002", "Desktop", "HP", "assigned")]
+        )
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_rows_are_mapped_in_column_order(self):
+        """Test each row becomes a model instance with its columns in the selected order"""
+        cursor = self.conn.cursor()
+        cursor.row_factory = row_mapper(Asset, ["serial_number", "name", "description", "status"])
+        assets = cursor.execute("SELECT serial_number, name, description, status FROM assets").fetchall()
+
+        self.assertEqual(assets[0], Asset(serial_number="SN001", name="Laptop", description="Dell XPS",
+                                          status="available"))
+        self.assertEqual(assets[1].status, "assigned")
+
+    def test_defaults_are_not_computed_for_loaded_rows(self):
+        """Test NULL columns stay None instead of going through __post_init__"""
+        self.conn.execute("CREATE TABLE issues (issue_id, user_id, asset_id, description, report_date)")
+        self.conn.execute("INSERT INTO issues VALUES ('I1', NULL, 'SN001', 'broken', NULL)")
+        cursor = self.conn.cursor()
+        columns = ["issue_id", "user_id", "asset_id", "description", "report_date"]
+        cursor.row_factory = row_mapper(Issue, columns)
+
+        issue = cursor.execute(f"SELECT {', '.join(columns)} FROM issues").fetchone()
+
+        self.assertEqual(issue.issue_id, "I1")
+        self.assertIsNone(issue.report_date)
+
+    def test_plain_slotted_class_is_supported(self):
+        """Test a non-dataclass model with __slots__ can be mapped"""
+        mapper = row_mapper(User, ["id", "name", "email", "password", "role", "department"])
+
+        user = mapper(None, ("U1", "mia", "mia@x.com", "hash", "admin", "IT"))
+
+        self.assertEqual((user.id, user.role, user.department), ("U1", "admin", "IT"))
+
+    def test_mapper_is_compiled_once(self):
+        """Test the same model and columns reuse the compiled mapper"""
+        columns = ["serial_number", "name", "description", "status"]
+
+        self.assertIs(row_mapper(Asset, columns), row_mapper(Asset, tuple(columns)))
+
+    def test_mismatched_columns_raise(self):
+        """Test columns must cover exactly the model's fields"""
+        with self.assertRaises(ValueError):
+            row_mapper(Asset, ["serial_number", "name"])
+
+    def test_model_without_slots_raises(self):
+        """Test models with an instance dict are rejected"""
+        class Plain:
+            pass
+
+        with self.assertRaises(TypeError):
+            row_mapper(Plain, ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
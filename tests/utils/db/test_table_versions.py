@@ -0,0 +1,74 @@
+import sqlite3
+import unittest
+
+from src.app.scripts.create_tables import create_tables, drop_triggers, create_triggers, bump_versions
+from src.app.utils.db.table_versions import fetch_table_versions
+
+
+class TestTableVersions(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("PRAGMA foreign_keys = ON;")
+        create_tables(self.conn)
+        with self.conn:
+            self.conn.execute("INSERT INTO users VALUES ('U1', 'mia', 'hash', 'mia@x.com', 'IT', 'user')")
+            self.conn.execute("INSERT INTO assets VALUES ('SN1', 'Laptop', 'Dell', 'assigned')")
+            self.conn.execute("INSERT INTO assets_assigned (asset_assigned_id, user_id, asset_id) VALUES ('A1', 'U1', 'SN1')")
+
+    def tearDown(self):
+        self.conn.close()
+
+    def versions(self, *tables):
+        return fetch_table_versions(self.conn, tables)
+
+    def test_versions_are_returned_in_the_order_asked(self):
+        """Test versions come back in the order of the tables given"""
+        assets, users = self.versions("assets", "users")
+
+        self.assertEqual(self.versions("users", "assets"), (users, assets))
+
+    def test_writes_bump_only_their_table(self):
+        """Test insert, update and delete each bump the written table's version"""
+        before = self.versions("assets", "issues")
+
+        with self.conn:
+            self.conn.execute("INSERT INTO assets VALUES ('SN2', 'Phone', 'Pixel', 'available')")
+            self.conn.execute("UPDATE assets SET status = 'assigned' WHERE serial_number = 'SN2'")
+            self.conn.execute("DELETE FROM assets WHERE serial_number = 'SN2'")
+
+        after = self.versions("assets", "issues")
+        self.assertEqual(after, (before[0] + 3, before[1]))
+
+    def test_cascaded_deletes_bump_versions(self):
+        """Test rows removed by ON DELETE CASCADE bump their table too"""
+        before = self.versions("assets_assigned")[0]
+
+        with self.conn:
+            self.conn.execute("DELETE FROM users WHERE id = 'U1'")
+
+        self.assertEqual(self.versions("assets_assigned")[0], before + 1)
+
+    def test_create_tables_keeps_existing_versions(self):
+        """Test re-running the idempotent schema setup does not reset the counters"""
+        before = self.versions("users", "assets", "issues", "assets_assigned")
+
+        create_tables(self.conn)
+
+        self.assertEqual(self.versions("users", "assets", "issues", "assets_assigned"), before)
+
+    def test_writes_without_triggers_need_a_bump(self):
+        """Test bulk writes with the triggers dropped leave versions alone until bumped"""
+        before = self.versions("assets")[0]
+        drop_triggers(self.conn)
+        with self.conn:
+            self.conn.execute("INSERT INTO assets VALUES ('SN2', 'Phone', 'Pixel', 'available')")
+        self.assertEqual(self.versions("assets")[0], before)
+
+        create_triggers(self.conn)
+        bump_versions(self.conn)
+
+        self.assertGreater(self.versions("assets")[0], before)
+
+
+if __name__ == "__main__":
+    unittest.main()
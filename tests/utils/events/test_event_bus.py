@@ -0,0 +1,244 @@
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import src.app.config.events_config as events_config
+import src.app.config.server_config as server_config
+from src.app.models.asset import Asset
+from src.app.models.asset_assigned import AssetAssigned
+from src.app.models.user import User
+from src.app.repositories.asset_repository import AssetRepository
+from src.app.repositories.change_repository import ChangeRepository
+from src.app.repositories.user_repository import UserRepository
+from src.app.scripts.create_tables import create_tables
+from src.app.utils.db.db import DB
+from src.app.utils.errors.error import StreamLimitError
+from src.app.utils.events.event_bus import EventBus
+
+
+def resume_in_child(bus: EventBus, last_event_id: str, results):
+    subscription = bus.subscribe("admin", last_event_id=last_event_id)
+    results.put((subscription.reset, [event.id for event in subscription.get(0)]))
+    subscription.close()
+
+
+class TestEventBus(unittest.TestCase):
+    """Events are read from the changes log, so these tests run against a real database"""
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+        conn = sqlite3.connect(self.db_path)
+        create_tables(conn)
+        conn.close()
+
+        db = DB(self.db_path)
+        self.asset_repository = AssetRepository(db)
+        self.user_repository = UserRepository(db)
+        # Polled by the tests themselves unless woken
+        self.bus = EventBus(ChangeRepository(db), queue_size=4, replay_limit=5, poll_seconds=60)
+
+        for user_id in ("U1", "U2"):
+            self.user_repository.save_user(User(id=user_id, name=user_id, email=f"{user_id}@x.com",
+                                                password="hash", department="IT"))
+        for serial_number in ("SN1", "SN2"):
+            self.add_asset(serial_number)
+
+    def tearDown(self):
+        for subscription in list(self.bus._subscribers):
+            subscription.close()
+        # Lets the poller see it has no subscribers left and exit
+        self.bus.wake()
+        os.remove(self.db_path)
+
+    def add_asset(self, serial_number):
+        self.asset_repository.add_asset(Asset(name="laptop", description="dell", serial_number=serial_number))
+
+    def assign(self, user_id, asset_id):
+        self.asset_repository.assign_asset(AssetAssigned(user_id=user_id, asset_id=asset_id))
+
+    def delete_assets(self, count):
+        for i in range(count):
+            self.add_asset(f"X{i}")
+            self.asset_repository.delete_asset(f"X{i}")
+
+    def resumed_with_reset(self, last_event_id: str) -> bool:
+        subscription = self.bus.subscribe("admin", last_event_id=last_event_id)
+        subscription.close()
+        return subscription.reset
+
+    def events(self, subscription):
+        self.bus.poll()
+        return subscription.get(0)
+
+    def test_admin_receives_every_event_and_users_only_their_own(self):
+        admin = self.bus.subscribe("admin", "admin-1")
+        user = self.bus.subscribe("user", "U1")
+
+        self.assign("U1", "SN1")
+        self.assign("U2", "SN2")
+        self.asset_repository.delete_asset("SN2")
+
+        self.assertEqual([event.type for event in self.events(admin)],
+                         ["asset.assigned", "asset.assigned", "asset.unassigned", "asset.deleted"])
+        self.assertEqual([(event.type, event.user_id) for event in user.get(0)], [("asset.assigned", "U1")])
+
+    def test_event_ids_are_change_versions(self):
+        subscription = self.bus.subscribe("admin")
+        self.assign("U1", "SN1")
+
+        event, = self.events(subscription)
+        version = ChangeRepository(DB(self.db_path)).fetch_latest_version()
+
+        self.assertEqual(event.frame.decode(), f'id: {version}\nevent: asset.assigned\n'
+                                              f'data: {{"asset_id":"SN1","user_id":"U1"}}\n\n')
+
+    def test_each_published_change_becomes_its_event(self):
+        subscription = self.bus.subscribe("admin")
+        self.assign("U1", "SN1")
+        self.asset_repository.unassign_asset("U1", "SN1")
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("INSERT INTO issues (issue_id, user_id, asset_id, description, report_date) "
+                         "VALUES ('I1', 'U1', 'SN1', 'broken', '2026-01-01 09:00:00')")
+        conn.close()
+        self.user_repository.delete_user("U2")
+
+        events = [(event.type, event.user_id, event.frame.decode().split("data: ")[1].strip())
+                  for event in self.events(subscription)]
+
+        self.assertEqual(events[1:], [
+            ("asset.unassigned", "U1", '{"asset_id":"SN1","user_id":"U1"}'),
+            ("issue.reported", "U1", '{"issue_id":"I1","asset_id":"SN1","user_id":"U1","description":"broken",'
+                                     '"report_date":"2026-01-01 09:00:00"}'),
+            ("user.deleted", "U2", '{"user_id":"U2"}'),
+        ])
+
+    def test_other_changes_are_not_published(self):
+        subscription = self.bus.subscribe("admin")
+
+        self.asset_repository.update_asset_status("SN1", "assigned")
+        self.add_asset("SN3")
+
+        self.assertEqual(self.events(subscription), [])
+        self.assertIsNotNone(self.bus.stats()["cursor"])
+
+    def test_full_queue_drops_the_oldest_events(self):
+        subscription = self.bus.subscribe("admin")
+
+        self.delete_assets(6)
+
+        self.assertEqual([event.type for event in self.events(subscription)], ["asset.deleted"] * 4)
+        self.assertEqual(subscription.take_dropped(), 2)
+        self.assertEqual(subscription.take_dropped(), 0)
+
+    def test_get_times_out_without_events(self):
+        subscription = self.bus.subscribe("admin")
+
+        self.assertEqual(subscription.get(0.01), [])
+
+    def test_resume_replays_missed_events(self):
+        first = self.bus.subscribe("admin")
+        self.assign("U1", "SN1")
+        seen, = self.events(first)
+        first.close()
+        self.assign("U2", "SN2")
+        self.bus.poll()
+
+        subscription = self.bus.subscribe("admin", last_event_id=seen.id)
+
+        self.assertFalse(subscription.reset)
+        self.assertEqual([event.user_id for event in self.events(subscription)], ["U2"])
+
+    def test_resume_filters_replayed_events_by_role(self):
+        admin = self.bus.subscribe("admin")
+        self.delete_assets(1)
+        seen, = self.events(admin)
+        self.assign("U2", "SN2")
+        self.assign("U1", "SN1")
+        self.bus.poll()
+
+        subscription = self.bus.subscribe("user", "U1", last_event_id=seen.id)
+
+        self.assertEqual([event.user_id for event in subscription.get(0)], ["U1"])
+
+    def test_resume_from_a_pruned_foreign_or_distant_id_is_flagged_reset(self):
+        self.bus.subscribe("admin")
+        latest = ChangeRepository(DB(self.db_path)).fetch_latest_version()
+        self.delete_assets(6)
+        self.bus.poll()
+
+        # More missed events than the replay limit
+        self.assertTrue(self.resumed_with_reset(str(latest)))
+        self.assertTrue(self.resumed_with_reset(str(latest + 1000)))
+        self.assertTrue(self.resumed_with_reset("garbage"))
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute("DELETE FROM changes WHERE version <= ?", (latest + 2,))
+        conn.close()
+        self.assertTrue(self.resumed_with_reset(str(latest + 1)))
+        self.assertFalse(self.resumed_with_reset(str(latest + 8)))
+
+    def test_closed_subscription_stops_receiving(self):
+        subscription = self.bus.subscribe("admin")
+        subscription.close()
+
+        self.delete_assets(1)
+
+        self.assertEqual(self.events(subscription), [])
+        self.assertEqual(self.bus.stats()["subscribers"], 0)
+
+    def test_another_worker_resumes_from_the_same_event_id(self):
+        subscription = self.bus.subscribe("admin")
+        self.assign("U1", "SN1")
+        seen, = self.events(subscription)
+        self.assign("U2", "SN2")
+        missed, = self.events(subscription)
+
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        child = context.Process(target=resume_in_child, args=(self.bus, seen.id, results))
+        child.start()
+        reset, replayed = results.get(timeout=5)
+        child.join()
+
+        self.assertFalse(reset)
+        self.assertEqual(replayed, [missed.id])
+
+    def test_poller_delivers_writes_once_woken(self):
+        subscription = self.bus.subscribe("admin")
+
+        self.assign("U1", "SN1")
+        self.bus.wake()
+
+        self.assertEqual([event.type for event in subscription.get(5)], ["asset.assigned"])
+
+    def test_poller_stops_without_subscribers(self):
+        self.bus.subscribe("admin").close()
+        poller = self.bus._poller
+
+        self.bus.wake()
+        poller.join(5)
+
+        self.assertFalse(poller.is_alive())
+        self.assertIsNone(self.bus.stats()["cursor"])
+
+    def test_streams_end_before_a_draining_worker_is_killed(self):
+        self.assertLess(events_config.EVENTS_MAX_STREAM_SECONDS, server_config.GRACEFUL_TIMEOUT)
+
+    def test_streams_leave_request_threads_for_other_requests(self):
+        self.assertLess(events_config.EVENTS_MAX_STREAMS, server_config.THREADS_PER_WORKER)
+
+    def test_subscribers_beyond_the_limit_are_refused(self):
+        for _ in range(events_config.EVENTS_MAX_STREAMS):
+            self.bus.subscribe("admin")
+
+        with self.assertRaises(StreamLimitError):
+            self.bus.subscribe("admin")
+        self.assertEqual(self.bus.stats()["subscribers"], events_config.EVENTS_MAX_STREAMS)
+
+
+if __name__ == "__main__":
+    unittest.main()
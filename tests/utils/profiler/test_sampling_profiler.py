@@ -0,0 +1,167 @@
+import multiprocessing
+import os
+import threading
+import time
+import unittest
+
+from flask import Flask
+
+from src.app.utils.control_block import ControlBlock
+from src.app.utils.profiler.sampling_profiler import SamplingProfiler, init_sampling_profiler
+
+
+def busy_handler_work(started: threading.Event, release: threading.Event):
+    started.set()
+    release.wait(5)
+
+
+def status_after_configure(profiler: SamplingProfiler, configured, results):
+    # A worker forked before the change, applying it as it would before its next request
+    configured.wait(5)
+    profiler.control_block.apply_pending()
+    results.put(profiler.status())
+    profiler.stop()
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = SamplingProfiler(interval_ms=1)
+
+    def tearDown(self):
+        self.profiler.stop()
+
+    def _run_tracked_thread(self, endpoint):
+        started, release = threading.Event(), threading.Event()
+
+        def serve():
+            self.profiler.track_request(endpoint)
+            try:
+                busy_handler_work(started, release)
+            finally:
+                self.profiler.untrack_request()
+
+        worker = threading.Thread(target=serve)
+        worker.start()
+        started.wait(5)
+        return worker, release
+
+    def test_untracked_threads_are_not_sampled(self):
+        self.profiler.sample_once()
+        self.assertEqual(self.profiler.sample_count, 0)
+        self.assertEqual(self.profiler.folded(), "")
+
+    def test_tracking_is_noop_while_stopped(self):
+        self.profiler.track_request("assets")
+        self.assertEqual(self.profiler._active_requests, {})
+
+    def test_sample_once_collapses_stack_per_endpoint(self):
+        self.profiler.start()
+        worker, release = self._run_tracked_thread("asset.assets")
+        self.profiler.sample_once()
+        release.set()
+        worker.join()
+
+        folded = self.profiler.folded("asset.assets")
+        stacks = dict(line.rsplit(" ", 1) for line in folded.strip().split("\n"))
+        self.assertTrue(any("test_sampling_profiler.py:busy_handler_work" in stack for stack in stacks))
+        self.assertTrue(all(int(count) >= 1 for count in stacks.values()))
+        self.assertTrue(self.profiler.folded().startswith("asset.assets;"))
+
+    def test_background_thread_collects_samples(self):
+        self.profiler.start()
+        self.assertTrue(self.profiler.running)
+        worker, release = self._run_tracked_thread("asset.assets")
+        time.sleep(0.05)
+        release.set()
+        worker.join()
+        self.profiler.stop()
+
+        self.assertFalse(self.profiler.running)
+        self.assertGreater(self.profiler.status()["endpoints"]["asset.assets"], 0)
+
+    def test_reset_clears_samples(self):
+        self.profiler.start()
+        worker, release = self._run_tracked_thread("asset.assets")
+        self.profiler.sample_once()
+        release.set()
+        worker.join()
+        self.profiler.reset()
+
+        self.assertEqual(self.profiler.sample_count, 0)
+        self.assertEqual(self.profiler.endpoints(), {})
+
+    def test_stop_racing_start_leaves_one_sampler_that_stops(self):
+        def toggle(method):
+            for _ in range(200):
+                method()
+
+        racers = [threading.Thread(target=toggle, args=(self.profiler.start,)),
+                  threading.Thread(target=toggle, args=(self.profiler.stop,))]
+        for racer in racers:
+            racer.start()
+        for racer in racers:
+            racer.join()
+        self.profiler.start()
+
+        samplers = [thread for thread in threading.enumerate() if thread.name == "sampling-profiler"]
+        self.assertEqual(samplers, [self.profiler._thread])
+        self.profiler.stop()
+        samplers[0].join(1)
+        self.assertFalse(samplers[0].is_alive())
+
+    def test_restart_does_not_reuse_the_stopped_thread_event(self):
+        self.profiler.start()
+        first_event = self.profiler._stop_event
+        self.profiler.stop()
+        self.profiler.start()
+
+        self.assertTrue(first_event.is_set())
+        self.assertFalse(self.profiler._stop_event.is_set())
+        self.assertTrue(self.profiler.running)
+
+    def test_set_interval_rejects_non_positive(self):
+        with self.assertRaises(ValueError):
+            self.profiler.set_interval(0)
+        self.profiler.set_interval(5)
+        self.assertEqual(self.profiler.interval_ms, 5)
+
+    def test_init_sampling_profiler_tracks_requests(self):
+        app = Flask(__name__)
+        init_sampling_profiler(app, self.profiler)
+        self.profiler.start()
+        seen = {}
+
+        def ping():
+            seen.update(self.profiler._active_requests)
+            return "pong"
+
+        app.add_url_rule("/ping", "ping", ping)
+        app.test_client().get("/ping")
+
+        self.assertEqual(list(seen.values()), ["ping"])
+        self.assertEqual(self.profiler._active_requests, {})
+
+    def test_configure_reaches_the_other_workers(self):
+        self.profiler.control_block = ControlBlock(slots=4)
+        self.profiler.control_block.register("profiler", self.profiler._configure)
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        configured = context.Event()
+        worker = context.Process(target=status_after_configure, args=(self.profiler, configured, results))
+        worker.start()
+
+        self.profiler.configure(enabled=True, interval_ms=7)
+        configured.set()
+        status = results.get(timeout=5)
+        worker.join(5)
+
+        self.assertTrue(self.profiler.running)
+        self.assertEqual((status["enabled"], status["interval_ms"]), (True, 7))
+        self.assertNotEqual(status["pid"], os.getpid())
+
+    def test_configure_without_changes_publishes_nothing(self):
+        self.profiler.control_block = ControlBlock(slots=4)
+
+        self.profiler.configure()
+
+        self.assertEqual(self.profiler.control_block._sequence.value, 0)
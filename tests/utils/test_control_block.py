@@ -0,0 +1,93 @@
+import multiprocessing
+import os
+import unittest
+
+from src.app.utils.control_block import ControlBlock
+from src.app.utils.errors.error import LockTimeoutError
+
+
+def publish_in_child(control_block: ControlBlock, kind: str, args: dict):
+    control_block.publish(kind, **args)
+
+
+def apply_in_child(control_block: ControlBlock, results):
+    applied = []
+    control_block.register("cache", lambda **args: applied.append(args))
+    control_block.apply_pending()
+    results.put(applied)
+
+
+class TestControlBlock(unittest.TestCase):
+    def setUp(self):
+        self.control_block = ControlBlock(slots=4, command_bytes=128)
+        self.applied = []
+        self.control_block.register("cache", lambda **args: self.applied.append(args))
+        self.context = multiprocessing.get_context("fork")
+
+    def run_child(self, target, *args):
+        child = self.context.Process(target=target, args=(self.control_block, *args))
+        child.start()
+        child.join(5)
+        self.assertEqual(child.exitcode, 0)
+
+    def test_commands_of_another_process_are_applied_once(self):
+        self.run_child(publish_in_child, "cache", {"name": "users", "max_bytes": 300})
+
+        self.assertEqual(self.control_block.apply_pending(), 1)
+        self.assertEqual(self.applied, [{"name": "users", "max_bytes": 300}])
+        self.assertEqual(self.control_block.apply_pending(), 0)
+
+    def test_own_commands_are_not_applied_again(self):
+        self.control_block.publish("cache", name="users", flush=True)
+
+        self.assertEqual(self.control_block.apply_pending(), 0)
+        self.assertEqual(self.applied, [])
+
+    def test_another_worker_applies_a_published_command(self):
+        self.control_block.publish("cache", name="users", flush=True)
+        results = self.context.Queue()
+
+        self.run_child(apply_in_child, results)
+
+        self.assertEqual(results.get(timeout=5), [{"name": "users", "flush": True}])
+
+    def test_only_the_commands_left_in_the_ring_are_applied(self):
+        for size in range(6):
+            self.run_child(publish_in_child, "cache", {"name": "users", "max_bytes": size})
+
+        self.control_block.apply_pending()
+
+        self.assertEqual([args["max_bytes"] for args in self.applied], [2, 3, 4, 5])
+
+    def test_failing_and_unknown_commands_are_skipped(self):
+        def refuse(**args):
+            raise ValueError("no")
+
+        self.control_block.register("profiler", refuse)
+        self.run_child(publish_in_child, "profiler", {"enabled": True})
+        self.run_child(publish_in_child, "unknown", {})
+        self.run_child(publish_in_child, "cache", {"name": "users"})
+
+        self.assertEqual(self.control_block.apply_pending(), 1)
+        self.assertEqual(self.control_block.failed, 1)
+
+    def test_command_too_big_for_a_slot_is_refused(self):
+        with self.assertRaises(ValueError):
+            self.control_block.publish("cache", name="x" * 200)
+
+    def test_publish_times_out_on_a_held_lock(self):
+        self.control_block._write_lock.acquire(1)
+        self.addCleanup(self.control_block._write_lock.release)
+
+        with self.assertRaises(LockTimeoutError):
+            self.control_block.publish("cache", name="users", flush=True)
+        self.assertEqual(self.control_block._sequence.value, 0)
+
+    def test_published_commands_carry_the_publisher_pid(self):
+        self.control_block.publish("cache", name="users", flush=True)
+
+        self.assertIn(f'"pid": {os.getpid()}'.encode(), self.control_block._read(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
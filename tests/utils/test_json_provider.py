@@ -0,0 +1,99 @@
+import dataclasses
+import json
+import unittest
+from datetime import datetime, timezone
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.app.models.asset import Asset
+from src.app.models.asset_issue import Issue
+from src.app.models.user import User, UserDTO
+from src.app.utils.json_provider import FastJSONProvider, orjson
+
+REPORT_DATE = datetime(2024, 12, 17, 16, 11, 31, tzinfo=timezone.utc)
+
+
+def sample_payload():
+    return {
+        "status_code": 200,
+        "message": "ok",
+        "data": [
+            Asset(name="thinkpad t14", description="laptop ü", serial_number="a-1"),
+            Issue(asset_id="a-1", description="cracked screen", user_id="u-1", issue_id="i-1",
+                  report_date=REPORT_DATE),
+            UserDTO(id="u-1", name="mia", email="mia@watchguard.com", department="CLOUD PLATFORM"),
+        ],
+    }
+
+
+class TestFastJSONProvider(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.provider = FastJSONProvider(self.app, use_orjson=False)
+
+    def test_models_match_default_provider_output(self):
+        payload = sample_payload()
+        expected = DefaultJSONProvider(self.app).dumps(
+            {**payload, "data": [dataclasses.asdict(item) for item in payload["data"]]}
+        )
+
+        self.assertEqual(json.loads(self.provider.dumps(payload)), json.loads(expected))
+
+    def test_output_is_compact_and_keeps_key_order(self):
+        output = self.provider.dumps({"b": 1, "a": [1, 2]})
+
+        self.assertEqual(output, '{"b":1,"a":[1,2]}')
+
+    def test_datetime_uses_http_date(self):
+        self.assertEqual(self.provider.dumps(REPORT_DATE), '"Tue, 17 Dec 2024 16:11:31 GMT"')
+
+    def test_registered_encoder_applies_to_subclasses(self):
+        class Laptop(Asset):
+            pass
+
+        output = json.loads(self.provider.dumps(Laptop(name="x", description="y", serial_number="s")))
+
+        self.assertEqual(output, {"serial_number": "s", "name": "x", "description": "y", "status": "available"})
+
+    def test_user_with_password_is_not_serializable(self):
+        user = User(id="u-1", name="mia", email="mia@watchguard.com", password="hash", role="user",
+                    department="CLOUD PLATFORM")
+
+        with self.assertRaises(TypeError):
+            self.provider.dumps(user)
+
+    def test_unknown_type_raises(self):
+        with self.assertRaises(TypeError):
+            self.provider.dumps(object())
+
+    @unittest.skipUnless(orjson, "orjson not installed")
+    def test_orjson_and_stdlib_produce_the_same_bytes(self):
+        fast = FastJSONProvider(self.app, use_orjson=True)
+
+        self.assertEqual(fast.dumps_bytes(sample_payload()), self.provider.dumps_bytes(sample_payload()))
+
+    def test_view_returning_models_is_serialized(self):
+        self.app.json = self.provider
+        self.app.add_url_rule("/assets", "assets", lambda: sample_payload())
+
+        response = self.app.test_client().get("/assets")
+
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_json()["data"][0]["serial_number"], "a-1")
+
+    def test_spliced_response_adds_encoded_data_verbatim(self):
+        response = self.provider.spliced_response({"status_code": 200, "message": "ok"}, b'[{"a":1}]')
+
+        self.assertEqual(response.get_data(), b'{"status_code":200,"message":"ok","data":[{"a":1}]}\n')
+        self.assertEqual(response.mimetype, "application/json")
+
+    def test_spliced_response_leaves_out_empty_arrays(self):
+        response = self.provider.spliced_response({"status_code": 200, "message": "ok"}, b"[]")
+
+        self.assertEqual(response.get_data(), b'{"status_code":200,"message":"ok"}\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
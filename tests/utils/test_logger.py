@@ -0,0 +1,37 @@
+import logging
+import unittest
+from unittest.mock import MagicMock
+
+from flask import Flask
+
+from src.app.server import configure_logging, log as server_log
+from src.app.utils.logger.custom_logger import custom_logger
+from src.app.utils.logger.logger import Logger
+
+
+class TestLogging(unittest.TestCase):
+    def test_request_log_never_includes_headers(self):
+        logger = MagicMock(spec=Logger)
+        logger.sanitize_body.return_value = {}
+        handler = custom_logger(logger)(lambda self: ("ok", 200))
+        app = Flask(__name__)
+
+        with app.test_request_context("/assets", headers={"Authorization": "Bearer secret-token"}):
+            handler(object())
+
+        logged = " ".join(str(call.args) for call in logger.debug.call_args_list + logger.info.call_args_list)
+        self.assertNotIn("secret-token", logged)
+        self.assertNotIn("Authorization", logged)
+
+    def test_app_and_server_logs_do_not_reach_the_root_logger(self):
+        root_handlers = list(logging.getLogger().handlers)
+
+        configure_logging()
+
+        self.assertEqual(logging.getLogger().handlers, root_handlers)
+        self.assertFalse(server_log.propagate)
+        self.assertFalse(Logger().logger.propagate)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from src.app.utils.stats import percentile, summarize_latencies
+
+
+class TestStats(unittest.TestCase):
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 99), 99)
+
+    def test_percentile_small_and_empty(self):
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_summarize_latencies(self):
+        summary = summarize_latencies([0.003, 0.001, 0.002, 0.004])
+
+        self.assertEqual(summary["count"], 4)
+        self.assertEqual(summary["mean_ms"], 2.5)
+        self.assertEqual(summary["p50_ms"], 2.0)
+        self.assertEqual(summary["max_ms"], 4.0)
+
+    def test_summarize_no_latencies(self):
+        self.assertEqual(summarize_latencies([])["count"], 0)
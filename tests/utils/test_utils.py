@@ -147,6 +147,73 @@ class TestUtils(unittest.TestCase):
             self.assertEqual(result[1], 403)
             self.assertIn("Unauthorized", result[0].get_json()["message"])
 
+    def conditional_client(self, get_version):
+        """
+        Serve a handler method decorated with Utils.conditional and count how often it runs
+        """
+        class Handler:
+            calls = 0
+
+            @Utils.conditional(get_version)
+            def get_items(self):
+                Handler.calls += 1
+                return {"items": [1, 2]}, 200
+
+        app = Flask(__name__)
+        handler = Handler()
+        app.add_url_rule("/items", "items", handler.get_items)
+        return app.test_client(), Handler
+
+    def test_conditional_decorator_sets_etag(self):
+        """
+        Test a full response carries the version as a weak ETag
+        """
+        client, _ = self.conditional_client(lambda handler: (3, 7))
+
+        response = client.get("/items")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["ETag"], 'W/"3-7"')
+
+    def test_conditional_decorator_returns_not_modified(self):
+        """
+        Test a matching If-None-Match gets an empty 304 without running the handler
+        """
+        client, handler = self.conditional_client(lambda handler: (3, 7))
+
+        response = client.get("/items", headers={"If-None-Match": 'W/"3-7"'})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.headers["ETag"], 'W/"3-7"')
+        self.assertEqual(handler.calls, 0)
+
+    def test_conditional_decorator_serves_stale_etag(self):
+        """
+        Test an outdated ETag gets the full response with the current one
+        """
+        client, handler = self.conditional_client(lambda handler: (4, 7))
+
+        response = client.get("/items", headers={"If-None-Match": 'W/"3-7"'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["ETag"], 'W/"4-7"')
+        self.assertEqual(handler.calls, 1)
+
+    def test_conditional_decorator_without_version(self):
+        """
+        Test the handler is served in full, without an ETag, when the version cannot be read
+        """
+        def broken_version(handler):
+            raise Exception("no table_versions table")
+
+        client, handler = self.conditional_client(broken_version)
+
+        response = client.get("/items", headers={"If-None-Match": "*"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
+
     def test_create_jwt_token_exception(self):
         """
         Test JWT token creation with problematic inputs
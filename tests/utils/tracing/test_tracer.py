@@ -0,0 +1,154 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from flask import Flask
+
+from src.app.utils.tracing.tracer import (
+    Tracer,
+    JsonlSpanExporter,
+    parse_traceparent,
+    format_traceparent,
+    current_span,
+    trace_function,
+    traced,
+    init_tracing
+)
+
+
+@traced
+class DummyService:
+    def __init__(self, repository):
+        self.repository = repository
+
+    def fetch(self):
+        return self.repository.fetch()
+
+    def fail(self):
+        raise ValueError("boom")
+
+
+@traced
+class DummyRepository:
+    def fetch(self):
+        return current_span().name
+
+
+class TestTraceparent(unittest.TestCase):
+    def test_parse_valid_traceparent(self):
+        header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+        self.assertEqual(
+            parse_traceparent(header),
+            ("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7", True)
+        )
+
+    def test_parse_unsampled_traceparent(self):
+        header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-00"
+        self.assertFalse(parse_traceparent(header)[2])
+
+    def test_parse_invalid_traceparent(self):
+        self.assertIsNone(parse_traceparent(None))
+        self.assertIsNone(parse_traceparent("garbage"))
+        self.assertIsNone(parse_traceparent("00-" + "0" * 32 + "-00f067aa0ba902b7-01"))
+
+    def test_format_traceparent_round_trip(self):
+        header = format_traceparent("a" * 32, "b" * 16, True)
+        self.assertEqual(parse_traceparent(header), ("a" * 32, "b" * 16, True))
+
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.exporter = MagicMock()
+        self.tracer = Tracer(self.exporter, sample_rate=1.0, enabled=True)
+
+    def test_spans_nest_under_root(self):
+        service = DummyService(DummyRepository())
+        root, token = self.tracer.start_trace("GET /assets")
+
+        result = service.fetch()
+        self.tracer.end_trace(root, token)
+
+        self.assertEqual(result, "DummyRepository.fetch")
+        self.assertEqual([span.name for span in root.iter_spans()],
+                         ["GET /assets", "DummyService.fetch", "DummyRepository.fetch"])
+        service_span = root.children[0]
+        self.assertEqual(service_span.parent_span_id, root.span_id)
+        self.assertEqual(service_span.children[0].parent_span_id, service_span.span_id)
+        self.exporter.export.assert_called_once_with(root)
+        self.assertIsNone(current_span())
+
+    def test_error_recorded_on_span(self):
+        service = DummyService(DummyRepository())
+        root, token = self.tracer.start_trace("GET /fail")
+
+        with self.assertRaises(ValueError):
+            service.fail()
+        self.tracer.end_trace(root, token)
+
+        self.assertEqual(root.children[0].error, "ValueError: boom")
+
+    def test_no_span_without_active_trace(self):
+        self.assertEqual(trace_function("noop")(lambda: 42)(), 42)
+
+    def test_incoming_traceparent_is_honored(self):
+        root, token = self.tracer.start_trace(
+            "GET /assets", traceparent="00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+        )
+        self.tracer.end_trace(root, token)
+
+        self.assertEqual(root.trace_id, "4bf92f3577b34da6a3ce929d0e0e4736")
+        self.assertEqual(root.parent_span_id, "00f067aa0ba902b7")
+
+    def test_unsampled_parent_is_not_recorded(self):
+        root, token = self.tracer.start_trace(
+            "GET /assets", traceparent="00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-00"
+        )
+        self.assertIsNone(root)
+        self.tracer.end_trace(root, token)
+        self.exporter.export.assert_not_called()
+
+    def test_sample_rate_zero_records_nothing(self):
+        tracer = Tracer(self.exporter, sample_rate=0.0, enabled=True)
+        root, token = tracer.start_trace("GET /assets")
+        self.assertIsNone(root)
+
+
+class TestJsonlSpanExporter(unittest.TestCase):
+    def test_export_writes_otlp_json_line(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "traces.jsonl")
+            tracer = Tracer(JsonlSpanExporter(path), sample_rate=1.0, enabled=True)
+            root, token = tracer.start_trace("GET /assets", attributes={"http.method": "GET"})
+            DummyService(DummyRepository()).fetch()
+            tracer.end_trace(root, token)
+
+            with open(path) as trace_file:
+                lines = trace_file.readlines()
+
+        self.assertEqual(len(lines), 1)
+        spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        self.assertEqual(len(spans), 3)
+        self.assertEqual(spans[0]["traceId"], root.trace_id)
+        self.assertNotIn("parentSpanId", spans[0])
+        self.assertEqual(spans[1]["parentSpanId"], spans[0]["spanId"])
+        self.assertEqual(spans[0]["attributes"][0], {"key": "http.method", "value": {"stringValue": "GET"}})
+
+
+class TestInitTracing(unittest.TestCase):
+    def test_request_produces_trace(self):
+        app = Flask(__name__)
+        exporter = MagicMock()
+        init_tracing(app, Tracer(exporter, sample_rate=1.0, enabled=True))
+        app.add_url_rule("/ping", "ping", lambda: "pong")
+
+        response = app.test_client().get(
+            "/ping", headers={"traceparent": "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["traceparent"].startswith("00-4bf92f3577b34da6a3ce929d0e0e4736-"))
+        root = exporter.export.call_args[0][0]
+        self.assertEqual(root.name, "GET /ping")
+        self.assertEqual(root.attributes["http.status_code"], 200)